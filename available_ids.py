@@ -1,8550 +1,90 @@
+from typing import Mapping, Union
+from collections import abc
+import pathlib
+import struct
 
-available_ids = {
-    615: 'veg_tree3',
-    616: 'veg_treea1',
-    617: 'veg_treeb1',
-    618: 'veg_treea3',
-    619: 'veg_palwee03',
-    620: 'veg_palm04',
-    621: 'veg_palm02',
-    622: 'veg_palm03',
-    623: 'veg_palwee01',
-    624: 'veg_palwee02',
-    625: 'veg_palmkb1',
-    626: 'veg_palmkb2',
-    627: 'veg_palmkb3',
-    628: 'veg_palmkb4',
-    629: 'veg_palmkb5',
-    630: 'veg_palmkb8',
-    631: 'veg_palmkb9',
-    632: 'veg_palmkb7',
-    633: 'veg_palmkb10',
-    634: 'veg_palmkbb11',
-    635: 'veg_fern_balcny_kb1',
-    636: 'veg_fern_balcny_kb2',
-    637: 'kb_planterbox',
-    638: 'kb_plante',
-    639: 'veg_ivy_balcny_kb3',
-    640: 'kb_plante',
-    641: 'veg_palmkb13',
-    642: 'kb_canopy_test',
-    643: 'kb_chr_tbl_test',
-    644: 'pot_02',
-    645: 'veg_palmbig14',
-    646: 'veg_palmkb14',
-    647: 'new_bushsm',
-    648: 'veg_palm01',
-    649: 'sjmpalm',
-    650: 'sjmcacti2',
-    651: 'sjmcacti1',
-    652: 'sjmpalmbig',
-    653: 'sjmcacti03',
-    654: 'pinetree08',
-    655: 'pinetree06',
-    656: 'pinetree05',
-    657: 'pinetree02',
-    658: 'pinetree04',
-    659: 'pinetree01',
-    660: 'pinetree03',
-    661: 'pinetree07',
-    664: 'firtree2',
-    669: 'sm_veg_tree4',
-    670: 'sm_firtallded',
-    671: 'sm_bushytree',
-    672: 'sm_veg_tree5',
-    673: 'sm_bevhiltree',
-    674: 'sm_des_josh_lrg1',
-    675: 'josh_ball',
-    676: 'sm_des_josh_sml1',
-    677: 'sm_des_agave1',
-    678: 'sm_des_agave2',
-    679: 'sm_des_cact_bsh',
-    680: 'sm_des_josh_lrg2',
-    681: 'sm_des_josh_sm2',
-    682: 'sm_des_cactflr',
-    683: 'sm_fir_group',
-    684: 'sm_fir_log02',
-    685: 'sm_fir_scabby',
-    686: 'sm_fir_dead',
-    687: 'sm_fir_',
-    688: 'sm_fir_scabg',
-    689: 'sm_fir_copse1',
-    690: 'sm_fir_copse2',
-    691: 'sm_veg_tree4_big',
-    692: 'sm_des_bush1',
-    693: 'sm_redwood_',
-    694: 'sm_redwoodgrp',
-    695: 'sm_fir_scabtg',
-    696: 'sm_fir_scabt',
-    697: 'sm_fir_tall',
-    698: 'sm_firtbshg',
-    700: 'sm_veg_tree6',
-    701: 'sm_tumblewd48p',
-    702: 'sm_tumbleweed',
-    703: 'sm_veg_tree7_big',
-    704: 'bg_fir_dead',
-    705: 'sm_veg_tree7vbig',
-    706: 'sm_vegvbbig',
-    707: 'sm_bushvbig',
-    708: 'sm_veg_tree4_vbig',
-    709: 'sm_vegvbbigbrn',
-    710: 'vgs_palm01',
-    711: 'vgs_palm02',
-    712: 'vgs_palm03',
-    713: 'veg_bevtree1',
-    714: 'veg_bevtree2',
-    715: 'veg_bevtree3',
-    716: 'sjmpalmbigpv',
-    717: 'sm_bevhiltreepv',
-    718: 'vgs_palm04',
-    719: 'veg_largefurs07',
-    720: 'veg_largefurs01',
-    721: 'veg_largefurs02',
-    722: 'veg_largefurs03',
-    723: 'veg_largefurs04',
-    724: 'veg_largefurs05',
-    725: 'veg_largefurs06',
-    726: 'tree_hipoly19',
-    727: 'tree_hipoly04',
-    728: 'tree_hipoly06',
-    729: 'tree_hipoly07',
-    730: 'tree_hipoly08',
-    731: 'tree_hipoly09',
-    732: 'tree_hipoly10',
-    733: 'tree_hipoly11',
-    734: 'tree_hipoly14',
-    735: 'tree_hipoly09b',
-    736: 'ceasertree01_lvs',
-    737: 'aw_streettree3',
-    738: 'aw_streettree2',
-    739: 'sjmpalmtall',
-    740: 'vgs_palmvtall',
-    741: 'pot_01',
-    742: 'pot_03',
-    743: 'kb_pot_1',
-    744: 'sm_scrub_rock4',
-    745: 'sm_scrub_rock5',
-    746: 'sm_scrub_rock2',
-    747: 'sm_scrub_rock3',
-    748: 'sm_scrb_grp1',
-    749: 'sm_scrb_column3',
-    750: 'sm_scrb_column2',
-    751: 'sm_scrb_column1',
-    752: 'sm_cunt_rock1',
-    753: 'sm_descactiigrpb',
-    754: 'sm_des_cactiigrp',
-    755: 'sm_des_pcklypr3',
-    756: 'sm_des_pcklypr2',
-    757: 'sm_des_pcklypr1',
-    758: 'sm_scrub_rock6',
-    759: 'sm_bush_large_1',
-    760: 'sm_bush_small_1',
-    761: 'sm_drybrush_sm1',
-    762: 'new_bushtest',
-    763: 'Ash1_hi',
-    764: 'Cedar3_hi',
-    765: 'Cedar2_hi',
-    766: 'Cedar1_hi',
-    767: 'Elmtreegrn_hi',
-    768: 'Elmtreegrn2_hi',
-    769: 'Locust_hi',
-    770: 'Pinebg_hi',
-    771: 'sprucetree_hi',
-    772: 'Elmred_hi',
-    773: 'Elmdead_hi',
-    774: 'Elmsparse_hi',
-    775: 'Elmwee_hi',
-    776: 'Hazelweetree_hi',
-    777: 'Hazeltall_hi',
-    778: 'Elmred_hism',
-    779: 'Pinebg_hism',
-    780: 'Elmsparse_hism',
-    781: 'Elmwee_hism',
-    782: 'Elmtreegrn_hism',
-    789: 'hashburytree4sfs',
-    790: 'sm_fir_tallgroup',
-    791: 'vbg_fir_copse',
-    792: 'aw_streettree1',
-    800: 'genVEG_bush07',
-    801: 'genVEG_bush01',
-    802: 'genVEG_bush08',
-    803: 'genVEG_bush09',
-    804: 'genVEG_bush10',
-    805: 'genVEG_bush11',
-    806: 'genVEG_tallgrass',
-    807: 'p_rubble',
-    808: 'genVEG_bush12',
-    809: 'genVEG_bush13',
-    810: 'genVEG_bush14',
-    811: 'genVEG_bush15',
-    812: 'genVEG_bush16',
-    813: 'genVEG_bush17',
-    814: 'genVEG_bush18',
-    815: 'genVEG_bush19',
-    816: 'p_rubble03',
-    817: 'veg_Pflowers01',
-    818: 'genVEG_tallgrass02',
-    819: 'genVEG_tallgrass03',
-    820: 'genVEG_tallgrass04',
-    821: 'genVEG_tallgrass05',
-    822: 'genVEG_tallgrass06',
-    823: 'genVEG_tallgrass07',
-    824: 'genVEG_tallgrass08',
-    825: 'genVEG_bushy',
-    826: 'genVEG_tallgrass10',
-    827: 'genVEG_tallgrass11',
-    828: 'p_rubble2',
-    829: 'DEAD_TREE_3',
-    830: 'DEAD_TREE_2',
-    831: 'DEAD_TREE_5',
-    832: 'DEAD_TREE_4',
-    833: 'DEAD_TREE_6',
-    834: 'DEAD_TREE_7',
-    835: 'DEAD_TREE_8',
-    836: 'DEAD_TREE_10',
-    837: 'DEAD_TREE_1',
-    838: 'DEAD_TREE_9',
-    839: 'DEAD_TREE_11',
-    840: 'DEAD_TREE_12',
-    841: 'DEAD_TREE_13',
-    842: 'DEAD_TREE_14',
-    843: 'DEAD_TREE_15',
-    844: 'DEAD_TREE_16',
-    845: 'DEAD_TREE_17',
-    846: 'DEAD_TREE_18',
-    847: 'DEAD_TREE_19',
-    848: 'DEAD_TREE_20',
-    849: 'CJ_urb_rub_3',
-    850: 'CJ_urb_rub_1',
-    851: 'CJ_urb_rub_2',
-    852: 'CJ_urb_rub_4',
-    853: 'CJ_urb_rub_5',
-    854: 'CJ_urb_rub_3b',
-    855: 'genVEG_tallgrass01',
-    856: 'genVEG_tallgrass12',
-    857: 'procweegrs',
-    858: 'sand_josh2',
-    859: 'sand_plant04',
-    860: 'sand_plant01',
-    861: 'sand_plant02',
-    862: 'sand_plant05',
-    863: 'sand_plant03',
-    864: 'sand_combush1',
-    865: 'sand_combush02',
-    866: 'sand_combush03',
-    867: 'p_rubble04col',
-    868: 'p_rubble05col',
-    869: 'veg_Pflowerswee',
-    870: 'veg_Pflowers2wee',
-    871: 'veg_procfpatchwee',
-    872: 'gen_tallgrsnew',
-    873: 'veg_procfpatch',
-    874: 'veg_procgrasspatch',
-    875: 'veg_procfpatch01',
-    876: 'veg_Pflowers03',
-    877: 'veg_Pflowers04',
-    878: 'veg_Pflowers02',
-    879: 'p_rubble04bcol',
-    880: 'p_rubble0bcol',
-    881: 'sm_fir_scabg_PO',
-    882: 'Ash_PO',
-    883: 'Cedar3_PO',
-    884: 'Cedar2_PO',
-    885: 'Cedar1_PO',
-    886: 'Elmtreegrn_PO',
-    887: 'Elmtreegrn2_PO',
-    888: 'Locust_PO',
-    889: 'Pinebg_PO',
-    890: 'Elmred_PO',
-    891: 'Elmdead_PO',
-    892: 'Hazelweetree_PO',
-    893: 'Elmredsm_PO',
-    894: 'Elmsparsesm_PO',
-    895: 'Elmweesm_PO',
-    896: 'searock06',
-    897: 'searock01',
-    898: 'searock02',
-    899: 'searock03',
-    900: 'searock04',
-    901: 'searock05',
-    902: 'Starfish',
-    903: 'seaweed',
-    904: 'sand_josh1',
-    905: 'rockbrkq',
-    906: 'p_rubblebig',
-    910: 'BUST_CABINET_4',
-    911: 'BUST_CABINET_1',
-    912: 'BUST_CABINET_2',
-    913: 'BUST_CABINET_3',
-    914: 'GRILL',
-    915: 'AIRCON_FAN',
-    916: 'FRUITCRATE2',
-    917: 'FRUITCRATE1',
-    918: 'CJ_FLAME_Drum',
-    919: 'AIRCON',
-    920: 'Y_GENERATOR',
-    921: 'CJ_IND_LIGHT',
-    922: 'Packing_carates1',
-    923: 'Packing_carates2',
-    924: 'FRUITCRATE3',
-    925: 'RACK2',
-    926: 'RUBBISH_BOX2',
-    927: 'Piping_Detail',
-    928: 'RUBBISH_BOX1',
-    929: 'GENERATOR',
-    930: 'O2_Bottles',
-    931: 'RACK3',
-    932: 'H_WHEELCHAIR',
-    933: 'CJ_CABLEROLL',
-    934: 'GENERATOR_BIG',
-    935: 'CJ_Drum',
-    936: 'CJ_DF_WORKTOP_2',
-    937: 'CJ_DF_WORKTOP',
-    938: 'CJ_DF_LIGHT',
-    939: 'CJ_DF_UNIT',
-    940: 'CJ_DF_LIGHT_2',
-    941: 'CJ_DF_WORKTOP_3',
-    942: 'CJ_DF_UNIT_2',
-    943: 'GENERATOR_LOW',
-    944: 'Packing_carates04',
-    945: 'WS_CF_LAMPS',
-    946: 'bskball_lax',
-    947: 'bskballhub_lax01',
-    948: 'Plant_Pot_10',
-    949: 'Plant_Pot_4',
-    950: 'Plant_Pot_12',
-    951: 'CJ_VIEW_TELE2',
-    952: 'GENERATOR_BIG_d',
-    953: 'CJ_OYSTER',
-    954: 'cj_horse_Shoe',
-    955: 'CJ_EXT_SPRUNK',
-    956: 'CJ_EXT_CANDY',
-    957: 'CJ_LIGHT_FIT_EXT',
-    958: 'CJ_CHIP_MAKER',
-    959: 'CJ_CHIP_MAKER_BITS',
-    960: 'CJ_ARM_CRATE',
-    961: 'CJ_ARM_CRATE_top',
-    962: 'CJ_T_TICKET_PED',
-    963: 'CJ_T_TICKET',
-    964: 'CJ_METAL_CRATE',
-    966: 'bar_gatebar01',
-    967: 'bar_gatebox01',
-    968: 'barrierturn',
-    969: 'Electricgate',
-    970: 'fencesmallb',
-    971: 'subwaygate',
-    972: 'tunnelentrance',
-    973: 'sub_roadbarrier',
-    974: 'tall_fence',
-    975: 'Columbiangate',
-    976: 'phils_compnd_gate',
-    977: 'newtowerdoor1',
-    978: 'sub_roadright',
-    979: 'sub_roadleft',
-    980: 'airportgate',
-    981: 'helix_barrier',
-    982: 'fenceshit',
-    983: 'fenceshit3',
-    984: 'fenceshit2',
-    985: 'gate_autoR',
-    986: 'gate_autoL',
-    987: 'elecfence_BAR',
-    988: 'ws_apgate',
-    989: 'ac_apgate',
-    990: 'bar_barrier12',
-    991: 'bar_barriergate1',
-    992: 'bar_barrier10b',
-    993: 'bar_barrier10',
-    994: 'lhouse_barrier2',
-    995: 'bar_barrier16',
-    996: 'lhouse_barrier1',
-    997: 'lhouse_barrier3',
-    998: 'Gdyn_barrier17',
-    1207: 'tiny_rock',
-    1208: 'washer',
-    1209: 'vendmach',
-    1210: 'briefcase',
-    1211: 'fire_hydrant',
-    1212: 'Money',
-    1213: 'mine',
-    1214: 'bollard',
-    1215: 'bollardlight',
-    1216: 'phonebooth1',
-    1217: 'barrel2',
-    1218: 'barrel1',
-    1219: 'palette',
-    1220: 'cardboardbox2',
-    1221: 'cardboardbox4',
-    1222: 'barrel3',
-    1223: 'lampost_coast',
-    1224: 'woodenbox',
-    1225: 'barrel4',
-    1226: 'lamppost3',
-    1227: 'dump1',
-    1228: 'roadworkbarrier1',
-    1229: 'bussign1',
-    1230: 'cardboardbox',
-    1231: 'Streetlamp2',
-    1232: 'Streetlamp1',
-    1233: 'noparkingsign1',
-    1234: 'phonesign',
-    1235: 'wastebin',
-    1236: 'rcyclbank01',
-    1237: 'strtbarrier01',
-    1238: 'trafficcone',
-    1239: 'info',
-    1240: 'health',
-    1241: 'adrenaline',
-    1242: 'bodyarmour',
-    1243: 'bouy',
-    1244: 'petrolpump',
-    1245: 'newramp',
-    1246: 'line',
-    1247: 'bribe',
-    1248: 'bonus',
-    1249: 'faketarget',
-    1250: 'smashbarpost',
-    1251: 'smashbar',
-    1252: 'barrelexpos',
-    1253: 'camerapickup',
-    1254: 'killfrenzy',
-    1255: 'lounger',
-    1256: 'Stonebench1',
-    1257: 'bustopm',
-    1258: 'Mpostbox1',
-    1259: 'BillBd1',
-    1260: 'BillBd3',
-    1262: 'MTraffic4',
-    1263: 'MTraffic3',
-    1264: 'BlackBag1',
-    1265: 'BlackBag2',
-    1267: 'BillBd2',
-    1269: 'parkingmeter',
-    1270: 'parkingmeterg',
-    1271: 'gunbox',
-    1272: 'property_locked',
-    1273: 'property_fsale',
-    1274: 'bigdollar',
-    1275: 'clothesp',
-    1276: 'package1',
-    1277: 'pickupsave',
-    1278: 'sub_floodlite',
-    1279: 'craigpackage',
-    1280: 'parkbench1',
-    1281: 'parktable1',
-    1282: 'Barrierm',
-    1283: 'MTraffic1',
-    1284: 'MTraffic2',
-    1285: 'newstandnew5',
-    1286: 'newstandnew4',
-    1287: 'newstandnew3',
-    1288: 'newstandnew2',
-    1289: 'newstandnew1',
-    1290: 'lamppost2',
-    1291: 'postbox1',
-    1292: 'postbox1_d',
-    1293: 'papermachn01',
-    1294: 'mlamppost',
-    1295: 'doublestreetlght1',
-    1296: 'doublestreetlght1_d',
-    1297: 'lamppost1',
-    1298: 'lamppost1_d',
-    1299: 'smashboxpile',
-    1300: 'bin1',
-    1301: 'heli_magnet',
-    1302: 'vendmachfd',
-    1303: 'dyn_quarryrock03',
-    1304: 'dyn_quarryrock02',
-    1305: 'dyn_quarryrock01',
-    1306: 'tlgraphpolegen',
-    1307: 'telgrphpoleall',
-    1308: 'telgrphpole02',
-    1309: 'BigBillBrd',
-    1310: 'pikupparachute',
-    1311: 'gen_roadsign1',
-    1312: 'gen_roadsign2',
-    1313: 'killfrenzy2plyr',
-    1314: 'twoplayer',
-    1315: 'trafficlight1',
-    1316: 'hoop',
-    1317: 'Cylinder',
-    1318: 'arrow',
-    1319: 'ws_ref_bollard',
-    1320: 'ws_roadwarning_05',
-    1321: 'ws_roadwarning_01',
-    1322: 'ws_roadwarning_02',
-    1323: 'ws_roadwarning_03',
-    1324: 'ws_roadwarning_04',
-    1327: 'junk_tyre',
-    1328: 'BinNt10_LA',
-    1329: 'BinNt13_LA',
-    1330: 'BinNt14_LA',
-    1331: 'BinNt01_LA',
-    1332: 'BinNt02_LA',
-    1333: 'BinNt03_LA',
-    1334: 'BinNt04_LA',
-    1335: 'BinNt05_LA',
-    1336: 'BinNt06_LA',
-    1337: 'BinNt07_LA',
-    1338: 'BinNt08_LA',
-    1339: 'BinNt09_LA',
-    1340: 'chillidogcart',
-    1341: 'icescart_prop',
-    1342: 'noodlecart_prop',
-    1343: 'CJ_Dumpster3',
-    1344: 'CJ_Dumpster2',
-    1345: 'CJ_Dumpster',
-    1346: 'CJ_PHONE_KIOSK2',
-    1347: 'CJ_WASTEBIN',
-    1348: 'CJ_O2Tanks',
-    1349: 'CJ_SHTROLLY',
-    1350: 'CJ_TRAFFIC_LIGHT4',
-    1351: 'CJ_TRAFFIC_LIGHT5',
-    1352: 'CJ_TRAFFIC_LIGHT3',
-    1353: 'CJ_AIRCON',
-    1354: 'CJ_AIRCON_FAN',
-    1355: 'CJ_FRUITCRATE1',
-    1356: 'CJ_FRUITCRATE2',
-    1357: 'CJ_FRUITCRATE3',
-    1358: 'CJ_SKIP_Rubbish',
-    1359: 'CJ_BIN1',
-    1360: 'CJ_BUSH_PROP3',
-    1361: 'CJ_BUSH_PROP2',
-    1362: 'CJ_FIREBIN',
-    1363: 'CJ_PHONE_KIOSK',
-    1364: 'CJ_BUSH_PROP',
-    1365: 'CJ_BIG_SKIP1',
-    1366: 'CJ_FIREHYDRANT',
-    1367: 'CJ_POSTBOX',
-    1368: 'CJ_BLOCKER_BENCH',
-    1369: 'CJ_WHEELCHAIR1',
-    1370: 'CJ_FLAME_Drum',
-    1371: 'CJ_HIPPO_BIN',
-    1372: 'CJ_Dump2_LOW',
-    1373: 'traincross1',
-    1374: 'traincross2',
-    1375: 'tramstop_SF',
-    1376: 'ContainerCrane_03',
-    1377: 'ContainerCrane_01',
-    1378: 'ContainerCrane_04',
-    1379: 'MagnoCrane_02',
-    1380: 'MagnoCrane_01',
-    1381: 'MagnoCrane_04',
-    1383: 'TwrCrane_M_04',
-    1384: 'TwrCrane_M_01',
-    1386: 'ContainerCrane_02',
-    1387: 'TwrCrane_M_03',
-    1388: 'TwrCrane_S_04',
-    1389: 'TwrCrane_S_01',
-    1390: 'TwrCrane_S_02',
-    1391: 'TwrCrane_S_03',
-    1392: 'TwrCrane_L_04',
-    1393: 'TwrCrane_L_01',
-    1394: 'TwrCrane_L_02',
-    1395: 'TwrCrane_L_03',
-    1407: 'DYN_F_R_WOOD_1',
-    1408: 'DYN_F_WOOD_2',
-    1409: 'CJ_Dump1_LOW',
-    1410: 'DYN_F_R_WOOD_1b',
-    1411: 'DYN_MESH_1',
-    1412: 'DYN_MESH_2',
-    1413: 'DYN_MESH_3',
-    1414: 'DYN_COR_SHEET',
-    1415: 'DYN_DUMPSTER',
-    1416: 'DYN_UNIT',
-    1417: 'DYN_CUPBOARD',
-    1418: 'DYN_F_WOOD_3',
-    1419: 'DYN_F_IRON_1',
-    1420: 'DYN_AIRCON',
-    1421: 'DYN_BOXES',
-    1422: 'DYN_ROADBARRIER_5',
-    1423: 'DYN_ROADBARRIER_4',
-    1424: 'DYN_ROADBARRIER_2',
-    1425: 'DYN_ROADBARRIER_3',
-    1426: 'DYN_SCAFFOLD',
-    1427: 'CJ_ROADBARRIER',
-    1428: 'DYN_LADDER',
-    1429: 'DYN_TV',
-    1430: 'CJ_Dump1_LOW01',
-    1431: 'DYN_BOX_PILE',
-    1432: 'DYN_TABLE_2',
-    1433: 'DYN_TABLE_1',
-    1434: 'DYN_ROADBARRIER_5a',
-    1435: 'DYN_ROADBARRIER_5b',
-    1436: 'DYN_SCAFFOLD_2',
-    1437: 'DYN_LADDER_2',
-    1438: 'DYN_BOX_PILE_2',
-    1439: 'DYN_DUMPSTER_1',
-    1440: 'DYN_BOX_PILE_3',
-    1441: 'DYN_BOX_PILE_4',
-    1442: 'DYN_FIREBIN0',
-    1443: 'DYN_STREET_SIGN_1',
-    1444: 'DYN_STREET_SIGN_2',
-    1445: 'DYN_FF_STAND',
-    1446: 'DYN_F_R_WOOD_4',
-    1447: 'DYN_MESH_4',
-    1448: 'DYN_CRATE_1',
-    1449: 'DYN_CRATE_2',
-    1450: 'DYN_CRATE_3',
-    1451: 'DYN_COUP',
-    1452: 'DYN_OUTHOUSE',
-    1453: 'DYN_H_BALE1',
-    1454: 'DYN_H_BALE2',
-    1455: 'DYN_GLASS',
-    1456: 'DYN_F_R_WOOD_2',
-    1457: 'DYN_OUTHOUSE_2',
-    1458: 'DYN_CART',
-    1459: 'DYN_ROADBARRIER_6',
-    1460: 'DYN_F_R_WOOD_3',
-    1461: 'DYN_LIFE_P',
-    1462: 'DYN_woodpile',
-    1463: 'DYN_WOODPILE2',
-    1464: 'DYN_SCAFFOLD_3',
-    1465: 'DYN_SCAFFOLD_4',
-    1466: 'DYN_SCAFFOLD_5',
-    1467: 'DYN_SCAFFOLD_3b',
-    1468: 'DYN_MESH_05',
-    1469: 'DYN_SCAFFOLD_4b',
-    1470: 'DYN_PORCH_3',
-    1471: 'DYN_PORCH_2',
-    1472: 'DYN_PORCH_1',
-    1473: 'DYN_PORCH_1b',
-    1474: 'DYN_PORCH_2b',
-    1475: 'DYN_PORCH_3b',
-    1476: 'DYN_PORCH_4',
-    1477: 'DYN_PORCH_4b',
-    1478: 'DYN_post_box',
-    1479: 'DYN_GAZ_1',
-    1480: 'DYN_GAZ_2',
-    1481: 'DYN_BAR_B_Q',
-    1482: 'DYN_GARRAGE1',
-    1483: 'DYN_GARRAGE2',
-    1484: 'CJ_BEAR_BOTTLE',
-    1485: 'CJ_CIGGY',
-    1486: 'DYN_BEER_1',
-    1487: 'DYN_WINE_1',
-    1488: 'DYN_SPIRIT_1',
-    1489: 'DYN_SALE_POST',
-    1490: 'tag_01',
-    1491: 'Gen_doorINT01',
-    1492: 'Gen_doorINT02',
-    1493: 'Gen_doorSHOP01',
-    1494: 'Gen_doorINT03',
-    1495: 'Gen_doorEXT01',
-    1496: 'Gen_doorSHOP02',
-    1497: 'Gen_doorEXT02',
-    1498: 'Gen_doorEXT03',
-    1499: 'Gen_doorINT05',
-    1500: 'Gen_doorEXT05',
-    1501: 'Gen_doorEXT04',
-    1502: 'Gen_doorINT04',
-    1503: 'DYN_RAMP',
-    1504: 'Gen_doorEXT06',
-    1505: 'Gen_doorEXT07',
-    1506: 'Gen_doorEXT08',
-    1507: 'Gen_doorEXT09',
-    1508: 'DYN_GARAGE_DOOR',
-    1509: 'DYN_WINE_3',
-    1510: 'DYN_ASHTRY',
-    1511: 'DYN_SPIRIT_02',
-    1512: 'DYN_WINE_03',
-    1513: 'DYN_SWEETIE_TRAY',
-    1514: 'DYN_FF_TILL',
-    1515: 'DYN_SLOT_PROP',
-    1516: 'DYN_TABLE_03',
-    1517: 'DYN_WINE_BREAK',
-    1518: 'DYN_TV_2',
-    1519: 'DYN_SCAFF_cover',
-    1520: 'DYN_WINE_BOUNCE',
-    1521: 'DYN_SCAFF2_cover',
-    1522: 'Gen_doorSHOP3',
-    1523: 'Gen_doorEXT10',
-    1524: 'tag_front',
-    1525: 'tag_kilo',
-    1526: 'tag_rifa',
-    1527: 'tag_rollin',
-    1528: 'tag_seville',
-    1529: 'tag_temple',
-    1530: 'tag_vagos',
-    1531: 'tag_azteca',
-    1532: 'Gen_doorEXT11',
-    1533: 'Gen_doorEXT12',
-    1534: 'CJ_WIN_POP2',
-    1535: 'Gen_doorEXT14',
-    1536: 'Gen_doorEXT15',
-    1537: 'Gen_doorEXT16',
-    1538: 'sl_dtdoor1',
-    1539: 'lamotsig1_LACJ',
-    1540: 'vegasmotsignCJ',
-    1541: 'CJ_BEER_TAPS_1',
-    1542: 'CJ_BEER_TAPS_2',
-    1543: 'CJ_BEER_B_2',
-    1544: 'CJ_BEER_B_1',
-    1545: 'CJ_B_OPTIC1',
-    1546: 'CJ_PINT_GLASS',
-    1547: 'CJ_B_PISH_T',
-    1548: 'CJ_DRIP_TRAY',
-    1549: 'CJ_ASHTRAY_b',
-    1550: 'CJ_MONEY_BAG',
-    1551: 'DYN_WINE_BIG',
-    1552: 'vegasmashfnce',
-    1553: 'vegasmashfnce_Gate',
-    1554: 'CJ_WATER_BARRIER',
-    1555: 'Gen_doorEXT17',
-    1556: 'Gen_doorEXT18',
-    1557: 'Gen_doorEXT19',
-    1558: 'CJ_CARDBRD_PICKUP',
-    1559: 'diamond_3',
-    1560: 'Gen_doorEXT7_11L',
-    1561: 'Gen_doorEXT7_11R',
-    1562: 'ab_jetseat',
-    1563: 'ab_jetseat_hrest',
-    1564: 'ab_jetLiteGlass',
-    1565: 'ab_jetLite',
-    1566: 'CJ_WS_DOOR',
-    1567: 'Gen_wardrobe',
-    1568: 'chinalamp_sf',
-    1569: 'ADAM_V_DOOR',
-    1570: 'CJ_NOODLE_3',
-    1571: 'CJ_NOODLE_1',
-    1572: 'CJ_AIR_TROLLY',
-    1574: 'trashcan',
-    1575: 'drug_white',
-    1576: 'drug_orange',
-    1577: 'drug_yellow',
-    1578: 'drug_green',
-    1579: 'drug_blue',
-    1580: 'drug_red',
-    1581: 'keycard',
-    1582: 'pizzabox',
-    1583: 'tar_gun2',
-    1584: 'tar_gun1',
-    1585: 'tar_civ2',
-    1586: 'tar_civ1',
-    1587: 'tar_frame',
-    1588: 'tar_top',
-    1589: 'tar_upright',
-    1590: 'tar_upleft',
-    1591: 'tar_downleft',
-    1592: 'tar_downright',
-    1593: 'plc_stinger',
-    1594: 'chairsntable',
-    1595: 'satdishbig',
-    1596: 'satdishsml',
-    1597: 'cntrlrsac1',
-    1598: 'beachball',
-    1599: 'fish1single',
-    1600: 'fish2single',
-    1601: 'fish3s',
-    1602: 'jellyfish',
-    1603: 'jellyfish01',
-    1604: 'fish3single',
-    1605: 'fish1s',
-    1606: 'fish2s',
-    1607: 'dolphin',
-    1608: 'shark',
-    1609: 'turtle',
-    1610: 'sandcastle1',
-    1611: 'sandcastle2',
-    1612: 'submarine',
-    1613: 'nt_firehose_01',
-    1614: 'nt_alarm1_01',
-    1615: 'nt_alarm2_01',
-    1616: 'nt_securecam1_01',
-    1617: 'nt_aircon1_01',
-    1618: 'nt_aircon1_02',
-    1619: 'nt_vent1_01',
-    1620: 'nt_vent2_01',
-    1621: 'nt_vent3_01',
-    1622: 'nt_securecam2_01',
-    1623: 'nt_aircon3_01',
-    1624: 'nt_cablebox1_01',
-    1625: 'nt_cablebox2_01',
-    1626: 'nt_cablebox3_01',
-    1627: 'nt_alarm3_01',
-    1628: 'nt_cablebox4_01',
-    1629: 'nt_cablebox5_01',
-    1630: 'nt_cablebox6_01',
-    1631: 'waterjump2',
-    1632: 'waterjump1',
-    1633: 'landjump',
-    1634: 'landjump2',
-    1635: 'nt_aircon1dbl',
-    1636: 'rcbomb',
-    1637: 'od_pat_hutb',
-    1638: 'od_pat_hut',
-    1639: 'od_vbnet',
-    1640: 'beachtowel04',
-    1641: 'beachtowel03',
-    1642: 'beachtowel02',
-    1643: 'beachtowel01',
-    1644: 'lotion',
-    1645: 'lounge_wood_up',
-    1646: 'lounge_towel_up',
-    1647: 'lounge_wood_dn',
-    1648: 'od_groyne01',
-    1649: 'wglasssmash',
-    1650: 'petrolcanm',
-    1651: 'od_copwindows',
-    1652: 'fencehaiti',
-    1653: 'fencehaitism',
-    1654: 'dynamite',
-    1655: 'waterjumpx2',
-    1656: 'Esc_step',
-    1660: 'ramp',
-    1662: 'nt_roadblockCI',
-    1663: 'swivelchair_B',
-    1664: 'propwinebotl2',
-    1665: 'propashtray1',
-    1666: 'propbeerglass1',
-    1667: 'propwineglass1',
-    1668: 'propvodkabotl1',
-    1669: 'propwinebotl1',
-    1670: 'propcollecttable',
-    1671: 'swivelchair_A',
-    1672: 'Gasgrenade',
-    1673: 'roadsign',
-    1675: 'wshxrefhse1',
-    1676: 'washgaspump',
-    1677: 'wshxrefhse2',
-    1679: 'chairsntableml',
-    1681: 'ap_learjet1_01',
-    1682: 'ap_radar1_01',
-    1683: 'ap_jumbo_01',
-    1684: 'portakabin',
-    1685: 'blockpallet',
-    1686: 'petrolpumpnew',
-    1687: 'gen_roofbit1',
-    1688: 'gen_roofbit2',
-    1689: 'gen_roofbit3',
-    1690: 'gen_roofbit4',
-    1691: 'gen_roofbit5',
-    1692: 'roofstuff18',
-    1693: 'roofstuff12',
-    1694: 'roofstuff13',
-    1695: 'roofstuff14',
-    1696: 'roofstuff15',
-    1697: 'roofstuff16',
-    1698: 'Esc_step8',
-    1700: 'kb_bed_test1',
-    1701: 'kb_bed_test2',
-    1702: 'kb_couch06',
-    1703: 'kb_couch02',
-    1704: 'kb_chair03',
-    1705: 'kb_chair04',
-    1706: 'kb_couch03',
-    1707: 'kb_couch01',
-    1708: 'kb_chair02',
-    1709: 'kb_couch08',
-    1710: 'kb_couch07',
-    1711: 'kb_chair01',
-    1712: 'kb_couch05',
-    1713: 'kb_couch04',
-    1714: 'kb_swivelchair1',
-    1715: 'kb_swivelchair2',
-    1716: 'kb_slot_stool',
-    1717: 'telly_low_test',
-    1718: 'snesish',
-    1719: 'LOW_CONSOLE',
-    1720: 'rest_chair',
-    1721: 'est_chair1',
-    1722: 'off_chairnu',
-    1723: 'mrk_seating1',
-    1724: 'mrk_seating1b',
-    1725: 'mrk_bed1',
-    1726: 'mrk_seating2',
-    1727: 'mrk_seating2b',
-    1728: 'mrk_seating3',
-    1729: 'mrk_seating3b',
-    1730: 'SWANK_CABINET_3',
-    1731: 'CJ_MLIGHT3',
-    1732: 'CJ_Juke_Box',
-    1733: 'CJ_WASHINGMAC',
-    1734: 'CJ_MLIGHT2',
-    1735: 'CJ_EASYCHAIR1',
-    1736: 'CJ_Stags_head',
-    1737: 'MED_DINNING_5',
-    1738: 'CJ_Radiator_old',
-    1739: 'SWANK_DIN_CHAIR_5',
-    1740: 'LOW_CABINET_3',
-    1741: 'LOW_CABINET_1',
-    1742: 'Med_BOOKSHELF',
-    1743: 'MED_CABINET_3',
-    1744: 'MED_SHELF',
-    1745: 'MED_BED_3',
-    1746: 'SWANK_1_FootStool',
-    1747: 'LOW_TV_2',
-    1748: 'LOW_TV_3',
-    1749: 'MED_TV_3',
-    1750: 'MED_TV_2',
-    1751: 'MED_TV_4',
-    1752: 'SWANK_TV_3',
-    1753: 'SWANK_COUCH_1',
-    1754: 'SWANK_SINGLE_1',
-    1755: 'MED_SINGLE_2',
-    1756: 'LOW_COUCH_4',
-    1757: 'LOW_COUCH_5',
-    1758: 'LOW_SINGLE_4',
-    1759: 'LOW_SINGLE_1',
-    1760: 'MED_COUCH_2',
-    1761: 'SWANK_COUCH_2',
-    1762: 'SWANK_SINGLE_2',
-    1763: 'LOW_COUCH_1',
-    1764: 'LOW_COUCH_2',
-    1765: 'LOW_SINGLE_2',
-    1766: 'MED_COUCH_1',
-    1767: 'MED_SINGLE_1',
-    1768: 'LOW_COUCH_3',
-    1769: 'LOW_SINGLE_3',
-    1770: 'LOW_DINNING_2',
-    1771: 'CJ_bunk_bed1',
-    1772: 'CJ_HOT_DOG1',
-    1773: 'CJ_COOKER2',
-    1774: 'CJ_Monketshopsign',
-    1775: 'CJ_SPRUNK1',
-    1776: 'CJ_CANDYVENDOR',
-    1777: 'CJ_COOKER1',
-    1778: 'CJ_MOP_PAIL',
-    1779: 'CJ_TICKETMACHINE',
-    1780: 'CJ_THIN_FRIGE',
-    1781: 'MED_TV_1',
-    1782: 'MED_VIDEO_2',
-    1783: 'SWANK_VIDEO_2',
-    1784: 'LOW_VIDEO_2',
-    1785: 'LOW_VIDEO_1',
-    1786: 'SWANK_TV_4',
-    1787: 'MED_VIDEO_1',
-    1788: 'SWANK_VIDEO_1',
-    1789: 'CJ_chambermaid',
-    1790: 'SWANK_VIDEO_3',
-    1791: 'SWANK_TV_2',
-    1792: 'SWANK_TV_1',
-    1793: 'LOW_BED_2',
-    1794: 'LOW_BED_3',
-    1795: 'SWANK_BED_2',
-    1796: 'LOW_BED_4',
-    1797: 'SWANK_BED_3',
-    1798: 'SWANK_BED_1',
-    1799: 'MED_BED_4',
-    1800: 'LOW_BED_1',
-    1801: 'SWANK_BED_4',
-    1802: 'MED_BED_2',
-    1803: 'MED_BED_7',
-    1804: 'MED_BED_1',
-    1805: 'CJ_BARSTOOL',
-    1806: 'MED_OFFICE_CHAIR',
-    1807: 'CJ_MEDIUMPOTS1',
-    1808: 'CJ_WATERCOOLER2',
-    1809: 'MED_HI_FI',
-    1810: 'CJ_FOLDCHAIR',
-    1811: 'MED_DIN_CHAIR_5',
-    1812: 'LOW_BED_5',
-    1813: 'COFFEE_LOW_5',
-    1814: 'COFFEE_MED_1',
-    1815: 'COFFEE_LOW_2',
-    1816: 'COFFEE_LOW_3',
-    1817: 'COFFEE_MED_2',
-    1818: 'COFFEE_SWANK_2',
-    1819: 'COFFEE_SWANK_4',
-    1820: 'COFFEE_LOW_4',
-    1821: 'COFFEE_LOW_1',
-    1822: 'COFFEE_SWANK_6',
-    1823: 'COFFEE_MED_5',
-    1824: 'craps_table',
-    1825: 'kb_table_chairs1',
-    1826: 'kb_table1',
-    1827: 'man_sdr_tables',
-    1828: 'man_sdr_rug',
-    1829: 'man_safenew',
-    1830: 'kb_bandit1',
-    1831: 'kb_bandit2',
-    1832: 'kb_bandit3',
-    1833: 'kb_bandit4',
-    1834: 'kb_bandit6',
-    1835: 'kb_bandit5',
-    1836: 'kb_bandit7',
-    1837: 'kb_bandit9',
-    1838: 'kb_bandit11',
-    1839: 'k_hifi_1',
-    1840: 'speaker_2',
-    1841: 'speaker_1',
-    1842: 'shop_shelf05',
-    1843: 'shop_shelf02',
-    1844: 'shop_shelf03',
-    1845: 'shop_shelf10',
-    1846: 'shop_shelf04',
-    1847: 'shop_shelf06',
-    1848: 'shop_shelf07',
-    1849: 'shop_shelf09',
-    1850: 'shop_shelf08',
-    1851: 'dice1',
-    1852: 'dice02',
-    1853: 'pkr_chp_hi04',
-    1854: 'pkr_chp_hi05',
-    1855: 'pkr_chp_hi03',
-    1856: 'pkr_chp_hi02',
-    1857: 'pkr_chp_hi01',
-    1858: 'pkr_chp_hi06',
-    1859: 'pkr_chp_med04',
-    1860: 'pkr_chp_med06',
-    1861: 'pkr_chp_med05',
-    1862: 'pkr_chp_med03',
-    1863: 'pkr_chp_med02',
-    1864: 'pkr_chp_med01',
-    1865: 'pkr_chplo06',
-    1866: 'pkr_chplo05',
-    1867: 'pkr_chplo04',
-    1868: 'pkr_chplo03',
-    1869: 'pkr_chplo02',
-    1870: 'pkr_chplo01',
-    1871: 'pkr_chp_vlo04',
-    1872: 'pkr_chp_vlo01',
-    1873: 'pkr_chp_vlo02',
-    1874: 'pkr_chp_vlo03',
-    1875: 'pkr_chp_vlo05',
-    1876: 'pkr_chp_vlo06',
-    1877: 'chip_stack02',
-    1878: 'chip_stack03',
-    1879: 'chip_stack04',
-    1880: 'chip_stack05',
-    1881: 'chip_stack06',
-    1882: 'chip_stack01',
-    1883: 'shop_shelf01',
-    1884: 'shop_dblshlf',
-    1885: 'shop_baskets',
-    1886: 'shop_sec_cam',
-    1887: 'shop_shelf11',
-    1888: 'shop_shelf12',
-    1889: 'shop_dblshlf01',
-    1890: 'shop_dblshlf02',
-    1891: 'shop_dblshlf03',
-    1892: 'security_gatsh',
-    1893: 'shoplight1',
-    1894: 'garys_luv_ramp',
-    1895: 'wheel_o_fortune',
-    1896: 'wheel_table',
-    1897: 'wheel_support',
-    1898: 'clicker',
-    1899: 'pkr_chp_vlo07',
-    1900: 'pkr_chplo07',
-    1901: 'chip_stack07',
-    1902: 'chip_stack08',
-    1903: 'chip_stack09',
-    1904: 'chip_stack10',
-    1905: 'pkr_chplo08',
-    1906: 'pkr_chplo09',
-    1907: 'pkr_chplo10',
-    1908: 'pkr_chplo11',
-    1909: 'pkr_chp_vlo08',
-    1910: 'pkr_chp_vlo09',
-    1911: 'chip_stack11',
-    1912: 'pkr_chp_vlo10',
-    1913: 'pkr_chp_vlo11',
-    1914: 'pkr_chp_vlo12',
-    1915: 'pkr_chp_med07',
-    1916: 'pkr_chp_med08',
-    1917: 'pkr_chp_med09',
-    1918: 'pkr_chp_med10',
-    1919: 'pkr_chplo12',
-    1920: 'pkr_chp_med11',
-    1921: 'chip_stack12',
-    1922: 'pkr_chp_med12',
-    1923: 'pkr_chp_hi07',
-    1924: 'pkr_chp_hi08',
-    1925: 'pkr_chp_hi09',
-    1926: 'pkr_chp_hi10',
-    1927: 'pkr_chp_hi11',
-    1928: 'pkr_chp_hi12',
-    1929: 'wheel_wee01',
-    1930: 'chip_stack13',
-    1931: 'chip_stack14',
-    1932: 'chip_stack15',
-    1933: 'chip_stack16',
-    1934: 'pkr_chp_hi13',
-    1935: 'pkr_chp_hi14',
-    1936: 'pkr_chp_hi15',
-    1937: 'pkr_chp_hi16',
-    1938: 'pkr_chp_hi17',
-    1939: 'pkr_chp_hi18',
-    1940: 'chip_stack18',
-    1941: 'chip_stack17',
-    1942: 'kg50',
-    1943: 'kg20',
-    1944: 'kg10',
-    1945: 'kg5',
-    1946: 'baskt_ball_hi',
-    1947: 'CHIPS_TEMP',
-    1948: 'slot_4chris',
-    1949: 'barrier_4andy',
-    1950: 'kb_beer',
-    1951: 'kb_beer01',
-    1952: 'turn_arm_R',
-    1953: 'turn_plater_R',
-    1954: 'turn_table_R',
-    1955: 'turn_armL',
-    1956: 'turn_platerL',
-    1957: 'turn_tableL',
-    1958: 'mxr_mix_body',
-    1959: 'shop_till',
-    1960: 'record2',
-    1961: 'record3',
-    1962: 'record1',
-    1963: 'est_desk',
-    1964: 'est_dsk_stuf',
-    1965: 'imcmptrkdrl_LAS',
-    1966: 'imcompmovedr1_las',
-    1967: 'imcmptrkdrr_LAS',
-    1968: 'dinerseat_2',
-    1969: 'dinerseat_3',
-    1970: 'dinerseat_1',
-    1971: 'kb_flykiller',
-    1972: 'kb_cuntopdisp2',
-    1973: 'kb_cuntopdisp1',
-    1974: 'kb_golfball',
-    1975: 'e_test',
-    1976: 'w_test',
-    1977: 'vendin3',
-    1978: 'roulette_tbl',
-    1979: 'wheel_wee',
-    1980: 'wilshire7dr1_law',
-    1981: 'shlf1_cab_mid',
-    1982: 'shlf2_cab_mid',
-    1983: 'shlf4_cab_mid',
-    1984: 'shlf5_till',
-    1985: 'punchbagnu',
-    1986: 'shlf2_cab_rt',
-    1987: 'shlf4_cablft',
-    1988: 'shlf4_cab_rt',
-    1989: 'kb_coolerlft2',
-    1990: 'kb_coolerlft',
-    1991: 'shlf1_cablft1',
-    1992: 'shlf2_cablft',
-    1993: 'shlf3_cab_mid2',
-    1994: 'shlf3_cablft',
-    1995: 'shlf3_cab_rt',
-    1996: 'shlf1_cab_rt',
-    1997: 'hos_trolley',
-    1998: 'officedesk1l',
-    1999: 'officedesk2',
-    2000: 'filing_cab_nu',
-    2001: 'nu_plant_ofc',
-    2002: 'water_coolnu',
-    2003: 'cr_safe_body',
-    2004: 'cr_safe_door',
-    2005: 'cr_safe_cash',
-    2006: 'cr_safe_dial',
-    2007: 'filing_cab_nu01',
-    2008: 'officedesk1',
-    2009: 'officedesk2l',
-    2010: 'nu_plant3_ofc',
-    2011: 'nu_plant2_ofc',
-    2012: 'shop_shelf13',
-    2013: 'kit_cab_sink',
-    2014: 'kit_cab_mid',
-    2015: 'kit_cab_rght',
-    2016: 'kit_cab_lft',
-    2017: 'kit_cab_cookr',
-    2018: 'kit_cab_washin',
-    2019: 'kit_cab_frdg',
-    2020: 'mrk_sidebrd1',
-    2021: 'mrk_bdsdecab1',
-    2022: 'kit_cab_crnr',
-    2023: 'mrk_stnd_lmp',
-    2024: 'mrk_liv_tble',
-    2025: 'mrk_wrobe_tmp',
-    2026: 'mrk_shade_tmp',
-    2027: 'dinerseat_4',
-    2028: 'SWANK_CONSOLE',
-    2029: 'SWANK_DINNING_1',
-    2030: 'MED_DINNING_1',
-    2031: 'MED_DINNING_3',
-    2032: 'MED_DINNING_2',
-    2033: 'CJ_sawnoff2',
-    2034: 'CJ_sawnoff',
-    2035: 'CJ_M16',
-    2036: 'CJ_psg1',
-    2037: 'CJ_PISTOL_AMMO',
-    2038: 'AMMO_BOX_S2',
-    2039: 'AMMO_BOX_S1',
-    2040: 'AMMO_BOX_M1',
-    2041: 'AMMO_BOX_M2',
-    2042: 'AMMO_BOX_M3',
-    2043: 'AMMO_BOX_M4',
-    2044: 'CJ_MP5K',
-    2045: 'CJ_BBAT_NAILS',
-    2046: 'CJ_GUNCUPBOARD',
-    2047: 'CJ_FLAG1',
-    2048: 'CJ_FLAG2',
-    2049: 'CJ_TARGET1',
-    2050: 'CJ_TARGET2',
-    2051: 'CJ_TARGET4',
-    2052: 'CJ_TOMMY_HAT',
-    2053: 'CJ_JERRY_HAT',
-    2054: 'CJ_CAPT_HAT',
-    2055: 'CJ_TARGET5',
-    2056: 'CJ_TARGET6',
-    2057: 'Flame_tins',
-    2058: 'CJ_Gun_docs',
-    2059: 'CJ_GUNSTUFF1',
-    2060: 'CJ_SANDBAG',
-    2061: 'CJ_SHELLS1',
-    2062: 'CJ_OilDrum2',
-    2063: 'CJ_GREENSHELVES',
-    2064: 'CJ_FEILDGUN',
-    2065: 'CJ_M_FILEING1',
-    2066: 'CJ_M_FILEING2',
-    2067: 'CJ_M_FILEING3',
-    2068: 'CJ_cammo_NET',
-    2069: 'CJ_MLIGHT7',
-    2070: 'CJ_MLIGHT6',
-    2071: 'CJ_MLIGHT5',
-    2072: 'CJ_MLIGHT4',
-    2073: 'CJ_MLIGHT1',
-    2074: 'CJ_MLIGHT8',
-    2075: 'CJ_MLIGHT9',
-    2076: 'CJ_MLIGHT10',
-    2077: 'CJ_MLIGHT11',
-    2078: 'SWANK_CABINET_1',
-    2079: 'SWANK_DIN_CHAIR_2',
-    2080: 'SWANK_DINNING_2',
-    2081: 'COFFEE_SWANK_3',
-    2082: 'COFFEE_MED_3',
-    2083: 'COFFEE_MED_4',
-    2084: 'MED_CABINET_1',
-    2085: 'SWANK_DINNING_3',
-    2086: 'SWANK_DINNING_4',
-    2087: 'MED_CABINET_2',
-    2088: 'LOW_CABINET_4',
-    2089: 'SWANK_CABINET_2',
-    2090: 'SWANK_BED_5',
-    2091: 'TV_WARD_Med_1',
-    2092: 'SWANK_CABINET_5',
-    2093: 'TV_WARD_Low',
-    2094: 'SWANK_CABINET_4',
-    2095: 'LOW_CABINET_2',
-    2096: 'CJ_RockingChair',
-    2097: 'Bath_high',
-    2098: 'CJ_SLOTCOVER1',
-    2099: 'MED_HI_FI_1',
-    2100: 'MED_HI_FI_2',
-    2101: 'MED_HI_FI_3',
-    2102: 'LOW_HI_FI_2',
-    2103: 'LOW_HI_FI_1',
-    2104: 'SWANK_HI_FI',
-    2105: 'CJ_MLIGHT14',
-    2106: 'CJ_MLIGHT15',
-    2107: 'CJ_MLIGHT12',
-    2108: 'CJ_MLIGHT13',
-    2109: 'LOW_DINNING_3',
-    2110: 'LOW_DINNING_4',
-    2111: 'LOW_DINNING_5',
-    2112: 'MED_DINNING_4',
-    2113: 'baskgamenet',
-    2114: 'basketball',
-    2115: 'LOW_DINNING_1',
-    2116: 'LOW_DINNING_6',
-    2117: 'SWANK_DINNING_5',
-    2118: 'SWANK_DINNING_6',
-    2119: 'MED_DINNING_6',
-    2120: 'MED_DIN_CHAIR_4',
-    2121: 'LOW_DIN_CHAIR_2',
-    2122: 'SWANK_DIN_CHAIR_3',
-    2123: 'SWANK_DIN_CHAIR_4',
-    2124: 'SWANK_DIN_CHAIR_1',
-    2125: 'MED_DIN_CHAIR_1',
-    2126: 'COFFEE_SWANK_5',
-    2127: 'CJ_K1_FRIDGE_UNIT',
-    2128: 'CJ_K1_TALL_UNIT',
-    2129: 'CJ_K1_LOW_UNIT',
-    2130: 'CJ_K1_SINK',
-    2131: 'CJ_KITCH2_FRIDGE',
-    2132: 'CJ_KITCH2_SINK',
-    2133: 'CJ_KITCH2_R',
-    2134: 'CJ_KITCH2_M',
-    2135: 'CJ_K3_COOKER',
-    2136: 'CJ_K3_SINK',
-    2137: 'CJ_K3_LOW_UNIT3',
-    2138: 'CJ_K3_LOW_UNIT1',
-    2139: 'CJ_K3_LOW_UNIT2',
-    2140: 'CJ_K3_TALL_UNIT1',
-    2141: 'CJ_KITCH2_L',
-    2142: 'CJ_K4_LOW_UNIT2',
-    2143: 'CJ_K4_LOW_UNIT1',
-    2144: 'CJ_COOKER3',
-    2145: 'CJ_K3_UNIT06',
-    2146: 'CJ_TROLLY1',
-    2147: 'CJ_KITCH1_FRIDGE',
-    2148: 'CJ_K4_LOW_UNIT03',
-    2149: 'CJ_MICROWAVE1',
-    2150: 'CJ_SINK1',
-    2151: 'CJ_K5_LOW_UNIT2',
-    2152: 'CJ_K5_LOW_UNIT3',
-    2153: 'CJ_K5_UNIT1',
-    2154: 'CJ_K5_LOW_UNIT1',
-    2155: 'CJ_K5_LOW_UNIT4',
-    2156: 'CJ_K6_LOW_UNIT1',
-    2157: 'CJ_K6_LOW_UNIT2',
-    2158: 'CJ_KITCH1_L',
-    2159: 'CJ_K6_LOW_UNIT4',
-    2160: 'CJ_K6_LOW_UNIT3',
-    2161: 'MED_OFFICE_UNIT_4',
-    2162: 'MED_OFFICE_UNIT_1',
-    2163: 'MED_OFFICE_UNIT_2',
-    2164: 'MED_OFFICE_UNIT_5',
-    2165: 'MED_OFFICE_DESK_1',
-    2166: 'MED_OFFICE_DESK_2',
-    2167: 'MED_OFFICE_UNIT_7',
-    2168: 'partition',
-    2169: 'MED_OFFICE3_DESK_1',
-    2170: 'CJ_KITCH1_COOKER',
-    2171: 'MED_OFFICE4_DESK_1',
-    2172: 'MED_OFFICE2_DESK_1',
-    2173: 'MED_OFFICE_DESK_3',
-    2174: 'MED_OFFICE4_DESK_2',
-    2175: 'MED_OFFICE4_DESK_3',
-    2176: 'Casino_light4',
-    2177: 'Casino_light3',
-    2178: 'Casino_light2',
-    2179: 'Casino_light1',
-    2180: 'MED_OFFICE5_DESK_3',
-    2181: 'MED_OFFICE5_DESK_2',
-    2182: 'MED_OFFICE5_DESK_1',
-    2183: 'MED_OFFICE3_DESK_09',
-    2184: 'MED_OFFICE6_DESK_2',
-    2185: 'MED_OFFICE6_DESK_1',
-    2186: 'PHOTOCOPIER_1',
-    2187: 'partition2',
-    2188: 'blck_jack',
-    2189: 'poker_tbl',
-    2190: 'PC_1',
-    2191: 'MED_OFFICE2_CAB',
-    2192: 'FAN_1',
-    2193: 'MED_OFFICE2_DESK_2',
-    2194: 'Plant_Pot_2',
-    2195: 'Plant_Pot_3',
-    2196: 'WORK_LAMP1',
-    2197: 'FILLING_CABINET',
-    2198: 'MED_OFFICE2_DESK_3',
-    2199: 'MED_OFFICE6_MC_1',
-    2200: 'MED_OFFICE5_UNIT_1',
-    2201: 'PRINTER_1',
-    2202: 'PHOTOCOPIER_2',
-    2203: 'Plant_Pot_1',
-    2204: 'MED_OFFICE8_CABINET',
-    2205: 'MED_OFFICE8_DESK_1',
-    2206: 'MED_OFFICE8_DESK_02',
-    2207: 'MED_OFFICE7_DESK_1',
-    2208: 'MED_OFFICE7_UNIT_1',
-    2209: 'MED_OFFICE9_DESK_1',
-    2210: 'MED_OFFICE9_UNIT_1',
-    2211: 'MED_OFFICE9_UNIT_2',
-    2212: 'burgerhigh',
-    2213: 'burgerlow',
-    2214: 'burgermed',
-    2215: 'clucklow',
-    2216: 'cluckmed',
-    2217: 'cluckhigh',
-    2218: 'pizzalow',
-    2219: 'pizzamed',
-    2220: 'pizzahigh',
-    2221: 'rustylow',
-    2222: 'rustyhigh',
-    2223: 'rustymed',
-    2224: 'CJ_Sphere_TV',
-    2225: 'SWANK_HI_FI_2',
-    2226: 'LOW_HI_FI_3',
-    2227: 'SWANK_HI_FI_3',
-    2228: 'CJ_SHOVEL',
-    2229: 'SWANK_SPEAKER',
-    2230: 'SWANK_SPEAKER_2',
-    2231: 'SWANK_SPEAKER_3',
-    2232: 'MED_SPEAKER_4',
-    2233: 'SWANK_SPEAKER_4',
-    2234: 'COFFEE_LOW_6',
-    2235: 'COFFEE_MED_6',
-    2236: 'COFFEE_SWANK_1',
-    2237: 'CJ_SHOVEL2',
-    2238: 'CJ_LAVA_LAMP',
-    2239: 'CJ_MLIGHT16',
-    2240: 'Plant_Pot_8',
-    2241: 'Plant_Pot_5',
-    2242: 'Plant_Pot_7',
-    2243: 'Plant_Pot_6',
-    2244: 'Plant_Pot_9',
-    2245: 'Plant_Pot_11',
-    2246: 'Plant_Pot_14',
-    2247: 'Plant_Pot_15',
-    2248: 'Plant_Pot_16',
-    2249: 'Plant_Pot_18',
-    2250: 'Plant_Pot_19',
-    2251: 'Plant_Pot_20',
-    2252: 'Plant_Pot_21',
-    2253: 'Plant_Pot_22',
-    2254: 'Frame_Clip_1',
-    2255: 'Frame_Clip_2',
-    2256: 'Frame_Clip_3',
-    2257: 'Frame_Clip_4',
-    2258: 'Frame_Clip_5',
-    2259: 'Frame_Clip_6',
-    2260: 'Frame_SLIM_1',
-    2261: 'Frame_SLIM_2',
-    2262: 'Frame_SLIM_3',
-    2263: 'Frame_SLIM_4',
-    2264: 'Frame_SLIM_5',
-    2265: 'Frame_SLIM_6',
-    2266: 'Frame_WOOD_5',
-    2267: 'Frame_WOOD_3',
-    2268: 'Frame_WOOD_2',
-    2269: 'Frame_WOOD_4',
-    2270: 'Frame_WOOD_6',
-    2271: 'Frame_WOOD_1',
-    2272: 'Frame_Fab_5',
-    2273: 'Frame_Fab_1',
-    2274: 'Frame_Fab_6',
-    2275: 'Frame_Fab_4',
-    2276: 'Frame_Fab_3',
-    2277: 'Frame_Fab_2',
-    2278: 'Frame_Thick_2',
-    2279: 'Frame_Thick_6',
-    2280: 'Frame_Thick_1',
-    2281: 'Frame_Thick_5',
-    2282: 'Frame_Thick_4',
-    2283: 'Frame_Thick_3',
-    2284: 'Frame_6',
-    2285: 'Frame_1',
-    2286: 'Frame_5',
-    2287: 'Frame_4',
-    2288: 'Frame_3',
-    2289: 'Frame_2',
-    2290: 'SWK_COUCH_1',
-    2291: 'SWK_SINGLE_1',
-    2292: 'SWK_SINGLE_1b',
-    2293: 'SWK_1_FStool',
-    2294: 'CJ_K_COOKER1',
-    2295: 'CJ_BEANBAG',
-    2296: 'TV_UNIT_1',
-    2297: 'TV_UNIT_2',
-    2298: 'SWANK_BED_7',
-    2299: 'SWANK_BED_6',
-    2300: 'MED_BED_8',
-    2301: 'MED_BED_9',
-    2302: 'LOW_BED_06',
-    2303: 'CJ_K3_WASH_MAC',
-    2304: 'CJ_K1_LOW_CORNER',
-    2305: 'CJ_K3_C_UNIT',
-    2306: 'SWANK_CABINET_4D',
-    2307: 'SWANK_CABINET_4b',
-    2308: 'MED_OFFICE4_DESK_4',
-    2309: 'MED_OFFICE_CHAIR2',
-    2310: 'MIKE_DIN_CHAIR',
-    2311: 'CJ_TV_TABLE2',
-    2312: 'CJ_TELE_2',
-    2313: 'CJ_TV_TABLE1',
-    2314: 'CJ_TV_TABLE3',
-    2315: 'CJ_TV_TABLE4',
-    2316: 'CJ_TELE_4',
-    2317: 'CJ_TELE_3',
-    2318: 'CJ_TELE_1',
-    2319: 'CJ_TV_TABLE5',
-    2320: 'CJ_TELE_5',
-    2321: 'CJ_TV_TABLE6',
-    2322: 'CJ_TELE_6',
-    2323: 'CJ_BEDROOM1',
-    2324: 'reel2',
-    2325: 'kb_bandit_U',
-    2326: 'reel3',
-    2327: 'reel1',
-    2328: 'LOW_CABINET_1_S',
-    2329: 'LOW_CABINET_1_L',
-    2330: 'CJ_BEDROOM1_W',
-    2331: 'CJ_BED_FURN_1',
-    2332: 'KEV_SAFE',
-    2333: 'CJ_BED_FURN_1b',
-    2334: 'CJ_KITCH1_M',
-    2335: 'CJ_KITCH1_R',
-    2336: 'CJ_KITCH1_SINK',
-    2337: 'CJ_KITCH1_WASHER',
-    2338: 'CJ_KITCH1_CORNER',
-    2339: 'CJ_KITCH2_COOKER',
-    2340: 'CJ_KITCH2_WASHER',
-    2341: 'CJ_KITCH2_CORNER',
-    2342: 'donut_disp',
-    2343: 'CJ_BARB_CHAIR_2',
-    2344: 'CJ_REMOTE',
-    2345: 'Plant_Pot_23',
-    2346: 'CJ_HIFI_TABLE',
-    2347: 'CJ_Wheel_1',
-    2348: 'CJ_Wheel_02',
-    2349: 'CJ_Wheel_03',
-    2350: 'CJ_BARSTOOL_2',
-    2351: 'CJ_DYN_PLUNGE_1',
-    2352: 'CJ_DYN_PLUNGE_2',
-    2353: 'cluck_healthy',
-    2354: 'burger_healthy',
-    2355: 'pizza_healthy',
-    2356: 'police_OFF_CHAIR',
-    2357: 'DUNC_DINNING',
-    2358: 'AMMO_BOX_c2',
-    2359: 'AMMO_BOX_c5',
-    2360: 'CJ_ICE_FRIDGE_2',
-    2361: 'CJ_ICE_FRIDGE_1',
-    2362: 'CJ_SWEETIE_TRAY_1',
-    2363: 'CJ_SHOP_SIGN_1',
-    2364: 'CJ_SHOP_SIGN_2',
-    2365: 'SHOPPING_BASKET',
-    2366: 'CJ_DUDS_RAIL',
-    2367: 'Shop_counter_2',
-    2368: 'Shop_counter_1',
-    2369: 'CJ_Till',
-    2370: 'Shop_set_1_Table',
-    2371: 'CLOTHES_RAIL',
-    2372: 'CLOTHES_RAIL2',
-    2373: 'CLOTHES_RAIL3',
-    2374: 'CJ_Tshirt',
-    2375: 'Shop_set_2_Unit1',
-    2376: 'Shop_set_2_Unit2',
-    2377: 'CJ_jean_dark',
-    2378: 'CJ_jean_light',
-    2379: 'Shop_set_2_Unit3',
-    2380: 'CJ_Suits',
-    2381: 'CJ_8_SWEATER',
-    2382: 'CJ_8_JEANS_Light',
-    2383: 'CJ_6_SWEATER',
-    2384: 'CJ_8_JEANS_DARK',
-    2385: 'Shop_set_2_Unit4',
-    2386: 'CJ_SWEATER_F_1',
-    2387: 'Shop_set_2_Unit5',
-    2388: 'CJ_DUDS_RAIL_2',
-    2389: 'CJ_4_SWEATERS',
-    2390: 'CJ_4way_clothes',
-    2391: 'CJ_jean_CREAM',
-    2392: 'CJ_8_JEANS_MED',
-    2393: 'CJ_DUDS_RAIL_3',
-    2394: 'CJ_CLOTHES_STEP_1',
-    2395: 'CJ_SPORTS_WALL',
-    2396: 'CJ_4_S_SWEATER',
-    2397: 'CJ_TRACKIES_dark',
-    2398: 'CJ_TRACKIES_LIGHT',
-    2399: 'CJ_4_S_SWEATER_2',
-    2400: 'CJ_SPORTS_WALL01',
-    2401: 'CJ_TRACKIES_WHITE',
-    2402: 'CJ_SPORTS_BAGS',
-    2403: 'Shop_set_2_SHOE',
-    2404: 'CJ_SURF_BOARD',
-    2405: 'CJ_SURF_BOARD2',
-    2406: 'CJ_SURF_BOARD3',
-    2407: 'CJ_F_TORSO',
-    2408: 'CJ_F_LEG_1',
-    2409: 'CJ_F_LEG_2',
-    2410: 'CJ_SURF_BOARD4',
-    2411: 'CJ_F_TORSO_1',
-    2412: 'CJ_DETECTOR',
-    2413: 'Shop_counter_3a',
-    2414: 'Shop_counter_3b',
-    2415: 'CJ_FF_FRYER',
-    2416: 'CJ_FF_DISP',
-    2417: 'CJ_FF_COOKER',
-    2418: 'CJ_FF_WORKTOP',
-    2419: 'CJ_FF_WORKTOP_2',
-    2420: 'CJ_FF_BUCKET',
-    2421: 'CJ_FF_MICROW',
-    2422: 'CJ_FF_TILL',
-    2423: 'CJ_FF_CONTER_1b',
-    2424: 'CJ_FF_CONTER_1',
-    2425: 'CJ_FF_JUICE',
-    2426: 'CJ_FF_PIZZA_OVEN',
-    2427: 'CJ_FF_JUICE_L',
-    2428: 'CJ_FF_STAND1',
-    2429: 'CJ_FF_CUP_DISP',
-    2430: 'CJ_FF_LIST1',
-    2431: 'CJ_FF_LIST2',
-    2432: 'CJ_FF_LIST3',
-    2433: 'CJ_FF_DISP1',
-    2434: 'CJ_FF_CONTER_2b',
-    2435: 'CJ_FF_CONTER_2',
-    2436: 'CJ_FF_DISP2',
-    2437: 'CJ_CUP_PILE',
-    2438: 'CJ_SLUSH_MAC',
-    2439: 'CJ_FF_CONTER_3',
-    2440: 'CJ_FF_CONTER_3b',
-    2441: 'CJ_FF_CONTER_4',
-    2442: 'CJ_FF_CONTER_4b',
-    2443: 'CJ_FF_FRIGE',
-    2444: 'CJ_FF_CONTER_4c',
-    2445: 'CJ_FF_CONTER_4d',
-    2446: 'CJ_FF_CONTER_5',
-    2447: 'CJ_FF_CONTER_5c',
-    2448: 'CJ_FF_CONTER_5d',
-    2449: 'CJ_FF_CONTER_5e',
-    2450: 'CJ_FF_CONTER_5b',
-    2451: 'CJ_FF_WORKTOP_3',
-    2452: 'CJ_FF_FRIDGE2',
-    2453: 'CJ_PIZZA_DISPf',
-    2454: 'CJ_FF_CONTER_8b',
-    2455: 'CJ_FF_CONTER_8',
-    2456: 'CJ_FF_STAND02',
-    2457: 'CJ_FF_CONTER_8c',
-    2458: 'CJ_HOBBY_C_3',
-    2459: 'CJ_HOBBY_C_4',
-    2460: 'CJ_HOBBY_C_1',
-    2461: 'CJ_HOBBY_C_2',
-    2462: 'CJ_HOBBY_SHELF',
-    2463: 'CJ_HOBBY_SHELF_2',
-    2464: 'MODEL_BOX1',
-    2465: 'MODEL_BOX2',
-    2466: 'MODEL_BOX3',
-    2467: 'CJ_HOBBY_C_5',
-    2468: 'MODEL_BOX4',
-    2469: 'MODEL_PLANES_3',
-    2470: 'MODEL_PLANES_4',
-    2471: 'MODEL_TRAINS2',
-    2472: 'MODEL_PLANES_1',
-    2473: 'MODEL_PLANES_2',
-    2474: 'MODEL_TRAINS1',
-    2475: 'CJ_HOBBY_SHELF_3',
-    2476: 'MODEL_BOX11',
-    2477: 'MODEL_BOX5',
-    2478: 'MODEL_BOX6',
-    2479: 'MODEL_BOX8',
-    2480: 'MODEL_BOX9',
-    2481: 'MODEL_BOX10',
-    2482: 'CJ_HOBBY_SHELF_4',
-    2483: 'MODEL_BOX13',
-    2484: 'MODEL_YAUGHT',
-    2485: 'MODEL_CAR_1',
-    2486: 'MODEL_CAR',
-    2487: 'HOBBY_KITE',
-    2488: 'MANHUNT_TOY_1',
-    2489: 'MANHUNT_TOY_2',
-    2490: 'VICE_TOY_1',
-    2491: 'MODEL_STAND',
-    2492: 'MANHUNT_TOY2_1',
-    2493: 'VICE_TOY2_1',
-    2494: 'MANHUNT_TOY2_2',
-    2495: 'VICE_TOY_2',
-    2496: 'VICE_TOY2_2',
-    2497: 'HOBBY_KITE2',
-    2498: 'HOBBY_KITE3',
-    2499: 'HOBBY_KITE4',
-    2500: 'CJ_FF_COFFEE',
-    2501: 'Train_toy_1',
-    2502: 'CJ_HOBBY_SHELF_5',
-    2503: 'Train_toy_2',
-    2504: 'Train_toy_3',
-    2505: 'MODEL_toy_1',
-    2506: 'MODEL_toy_2',
-    2507: 'MODEL_toy_3',
-    2508: 'MODEL_toy_4',
-    2509: 'CJ_HOBBY_SHELF_6',
-    2510: 'MODEL_PLANE_BIG2',
-    2511: 'MODEL_PLANE_BIG1',
-    2512: 'MODEL_PLANE_BIG3',
-    2513: 'MODEL_TRAINS3',
-    2514: 'CJ_TOILET1',
-    2515: 'CJ_BS_SINK',
-    2516: 'CJ_BATH1',
-    2517: 'CJ_SHOWER1',
-    2518: 'CJ_B_SINK2',
-    2519: 'CJ_BATH2',
-    2520: 'CJ_SHOWER2',
-    2521: 'CJ_TOILET2',
-    2522: 'CJ_BATH3',
-    2523: 'CJ_B_SINK3',
-    2524: 'CJ_B_SINK4',
-    2525: 'CJ_TOILET4',
-    2526: 'CJ_BATH4',
-    2527: 'CJ_SHOWER4',
-    2528: 'CJ_TOILET3',
-    2529: 'CJ_OFF2_LIC_2_L',
-    2530: 'CJ_OFF2_LIC_2_R',
-    2531: 'CJ_OFF2_LIC_1_M',
-    2532: 'CJ_OFF2_LIC_1_R',
-    2533: 'CJ_OFF2_LIC_1_L',
-    2534: 'CJ_OFF2_LIC_2_M',
-    2535: 'CJ_SS_1_M',
-    2536: 'CJ_SS_1_L',
-    2537: 'CJ_SS_1_R',
-    2538: 'CJ_SS_2_R',
-    2539: 'CJ_SS_2_M',
-    2540: 'CJ_SS_2_L',
-    2541: 'CJ_SS_3_M',
-    2542: 'CJ_SS_3_L',
-    2543: 'CJ_SS_4_M',
-    2544: 'CJ_SS_4_L',
-    2545: 'CJ_SS_4_R',
-    2546: 'CJ_SS_7_M',
-    2547: 'CJ_SS_6_R',
-    2548: 'CJ_SS_6_M',
-    2549: 'CJ_SS_6_L',
-    2550: 'CJ_SS_7_R',
-    2551: 'CJ_SS_7_L',
-    2552: 'CJ_SS_8_R',
-    2553: 'CJ_SS_8_L',
-    2554: 'CJ_SS_8_M',
-    2555: 'CJ_SS_5_M',
-    2556: 'CJ_SS_5_L',
-    2557: 'CJ_SS_5_R',
-    2558: 'CURTAIN_1_CLOSED',
-    2559: 'CURTAIN_1_OPEN',
-    2560: 'CURTAIN_2_OPEN',
-    2561: 'CURTAIN_2_CLOSED',
-    2562: 'Hotel_dresser_2',
-    2563: 'HOTEL_S_BEDSET_1',
-    2564: 'HOTEL_D_BEDSET_1',
-    2565: 'HOTEL_D_BEDSET_3',
-    2566: 'HOTEL_S_BEDSET_3',
-    2567: 'ab_warehouseShelf',
-    2568: 'Hotel_dresser_3',
-    2569: 'Hotel_dresser_1',
-    2570: 'Hotel_dresser_4',
-    2571: 'Hotel_SINGLE_1',
-    2572: 'Hotel_SINGLE_2',
-    2573: 'Hotel_dresser_6',
-    2574: 'Hotel_dresser_5',
-    2575: 'HOTEL_S_BEDSET_8',
-    2576: 'Hotel_dresser_8',
-    2577: 'CJ_SEX_COUNTER',
-    2578: 'CJ_SEX_SHELF_1',
-    2579: 'CJ_SEX_SHELF_2',
-    2580: 'SEX_1',
-    2581: 'CJ_SEX_V_RACK',
-    2582: 'CJ_SEX_VIDEO_1',
-    2583: 'CJ_SEX_VIDEO_2',
-    2584: 'CJ_sex_dildo',
-    2585: 'CJ_SEX_SHELF_3',
-    2586: 'CJ_SEX_COUNTER2',
-    2587: 'SEX_2',
-    2588: 'SEX_3',
-    2589: 'ab_carcass',
-    2590: 'ab_hook',
-    2591: 'ab_partition1',
-    2592: 'ab_slotTable',
-    2593: 'roleplay_rack',
-    2594: 'roleplay_outfits',
-    2595: 'CJ_SHOP_TV_VIDEO',
-    2596: 'CJ_SEX_TV',
-    2597: 'DILDO_rack1',
-    2598: 'DILDO_rack2',
-    2599: 'CJ_SEX_SHOP_SIGN',
-    2600: 'CJ_VIEW_TELE',
-    2601: 'CJ_JUICE_CAN',
-    2602: 'Police_cell_Toilet',
-    2603: 'Police_Cell_Bed',
-    2604: 'CJ_POLICE_COUNTER',
-    2605: 'POLCE_DESK1',
-    2606: 'CJ_POLICE_COUNTER2',
-    2607: 'POLCE_DESK2',
-    2608: 'POLCE_SHELF',
-    2609: 'CJ_P_FILEING1',
-    2610: 'CJ_P_FILEING2',
-    2611: 'POLICE_NB1',
-    2612: 'POLICE_NB2',
-    2613: 'POLICE_WASTEBIN',
-    2614: 'CJ_US_FLAG',
-    2615: 'POLICE_NB3',
-    2616: 'POLICE_NB04',
-    2617: 'Hotel_SINGLE_3',
-    2618: 'CJ_SLOT_PROPg',
-    2619: 'mp_ammoambient',
-    2620: 'CJ_TRAINER_ERIS',
-    2621: 'CJ_TRAINER_HEAT',
-    2622: 'CJ_TRAINER_PRO',
-    2623: 'CJ_PRO_COUNTER',
-    2624: 'CJ_SHOE_CORNER01',
-    2625: 'CJ_SHOE_URBAN2',
-    2626: 'CJ_URB_COUNTER',
-    2627: 'gym_treadmill',
-    2628: 'gym_bench2',
-    2629: 'gym_bench1',
-    2630: 'gym_bike',
-    2631: 'gym_mat1',
-    2632: 'gym_mat02',
-    2633: 'crack_walkway1',
-    2634: 'ab_vaultDoor',
-    2635: 'CJ_PIZZA_TABLE',
-    2636: 'CJ_PIZZA_CHAIR',
-    2637: 'CJ_PIZZA_TABLE2',
-    2638: 'CJ_PIZZA_CHAIR2',
-    2639: 'CJ_PIZZA_CHAIR3',
-    2640: 'NEIL_SLOT',
-    2641: 'CJ_BURGER_POSTER',
-    2642: 'CJ_BURGER_POSTER2',
-    2643: 'CJ_BURGER_POSTER3',
-    2644: 'CJ_BURG_TABLE',
-    2645: 'CJ_PIZZA_POSTER',
-    2646: 'CJ_PIZZA_POSTER2',
-    2647: 'CJ_BS_CUP',
-    2648: 'CJ_STEAL_TV',
-    2649: 'CJ_aircon2',
-    2650: 'CJ_Skate_wall2',
-    2651: 'CJ_Skate_wall1',
-    2652: 'CJ_SKATE_CUBES',
-    2653: 'CJ_aircon3',
-    2654: 'CJ_shoe_box',
-    2655: 'CJ_BANNER1',
-    2656: 'CJ_BANNER02',
-    2657: 'CJ_BANNER03',
-    2658: 'CJ_BANNER04',
-    2659: 'CJ_BANNER05',
-    2660: 'CJ_BANNER06',
-    2661: 'CJ_BANNER07',
-    2662: 'CJ_BANNER08',
-    2663: 'CJ_BS_BAG',
-    2664: 'CJ_SUBURB_DOOR',
-    2665: 'CJ_FF_LIST04',
-    2666: 'CJ_PIZ_POSTER2',
-    2667: 'CJ_PIZ_POSTER1',
-    2668: 'CJ_PIZ_POSTER3',
-    2669: 'CJ_CHRIS_CRATE',
-    2670: 'PROC_RUBBISH_1',
-    2671: 'PROC_RUBBISH_3',
-    2672: 'PROC_RUBBISH_4',
-    2673: 'PROC_RUBBISH_5',
-    2674: 'PROC_RUBBISH_2',
-    2675: 'PROC_RUBBISH_6',
-    2676: 'PROC_RUBBISH_8',
-    2677: 'PROC_RUBBISH_7',
-    2678: 'CJ_CHRIS_CRATE_LD',
-    2679: 'CJ_CHRIS_CRATE_RD',
-    2680: 'CJ_Padlock',
-    2681: 'CJ_COIN_OP',
-    2682: 'PIZZA_MENU',
-    2683: 'PIZZA_S_P',
-    2684: 'CJ_food_post',
-    2685: 'CJ_food_post1',
-    2686: 'CJ_food_post2',
-    2687: 'CJ_food_post3',
-    2688: 'CJ_food_post4',
-    2689: 'CJ_HOODIE_2',
-    2690: 'CJ_FIRE_EXT',
-    2691: 'CJ_BANNER09',
-    2692: 'CJ_BANNER10',
-    2693: 'CJ_BANNER11',
-    2694: 'CJ_shoe_box2',
-    2695: 'CJ_BANNER12',
-    2696: 'CJ_BANNER13',
-    2697: 'CJ_BANNER14',
-    2698: 'CJ_DUDS_RAIL01',
-    2699: 'CJ_DUDS_RAIL02',
-    2700: 'CJ_SEX_TV2',
-    2701: 'CJ_PRO_LIGHT',
-    2702: 'CJ_PIZZA_1',
-    2703: 'CJ_BURG_1',
-    2704: 'CJ_HOODIE_3',
-    2705: 'CJ_HOODIE_04',
-    2706: 'CJ_HOODIE_05',
-    2707: 'CJ_LIGHT_FIT',
-    2708: 'ZIP_SHELF1',
-    2709: 'Pain_Killer',
-    2710: 'WATCH_PICKUP',
-    2711: 'Tatoo_needle',
-    2712: 'CJ_MOP',
-    2713: 'cj_bucket',
-    2714: 'CJ_OPEN_SIGN_2',
-    2715: 'CJ_DON_POSTER',
-    2716: 'CJ_DON_POSTER3',
-    2717: 'CJ_DON_POSTER2',
-    2718: 'CJ_FLY_KILLER',
-    2719: 'CJ_BANNER15',
-    2720: 'CJ_BANNER16',
-    2721: 'CJ_BANNER17',
-    2722: 'CJ_BANNER18',
-    2723: 'LM_stripStool',
-    2724: 'LM_stripChair',
-    2725: 'LM_stripTable',
-    2726: 'LM_stripLamp',
-    2727: 'DS_SIGN',
-    2728: 'DS_BACKLIGHT',
-    2729: 'CJ_BINC_POST3',
-    2730: 'CJ_BINC_POST2',
-    2731: 'CJ_BINC_POST',
-    2732: 'CJ_ZIP_POST_2',
-    2733: 'CJ_ZIP_POST_1',
-    2734: 'CJ_ZIP_POST_3',
-    2735: 'CJ_ZIP_POST_4',
-    2736: 'CJ_ZIP_POST_05',
-    2737: 'POLICE_NB_car',
-    2738: 'CJ_TOILET_BS',
-    2739: 'CJ_B_SINK1',
-    2740: 'cj_bs_light',
-    2741: 'CJ_SOAP_DISP',
-    2742: 'CJ_HANDDRIER',
-    2743: 'CJ_STAT_1',
-    2744: 'CJ_STAT_2',
-    2745: 'CJ_STAT_3',
-    2746: 'CJ_DONUT_CHAIR',
-    2747: 'CJ_donut_TABLE',
-    2748: 'CJ_DONUT_CHAIR2',
-    2749: 'CJ_hairspray',
-    2750: 'CJ_hair_dryer',
-    2751: 'CJ_hairsCREAM',
-    2752: 'CJ_hairspray2',
-    2753: 'CJ_FF_TILL_que',
-    2754: 'OTB_machine',
-    2755: 'Dojo_Wall',
-    2756: 'CJ_S1_base',
-    2757: 'CJ_S1_Larm',
-    2758: 'CJ_S1_Rarm',
-    2759: 'CJ_S1_Head',
-    2760: 'CJ_S1_torso',
-    2761: 'CJ_S1_legs',
-    2762: 'CJ_CHICK_TABLE',
-    2763: 'CJ_CHICK_TABLE_2',
-    2764: 'CJ_PIZZA_TABLE03',
-    2765: 'CJ_CB_LIST1',
-    2766: 'CJ_CB_LIST2',
-    2767: 'CJ_CB_TRAY',
-    2768: 'CJ_CB_BURG',
-    2769: 'CJ_CJ_BURG2',
-    2770: 'CJ_CB_BIN',
-    2771: 'CJ_OTB_TILL_Q',
-    2772: 'CJ_esculator',
-    2773: 'CJ_AIRPRT_BAR',
-    2774: 'CJ_AIRP_PILLARS',
-    2775: 'CJ_AIRPRT_MON',
-    2776: 'LEE_stripCHAIR2',
-    2777: 'LEE_stripCHAIR1',
-    2778: 'CJ_COIN_OP_1',
-    2779: 'CJ_COIN_OP_2',
-    2780: 'CJ_SMOKE_MACH',
-    2781: 'CJ_AIR_TICKET',
-    2782: 'CJ_OYSTER_2',
-    2783: 'cj_bandit_6',
-    2784: 'ab_slotTable6',
-    2785: 'CJ_SLOT_BANK',
-    2788: 'CJ_BURG_CHAIR',
-    2789: 'CJ_DEPART_BOARD',
-    2790: 'CJ_ARRIVE_BOARD',
-    2791: 'CJ_index_BOARD',
-    2792: 'CJ_AIR_D_1',
-    2793: 'CJ_AIR_D_2',
-    2794: 'CJ_AIR_D_3',
-    2795: 'CJ_AIR_D_4',
-    2796: 'CJ_AIR_D_6',
-    2797: 'CJ_AIR_D_5',
-    2798: 'CJ_EX_PEDALS',
-    2799: 'castable2',
-    2800: 'castable2top',
-    2801: 'castable1top',
-    2802: 'castable1',
-    2803: 'CJ_MEAT_BAG_1',
-    2804: 'CJ_MEAT_1',
-    2805: 'CJ_MEAT_BAG_2',
-    2806: 'CJ_MEAT_2',
-    2807: 'CJ_BURG_CHAIR_NA',
-    2808: 'CJ_PIZZA_CHAIR4',
-    2809: 'CJ_STAT_1_BIT',
-    2810: 'CJ_STAT_2_bit',
-    2811: 'GB_romanpot01',
-    2812: 'GB_platedirty01',
-    2813: 'GB_novels01',
-    2814: 'GB_takeaway01',
-    2815: 'gb_livingrug01',
-    2816: 'gb_bedmags01',
-    2817: 'gb_bedrug01',
-    2818: 'gb_bedrug02',
-    2819: 'gb_bedclothes01',
-    2820: 'GB_kitchdirt01',
-    2821: 'gb_foodwrap01',
-    2822: 'GB_kitchplatecln01',
-    2823: 'gb_kitchtakeway01',
-    2824: 'GB_novels02',
-    2825: 'GB_novels03',
-    2826: 'GB_novels04',
-    2827: 'GB_novels05',
-    2828: 'gb_ornament02',
-    2829: 'GB_platedirty02',
-    2830: 'GB_platedirty04',
-    2831: 'GB_platedirty03',
-    2832: 'GB_platedirty05',
-    2833: 'gb_livingrug02',
-    2834: 'gb_livingrug03',
-    2835: 'gb_livingrug04',
-    2836: 'gb_livingrug05',
-    2837: 'GB_takeaway02',
-    2838: 'GB_takeaway03',
-    2839: 'GB_takeaway04',
-    2840: 'GB_takeaway05',
-    2841: 'gb_bedrug03',
-    2842: 'gb_bedrug04',
-    2843: 'gb_bedclothes02',
-    2844: 'gb_bedclothes03',
-    2845: 'gb_bedclothes04',
-    2846: 'gb_bedclothes05',
-    2847: 'gb_bedrug05',
-    2848: 'GB_kitchdirt02',
-    2849: 'GB_kitchdirt03',
-    2850: 'GB_kitchdirt04',
-    2851: 'GB_kitchdirt05',
-    2852: 'gb_bedmags02',
-    2853: 'gb_bedmags03',
-    2854: 'gb_bedmags04',
-    2855: 'gb_bedmags05',
-    2856: 'gb_foodwrap02',
-    2857: 'gb_kitchtakeway02',
-    2858: 'gb_kitchtakeway03',
-    2859: 'gb_kitchtakeway04',
-    2860: 'gb_kitchtakeway05',
-    2861: 'gb_foodwrap03',
-    2862: 'GB_kitchplatecln02',
-    2863: 'GB_kitchplatecln03',
-    2864: 'GB_kitchplatecln04',
-    2865: 'GB_kitchplatecln05',
-    2866: 'gb_foodwrap04',
-    2867: 'gb_foodwrap05',
-    2868: 'gb_ornament03',
-    2869: 'gb_ornament04',
-    2870: 'gb_ornament05',
-    2871: 'CJ_SS_3_R',
-    2872: 'CJ_COIN_OP_3',
-    2880: 'CJ_BURG_2',
-    2881: 'CJ_PIZZA_2',
-    2882: 'Object01',
-    2885: 'xref_garagedoor',
-    2886: 'sec_keypad',
-    2887: 'a51_spotbulb',
-    2888: 'a51_spothousing',
-    2889: 'a51_spotbase',
-    2890: 'kmb_skip',
-    2891: 'kmb_packet',
-    2892: 'temp_stinger',
-    2893: 'kmb_ramp',
-    2894: 'kmb_rhymesbook',
-    2895: 'fun_flower_law',
-    2896: 'casket_law',
-    2897: 'funtarp_law',
-    2898: 'funturf_law',
-    2899: 'temp_stinger2',
-    2900: 'temp_cardbox',
-    2901: 'kmb_marijuana',
-    2902: 'kmb_smokecan',
-    2903: 'kmb_parachute',
-    2904: 'warehouse_door1',
-    2905: 'kmb_deadleg',
-    2906: 'kmb_deadarm',
-    2907: 'kmb_deadtorso',
-    2908: 'kmb_deadhead',
-    2909: 'kmb_frontgate',
-    2910: 'temp_road',
-    2911: 'kmb_petroldoor',
-    2912: 'temp_crate1',
-    2913: 'kmb_bpress',
-    2914: 'kmb_rcflag',
-    2915: 'kmb_dumbbell2',
-    2916: 'kmb_dumbbell',
-    2917: 'a51_crane',
-    2918: 'kmb_mine',
-    2919: 'kmb_holdall',
-    2920: 'police_barrier',
-    2921: 'kmb_cam',
-    2922: 'kmb_keypad',
-    2923: 'bottle_bank',
-    2924: 'kmb_crash3door',
-    2925: 'dyno_box_B',
-    2926: 'dyno_box_A',
-    2927: 'a51_blastdoorR',
-    2928: 'a51_intdoor',
-    2929: 'a51_blastdoorL',
-    2930: 'chinaTgate',
-    2931: 'kmb_jump1',
-    2932: 'kmb_container_blue',
-    2933: 'pol_comp_gate',
-    2934: 'kmb_container_red',
-    2935: 'kmb_container_yel',
-    2936: 'kmb_rock',
-    2937: 'kmb_plank',
-    2938: 'shutter_vegas',
-    2939: 'ramp_bot',
-    2940: 'ramp_top',
-    2941: 'temp_till',
-    2942: 'kmb_atm1',
-    2943: 'kmb_atm2',
-    2944: 'freight_SFW_door',
-    2945: 'kmb_netting',
-    2946: 'cr_door_03',
-    2947: 'cr_door_01',
-    2948: 'cr_door_02',
-    2949: 'kmb_lockeddoor',
-    2950: 'BREAK_WALL_2A',
-    2951: 'a51_labdoor',
-    2952: 'kmb_gimpdoor',
-    2953: 'kmb_paper_code',
-    2954: 'kmb_ot',
-    2955: 'imy_compin',
-    2956: 'immmcran',
-    2957: 'chinaTgarageDoor',
-    2958: 'cutscene_beer',
-    2959: 'rider1_door',
-    2960: 'kmb_beam',
-    2961: 'fire_break',
-    2962: 'fire_break_glass',
-    2963: 'freezer_door',
-    2964: 'k_pooltablesm',
-    2965: 'k_pooltriangle01',
-    2966: 'mobile1993b',
-    2967: 'mobile1993a',
-    2968: 'cm_box',
-    2969: 'level_ammobox',
-    2970: 'dts_bbdoor',
-    2971: 'k_smashboxes',
-    2972: 'k_cargo4',
-    2973: 'k_cargo2',
-    2974: 'k_cargo1',
-    2975: 'k_cargo3',
-    2976: 'green_gloop',
-    2977: 'kmilitary_crate',
-    2978: 'kmilitary_base',
-    2979: 'reel02',
-    2980: 'kb_bandit10',
-    2981: 'reel03',
-    2982: 'reel01',
-    2983: 'will_valve',
-    2984: 'portaloo',
-    2985: 'minigun_base',
-    2986: 'lxr_motelvent',
-    2987: 'lxr_motel_doorsim',
-    2988: 'comp_wood_gate',
-    2989: 'imy_skylight',
-    2990: 'wongs_gate',
-    2991: 'imy_bbox',
-    2992: 'roulette_marker',
-    2993: 'kmb_goflag',
-    2994: 'kmb_trolley',
-    2995: 'k_poolballstp01',
-    2996: 'k_poolballstp02',
-    2997: 'k_poolballstp03',
-    2998: 'k_poolballstp04',
-    2999: 'k_poolballstp05',
-    3000: 'k_poolballstp06',
-    3001: 'k_poolballstp07',
-    3002: 'k_poolballspt01',
-    3003: 'k_poolballcue',
-    3004: 'k_poolq2',
-    3005: 'smash_box_stay',
-    3006: 'smash_box_brk',
-    3007: 'chopcop_torso',
-    3008: 'chopcop_armR',
-    3009: 'chopcop_armL',
-    3010: 'chopcop_legR',
-    3011: 'chopcop_legL',
-    3012: 'chopcop_head',
-    3013: 'cr_ammobox',
-    3014: 'cr_guncrate',
-    3015: 'cr_cratestack',
-    3016: 'cr_ammobox_nonbrk',
-    3017: 'arch_plans',
-    3018: 'target_rleg',
-    3019: 'target_lleg',
-    3020: 'target_ltorso',
-    3021: 'target_rtorso',
-    3022: 'target_rarm',
-    3023: 'target_larm',
-    3024: 'target_head',
-    3025: 'target_frame',
-    3026: 'para_pack',
-    3027: 'ciggy',
-    3028: 'Katana_LHand',
-    3029: 'cr1_door',
-    3030: 'wongs_erection',
-    3031: 'wong_dish',
-    3032: 'bd_window_shatter',
-    3033: 'md_lockdoor',
-    3034: 'bd_window',
-    3035: 'tmp_bin',
-    3036: 'ct_gatexr',
-    3037: 'warehouse_door2b',
-    3038: 'ct_lanterns',
-    3039: 'ct_stall1',
-    3040: 'ct_stall2',
-    3041: 'ct_table',
-    3042: 'ct_vent',
-    3043: 'kmb_container_open',
-    3044: 'CIGAR',
-    3045: 'CIGAR_glow',
-    3046: 'kb_barrel',
-    3047: 'jet_baggage_Door',
-    3048: 'cement_in_hole',
-    3049: 'des_quarrygate',
-    3050: 'des_quarrygate2',
-    3051: 'lift_dr',
-    3052: 'db_ammo',
-    3053: 'INDUS_MAGNET',
-    3054: 'DYN_WREKING_BALL',
-    3055: 'kmb_shutter',
-    3056: 'mini_magnet',
-    3057: 'kb_barrel_exp',
-    3058: 'storm_drain_cover',
-    3059: 'imy_shash_wall',
-    3060: 'para_collision',
-    3061: 'ad_flatdoor',
-    3062: 'container_door',
-    3063: 'BREAK_WALL_3A',
-    3064: 'BREAK_WALL_1A',
-    3065: 'BBALL_col',
-    3066: 'ammotrn_obj',
-    3067: 'kmb_atm3',
-    3068: 'cargo_rear',
-    3069: 'd9_ramp',
-    3070: 'kmb_goggles',
-    3071: 'kmb_dumbbell_R',
-    3072: 'kmb_dumbbell_L',
-    3073: 'kmb_container_broke',
-    3074: 'd9_runway',
-    3075: 'impexp_door',
-    3076: 'ad_roadmark1',
-    3077: 'nf_blackboard',
-    3078: 'ad_finish',
-    3079: 'ad_roadmark2',
-    3080: 'ad_jump',
-    3081: 'fake_mule_col',
-    3082: 'ammo_capsule',
-    3083: 'md_poster',
-    3084: 'trdcsgrgdoor_lvs',
-    3085: 'nf_list_1',
-    3086: 'wanted_cross_off',
-    3087: 'nf_list_2',
-    3088: 'nf_list_3',
-    3089: 'ab_casdorLok',
-    3090: 'nf_ped_coll',
-    3091: 'imy_track_barrier',
-    3092: 'dead_tied_cop',
-    3093: 'cuntgirldoor',
-    3094: 'k_pooltableb',
-    3095: 'a51_jetdoor',
-    3096: 'bb_pickup',
-    3097: 'BREAK_WALL_2B',
-    3098: 'BREAK_WALL_1B',
-    3099: 'BREAK_WALL_3B',
-    3100: 'k_poolballspt02',
-    3101: 'k_poolballspt03',
-    3102: 'k_poolballspt04',
-    3103: 'k_poolballspt05',
-    3104: 'k_poolballspt06',
-    3105: 'k_poolballspt07',
-    3106: 'k_poolball8',
-    3107: 'wongs_erection2',
-    3108: 'basejump_target',
-    3109: 'imy_la_door',
-    3110: 'md_billbolaeb',
-    3111: 'st_arch_plan',
-    3112: 'TriMainLite',
-    3113: 'CARRIER_DOOR_SFSE',
-    3114: 'CARRIER_LIFT2_SFSE',
-    3115: 'CARRIER_LIFT1_SFSE',
-    3116: 'acwinch1',
-    3117: 'a51_ventcoverb',
-    3119: 'cs_ry_props',
-    3134: 'quarry_barrel',
-    3135: 'cat2_safe_col',
-    3167: 'trailer_large1_01',
-    3168: 'trailer2_01',
-    3169: 'trailer_large2_01',
-    3170: 'trailer_large3_01',
-    3171: 'trailer5_01',
-    3172: 'trailer6_01',
-    3173: 'trailer_large4_01',
-    3174: 'sm_airstrm_sml_',
-    3175: 'sm_airstrm_med_',
-    3178: 'Shack02',
-    3187: 'nt_gasstation',
-    3193: 'st5base',
-    3214: 'quarry_crusher',
-    3221: 'drv_in_spkrs',
-    3241: 'conhoos2',
-    3242: 'conhoos1',
-    3243: 'tepee_room_',
-    3244: 'pylon_big1_',
-    3246: 'des_westrn7_',
-    3249: 'des_westsaloon_',
-    3250: 'des_westrn9_',
-    3252: 'des_oldwattwr_',
-    3253: 'des_westrn11_',
-    3255: 'ref_oiltank01',
-    3256: 'refchimny01',
-    3257: 'refinerybox1',
-    3258: 'refthinchim1',
-    3259: 'refcondens1',
-    3260: 'oldwoodpanel',
-    3261: 'grasshouse',
-    3262: 'privatesign1',
-    3263: 'privatesign2',
-    3264: 'privatesign3',
-    3265: 'privatesign4',
-    3267: 'mil_samsite',
-    3268: 'mil_hangar1_',
-    3269: 'bonyrd_block1_',
-    3270: 'bonyrd_block2_',
-    3271: 'bonyrd_block3_',
-    3272: 'substa_transf1_',
-    3273: 'substa_transf2_',
-    3274: 'substa_grid_',
-    3275: 'cxreffence',
-    3276: 'cxreffencesld',
-    3277: 'mil_sambase',
-    3278: 'des_warewin',
-    3279: 'a51_spottower',
-    3280: 'a51_panel',
-    3281: 'mtb_banner1',
-    3282: 'cxreffencemsh',
-    3283: 'conhoos3',
-    3284: 'conhoos5',
-    3285: 'conhoos4',
-    3286: 'cxrf_watertwr',
-    3287: 'cxrf_oiltank',
-    3292: 'cxf_payspray_',
-    3293: 'des_payspint',
-    3294: 'cxf_spraydoor1',
-    3302: 'cxrf_corpanel',
-    3303: 'des_bighus03',
-    3304: 'des_bighus02',
-    3305: 'des_bighus01',
-    3306: 'swburbhaus02',
-    3307: 'swburbhaus01',
-    3308: 'swburbhaus03',
-    3309: 'swburbhaus04',
-    3310: 'sw_woodhaus04',
-    3311: 'sw_woodhaus01a',
-    3312: 'sw_woodhaus02',
-    3313: 'sw_woodhaus03',
-    3314: 'sw_bigburb_04',
-    3315: 'sw_bigburb_03',
-    3316: 'sw_bigburb_02',
-    3317: 'sw_bigburb_01',
-    3330: 'cxrf_brigleg',
-    3331: 'cxrf_whitebrig',
-    3334: 'BIG_COCK_SIGN',
-    3335: 'CE_roadsign1',
-    3336: 'cxrf_frway1sig',
-    3337: 'cxrf_desertsig',
-    3350: 'torino_mic',
-    3351: 'sw_bigburbsave',
-    3352: 'burbdoorRENAME_ME',
-    3353: 'sw_bigburbsave2',
-    3354: 'burbdoor2REF',
-    3355: 'cxrf_savhus1_',
-    3356: 'cxrf_savhus2_',
-    3359: 'cxrf_savhusgar1_',
-    3361: 'cxref_woodstair',
-    3362: 'des_ruin2_',
-    3363: 'des_ruin1_',
-    3364: 'des_ruin3_',
-    3374: 'SW_haybreak02',
-    3375: 'CE_dblbarn01',
-    3378: 'CE_beerpile01',
-    3379: 'CE_hairpinR',
-    3380: 'CE_hairpinL',
-    3381: 'cxrf_redarch',
-    3383: 'a51_labtable1_',
-    3384: 'a51_halbox_',
-    3385: 'a51_light1_',
-    3386: 'a51_srack2_',
-    3387: 'a51_srack3_',
-    3388: 'a51_srack4_',
-    3389: 'a51_srack1_',
-    3390: 'a51_sdsk_ncol1_',
-    3391: 'a51_sdsk_ncol2_',
-    3392: 'a51_sdsk_ncol3_',
-    3393: 'a51_sdsk_ncol4_',
-    3394: 'a51_sdsk_2_',
-    3395: 'a51_sdsk_3_',
-    3396: 'a51_sdsk_4_',
-    3397: 'a51_sdsk_1_',
-    3398: 'cxrf_floodlite_',
-    3399: 'cxrf_a51_stairs',
-    3400: 'cxrf_a51sect',
-    3401: 'cxrf_a51sect2',
-    3402: 'sw_tempbarn01',
-    3403: 'sw_logcover',
-    3406: 'cxref_woodjetty',
-    3407: 'CE_mailbox1',
-    3408: 'CE_mailbox2',
-    3409: 'grassplant',
-    3410: 'cxrf_Aldea',
-    3411: 'cunteRB01',
-    3412: 'cunteRB03',
-    3414: 'CE_oldhut1',
-    3415: 'CE_loghut1',
-    3417: 'CE_loghut02',
-    3418: 'CE_oldhut02',
-    3419: 'CE_logbarn02',
-    3555: 'compmedhos2_LAe',
-    3556: 'compmedhos3_LAe',
-    3557: 'compmedhos4_LAe',
-    3558: 'compmedhos5_LAe',
-    3564: 'lastran1_LA01',
-    3565: 'lasdkrt1_LA01',
-    3566: 'lasntrk1',
-    3567: 'lasnfltrail',
-    3568: 'lasntrk2',
-    3569: 'lasntrk3',
-    3570: 'lasdkrt2',
-    3571: 'lasdkrt3',
-    3572: 'lasdkrt4',
-    3573: 'lasdkrtgrp1',
-    3574: 'lasdkrtgrp2',
-    3575: 'lasdkrt05',
-    3576: 'DockCrates2_LA',
-    3577: 'DockCrates1_LA',
-    3578: 'DockBarr1_LA',
-    3580: 'compbigho2_LAe',
-    3582: 'compmedhos1_LAe',
-    3583: 'compbigho3_LAe',
-    3584: 'compproj01_LA',
-    3585: 'lastran1_LA02',
-    3586: 'escl_LA',
-    3587: 'nwsnpedhus1_LAS',
-    3588: 'sanped_hse1_LAs',
-    3589: 'compfukhouse3',
-    3590: 'compfukhouse2',
-    3593: 'la_fuckcar2',
-    3594: 'la_fuckcar1',
-    3595: 'Dingbat01Aex_LA',
-    3596: 'Dingbat02Aex_LA',
-    3597: 'Dingbat01Bex_LA',
-    3598: 'hillhouse01_LA',
-    3599: 'hillhouse02_LA',
-    3600: 'hillhouse06_LA',
-    3601: 'hillhouse04_LA',
-    3602: 'hillhouse05_LA',
-    3603: 'bevman_LAW2',
-    3604: 'bevmangar_LAW2',
-    3605: 'bevman3_LAW2',
-    3606: 'bevbrkhus1',
-    3607: 'bevman2_LAW2',
-    3608: 'hillhouse08_LA',
-    3609: 'hillhouse13_LA',
-    3612: 'hillhouse12_LA',
-    3613: 'hillhouse10_LA',
-    3614: 'hillhouse09_LA',
-    3615: 'sanmonbhut1_LAW2',
-    3616: 'midranhus2_LAS',
-    3617: 'midranhus_LAS',
-    3618: 'nwlaw2husjm3_Law2',
-    3619: 'nwlaw2husjm4_Law2',
-    3620: 'redockrane_LAS',
-    3621: 'rbigcrate_LAS',
-    3622: 'rdwarhus',
-    3623: 'rdwarhus2',
-    3624: 'nwwarhus',
-    3625: 'crgostntrmp',
-    3626: 'dckwrkhut',
-    3627: 'dckcanpy',
-    3628: 'smallprosjmt_LAS',
-    3629: 'arhang_LAS',
-    3630: 'crdboxes2_LAs',
-    3631: 'oilcrat_LAS',
-    3632: 'imoildrum_LAS',
-    3633: 'imoildrum4_LAS',
-    3634: 'nwccumphus1_LAS',
-    3635: 'nwccumphus2_LAS',
-    3636: 'indust1las_LAS',
-    3637: 'indust1las2_LAS',
-    3638: 'elecstionv_LAS',
-    3639: 'GlenPHouse01_LAx',
-    3640: 'GlenPHouse02_LAx',
-    3641: 'GlenPHouse04_LAx',
-    3642: 'GlenPHouse03_LAx',
-    3643: 'LA_chem_piping',
-    3644: 'idlebuild01_LAx',
-    3646: 'ganghous05_LAx',
-    3648: 'ganghous02_LAx',
-    3649: 'ganghous01_LAx',
-    3651: 'ganghous04_LAx',
-    3653: 'BeachApartA1_LAx',
-    3655: 'ganghous03_LAx',
-    3657: 'airseata_LAS',
-    3658: 'airlastrola_LAS',
-    3659: 'airfinfoa_LAS',
-    3660: 'lasairfbed_LAS',
-    3661: 'projects01_LAx',
-    3663: 'lasstepsa_LAS',
-    3664: 'lasblastde_LAS',
-    3665: 'airyelrm_LAS',
-    3666: 'airuntest_las',
-    3671: 'centuBal01_LAx',
-    3673: 'laxrf_refinerybase',
-    3674: 'laxrf_refineryalpha',
-    3675: 'laxrf_refinerypipe',
-    3676: 'lawnhouseredA',
-    3677: 'lawnhousegreyLS',
-    3678: 'lawnhousegreyRS',
-    3684: 'Lawnapartmnt',
-    3689: 'rdwarhusbig',
-    3694: 'ryder_holes',
-    3697: 'project2lae2',
-    3698: 'barrio3B_LAe',
-    3700: 'DrugDealHs1_LAe',
-    3702: 'barrio6B_LAe2',
-    3704: 'barrio6a_LAe2',
-    3707: 'rdwarhusmed',
-    3711: 'BeachApartA5b',
-    3713: 'BeachApartA5a',
-    3715: 'Arch_sign',
-    3717: 'sanclifbal1_LAx',
-    3722: 'laxrf_scrapbox',
-    3724: 'laxrf_cargotop',
-    3741: 'CEhillhse14',
-    3743: 'escl_SingleLA',
-    3749: 'ClubGate01_LAx',
-    3752: 'ferseat01_LAx',
-    3753: 'dockwall_LAS2',
-    3754: 'lamotsig1_LA',
-    3755: 'las2warhus_las2',
-    3757: 'lamotsig2_LA',
-    3759: 'vencanhou01_LAx',
-    3761: 'industshelves',
-    3762: 'CEnwlaw4',
-    3763: 'CE_radarmast3',
-    3764: 'TCEnewhillhus02',
-    3765: 'TCEmulhouse04_Law01',
-    3771: 'CEhillhse14_alpha',
-    3776: 'ci_bstage',
-    3781: 'Lan2officeflrs',
-    3783: 'LAs2Xref01_LAx',
-    3785: 'bulkheadlight',
-    3786: 'missile_05_SFXR',
-    3787: 'missile_02_SFXR',
-    3788: 'missile_03_SFXR',
-    3789: 'missile_09_SFXR',
-    3790: 'missile_01_SFXR',
-    3791: 'missile_10_SFXR',
-    3792: 'missile_08_SFXR',
-    3793: 'missile_06_SFXR',
-    3794: 'missile_07_SFXR',
-    3795: 'missile_04_SFXR',
-    3796: 'acbox1_SFS',
-    3797: 'missile_11_SFXR',
-    3798: 'acbox3_SFS',
-    3799: 'acbox2_SFS',
-    3800: 'acbox4_SFS',
-    3801: 'sfx_lite04',
-    3802: 'sfx_plant03',
-    3803: 'sfx_alarms03',
-    3804: 'sfxref_aircon11',
-    3805: 'sfxref_aircon12',
-    3806: 'sfx_winplant07',
-    3807: 'sfx_flag02',
-    3808: 'sfx_alarms04',
-    3809: 'sfx_lite05',
-    3810: 'sfx_plant04',
-    3811: 'sfx_winplant08',
-    3812: 'sfxref_aircon13',
-    3813: 'sfxref_aircon14',
-    3814: 'hangar1_SFXREF',
-    3816: 'bighangar1_SFx',
-    3818: 'sf_frwaysig',
-    3819: 'bleacher_SFSx',
-    3820: 'box_hse_09_SFXRF',
-    3821: 'box_hse_02_SFXRF',
-    3822: 'box_hse_03_SFXRF',
-    3823: 'box_hse_11_SFXRF',
-    3824: 'box_hse_10_SFXRF',
-    3825: 'box_hse_01_SFXRF',
-    3826: 'box_hse_06_SFXRF',
-    3827: 'box_hse_07_SFXRF',
-    3828: 'box_hse_05_SFXRF',
-    3829: 'box_hse_04_SFXRF',
-    3830: 'box_hse_08_SFXRF',
-    3842: 'box_hse_14_SFXRF',
-    3843: 'box_hse_12_SFXRF',
-    3844: 'box_hse_15_SFXRF',
-    3845: 'box_hse_13_SFXRF',
-    3850: 'carshowbann_SFSX',
-    3851: 'carshowwin_SFSX',
-    3852: 'sf_jump',
-    3853: 'Gay_lamppost',
-    3854: 'GAY_telgrphpole',
-    3855: 'GAY_TRAFFIC_LIGHT',
-    3856: 'sf_frwaysig_half',
-    3857: 'ottosmash3',
-    3858: 'ottosmash1',
-    3859: 'ottosmash04',
-    3860: 'marketstall04_SFXRF',
-    3861: 'marketstall01_SFXRF',
-    3862: 'marketstall02_SFXRF',
-    3863: 'marketstall03_SFXRF',
-    3864: 'WS_floodlight',
-    3865: 'concpipe_SFXRF',
-    3866: 'demolish1_SFXRF',
-    3867: 'ws_scaffolding_SFX',
-    3873: 'Silicon04_SFS',
-    3875: 'SFtelepole',
-    3876: 'sf_roofmast',
-    3877: 'sf_rooflite',
-    3878: 'headstones_SFSx',
-    3879: 'ws_jetty_SFX',
-    3881: 'airsecbooth_SFSe',
-    3882: 'airsecboothint_SFSe',
-    3884: 'samsite_SFXRF',
-    3885: 'sambase_SFXRF',
-    3886: 'ws_jettynol_SFX',
-    3887: 'demolish4_SFXRF',
-    3890: 'lib_street09',
-    3891: 'lib_street08',
-    3892: 'lib_street10',
-    3893: 'lib_street05',
-    3894: 'lib_street11',
-    3895: 'lib_street14',
-    3897: 'lib_street03',
-    3898: 'lib_street15',
-    3899: 'lib_street04',
-    3900: 'lib_street12',
-    3902: 'lib_street16',
-    3903: 'lib_street07',
-    3905: 'lib_street02',
-    3906: 'lib_street01',
-    3907: 'lib_street06',
-    3910: 'trackshad05',
-    3911: 'lib_street13',
-    3914: 'snowover02',
-    3915: 'snowover03',
-    3916: 'snowover04',
-    3917: 'lib_street17',
-    3918: 'snowover01',
-    3919: 'lib_main_bistrotop',
-    3920: 'lib_veg3',
-    3921: 'lib_counchs',
-    3922: 'rest_chair2',
-    3923: 'libstreetfar',
-    3924: 'playroom',
-    3925: 'bridge_1',
-    3926: 'd_sign',
-    3927: 'd_sign01',
-    3928: 'helipad',
-    3929: 'd_rock',
-    3930: 'd_rock01',
-    3931: 'd_rock02',
-    3932: 'hanger',
-    3933: 'fake_sky',
-    3934: 'helipad01',
-    3935: 'statue',
-    3936: 'bwire_fence',
-    3937: 'bwire_fence01',
-    3938: 'rczero4_base01',
-    3939: 'hanger01',
-    3940: 'comms01',
-    3941: 'comms02',
-    3942: 'bistrobar',
-    3943: 'mid_staircase',
-    3944: 'bistro_blok',
-    3945: 'alpha_fence',
-    3946: 'plants01',
-    3947: 'rc_track_a',
-    3948: 'bistrogarden',
-    3949: 'rc_track_b',
-    3950: 'rc_zero_c',
-    3951: 'rc_water',
-    3952: 'rc_track_d',
-    3953: 'rc_track_e',
-    3954: 'rc_track_f',
-    3955: 'rc_track_g',
-    3956: 'rc_track_h',
-    3957: 'rc_track_i',
-    3958: 'warehooseboxes',
-    3959: 'rczero_alpha',
-    3960: 'rczero4_base02',
-    3961: 'Boxkitch',
-    3962: 'lee_Plane07',
-    3963: 'lee_Plane08',
-    3964: 'lee_Plane09',
-    3965: 'lee_Object11',
-    3966: 'lee_object01',
-    3967: 'AIRPORT_int2',
-    3968: 'AIRPORT_FRONT',
-    3969: 'BAG_BELT2',
-    3970: 'CJ_CUSTOM_BAR',
-    3971: 'CJ_BAG_RECLAIM',
-    3972: 'mon1',
-    3973: 'CJ_BAG_DET',
-    3975: 'PoliceSt01_LAn',
-    3976: 'PoliceSt02_LAn',
-    3977: 'LAriverSec1_LAn',
-    3978: 'LAriverSec3_LAn',
-    3979: 'bonaventura_LAn',
-    3980: 'LAcityhall1_LAn',
-    3981: 'LAriverSec4a_LAn',
-    3982: 'LAriverSec5a_LAn',
-    3983: 'peublomiss2_LAn',
-    3984: 'churchprog1_LAn',
-    3985: 'PershingSq1_LAn',
-    3986: 'mis1_LAn',
-    3987: 'fightplaza2_LAn',
-    3988: 'cityhallblock2_LAn',
-    3989: 'bonaplazagr_LAn',
-    3990: 'GSFreeway6_LAn',
-    3991: 'GSFreeway7_LAn',
-    3992: 'Roads03_LAn',
-    3993: 'Roads04_LAn',
-    3994: 'Roads06_LAn',
-    3995: 'Roads07_LAn',
-    3996: 'Roads08_LAn',
-    3997: 'cityhallblok_LAn',
-    3998: 'court1_LAn',
-    4000: 'twintjail2_LAn',
-    4001: 'BailBonds1_LAn',
-    4002: 'LAcityhall2_LAn',
-    4003: 'LAcityhallTrans_LAn',
-    4004: 'LAcityhall3_LAn',
-    4005: 'decoblok2_LAn',
-    4006: 'eastcolumb1_LAn',
-    4007: 'wellsfargo1_LAn',
-    4008: 'decoblok1_LAn',
-    4010: 'figfree1_LAn',
-    4011: 'figfree2_LAn',
-    4012: 'TermAnexGrd1_LAn',
-    4013: 'bonavenBase_LAn',
-    4014: 'bonaplaza_LAn',
-    4015: 'bonaventuraGL_LAn',
-    4016: 'fighotbase_LAn',
-    4017: 'offblokA_LAn',
-    4018: 'newbuildsm02',
-    4019: 'newbuildsm01',
-    4020: 'fighotblok1_LAn',
-    4021: 'Officessml1_lan',
-    4022: 'Foodmart1_lan',
-    4023: 'newdbbuild_lan04',
-    4027: 'langrasspatch',
-    4028: 'lanstap',
-    4029: 'LAriverSec5b_LAn',
-    4030: 'LAriverSec4b_LAn',
-    4032: 'carimp_LAn',
-    4033: 'fightplaza1_LAn',
-    4034: 'fightplaza1tra_LAn',
-    4048: 'LAcityhall4_LAn',
-    4058: 'fighotblok2_LAn',
-    4059: 'fighotblok3_LAn',
-    4060: 'fighotblok4_LAn',
-    4079: 'twintjail1_LAn',
-    4084: 'JUD_LAN',
-    4085: 'supports01_LAn',
-    4086: 'supports02_LAn',
-    4087: 'supports03_LAn',
-    4088: 'supports04_LAn',
-    4089: 'supports05_LAn',
-    4090: 'supports06_LAn',
-    4091: 'supports07_LAn',
-    4099: 'twintjailfence_LAn',
-    4100: 'meshfence1_LAn',
-    4101: 'expo_LAn',
-    4102: 'expoalpha_LAn',
-    4103: 'staples_LAn',
-    4106: 'shpfireesc_LAn',
-    4107: 'Roads01_LAn',
-    4108: 'Roads01b_LAn',
-    4109: 'LAriverSec5_LAn',
-    4110: 'Lan_embank1',
-    4112: 'build01_LAn',
-    4113: 'LanOfficeBlok1',
-    4114: 'lanBlocknew2',
-    4117: 'figfree3_LAn',
-    4120: 'LAn_fescalpha1',
-    4121: 'LAn_fescalpha02',
-    4122: 'ctyhllblk2land_LAn',
-    4123: 'cityhallblock1_LAn',
-    4125: 'GSFreeway1_LAn',
-    4127: 'GSFreeway2_LAn',
-    4128: 'GSFreeway3_LAn',
-    4129: 'GSFreeway4_LAn',
-    4131: 'GSFreeway5_LAn',
-    4133: 'GSFreeway8_LAn',
-    4139: 'Roads09_LAn',
-    4141: 'Hotelexterior1_LAn',
-    4142: 'Roads10_LAn',
-    4144: 'Roads11_LAn',
-    4146: 'Roads12_LAn',
-    4148: 'Roads13_LAn',
-    4150: 'Roads14_LAn',
-    4152: 'Roads15_LAn',
-    4154: 'Roads16_LAn',
-    4156: 'Roads17_LAn',
-    4158: 'Roads18_LAn',
-    4160: 'Roads19_LAn',
-    4163: 'Roads24_LAn',
-    4165: 'Roads21_LAn',
-    4168: 'Roads23_LAn',
-    4170: 'LAn_fescalpha04',
-    4171: 'LAn_fescalpha05',
-    4172: 'plantbeds1_LAn01',
-    4173: 'plantbeds1_LAn02',
-    4174: 'plantbeds1_LAn04',
-    4175: 'plantbeds1_LAn05',
-    4176: 'BailBonds2_LAn',
-    4178: 'BailBonds3_LAn',
-    4180: 'LAn_fescalpha06',
-    4182: 'Roads22_LAn',
-    4183: 'expoalpha_LAn02',
-    4184: 'hotelferns2_LAn',
-    4185: 'hotelferns3_LAn',
-    4186: 'PershingSq2_LAn',
-    4188: 'bventuraENV_LAn',
-    4189: 'twintjail1alpha_LAn',
-    4190: 'SDfences1_LAn',
-    4192: 'PoliceStalphas_LAn',
-    4193: 'officeblok1_Lan',
-    4195: 'SDfences2_LAn',
-    4196: 'SDfences3_LAn',
-    4197: 'LAnAlley1_LAn',
-    4198: 'LAriverSec3b_LAn',
-    4199: 'garages1_LAn',
-    4201: 'SDfences4_LAn',
-    4202: 'SDfences5_LAn',
-    4203: 'LAriverSec1b_LAn',
-    4205: 'wefargoalphas_LAn',
-    4206: 'PershingPool_LAn',
-    4207: 'Roads02_LAn',
-    4209: 'Roads20_LAn',
-    4227: 'graffiti_lan01',
-    4230: 'billbrdlan_08',
-    4231: 'LAn_fescalpha03',
-    4232: 'carimp2_LAn',
-    4233: 'Roads05_LAn',
-    4235: 'billbrdlan_03',
-    4238: 'billbrdlan_10',
-    4239: 'billbrdlan_11',
-    4240: 'sbsbedlaw2',
-    4241: 'sbsbed4law2',
-    4242: 'sbsbed5law2',
-    4243: 'sbsbed8law2',
-    4244: 'sbsbed9law2',
-    4245: 'sbsbed1law2',
-    4246: 'sbsbed3law2',
-    4247: 'sbsbed6law2',
-    4248: 'sbsbed7law2',
-    4249: 'sbsbed91law2',
-    4250: 'sbcne_seafloor01',
-    4251: 'sbcne_seafloor02',
-    4252: 'sbcne_seafloor03',
-    4253: 'sbcne_seafloor05',
-    4254: 'sbCE_groundPALO09',
-    4255: 'sbcne_seafloor04',
-    4256: 'sbcne_seafloor06',
-    4257: 'sbseabed_sfe03',
-    4258: 'sbseabed_sfe05',
-    4259: 'sbseabed_sfe01',
-    4260: 'sbseabed_sfe69',
-    4261: 'sbseabed_SFN02',
-    4262: 'sbseabed_SFN03',
-    4263: 'sbseabed_SFNcunt',
-    4264: 'sbseabed1_SFW',
-    4265: 'sbseabed2_SFW',
-    4266: 'sbseabed6_SFW',
-    4267: 'sbseabed2_las2',
-    4268: 'sbseabed3_las20',
-    4269: 'sbseabed1_las2',
-    4270: 'sbseabed5_las2',
-    4271: 'sbseabed6las2',
-    4272: 'sbseabed8_las2',
-    4273: 'sbseabed7_las2',
-    4274: 'sbseabed86_las2',
-    4275: 'sbseabed9_las20',
-    4276: 'sbseabed91_las2',
-    4277: 'sbseabed93_LAS',
-    4278: 'sbseabed92_LAS',
-    4279: 'sbseabed94_LAS',
-    4280: 'sbseabed95_LAS',
-    4281: 'sbseabed96_LAS',
-    4282: 'sbseabed97_LAS',
-    4283: 'sbseabed99_LAS',
-    4284: 'sbseabed98_LAS',
-    4285: 'sbseabed81_LAS',
-    4286: 'sbseabed85_LAS',
-    4287: 'sbseabed84_LAS',
-    4288: 'sbseabed83_LAS',
-    4289: 'sbseabed82_LAS',
-    4290: 'sbcs_landbit_46',
-    4291: 'sbcs_landbit_54',
-    4292: 'sbcs_landbit_63',
-    4293: 'sbcs_landbit_72',
-    4294: 'sbcs_landbit_77',
-    4295: 'sbcs_landbit_78',
-    4296: 'sbcs_seabit_new',
-    4297: 'sbcs_seabit1_new',
-    4298: 'sbcs_seabit2_new',
-    4299: 'sbcs_seabit3_new',
-    4300: 'sbcs_seabit4_new',
-    4301: 'sbcs_seabit5_new',
-    4302: 'sbcs_seabit6_new',
-    4303: 'sbcs_seabit7_new',
-    4304: 'sbcs_seabit8_new',
-    4305: 'sbcs_seabit9_new',
-    4306: 'sbcs_seabit11_new',
-    4307: 'sbcs_seabit10_new',
-    4308: 'sbcs_seabit12_new',
-    4309: 'sbcs_seabit13_new',
-    4310: 'sbcs_seabit14_new',
-    4311: 'sbcs_seabit15_new',
-    4312: 'sbcs_seabit16_new',
-    4313: 'sbcs_seabit17_new',
-    4314: 'sbseabed_CN01',
-    4315: 'sbseabed_CN03',
-    4316: 'sbseabed_CN04',
-    4317: 'sbcn_seafloor03',
-    4318: 'sbcn_seafloor04',
-    4319: 'sbcn_seafloor01',
-    4320: 'sbcn_seafloor05',
-    4321: 'sbcn_seafloor06',
-    4322: 'sbcn_seafloor07',
-    4323: 'sbxseabed_CN02',
-    4324: 'sbxseabed_CN05',
-    4325: 'sbxseabed_CN06',
-    4326: 'sbxseabed_CN07',
-    4327: 'sbcn_seafloor08',
-    4328: 'sbcn_seafloor09',
-    4329: 'sbcn_seafloor10',
-    4330: 'sbcn2_seafloor01',
-    4331: 'sbcn2_seafloor02',
-    4332: 'sbcn2_seafloor03',
-    4333: 'sbcn2_seafloor04',
-    4334: 'sbvgsEseafloor03',
-    4335: 'sbseabed_05_SFSe',
-    4336: 'sbseabed_10_SFSe',
-    4337: 'sbseabed_09_SFSe',
-    4338: 'sbseabed_08_SFSe',
-    4339: 'sbseabed_07_SFSe',
-    4340: 'sbseabed_11_SFSe',
-    4341: 'sbseabed_03_SFSe',
-    4342: 'sbseabed_02_SFSe',
-    4343: 'sbseabed_01_SFSe',
-    4344: 'sbseabed01_LAW',
-    4345: 'sbvgsSseafloor05',
-    4346: 'sbvgsSseafloor04',
-    4347: 'sbcw_seabed01',
-    4348: 'sbcw_seabed02',
-    4349: 'sbcw_seabed03',
-    4350: 'sbcw_seabed04',
-    4351: 'sbcw_seabed05',
-    4352: 'sbcw_seabed06',
-    4353: 'sbcuntwland27b',
-    4354: 'sbcuntwland28b',
-    4355: 'sbcuntwland30b',
-    4356: 'sbcuntwland43b',
-    4357: 'sbcuntwland44b',
-    4358: 'sbcuntwland28bb',
-    4359: 'sbcuntwland30bb',
-    4360: 'sbObject01',
-    4361: 'sbObject02',
-    4362: 'sbObject03',
-    4363: 'sbObject04',
-    4364: 'sbObject05',
-    4365: 'sbObject06',
-    4366: 'sbObject07',
-    4367: 'sbObject08',
-    4368: 'sbObject09',
-    4369: 'sbObject10',
-    4370: 'sbObject11',
-    4371: 'sbObject12',
-    4372: 'beach04_sv',
-    4373: 'sv_roadscoast01',
-    4374: 'beach04b_sv',
-    4504: 'cuntw_roadblockld',
-    4505: 'cuntw_roadblock01ld',
-    4506: 'cuntw_roadblock02ld',
-    4507: 'cuntw_roadblock03ld',
-    4508: 'cuntw_roadblock04ld',
-    4509: 'cuntw_roadblock05ld',
-    4510: 'sfw_roadblock1ld',
-    4511: 'sfw_roadblock2ld',
-    4512: 'sfw_roadblock3ld',
-    4513: 'sfn_roadblockld',
-    4514: 'cn2_roadblock01ld',
-    4515: 'cn2_roadblock02ld',
-    4516: 'cn2_roadblock03ld',
-    4517: 'cn2_roadblock04ld',
-    4518: 'CE_Makospan1ld',
-    4519: 'CE_Fredbarld',
-    4520: 'CE_Fredbar01ld',
-    4521: 'CE_Flintwat01ld',
-    4522: 'CE_Flintintld',
-    4523: 'sfse_roadblock1',
-    4524: 'sfse_roadblock3',
-    4525: 'sfse_roadblock4',
-    4526: 'sfse_roadblock5',
-    4527: 'sfse_roadblock2',
-    4533: 'sbseabed_SFN03bb',
-    4535: 'sbseabed_SFN01',
-    4538: 'sbCE_grndPALCST05',
-    4540: 'sbcn_seafloor02',
-    4550: 'LibrTow1_LAn',
-    4551: 'LAriverSec2_LAn',
-    4552: 'amubloksun1_LAn',
-    4553: 'road12_LAn2',
-    4554: 'LibBase1_LAn',
-    4555: 'figfree4_LAn',
-    4556: 'sky4plaz1_LAn',
-    4557: 'road10_LAn2',
-    4558: 'LacmEntr1_LAn',
-    4559: 'LacmaBase1_LAn',
-    4560: 'LacmCanop1_LAn',
-    4562: 'LAplaza2_LAn',
-    4563: 'LAskyscrap1_LAn',
-    4564: 'LAskyscrap2_LAn',
-    4565: 'bunksteps1_LAn',
-    4567: 'road07_LAn2',
-    4568: 'ground01_LAn2',
-    4569: 'stolenbuilds05',
-    4570: 'stolenbuilds08',
-    4571: 'stolenbuilds09',
-    4572: 'stolenbuilds11',
-    4573: 'stolenbuilds12',
-    4574: 'stolenbuilds13',
-    4575: 'fireescapes1_lan2',
-    4576: 'lan2newbuild1',
-    4584: 'halgroundlan2',
-    4585: 'towerlan2',
-    4586: 'skyscrapn201',
-    4587: 'skyscrapn203',
-    4588: 'roofshitlan2',
-    4589: 'road15_LAn2',
-    4590: 'grasspatchlan2',
-    4591: 'lan2shit03',
-    4592: 'lan2shit04',
-    4593: 'lan2buildblk01',
-    4594: 'lan2buildblk02',
-    4595: 'cpark05_LAN2',
-    4596: 'cspGM_LAN2',
-    4597: 'crprkblok4_LAN2',
-    4598: 'crprkblok2_LAN2',
-    4599: 'csp2GM_LAN2',
-    4600: 'LAdtbuild10_LAn',
-    4601: 'LAn2_gm1',
-    4602: 'LAskyscrap4_LAn',
-    4603: 'sky4plaz2_LAn',
-    4604: 'build4plaz_LAn2',
-    4605: 'skyscrapn203_gls',
-    4636: 'cparkgmaumk_LAN',
-    4637: 'cpark_muck_lan2',
-    4638: 'paypark_lan01',
-    4639: 'paypark_lan02',
-    4640: 'paypark_lan03',
-    4641: 'paypark_lan04',
-    4642: 'paypark_lan',
-    4643: 'LAplaza2b_LAn2',
-    4644: 'road06_LAn2',
-    4645: 'road14_LAn2',
-    4646: 'road13_LAn2',
-    4647: 'road11_LAn2',
-    4648: 'road05_LAn2',
-    4649: 'road01_LAn2',
-    4650: 'road02_LAn2',
-    4651: 'road03_LAn2',
-    4652: 'road04_LAn2',
-    4653: 'Freeway7_LAn2',
-    4654: 'road09_LAn2',
-    4656: 'Freeway1_LAn2',
-    4658: 'Freeway2_LAn2',
-    4660: 'Freeway3_LAn2',
-    4662: 'Freeway4_LAn2',
-    4664: 'Freeway5_LAn2',
-    4666: 'Freeway6_LAn2',
-    4679: 'Freeway8_LAn2',
-    4681: 'LAdtbuild6_LAn2',
-    4682: 'LAdtbuild3_LAn2',
-    4683: 'LAdtbuild2_LAn2',
-    4684: 'LAalley1_LAn2',
-    4685: 'LAalley2_LAn2',
-    4690: 'skyscrapn202',
-    4691: 'csp3GM_LAN2',
-    4692: 'Freeway9_LAn2',
-    4694: 'Freeway10_LAn2',
-    4695: 'Freeway11_LAn2',
-    4697: 'crprkblok1_LAN2',
-    4700: 'cpark01_LAN2',
-    4701: 'cpark02_LAN2',
-    4702: 'cpark03_LAN2',
-    4703: 'cpark04_LAN2',
-    4708: 'LAdtbuild1_LAn2',
-    4710: 'road08_LAn2',
-    4711: 'amublokalpha_LAn2',
-    4712: 'LibPlaza1_LAn',
-    4714: 'Lacmaalphas1_LAn',
-    4718: 'gm_build4_LAn2',
-    4720: 'LTSLAsky1b_LAn',
-    4721: 'LTSLAsky2b_LAn2',
-    4722: 'LTSLAsky3b_LAn2',
-    4724: 'librarywall_lan2',
-    4726: 'libtwrhelipd_LAn2',
-    4727: 'libtwrhelipda_LAn2',
-    4729: 'billbrdlan2_01',
-    4730: 'billbrdlan2_03',
-    4731: 'billbrdlan2_05',
-    4732: 'billbrdlan2_06',
-    4733: 'billbrdlan2_07',
-    4734: 'billbrdlan2_08',
-    4735: 'billbrdlan2_09',
-    4736: 'billbrdlan2_10',
-    4737: 'fireescapes3_lan2',
-    4738: 'fireescapes2_lan2',
-    4806: 'BTOLAND8_LAS',
-    4807: 'LAroads_20gh_LAs',
-    4808: 'LAroadss_30_LAs',
-    4809: 'LAroads_05_LAs',
-    4810: 'hillpalos04_LAs',
-    4811: 'clifftest02',
-    4812: 'clifftest05',
-    4813: 'clifftest07',
-    4814: 'clifftest09',
-    4815: 'clifftestgrnd2',
-    4816: 'ROCKLIFF1_LAS',
-    4817: 'TRNTRK7_LAS',
-    4818: 'TRNTRK8_LAS',
-    4819: 'TRNTRK5_LAS',
-    4820: 'BTOLAND1_LAS',
-    4821: 'BTOLAND2_LAS',
-    4822: 'NWCSTRD1_LAS',
-    4823: 'lasgrifroad',
-    4824: 'lasgrifsteps2',
-    4825: 'griffithoblas',
-    4826: 'grifftop2',
-    4827: 'LAroads_20ghi_LAs',
-    4828: 'lasairprt5',
-    4829: 'lasairprt4',
-    4830: 'lasairprt3',
-    4831: 'airpurt2_las',
-    4832: 'airtwer_Las',
-    4833: 'airpurtder_las',
-    4834: 'airoad1d_LAS',
-    4835: 'airoad1b_LAS',
-    4836: 'LAroadsx_04_LAs',
-    4837: 'LApedhusrea_LAs',
-    4838: 'airpurtderfr_las',
-    4839: 'bchcostrd3_LAS',
-    4840: 'bchcostrd4_LAS',
-    4841: 'bchcostrd1_LAS',
-    4842: 'Beach1_LAs0fg',
-    4843: 'Beach1_LAs0fhy',
-    4844: 'Beach1_LAs04',
-    4845: 'hillpalos02_LAs',
-    4846: 'LAcityped1_LAs',
-    4847: 'Beach1_LAs0gj',
-    4848: 'sanpedbeaut',
-    4849: 'snpdmshfnc3_LAS',
-    4850: 'snpedshpblk07',
-    4851: 'hillpalos01_LAs',
-    4852: 'hillpalos03_LAs',
-    4853: 'traincano_LAS',
-    4854: 'lasundrairprt2',
-    4855: 'lasundrairprt1',
-    4856: 'lasundrairprt3',
-    4857: 'snpedmtsp1_LAS',
-    4858: 'snpedland1_LAS',
-    4859: 'snpedland2_LAS',
-    4860: 'unionstwar_LAS',
-    4861: 'snpedhuair2_LAS',
-    4862: 'airtun2_LAS',
-    4863: 'airtun1_LAS',
-    4864: 'airtun3_LAS',
-    4865: 'lasrnway2_LAS',
-    4866: 'lasrnway1_LAS',
-    4867: 'lasrnway3_LAS',
-    4868: 'LAroads_23_LAs',
-    4869: 'lasrnway8_LAS',
-    4870: 'airpurt2ax_las',
-    4871: 'airpurt2bx_las',
-    4872: 'LAroads_042e_LAs',
-    4873: 'unionstwarc2_LAS',
-    4874: 'Helipad1_las',
-    4875: 'hillpalos06_LAs',
-    4876: 'hillpalos08_LAs',
-    4877: 'dwntwnbit4_LAS',
-    4878: 'obcity1_LAS',
-    4879: 'hillpaloswal1_LAs',
-    4880: 'dwntwnbit2_LAS',
-    4881: 'uninstps_LAS01',
-    4882: 'lasbrid1_LAS',
-    4883: 'bchcostair_LAS',
-    4884: 'lastranentun1_LAS',
-    4885: 'lastranentun4_LAS',
-    4886: 'gngspwnhus1_LAS',
-    4887: 'dwntwnbit1_LAS',
-    4888: 'dwntwnbit3_LAS',
-    4889: 'dwntwnbit2b_LAS',
-    4890: 'lasairprterm2_LAS',
-    4891: 'billboard_LAS',
-    4892: 'kbsgarage2_LAS',
-    4894: 'dwntwnbit1b_LAS',
-    4895: 'lstrud_LAS',
-    4896: 'clifftest12',
-    4897: 'Beach1a1_LAs',
-    4898: 'clifftestgrnd',
-    4981: 'snpedteew1_LAS',
-    4982: 'snpedteew3_LAS',
-    4983: 'snpedteew1vv_LAS',
-    4984: 'snpedteew3gt_LAS',
-    4985: 'Cylinder03',
-    4986: 'odfwer_LAS',
-    4988: 'lasbillbrd1_las',
-    4990: 'airprtwlkto1_LAS',
-    4991: 'lasairprterm1_LAS',
-    4992: 'airplants_LAS',
-    4993: 'airplnt2_LAS',
-    4994: 'airbillb_LAS',
-    4995: 'airsinage_LAS',
-    4996: 'airsinage2_LAS',
-    4997: 'airsinage3_LAS',
-    4998: 'airsinage4_LAS',
-    4999: 'airsinage6_LAS',
-    5000: 'airsinage5_LAS',
-    5001: 'lasrunwall2_LAS',
-    5002: 'lasrnway4_LAS',
-    5003: 'lasrnway5_LAS',
-    5004: 'lasrnway6_LAS',
-    5005: 'lasrunwall1_LAS',
-    5006: 'airprtwlkto2_LAS',
-    5007: 'lasrunwall3_LAS',
-    5009: 'lasrnway7_LAS',
-    5013: 'LAroakt1_30_LAs',
-    5016: 'snpdPESS1_LAS',
-    5017: 'lastripx1_LAS',
-    5020: 'mul_LAS',
-    5021: 'LAroadsbrk_05_LAs',
-    5023: 'grifovrhang2_LAS',
-    5024: 'snpedtee_LAS',
-    5025: 'snpedtedc_LAS',
-    5026: 'lstrudct1_LAS',
-    5028: 'obcity1ct1_LAS',
-    5030: 'lasrunwall1ct_LAS',
-    5031: 'snpedteairt_LAS',
-    5032: 'las_runsigns_LAS',
-    5033: 'unmainstat_LAS',
-    5034: 'lasairprtcut4',
-    5036: 'BTOLAND1ct_LAS',
-    5038: 'airtun2ct_LAS',
-    5040: 'unionliq_LAS',
-    5042: 'bombshop_LAs',
-    5043: 'bombdoor_LAs',
-    5044: 'las_runsignsx_LAS',
-    5046: 'bchcostrd4fuk_LAS',
-    5051: 'airobarsjm_LAS',
-    5052: 'BTOROAD1vb_LAS',
-    5056: 'modLAS',
-    5060: 'crlsafhus_LAS',
-    5061: 'lascarl',
-    5062: 'hillpawfnce_LAs',
-    5064: 'TRNTRK5z_LAS',
-    5066: 'mondoshave_LAS',
-    5068: 'airctsjm1_las',
-    5069: 'ctscene1_las',
-    5070: 'sjmctfnce1_las',
-    5071: 'sjmctfnce2_las',
-    5072: 'sjmctfnce3_las',
-    5073: 'sjmctfnce4_las',
-    5074: 'sjmctfnce5_las',
-    5075: 'sjmctfnce6_las',
-    5076: 'sjmctfnce7_las',
-    5077: 'sjmctfnce8_las',
-    5078: 'ctscene2_las',
-    5079: 'sjmbarct1_LAS',
-    5080: 'sjmbarct2_LAS',
-    5081: 'rdcrashbar1_LAs',
-    5082: 'rdcrashbar2_LAs',
-    5083: 'alphbrk1_las',
-    5084: 'alphbrk2_las',
-    5086: 'alphbrk3_las',
-    5087: 'alphbrk4_las',
-    5088: 'alphbrk5_las',
-    5089: 'alphbrk6_las',
-    5105: 'Stordralas2',
-    5106: 'Roadsbx_las2',
-    5107: 'chemplant2_las2',
-    5108: 'LADocks2_las2',
-    5109: 'sanpdmdock3_las2',
-    5110: 'mexcrnershp2_las2',
-    5111: 'IndusLand2_las2',
-    5112: 'LAroads_26_las2',
-    5113: 'BlockAA_las2',
-    5114: 'Beach1_las2',
-    5115: 'las2chemdock1',
-    5116: 'las2stripbar1',
-    5117: 'TRNTRK4_las2',
-    5118: 'TRNTRK3_las2',
-    5119: 'TRNTRK4A_las2',
-    5120: 'BTOROAD3_las2',
-    5121: 'BTOLAND6_las2',
-    5122: 'BTOLAND5_las2',
-    5123: 'NEWCOMP2_las2',
-    5124: 'NWCSTRD2_las2',
-    5125: 'NWCSTRD3_las2',
-    5126: 'dockcranescale0',
-    5127: 'imcomp1trk',
-    5128: 'BTOROAD1mnk_las2',
-    5129: 'imracompint_las2',
-    5130: 'imcompstrs02',
-    5131: 'imrancomp1_las2',
-    5132: 'las2dkwar107',
-    5133: 'bchcostrd6_las2',
-    5134: 'snpedshprk_las2',
-    5135: 'brkwrhus02',
-    5136: 'snpedshprk1_las2',
-    5137: 'brkwrhus3_las2',
-    5138: 'snpdoldwrhs2_las2',
-    5139: 'sanpedro4_las2',
-    5140: 'snpedtatshp',
-    5141: 'BTOROADxtra_las2',
-    5142: 'las2plaza1bit',
-    5143: 'las2chendock04',
-    5144: 'las2jmscum11',
-    5145: 'sanpdmdock2_las2',
-    5146: 'sanpdmdock1_las2',
-    5147: 'sanpedbigbrid_las2',
-    5148: 'bigstormbrid_las2',
-    5149: 'scumest1_las2',
-    5150: 'SCUMWIRES1_las2',
-    5151: 'carganghud_las2',
-    5152: 'stuntramp1_las2',
-    5153: 'stuntramp7_las2',
-    5154: 'dk_cargoshp03d',
-    5155: 'dk_cargoshp05d',
-    5156: 'dk_cargoshp24d',
-    5157: 'dk_cargoshpd25d',
-    5158: 'dk_cargoshp76d',
-    5160: 'dkcargohull2d',
-    5166: 'dkcargohull2bd',
-    5167: 'dkcargohull2cd',
-    5168: 'cluckinbell1_las2',
-    5169: 'imnrmpy1_las2',
-    5170: 'imnrmpy2_las2',
-    5171: 'dockoff01_LAs2',
-    5172: 'Beach1spt_las2',
-    5173: 'las2jmscum12',
-    5174: 'sanpedmexq4_las2',
-    5175: 'sanpedmexq3_las2',
-    5176: 'sanpdmdocka_las2',
-    5177: 'las2stripsshp1',
-    5178: 'cutrdn1_las2',
-    5179: 'mexcrnershp_las2',
-    5180: 'nwspltbild2_las2',
-    5181: 'nwspltbild3_las2',
-    5182: 'nwspltbild4_las2',
-    5183: 'nwspltbild1_las2',
-    5184: 'mdock1a_las2',
-    5185: 'brkwrhusfuk_las2',
-    5186: 'nwsnpdnw_las2',
-    5187: 'mexcrnrxc_las2',
-    5188: 'nwrrdssplt_las2',
-    5189: 'ctddwwnblk_las2',
-    5190: 'scrapfnce_las2',
-    5191: 'nwdkbridd_las2',
-    5192: 'chemgrnd_las2',
-    5231: 'snpedteew2_las2',
-    5232: 'snpedteew9_las2',
-    5233: 'snpedteew8_las2',
-    5234: 'SCUMWFIRES1_las20',
-    5243: 'RiverBridls_las2',
-    5244: 'lasntrk1im03',
-    5250: 'bchcostrd6v_las2',
-    5259: 'las2dkwar01',
-    5260: 'las2dkwar02',
-    5261: 'las2dkwar03',
-    5262: 'las2dkwar04',
-    5265: 'SCUMWFIRES1_las01',
-    5266: 'snpedteew8_las01',
-    5267: 'sanpedmexq1_las2',
-    5268: 'imracompral_las2',
-    5269: 'las2dkwar05',
-    5270: 'StormDraifr1_las2',
-    5271: 'LAroads_24_las2',
-    5272: 'TRNTRK2_las2',
-    5273: 'BTOLAND4_las2',
-    5274: 'StormDraifr2_las2',
-    5275: 'TRNTRK4A_las201',
-    5276: 'NEWCOMPRD_las2',
-    5277: 'NEWCMPTRK_las2',
-    5278: 'NEWCOMP1_las2',
-    5279: 'nwsnpdgrnd1_las2',
-    5290: 'SCUMWIRES1_las03',
-    5291: 'snpedscrsap_las01',
-    5292: 'snpedteew8_las03',
-    5293: 'snpedteew8_las04',
-    5294: 'snpedteew8_las05',
-    5295: 'snpedteew8_las06',
-    5296: 'LAroads_26a_las01',
-    5297: 'LAroads_26b_las01',
-    5298: 'bigstormbridb_las2',
-    5299: 'las2_brigtower',
-    5301: 'balcony_kbolt01',
-    5302: 'burg_lkupdoor',
-    5306: 'chemfence_las2',
-    5308: 'balcony_kbolt02',
-    5309: 'las2lnew3_las2',
-    5310: 'las2lnew2_las2',
-    5311: 'las2lnew1_las2',
-    5312: 'snpedteevbg_las2',
-    5313: 'newlas2sh_LAS2',
-    5314: 'NEWCOMfuk_las2',
-    5322: 'stormd_fill1_LAS2',
-    5323: 'dockfenceq_las2',
-    5324: 'dockfencew_las2',
-    5325: 'dockfencee_las2',
-    5326: 'dockfencer_las2',
-    5327: 'stormful2_LAS2',
-    5328: 'stormful2s_LAS2',
-    5329: 'BTOROADsp3_las2',
-    5330: 'BTOROAsp2_las2',
-    5333: 'sanpedbigslt_las2',
-    5337: 'induswire1_las2',
-    5338: 'Beach1fnce_las2',
-    5339: 'Bealpha1_las2',
-    5340: 'modlas2',
-    5341: 'crlsafhus_LAS2',
-    5342: 'BTOLAND5m_las2',
-    5343: 'BTOLAND5n_las2',
-    5347: 'TRNTRK3p_las2',
-    5349: 'BTOLAND6q_las2',
-    5351: 'snpedteew8_las07',
-    5353: 'NWCSTRD4_las2',
-    5355: 'Stordrablas2',
-    5358: 'las2jmscumTR12',
-    5363: 'NWCSTRtr_las2',
-    5364: 'NEWCOMtr_las2',
-    5366: 'alphbrk1_las2',
-    5367: 'alphbrk2_las2',
-    5368: 'alphbrk3_las2',
-    5369: 'alphbrk4_las2',
-    5370: 'alphbrk5_las2',
-    5371: 'alphbrk6_las2',
-    5372: 'alphbrk7_las2',
-    5373: 'alphbrk8_las2',
-    5374: 'alphbrk9_las2',
-    5375: 'alphbrk91_las2',
-    5390: 'laeskateparkLA',
-    5391: 'laeroad01',
-    5392: 'laestripmall1',
-    5393: 'laeshop1',
-    5394: 'xstpdnam_LAE',
-    5395: 'laecomptonbrij3',
-    5396: 'laeRailBrijBlok',
-    5397: 'laeclubBlock1',
-    5398: 'laetraintunn02',
-    5399: 'laetraintunn01',
-    5400: 'laeskatetube1',
-    5401: 'laegarages1nw',
-    5402: 'laehospground1',
-    5403: 'laehospital1',
-    5404: 'laestormdrain01',
-    5405: 'laeBlakWesTran2',
-    5406: 'laecrackmotel4',
-    5407: 'laelasruff201',
-    5408: 'laeexaminerbuild1',
-    5409: 'laepetrol1a',
-    5410: 'laecumpstreet',
-    5411: 'laeroadsblk',
-    5412: 'laelasjmscubit',
-    5413: 'laecrackmotel1',
-    5414: 'laeJeffers02',
-    5415: 'laeskateparkTrans',
-    5416: 'laeganghous205',
-    5417: 'laenwblk2',
-    5418: 'lae711block01',
-    5419: 'laestormdrain02',
-    5420: 'laestormdrain03',
-    5421: 'laesmokeshse',
-    5422: 'laespraydoor1',
-    5423: 'laeJeffers03',
-    5424: 'laeJeffers04',
-    5425: 'laeJeffers05',
-    5426: 'laeJeffers06',
-    5427: 'laeJeffers09',
-    5428: 'laeJeffers10',
-    5429: 'xwhattfk_LAE',
-    5430: 'laeIdlewood11',
-    5431: 'laeroad02',
-    5432: 'laeroad03',
-    5433: 'laeroad04',
-    5434: 'laeroad05',
-    5435: 'laeroad06',
-    5436: 'fukxroad07',
-    5437: 'laeroad08',
-    5438: 'laeroad09',
-    5439: 'laeroad10',
-    5440: 'laeroad11',
-    5441: 'laeroad12',
-    5442: 'laeroad13',
-    5443: 'laeGlenPark02',
-    5444: 'laeChicano02',
-    5445: 'laeChicano01',
-    5446: 'laeChicano03',
-    5447: 'laeChicano04',
-    5448: 'laeChicano05',
-    5449: 'laeChicanoTr1',
-    5450: 'laeChicano06',
-    5451: 'laeChicano07',
-    5452: 'laeChicano09',
-    5453: 'laeChicano10',
-    5456: 'laeroad14',
-    5457: 'laeGlenPark01',
-    5458: 'laeMacPark01',
-    5459: 'laeJeffers01',
-    5461: 'laeGlenPark05',
-    5462: 'laeGlenPark04',
-    5463: 'laebuildsit01',
-    5464: 'laeGlenPark04Tr',
-    5467: 'laehospitalTr',
-    5469: 'laeRoads11Tr',
-    5470: 'laeRoads10Tr',
-    5471: 'laeIdlewood01',
-    5472: 'frecrsbrid_LAE',
-    5473: 'laeidlebrijTr',
-    5474: 'laeIdlewood02',
-    5475: 'laeIdleProj02',
-    5476: 'laeIdleProj01',
-    5477: 'laerailtrack1',
-    5478: 'laerailtrack2',
-    5479: 'laerailtrack3',
-    5480: 'laerailtrack4',
-    5481: 'laebridge',
-    5482: 'laeroad16',
-    5483: 'laeroad17',
-    5484: 'laeroad18',
-    5485: 'laeroad20',
-    5486: 'laeroad21',
-    5487: 'laeroad22',
-    5488: 'laeroad23',
-    5489: 'laeroad24',
-    5490: 'laeroad25',
-    5491: 'laeroad26',
-    5492: 'laeroad27',
-    5493: 'laeroad28',
-    5494: 'laeroad29',
-    5495: 'laeroad30',
-    5496: 'laeroad31',
-    5497: 'laeroad32',
-    5498: 'laeroad33',
-    5499: 'laeroad34',
-    5500: 'laeroad35',
-    5501: 'laeroad36',
-    5502: 'laeroad37',
-    5503: 'laeroad38',
-    5504: 'laeroad39',
-    5505: 'laeroad40',
-    5506: 'laeroad41',
-    5507: 'laeroad42',
-    5508: 'laeroad43',
-    5509: 'laeroad44',
-    5510: 'laeroad45',
-    5511: 'laeroad46',
-    5512: 'laeroad47',
-    5513: 'laerail6',
-    5518: 'Idlewood05_LAe',
-    5519: 'Idlewood04_LAe',
-    5520: 'BDupsHouse_LAe',
-    5521: 'Idlewofuk06_LAe',
-    5522: 'Idlewood06Tr_LAe',
-    5528: 'laeroadct43',
-    5532: 'laesprayshop',
-    5565: 'laectru_LAE',
-    5624: 'laeHillsctst03',
-    5626: 'laecompmedhos518',
-    5627: 'lasbrid1SJM_LAe',
-    5628: 'laenwblkB1',
-    5629: 'LAEalpha6',
-    5630: 'blockalphalae',
-    5631: 'apartmntalpha',
-    5632: 'motelalpha',
-    5633: 'LAEalpha1',
-    5634: 'LAEalpha2',
-    5635: 'LAEalpha3',
-    5636: 'LAEalpha4',
-    5637: 'LAEalpha5',
-    5638: 'LAEalpha7',
-    5639: 'LAEdirtapha',
-    5640: 'laemacpark02',
-    5641: 'LAEalpha5b',
-    5642: 'laeChicano11',
-    5643: 'laeChicano08',
-    5644: 'laebuildsit01a',
-    5650: 'laeroad03b',
-    5652: 'stormdraindrt1_LAe',
-    5654: 'laeJeffers06alphas',
-    5655: 'laeChicano01b',
-    5656: 'laeChicano01c',
-    5660: 'laeskateP_alphas',
-    5663: 'graffiti01_lae',
-    5668: 'laebridgeb',
-    5674: 'laerailtrack2b',
-    5676: 'Motel2laealphas',
-    5677: 'laeJeffersalpha',
-    5678: 'Lae_smokecutscene',
-    5679: 'laetraintunn03',
-    5681: 'carwashalphas_lae',
-    5682: 'laeJeffers10alphas',
-    5703: 'road_lawn23',
-    5704: 'archwindshop_laW',
-    5705: 'filmstud1',
-    5706: 'studiobld03_laW',
-    5707: 'road_lawn03',
-    5708: 'hospital_law',
-    5709: 'shop03_laW01',
-    5710: 'cem01_law',
-    5711: 'cem02_law',
-    5712: 'cemint01_law',
-    5713: 'grave01_law',
-    5714: 'grave03_law',
-    5715: 'grave08_law',
-    5716: 'manns01_LAwN',
-    5717: 'Sunset20_LAwN',
-    5718: 'sunset16_LAwN',
-    5719: 'holbuild01_law',
-    5720: 'holbuild02_law',
-    5721: 'holbuild04_law',
-    5722: 'manns05_LAwN',
-    5723: 'manns04_LAwN',
-    5724: 'holsign03n_law',
-    5725: 'holpacific2_law',
-    5726: 'Lawn_holbuild21',
-    5727: 'holbuild10_law',
-    5728: 'dummybuild46_law',
-    5729: 'MelBlok02_LAwN',
-    5730: 'MelBlok03_LAwN',
-    5731: 'MelBlok05_LAwN',
-    5732: 'donut01_LAwN',
-    5733: 'melrose07_law',
-    5734: 'melrose09_law',
-    5735: 'studoff_law',
-    5736: 'studoff02_law',
-    5737: 'archshop07_laW02',
-    5738: 'hothol02_law01',
-    5739: 'tallbldgrn',
-    5740: 'tall2',
-    5741: 'lawnstuff21',
-    5742: 'lawnstuff15',
-    5743: 'grndLAwn',
-    5744: 'road_lawn32',
-    5745: 'road_lawn07',
-    5746: 'road_lawn08',
-    5747: 'road_lawn01',
-    5748: 'road_lawn09',
-    5749: 'road_lawn10',
-    5750: 'road_lawn11',
-    5751: 'road_lawn12',
-    5752: 'road_lawn13',
-    5753: 'road_lawn37',
-    5754: 'road_lawn15',
-    5755: 'road_lawn36',
-    5756: 'road_lawn33',
-    5757: 'road_lawn18',
-    5758: 'road_lawn19',
-    5759: 'road_lawn20',
-    5760: 'MelBlok09_LAwN',
-    5761: 'MelBlok06_LAwN',
-    5762: 'foodmartlawn',
-    5763: 'bigbuillawn',
-    5764: 'lawnwires01',
-    5765: 'sunset15_LAwN',
-    5766: 'capitRec2_LAwN',
-    5767: 'capitRec1_LAwN',
-    5768: 'TaftBldg1_LAwN',
-    5769: 'VineBlock1_LAwN',
-    5770: 'TaftBldgTran_LAwN',
-    5771: 'melrose10_law',
-    5772: 'RailTunn01_LAwN',
-    5773: 'TrainStat01_LAwN',
-    5774: 'garage01_LAwN',
-    5775: 'standard01_LAwN',
-    5777: 'tombston01_LAwN',
-    5778: 'gravecov01_LAwN',
-    5779: 'garagDoor1_LAwN',
-    5780: 'MelBlok11Tr_LAwN',
-    5781: 'MelBlok11_LAwN',
-    5782: 'MelBlok12_LAwN',
-    5783: 'MelWir02_LAwN',
-    5784: 'MelBlok08_LAwN',
-    5785: 'MelBlok02Tr_LAwN',
-    5787: 'MelBlok01_LAwN',
-    5788: 'MelBlok01T_LAwN',
-    5789: 'melrose01Tr_law',
-    5790: 'shopboards01_LAwn',
-    5792: 'fredricks01_LAwN',
-    5793: 'road_lawn02',
-    5794: 'road_lawn06',
-    5795: 'road_lawn14',
-    5796: 'road_lawn38',
-    5797: 'road_lawn21',
-    5798: 'road_lawn35',
-    5799: 'road_lawn29',
-    5800: 'road_lawn30',
-    5801: 'road_lawn28',
-    5802: 'road_lawn34',
-    5803: 'road_hillLAwn12',
-    5804: 'road_lawn25',
-    5805: 'road_lawn22',
-    5806: 'road_lawn17',
-    5807: 'road_lawn16',
-    5808: 'road_lawn39',
-    5809: 'lawngrndaa',
-    5810: 'lawnmalstrip',
-    5811: 'lawnmallsign1',
-    5812: 'grasspatchlawn',
-    5813: 'lawnshop1',
-    5814: 'lawncluckbel',
-    5815: 'lawngrnda',
-    5816: 'odrampbit',
-    5817: 'odrampbit01',
-    5818: 'posters02_LAwN',
-    5819: 'lawnbuildg',
-    5820: 'odrampbit02',
-    5821: 'odrampbit03',
-    5822: 'lhroofst14',
-    5823: 'lawnalley',
-    5835: 'ci_astage',
-    5836: 'ci_watertank',
-    5837: 'ci_guardhouse1',
-    5838: 'ci_watertank01',
-    5844: 'lawnmart_alpha',
-    5845: 'lawngrndasas',
-    5846: 'posters01_LAwN',
-    5847: 'lawnbushb',
-    5848: 'mainblk_LAwN',
-    5853: 'sunset21_LAwN',
-    5854: 'lawnbillbrd2',
-    5855: 'lawncrates',
-    5856: 'lawnspraydoor1',
-    5857: 'Lawn_buyable1',
-    5859: 'road_lawn24',
-    5860: 'road_lawn27',
-    5861: 'road_lawn05',
-    5862: 'road_lawn31',
-    5863: 'filmstud4',
-    5864: 'filmstud3',
-    5865: 'filmstud2',
-    5866: 'road40_LAwN',
-    5868: 'sunset16Tr_LAwN',
-    5870: 'sunset17_LAwN',
-    5871: 'Graveyard01_LAwN',
-    5873: 'manns03Tr_LAwN',
-    5874: 'manns03_LAwN',
-    5875: 'manns02_LAwN',
-    5877: 'VineBlokTran_LAwN',
-    5878: 'VineBlock2_LAwN',
-    5881: 'skyscr02_LAwN',
-    5882: 'skyscr01_LAwN',
-    5885: 'skyscr03_LAwN',
-    5886: 'spray01_LAwN',
-    5887: 'FredBlock_LAwN',
-    5888: 'FredBlokTran_LAwN',
-    5891: 'hblues02_LAwN',
-    5892: 'hblues01_LAwN',
-    5893: 'hblues01Tr_LAwN',
-    5896: 'sunset22_LAwN',
-    5986: 'Chateau01_LAwN',
-    5987: 'sunset19_LAwN',
-    5993: 'lawnmalstripTR',
-    5994: 'road_lawn26',
-    5995: 'road_lawn04',
-    5998: 'sunset18Tr_LAwN',
-    5999: 'sunset18_LAwN',
-    6006: 'newbit01_LAwN',
-    6007: 'newbit02_LAwN',
-    6035: 'lawroads_law12',
-    6036: 'filler01_laW',
-    6037: 'filler02_laW',
-    6038: 'wilshire2_law',
-    6039: 'wilshire5_law',
-    6040: 'wilshire7_law',
-    6041: 'wilshire6_law',
-    6042: 'venblue01_law',
-    6043: 'wilshire1w_law',
-    6044: 'wilshire2w_law',
-    6045: 'wilshire5w_law',
-    6046: 'hedge01_law',
-    6047: 'wilshire1_law',
-    6048: 'mall_laW',
-    6049: 'beachwall_law',
-    6050: 'beachhut01_law',
-    6051: 'mallglass_laW',
-    6052: 'artcurve_law',
-    6053: 'stepshop_law',
-    6054: 'lawroads_law02',
-    6055: 'lawroads_law03',
-    6056: 'jettysign_law',
-    6057: 'wdpanelhs09_law',
-    6058: 'wdpanelhs08_law',
-    6059: 'offven02_law',
-    6060: 'plaza2top_law',
-    6061: 'plaza2bot_law',
-    6062: 'Miami_atm',
-    6063: 'staplaz_law',
-    6064: 'LAbeach_03bx',
-    6065: 'LAbeach_04bx',
-    6066: 'vengym_law',
-    6087: 'offven01_law',
-    6088: 'offven05_law',
-    6094: 'bevgrnd03b_law',
-    6095: 'offvensp02_law',
-    6096: 'offvensp03_law',
-    6098: 'gzbuild2_law',
-    6099: 'gaz3_law',
-    6100: 'gaz1_law',
-    6101: 'gaz2_law',
-    6102: 'gaz4_LAW',
-    6103: 'gaz5_LAW',
-    6104: 'gaz18_LAW',
-    6110: 'plazadrawlast_LAW',
-    6111: 'lawroads_law05',
-    6112: 'lawroads_law06',
-    6113: 'lawroads_law07',
-    6114: 'lawroads_law08',
-    6115: 'lawroads_law09',
-    6116: 'lawroads_law10',
-    6117: 'lawroads_law11',
-    6118: 'lawroads_law01',
-    6119: 'lawroads_law13',
-    6120: 'lawroads_law14',
-    6121: 'lawroads_law15',
-    6122: 'lawroads_law16',
-    6123: 'lawroads_law17',
-    6124: 'lawroads_law18',
-    6125: 'lawroads_law19',
-    6126: 'lawroads_law20',
-    6127: 'lawroads_law21',
-    6128: 'lawroads_law22',
-    6129: 'lawroads_law23',
-    6130: 'mallb_laW',
-    6132: 'gaz8_law',
-    6133: 'gaz9_law',
-    6134: 'gaz11_law',
-    6135: 'gaz13_law',
-    6136: 'gaz15_law',
-    6137: 'gaz12_law',
-    6138: 'gaz10_law',
-    6145: 'gaz16_law',
-    6148: 'gaz19_law',
-    6150: 'gaz7_LAW',
-    6151: 'gaz21_LAW',
-    6152: 'gaz20_law',
-    6157: 'gaz22_law',
-    6158: 'gaz24_law',
-    6159: 'gaz25_law',
-    6160: 'gaz23_law',
-    6165: 'burggrnd1_law',
-    6186: 'gaz5_LAW01',
-    6187: 'gaz26_law',
-    6188: 'gaz_pier2',
-    6189: 'gaz_pier1',
-    6199: 'gaz27_LAW',
-    6203: 'LAland_08',
-    6204: 'lawplaza_alpha',
-    6205: 'ja_gerrartlaw',
-    6209: 'beachbnt',
-    6210: 'beachbunt2',
-    6211: 'offven01_law01',
-    6212: 'offven05_law01',
-    6213: 'venlaw_grnd',
-    6214: 'LAW_alphaveg',
-    6217: 'law_vengrnd',
-    6223: 'gaz2bld_law',
-    6225: 'lawroads_law04',
-    6227: 'canalWest01_LAw',
-    6228: 'CanalBrij02_LAw',
-    6229: 'canalEast01_LAw',
-    6230: 'canaljetty_LAw',
-    6231: 'CanalRoad01_LAw',
-    6232: 'canal_arch',
-    6233: 'canal_floor',
-    6234: 'canal_floor2',
-    6235: 'canal_arch01',
-    6236: 'canal_floor3',
-    6237: 'venice_alpha',
-    6248: 'RailTunn01_LAw',
-    6249: 'RailTunn02_LAw',
-    6250: 'RailTunn03_LAw',
-    6251: 'RailTunn04_LAw',
-    6252: 'RailTunn05_LAw',
-    6280: 'Beach01_LAw2',
-    6281: 'Beach02_LAw2',
-    6282: 'venice03_laW2',
-    6283: 'pier04b_LAw2',
-    6284: 'santahouse02_law2',
-    6285: 'santahouse04_law2',
-    6286: 'santahouse05_law2',
-    6287: 'Pier02c_LAw2',
-    6288: 'Pier02b_LAw2',
-    6289: 'pier03b_LAw2',
-    6290: 'RailTunn02_LAw2',
-    6291: 'Roads30_LAw2',
-    6292: 'RailTunn01_LAw2',
-    6293: 'lawborder2b_LAW2',
-    6294: 'santahousegrp_law2',
-    6295: 'sanpedlithus_LAw2',
-    6296: 'veropolice_LAW2',
-    6297: 'Beachut01_LAw2',
-    6298: 'ferris01_LAw2',
-    6299: 'pier03c_LAw2',
-    6300: 'Pier04_LAw2',
-    6301: 'Roads11_LAw2',
-    6302: 'Roads14_LAw2',
-    6303: 'Roads16_LAw2',
-    6304: 'Roads19_LAw2',
-    6305: 'Roads23_LAw2',
-    6306: 'Roads24_LAw2',
-    6307: 'Roads26_LAw2',
-    6308: 'Roads28_LAw2',
-    6309: 'Roads29_LAw2',
-    6310: 'Roads08_LAw2',
-    6311: 'Roads33_LAw2',
-    6312: 'BeaCliff03_LAw2',
-    6313: 'BeaCliff01_LAw2',
-    6314: 'Roads31_LAw2',
-    6315: 'BeaLand01_LAw2',
-    6316: 'Roads02_LAw2',
-    6317: 'Roads07_LAw2',
-    6318: 'Roads12_LAw2',
-    6319: 'Roads17_LAw2',
-    6320: 'Roads15_LAw2',
-    6321: 'Roads18_LAw2',
-    6322: 'Roads20_LAw2',
-    6323: 'Roads21_LAw2',
-    6324: 'Roads22_LAw2',
-    6325: 'Roads01_LAw2',
-    6326: 'Roads34_LAw2',
-    6327: 'Roads35_LAw2',
-    6328: 'sunset12_LAw2',
-    6329: 'Roads27_LAw2',
-    6330: 'Roads06_LAw2',
-    6331: 'Roads05_LAw2',
-    6332: 'rodeo01_LAw2',
-    6333: 'Roads25_LAw2',
-    6334: 'rodeo02_LAw2',
-    6336: 'rodeo03_LAw2',
-    6337: 'sunset01_LAw2',
-    6338: 'sunset02_LAw2',
-    6340: 'rodeo06_LAw2',
-    6341: 'century02_LAw2',
-    6342: 'century01_LAw2',
-    6343: 'GeoPark01_LAw2',
-    6344: 'GeoParkTr_LAw2',
-    6345: 'Roads04_LAw2',
-    6347: 'BeaCliff04_LAw2',
-    6349: 'SunBils02_LAw2',
-    6350: 'SunBils01_LAw2',
-    6351: 'rodeo05_LAw2',
-    6352: 'rodeo05Tr_LAw2',
-    6353: 'SunBils04_LAw2',
-    6354: 'Sunset04_LAw2',
-    6355: 'Sunset05_LAw2',
-    6356: 'Sunset06_LAw2',
-    6357: 'Sunset04Tr_LAw2',
-    6362: 'Roads34Tr_LAw2',
-    6363: 'sunset02Tr_LAw2',
-    6364: 'sunset07_LAw2',
-    6366: 'sunset08_LAw2',
-    6368: 'sunset03_LAw2',
-    6369: 'sunset09_LAw2',
-    6370: 'rodeo06Tr_LAw2',
-    6371: 'rodeo04_LAw2',
-    6372: 'rodeo04Tr_LAw2',
-    6373: 'sunset11_LAw2',
-    6385: 'rodeo02Tr_LAw2',
-    6386: 'century02Tr_LAw2',
-    6387: 'century03_LAw2',
-    6388: 'SanClifft02_LAw2',
-    6389: 'SanClift01_LAw2',
-    6390: 'SanClifft04_LAw2',
-    6391: 'SanClifft05_LAw2',
-    6393: 'SanCliff04Tr_LAw2',
-    6397: 'SanCliff02Tr_LAw2',
-    6398: 'BeaCliff06_LAw2',
-    6399: 'BeaCliff06Tr_LAw2',
-    6400: 'spraydoor_LAw2',
-    6403: 'BeaCliff01Tr_LAw2',
-    6404: 'venice01b_LAw2',
-    6405: 'venice03Tr_laW2',
-    6406: 'venice04_LAw2',
-    6407: 'venice04Tr_LAw2',
-    6411: 'venice01bT_LAw2',
-    6413: 'sunset07Tr_LAw2',
-    6416: 'lawborder2a_LAW2',
-    6417: 'lawborder2c_LAW2',
-    6421: 'BeaLanTr02_LAw2',
-    6422: 'rdsign01_LAw2',
-    6427: 'Roads03_LAw2',
-    6428: 'Roads32_LAw2',
-    6430: 'BeaLanTr01_LAw01',
-    6431: 'BeaLanTr03_LAw2',
-    6436: 'santahouseTr_law2',
-    6443: 'BeaCliff02_LAw2',
-    6444: 'BeaCliff02Tr_LAw2',
-    6448: 'Pier01_LAw2',
-    6449: 'Pier02_LAw2',
-    6450: 'Pier03_LAw2',
-    6451: 'Pier01Tr_LAw2',
-    6457: 'Pier02Tr_LAw2',
-    6458: 'pier03Tr_LAw2',
-    6461: 'ferris01Tr_LAw2',
-    6462: 'pier04a_LAw2',
-    6466: 'pier04Tr_LAw2',
-    6487: 'countclub01_LAw2',
-    6488: 'countclub02_LAw2',
-    6489: 'countclubTr_LAw2',
-    6490: 'tvstudio01_LAw2',
-    6497: 'sunset10_LAw2',
-    6499: 'sunset12Tr_LAw2',
-    6501: 'RailTunn03_LAw2',
-    6502: 'RailTunn04_LAw2',
-    6507: 'Roads09_LAw2',
-    6508: 'Roads10_LAw2',
-    6509: 'Roads36_LAw2',
-    6513: 'tunblock_LAw2',
-    6514: 'tunent01_LAw2',
-    6516: 'tvstudioTr_LAw2',
-    6517: 'santagard_LAw2',
-    6522: 'country_law2',
-    6524: 'rdsign01_LAw03',
-    8390: 'multicarpark01_lvS',
-    8391: 'ballys03_lvs',
-    8392: 'ballys02_lvs',
-    8393: 'ballys01_lvs',
-    8394: 'vgsbox10sgn_lvS',
-    8395: 'vgEpyrmd_dy',
-    8396: 'sphinx02_lvs',
-    8397: 'luxorpillar01_lvs',
-    8398: 'luxorland01_lvS',
-    8399: 'nightclub01_lvs',
-    8400: 'nightclub02_lvs',
-    8401: 'shop05_lvs',
-    8402: 'vgshpgrnd01_lvS',
-    8403: 'shop03_lvs',
-    8404: 'vgshpgrnd03_lvS',
-    8405: 'vgshpgrnd02_lvS',
-    8406: 'carparksign01_lvs',
-    8407: 'carparkhut01_lvs',
-    8408: 'carparksign02_lvs',
-    8409: 'gnhotel01_lvs',
-    8410: 'carparkhut02_lvs',
-    8411: 'gnhotel02_lvs',
-    8412: 'wddngchplsign_lvs',
-    8416: 'bballcourt02_lvs',
-    8417: 'bballcourt01_lvs',
-    8418: 'vgshpgrnd04_lvS',
-    8419: 'vgsbldng01_lvs',
-    8420: 'arprtcrprk04_lvS',
-    8421: 'pirtehtl02_lvS',
-    8422: 'pirtehtl01_lvS',
-    8423: 'prtskllsgn02_lvs',
-    8424: 'vagbond01_lvs',
-    8425: 'villa_inn01_lvs',
-    8426: 'vlla_innfnc1_lvs',
-    8427: 'villa_inn03_lvs',
-    8428: 'villa_inn02_lvs',
-    8429: 'vlla_innfnc2_lvs',
-    8430: 'vlla_innfnc3_lvs',
-    8431: 'nucarpark01_lvs',
-    8432: 'shop06_lvs',
-    8433: 'residnce01_lvs',
-    8434: 'vgsoffice01_lvs',
-    8435: 'shop11_lvs',
-    8436: 'shop12_lvs',
-    8437: 'residntial01_lvs',
-    8438: 'VegasEroad003',
-    8439: 'vgsEedge12',
-    8440: 'vgsEedge15',
-    8441: 'vgsEedge16',
-    8442: 'VegasEroad009',
-    8443: 'VegasEroad010',
-    8444: 'VegasEroad011',
-    8445: 'vgsEedge13',
-    8446: 'VegasEroad013',
-    8447: 'VegasEroad019',
-    8448: 'VegasEroad020',
-    8449: 'VegasEroad021',
-    8450: 'VegasEroad022',
-    8451: 'VegasEroad031',
-    8452: 'VegasEroad032',
-    8453: 'VegasEroad033',
-    8454: 'VegasEroad034',
-    8455: 'VegasEroad041',
-    8456: 'VegasEroad058',
-    8457: 'vgsEedge19',
-    8458: 'VegasEroad075',
-    8459: 'vgsEland02_lvs',
-    8460: 'vgsEland03_lvs',
-    8461: 'vgsEland04_lvs',
-    8462: 'vgsEland06_lvs',
-    8463: 'vgsEland07_lvs',
-    8464: 'vgsEland08_lvs',
-    8465: 'vgsEcoast07',
-    8466: 'vgsEcoast08',
-    8467: 'vgsEland11_lvs',
-    8468: 'vgsEland12_lvs',
-    8469: 'vgsEedge25',
-    8470: 'vgsEedge27',
-    8471: 'VegasEroad092',
-    8472: 'VegasEroad094',
-    8473: 'VegasEroad095',
-    8474: 'VegasEroad096',
-    8475: 'VegasEroad097',
-    8476: 'VegasEroad098',
-    8477: 'VegasEroad099',
-    8480: 'csrspalace01_lvs',
-    8481: 'csrsfence01_lvs',
-    8482: 'csrspalace02_lvs',
-    8483: 'pirateland02_lvS',
-    8484: 'pirateland03_lvS',
-    8485: 'ballysbase_lvs',
-    8486: 'vgsEedge21',
-    8487: 'ballyswtr01_lvs',
-    8488: 'flamingo02_lvs',
-    8489: 'flamingo01_lvs',
-    8490: 'flamingo03_lvs',
-    8491: 'flamingo04_lvs',
-    8492: 'flamingo05_lvs',
-    8493: 'pirtshp01_lvs',
-    8494: 'lowbuild01_lvs',
-    8495: 'mall01_lvs',
-    8496: 'lowbuild03_lvs',
-    8497: 'vgsEland16_lvs',
-    8498: 'exclbr_hotl01_lvS',
-    8499: 'exclbr_hotl02_lvS',
-    8500: 'excalibur01_lvS',
-    8501: 'casroyale01_lvs',
-    8502: 'casroyldge01_lvs',
-    8503: 'shop08_lvs',
-    8504: 'shop10_lvs',
-    8505: 'shop14_lvs',
-    8506: 'shop16_lvs',
-    8507: 'shop15_lvs',
-    8508: 'genshop01_lvs',
-    8509: 'shop09_lvs',
-    8510: 'VegasEroad112',
-    8511: 'VegasEroad111',
-    8512: 'VegasEroad113',
-    8513: 'residnce01_lvs01',
-    8514: 'VegasEroad110',
-    8515: 'vgsEland01_lvs',
-    8516: 'shop07_lvs',
-    8517: 'VegasEroad114',
-    8518: 'vgsEedge26',
-    8519: 'VegasEroad015',
-    8520: 'VegasEroad045',
-    8521: 'VegasEroad071',
-    8522: 'VegasEroad093',
-    8523: 'VegasEroad072',
-    8524: 'VegasEroad042',
-    8525: 'VegasEroad043',
-    8526: 'vgbndsign01_lvs',
-    8527: 'vagbond02_lvs',
-    8528: 'vagbond03_lvs',
-    8529: 'vgsEland17_lvs',
-    8530: 'vgbndsign02_lvs',
-    8531: 'vgsEland18_lvs',
-    8532: 'vgsEland19_lvs',
-    8533: 'vgsEedge10',
-    8534: 'tikimotel01_lvs',
-    8535: 'tikimotel02_lvs',
-    8536: 'tikisign01_lvs',
-    8537: 'tikisign02_lvs',
-    8538: 'vgsrailroad03',
-    8539: 'vgsrailroad04',
-    8540: 'vgsrailroad05',
-    8541: 'vgsrailroad06',
-    8542: 'vgsrailroad07',
-    8543: 'vgsEedge11',
-    8544: 'vgsEhseing06',
-    8545: 'vgsEwrehse01',
-    8546: 'vgsEwrehse02',
-    8547: 'fctrygrnd01_lvs',
-    8548: 'trainsign01_lvs',
-    8549: 'fctryfnce01_lvs',
-    8550: 'laconcha_lvs',
-    8551: 'lacnchasgn_lvs',
-    8552: 'VegasEroad123',
-    8553: 'vgsEland21_lvs',
-    8554: 'vgsEland22_lvs',
-    8555: 'vgsEcrthse',
-    8556: 'vgshsegate04',
-    8557: 'vgshseing27',
-    8558: 'vgshseing28',
-    8559: 'vgshsewall06',
-    8560: 'vgEhseland05',
-    8561: 'VegasEroad124',
-    8562: 'VegasEroad127',
-    8563: 'lacnchasgn2_lvs',
-    8564: 'vgsEland29_lvs',
-    8565: 'vgsEbuild03_lvs',
-    8566: 'vgsEbuild02_lvs',
-    8567: 'vgsEbuild04_lvs',
-    8568: 'vgsEbuild05_lvs',
-    8569: 'vgsEbuild12_lvs',
-    8570: 'vgsEbuild09_lvs',
-    8571: 'vgsEbuild11_lvs',
-    8572: 'vgsSstairs02_lvs',
-    8573: 'balcony01_lvs',
-    8574: 'shpfrnt01_lvs',
-    8575: 'vgstrainstation',
-    8576: 'balcony02_lvs',
-    8577: 'trnstngrnd01_lvs',
-    8578: 'vgstrainstation3',
-    8579: 'balcony03_lvs',
-    8580: 'vgsSstairs05_lvs',
-    8581: 'vgsEbuild06_lvs',
-    8582: 'vgsEedge01',
-    8583: 'vgsEcoast02',
-    8584: 'vgsEcoast03',
-    8585: 'vgsEcoast04',
-    8586: 'vgsrailroad11',
-    8587: 'vgsrailroad13',
-    8588: 'vgsrailroad15',
-    8589: 'lwbldstuff03_lvs',
-    8590: 'filmrllprop01_lvs',
-    8591: 'olympic01_lvs',
-    8592: 'olympcrail01_lvs',
-    8593: 'vgsEwires01_lvs',
-    8594: 'vgsEwires02_lvs',
-    8595: 'vgsEwires19_lvs',
-    8596: 'vgsEwires03_lvs',
-    8597: 'tikimtl02rail_lvs',
-    8607: 'vgsEwires05_lvs',
-    8608: 'vgsEwires04_lvs',
-    8609: 'VegasEroad008',
-    8610: 'VegasEroad023',
-    8611: 'VegasEroad036',
-    8612: 'VegasEroad037',
-    8613: 'vgsSstairs03_lvs',
-    8614: 'vgsSstairs01_lvs',
-    8615: 'vgsSstairs04_lvs',
-    8616: 'VegasEroad130',
-    8617: 'bush01_lvs',
-    8618: 'ceasersign_lvs',
-    8619: 'bush02_lvs',
-    8620: 'exclbrsign01_lvS',
-    8622: 'VegasEroad131',
-    8623: 'bush03_lvs',
-    8624: 'vgsrailroad16',
-    8625: 'vgsEedge04',
-    8626: 'vgsEedge03',
-    8627: 'vgsrailroad23',
-    8628: 'vgsrailroad22',
-    8629: 'vgsrailroad19',
-    8630: 'vgsrailroad20',
-    8631: 'vgsrailroad21',
-    8632: 'vgsrailroad24',
-    8633: 'vgsrailroad26',
-    8634: 'vgsrailroad25',
-    8635: 'vgsrailbuild01',
-    8636: 'tikimtlwall01_lvs',
-    8637: 'VegasEroad134',
-    8638: 'vgsEedge09',
-    8639: 'chnatwnmll01_lvs',
-    8640: 'chnatwnmll02_lvs',
-    8641: 'chnatwnmll03_lvs',
-    8642: 'chnatwnmll04_lvs',
-    8643: 'vgsEbuild01_lvs',
-    8644: 'exclbrsign03_lvS',
-    8645: 'shbbyhswall01_lvs',
-    8646: 'shbbyhswall02_lvs',
-    8647: 'shbbyhswall03_lvs',
-    8648: 'shbbyhswall04_lvs',
-    8649: 'shbbyhswall05_lvs',
-    8650: 'shbbyhswall06_lvs',
-    8651: 'shbbyhswall07_lvs',
-    8652: 'shbbyhswall12_lvs',
-    8653: 'shbbyhswall08_lvs',
-    8654: 'vgsEland23_lvs',
-    8655: 'vgsEland24_lvs',
-    8656: 'shbbyhswall09_lvs',
-    8657: 'shbbyhswall10_lvs',
-    8658: 'shabbyhouse11_lvs',
-    8659: 'shbbyhswall11_lvs',
-    8660: 'bush04_lvs',
-    8661: 'gnhtelgrnd_lvs',
-    8662: 'nucrprkwall_lvs',
-    8663: 'triadcasno01_lvs',
-    8664: 'casrylegrnd_lvs',
-    8665: 'chnatwnmll06_lvs',
-    8666: 'chnatwnmll07_lvs',
-    8667: 'chnatwnmll08_lvs',
-    8668: 'chnatwnmll11_lvs',
-    8669: 'chnatwnmll13_lvs',
-    8670: 'chnatwnmll12_lvs',
-    8671: 'vgsEland26_lvs',
-    8672: 'vgsEedge06',
-    8673: 'csrsfence03_lvs',
-    8674: 'csrsfence02_lvs',
-    8675: 'wddngchpl02_lvs',
-    8676: 'wdngchplsgn2_lvs',
-    8677: 'vgsEland09_lvs',
-    8678: 'wdngchplgrnd01_lvs',
-    8679: 'bush05_lvs',
-    8680: 'chnatwnfnc02_lvs',
-    8681: 'chnatwnfnc03_lvs',
-    8682: 'chnatwnfnc04_lvs',
-    8683: 'chnatwnfnc05_lvs',
-    8684: 'chnatwnfnc06_lvs',
-    8685: 'chnatwnfnc07_lvs',
-    8686: 'chnatwnfnc01_lvs',
-    8687: 'vgelwbld15_lvs',
-    8688: 'vgelwbld16_lvs',
-    8689: 'vgelwbld17_lvs',
-    8710: 'bnuhotel01_lvs',
-    8824: 'vgsEedge05',
-    8825: 'vgsEstrphdge01',
-    8826: 'vgsEstrphdge02',
-    8827: 'vgsEstrphdge03',
-    8828: 'vgsEstrphdge04',
-    8832: 'pirtebrdg01_lvS',
-    8833: 'prtbrdgrope_lvS',
-    8834: 'prtbrdgrope2_lvS',
-    8835: 'pirtetrees01_lvS',
-    8836: 'pirtetrees02_lvS',
-    8837: 'pirtetrees03_lvS',
-    8838: 'vgEhshade01_lvs',
-    8839: 'vgsEcarshow1',
-    8840: 'vgsEflgs1_lvs',
-    8841: 'rsdncarprk01_lvs',
-    8842: 'vgsE24hr_lvs',
-    8843: 'arrows01_lvs',
-    8844: 'vgsEedge23',
-    8845: 'flamingrnd_lvs',
-    8846: 'bush06_lvs',
-    8849: 'vgelwbld18_lvs',
-    8850: 'vgelwbldgrd_lvs',
-    8851: 'vgEplntr01_lvs',
-    8852: 'bush07_lvs',
-    8853: 'vgEplntr02_lvs',
-    8854: 'vgEplntr03_lvs',
-    8855: 'vgEplntr04_lvs',
-    8856: 'vgEplntr06_lvs',
-    8857: 'vgsEcoast06',
-    8858: 'vgsrailroad09',
-    8859: 'vgsEcoast05',
-    8860: 'vgsrailroad14',
-    8865: 'vgEplntr07_lvs',
-    8866: 'vgEplntr08_lvs',
-    8867: 'vgsEcnstrct01',
-    8868: 'vgsEcnstrct02',
-    8869: 'vgsEcnstrct05',
-    8870: 'vgsEcnstrct03',
-    8871: 'vgsEcnstrct04',
-    8872: 'vgEscfldples01',
-    8873: 'vgsEcnstrct12',
-    8875: 'vgsEcnstrct14',
-    8877: 'vgsEcnstrct10',
-    8879: 'vgsEcnstrct08',
-    8881: 'excalibur02_lvS',
-    8882: 'excalibur03_lvS',
-    8883: 'vgsEfrght01',
-    8884: 'vgsEfrght02',
-    8885: 'vgsEfrght03',
-    8886: 'vgsEfrght04',
-    8887: 'bush08_lvs',
-    8888: 'bush09_lvs',
-    8889: 'vgsEstrphdge33',
-    8932: 'VegasEroad136',
-    8947: 'vgElkup',
-    8948: 'lckupgrgdoor_lvs',
-    8954: 'vgsEspras01',
-    8955: 'vgsEspray01',
-    8957: 'vgsEspdr01',
-    8969: 'vgsEwires06_lvs',
-    8979: 'vgsEesc02',
-    8980: 'vgsEesc01',
-    8981: 'prtwires_lvs',
-    8982: 'vgsEstrphdge34',
-    8983: 'vgsEedge02',
-    8989: 'bush10_lvs',
-    8990: 'bush11_lvs',
-    8991: 'bush12_lvs',
-    9000: 'vgsEedge17',
-    9001: 'vgsEedge20',
-    9002: 'vgsEedge22',
-    9003: 'vgsEedge24',
-    9004: 'VegasEroad051',
-    9005: 'VegasEroad050',
-    9006: 'VegasEroad086',
-    9007: 'VegasEroad049',
-    9008: 'VegasEroad048',
-    9019: 'luxortrees01_lvS',
-    9020: 'vgsEcnstfnc01',
-    9021: 'vegasEroad068',
-    9022: 'vegasEroad067',
-    9023: 'VegasEroad069',
-    9024: 'vegasEroad070',
-    9025: 'vegasEroad065',
-    9026: 'VegasEroad066',
-    9027: 'vegasEroad064',
-    9028: 'VegasEroad063',
-    9029: 'vgsEtrainfence01',
-    9030: 'vgsEtrainfence02',
-    9031: 'vgsEtrainfence03',
-    9032: 'vgsEtrainfence04',
-    9033: 'vgsEtrainfence05',
-    9034: 'tikitrees01_lvS',
-    9035: 'tikitrees02_lvS',
-    9036: 'tikibrdg01_lvs',
-    9037: 'csrspalace03_lvs',
-    9039: 'csrspalace04_lvs',
-    9041: 'prthotelfnc01',
-    9042: 'VegasEroad137',
-    9043: 'luxorpillar03_lvs',
-    9044: 'pirateland05_lvS',
-    9045: 'pirateland04_lvS',
-    9046: 'vgsEland31_lvs',
-    9047: 'vgsEland32_lvs',
-    9052: 'pirateland06_lvS',
-    9054: 'chnatwnmll14_lvs',
-    9055: 'chnatwnmll15_lvs',
-    9056: 'vgsEedge07',
-    9057: 'vgsEedge08',
-    9062: 'arprtcrprk05_lvS',
-    9064: 'vgsEland36_lvs',
-    9065: 'vgsEland35_lvs',
-    9066: 'vgsEland37_lvs',
-    9070: 'casroyale02_lvs',
-    9071: 'casroyale03_lvs',
-    9072: 'casroyale04_lvs',
-    9076: 'sphinx01_lvs',
-    9078: 'excalibur04_lvS',
-    9080: 'excalibur05_lvS',
-    9082: 'vgsEcnstrct17',
-    9083: 'vgsEcnstrct18',
-    9086: 'vgEhseland06',
-    9087: 'vgEhseland07',
-    9090: 'vgEferryland',
-    9093: 'cmdgrgdoor_lvs',
-    9098: 'vgsEsvhse01',
-    9099: 'vgsEsvehse1',
-    9106: 'vgsEamuntn',
-    9108: 'vgsEtrainfence06',
-    9109: 'vgsEtrainfence07',
-    9110: 'vgsEtrainfence08',
-    9111: 'vgsEtrainfence09',
-    9112: 'vgsEtrainfence10',
-    9113: 'vgbndfnce',
-    9114: 'wddngchpl01_lvs',
-    9115: 'VegasEroad138',
-    9116: 'VegasEroad139',
-    9117: 'VegasEroad140',
-    9118: 'VegasEroad141',
-    9119: 'vgsEedge14',
-    9120: 'VegasEroad143',
-    9131: 'shbbyhswall13_lvs',
-    9132: 'triadcasign_lvs',
-    9135: 'sbvgsEseafloor01',
-    9136: 'sbvgsEseafloor02',
-    9137: 'sbvgsEseafloor04',
-    9138: 'sbvgsEseafloor05',
-    9139: 'sbvgsEseafloor06',
-    9140: 'sbvgsEseafloor07',
-    9150: 'VegasEroad144',
-    9152: 'bush13_lvs',
-    9153: 'bush14_lvs',
-    9154: 'triadwires',
-    9159: 'pirtshp02_lvs',
-    9162: 'shop01_lvs',
-    9163: 'shop04_lvs',
-    9164: 'vgsrailbuild02',
-    9165: 'vgsrailbuild03',
-    9166: 'vgsrailbuild04',
-    9167: 'vgsrailbuild05',
-    9168: 'vgsrailbuild06',
-    9169: 'vgsEprtlstation1',
-    9171: 'vgsEprtlstation2',
-    9173: 'vgsEedge18',
-    9174: 'tislandbrdge01_lvs',
-    9184: 'vgEastbillbrd08',
-    9185: 'vgEastbillbrd07',
-    9186: 'vgEastbillbrd05',
-    9187: 'vgEastbillbrd04',
-    9188: 'vgEastbillbrd02',
-    9189: 'vgEastbillbrd06',
-    9190: 'vgEastbillbrd01',
-    9191: 'vgEastbillbrd03',
-    9205: 'road04sfn',
-    9206: 'land2_sfN10',
-    9207: 'land2_sfN01',
-    9208: 'land2_sfN19',
-    9209: 'land_SFN06',
-    9210: 'land2_sfN11',
-    9211: 'land2_sfN09',
-    9212: 'land2_sfN13',
-    9213: 'land2_sfN15',
-    9214: 'land2_sfN12',
-    9215: 'land2_sfN17',
-    9216: 'land_SFN13',
-    9217: 'land2_sfN16',
-    9218: 'land_SFN15',
-    9219: 'land2_sfN14',
-    9220: 'Villa_SFN_CHRIS_01',
-    9221: 'Villa_SFN_CHRIS_02',
-    9222: 'road08sfn',
-    9223: 'land_sfn21',
-    9224: 'cock_sfn02',
-    9225: 'land_sfn22',
-    9226: 'land_sfn18',
-    9227: 'moresfnshit20',
-    9228: 'moresfnshit22',
-    9229: 'sfn_coast03',
-    9230: 'sfn_coast01',
-    9231: 'road01sfn',
-    9232: 'road06sfn',
-    9233: 'road07sfn',
-    9234: 'land_sfn20',
-    9235: 'land2_sfN18',
-    9236: 'cock_sfn07',
-    9237: 'lighhouse_SFN',
-    9238: 'moresfnshit28',
-    9239: 'track01_SFN',
-    9240: 'track02_SFN',
-    9241: 'copbits_sfn',
-    9242: 'cock_sfn06',
-    9243: 'hrborbuild_SFN02',
-    9244: 'hrborbuild_SFN01',
-    9245: 'cstguard_SFN01',
-    9246: 'cock_sfn09',
-    9247: 'hrbrmstr_SFN01',
-    9248: 'cock_sfn08',
-    9249: 'beach_sfn01',
-    9250: 'road02sfn',
-    9251: 'road03sfn',
-    9252: 'road05sfn',
-    9253: 'sfn_coast04',
-    9254: 'carpark_sfn01',
-    9255: 'carpark_sfn02',
-    9256: 'cock_sfn14',
-    9257: 'sfn_coast05',
-    9258: 'preshoosml02_SFN',
-    9259: 'preshoosbig02_SFN',
-    9260: 'hrborbuild_SFN03',
-    9261: 'land_sfn19',
-    9262: 'hway_SFN01',
-    9264: 'hway_SFN03',
-    9265: 'hway_SFN04',
-    9266: 'hway_SFN05',
-    9267: 'hway_SFN06',
-    9269: 'GGbridgeend_SFN',
-    9270: 'preshoosbig01_SFN01',
-    9271: 'preshoos03_SFN01',
-    9272: 'preshoos03_SFN02',
-    9273: 'preshoos01_SFN03',
-    9274: 'preshoos03_SFN03',
-    9275: 'preshoosml02_SFN01',
-    9276: 'land_SFN17',
-    9277: 'bigsfnlite02',
-    9278: 'bigsfnlite05',
-    9279: 'bigsfnlite08',
-    9280: 'bigsfnlite10',
-    9281: 'bigsfnlite12',
-    9282: 'bigsfnlite14',
-    9283: 'bigsfnlite16',
-    9284: 'land2_sfN02',
-    9285: 'land2_sfN04',
-    9286: 'land2_sfN03',
-    9287: 'land2_sfN06',
-    9288: 'land2_sfN05',
-    9289: 'land2_sfN20',
-    9290: 'land2_sfN07',
-    9291: 'land2_sfN08',
-    9292: 'sfn_crashbar06',
-    9293: 'sfn_crashbar01',
-    9294: 'sfn_crashbar02',
-    9295: 'sfn_crashbar03',
-    9296: 'sfn_crashbar04',
-    9297: 'sfn_crashbar05',
-    9298: 'sfn_crashbar07',
-    9299: 'sfn_clothesSHOP_cm1',
-    9300: 'sfn_town02',
-    9301: 'tempobj_SFN04',
-    9302: 'sfn_town01',
-    9303: 'sfn_town03',
-    9304: 'land_sfn23',
-    9305: 'ground01_SFN_CM',
-    9306: 'sfn_cm_grNd02',
-    9307: 'SFN_SHOPBITS01',
-    9308: 'SFN_DOORWAY02',
-    9309: 'SFN_CM_GRNDSHOP',
-    9310: 'chapel_SFN',
-    9311: 'SFN_newland_cm02',
-    9312: 'SFN_newland_cm03',
-    9313: 'SFN_newland_cm01',
-    9314: 'advert01_sfn',
-    9315: 'carpark01_sfs_cm',
-    9316: 'shopstairsSFN1',
-    9317: 'hedge02_SFN_CM',
-    9318: 'hedge03SFN_CM',
-    9319: 'preshoos03_SFN04',
-    9320: 'preshoosbig02_SFN01',
-    9321: 'garage_sfn01',
-    9322: 'preshoos03_SFN05',
-    9323: 'moresfnshit29',
-    9324: 'preshoosbig02_SFN02',
-    9325: 'preshoos03_SFN06',
-    9326: 'preshoos03_SFN07',
-    9327: 'moresfnshit30',
-    9328: 'moresfnshit31',
-    9329: 'sfn_coast06',
-    9330: 'SFN_wall_cm01',
-    9331: 'SFN_PRESHEDGE1',
-    9332: 'SFN_wall_cm02',
-    9333: 'SFNhedge_PRES02',
-    9334: 'hedge09_SFN_CM',
-    9335: 'SFN_hedge_cm_010',
-    9336: 'hedge04_SFN_CM',
-    9337: 'SFN_WALL_cm2',
-    9338: 'land_sfn19B',
-    9339: 'SFNvilla001_CM',
-    9340: 'SFNfence_CM01',
-    9341: 'Villa_SFN_CHRIS_04',
-    9342: 'land2_sfN09a',
-    9343: 'SFN_fence_cm2',
-    9344: 'SFNhdge_presi_cm10',
-    9345: 'SFN_PIER_grassbit',
-    9346: 'SFNLand_villaCM1',
-    9347: 'SFNpres_hdge_10',
-    9348: 'sfn_hedge05_cm',
-    9349: 'SFNfence_pres_5',
-    9350: 'SFN_pres_hedge9',
-    9351: 'SFN_STAIRS_bit',
-    9352: 'cables',
-    9353: 'land_SFN17a',
-    9361: 'boatoffice_sfn',
-    9362: 'boatoffice2_sfn',
-    9437: 'sbedsfn4_SFN',
-    9438: 'sbedsfn1_SFN',
-    9439: 'sbedsfn2_SFN',
-    9440: 'sbedsfn3_SFN',
-    9476: 'hway_SFN02',
-    9482: 'chinagate',
-    9483: 'land_16_sfw',
-    9484: 'land_46_sfw',
-    9485: 'road_SFW02',
-    9486: 'road_SFW03',
-    9487: 'road_SFW04',
-    9488: 'road_SFW05',
-    9489: 'road_SFW06',
-    9490: 'road_SFW07',
-    9491: 'road_SFW08',
-    9492: 'road_SFW09',
-    9493: 'road_SFW10',
-    9494: 'tempbuild_sfw41',
-    9495: 'tempbuild_sfw42',
-    9496: 'sboxbld4_sfw02',
-    9497: 'sboxbld4_sfw69',
-    9498: 'sboxbld4_sfw70',
-    9499: 'sboxbld4_sfw71',
-    9500: 'sboxbld4_sfwa',
-    9501: 'sfwbox_sfw27',
-    9502: 'sfwbox_sfw43',
-    9503: 'sboxbld4_sfw72',
-    9504: 'sboxbld4_sfw73',
-    9505: 'gard_sfw01',
-    9506: 'bigboxtmp02',
-    9507: 'bigboxtmp03',
-    9508: 'bigboxtmp09',
-    9509: 'bigboxtmp05',
-    9510: 'bigboxtmp06',
-    9511: 'bigboxtmp07',
-    9512: 'bigboxtmp08',
-    9513: 'bigboxtmp1',
-    9514: 'supasave_sfw',
-    9515: 'bigboxtmp18',
-    9516: 'bigboxtmp17',
-    9517: 'bigboxtmp16',
-    9518: 'bigboxtmp15',
-    9519: 'bigboxtmp20',
-    9520: 'boxbuildsfw_31',
-    9521: 'morboxes03',
-    9522: 'morboxes04',
-    9523: 'newvic2_sfw',
-    9524: 'blokmod1_sfw',
-    9525: 'boigas_sfw03',
-    9526: 'boigas_sfw02',
-    9527: 'boigas_sfw01',
-    9528: 'boigas_sfw04',
-    9529: 'blokmod3_sfw',
-    9530: 'sandbch_sfw02',
-    9547: 'blokcut_sfw04',
-    9549: 'sfw_boxwest10',
-    9550: 'sfw_boxwest04',
-    9551: 'sandbch_sfw04',
-    9552: 'sandbch_sfw03',
-    9553: 'sandbch_sfw69',
-    9554: 'park3_sfw',
-    9555: 'park1_sfw',
-    9556: 'park2_sfw',
-    9557: 'lake_sfw',
-    9558: 'cables_sfw',
-    9559: 'fescape_sfw07',
-    9560: 'fescape_sfw08',
-    9561: 'fescape_sfw09',
-    9562: 'fescape_sfw02',
-    9563: 'fescape_sfw04',
-    9564: 'firscape_sfw04',
-    9565: 'fescape_sfw06',
-    9566: 'fescape_sfw01',
-    9567: 'cables_sfw01',
-    9568: 'cables_sfw24',
-    9569: 'cables_sfw28',
-    9570: 'road_SFW11',
-    9571: 'road_SFW12',
-    9572: 'blokmod3_sfw04',
-    9573: 'newvic1_sfw',
-    9575: 'archbrij_SFW',
-    9576: 'frway_box1',
-    9577: 'frway_box2',
-    9578: 'blokmod2_sfw01',
-    9579: 'blokmod2_sfw03',
-    9580: 'sboxbld4_sfw83',
-    9581: 'sboxbld4_sfw84',
-    9582: 'temp_SFW35',
-    9583: 'freight_SFW15',
-    9584: 'freight_SFW31',
-    9585: 'freight_SFW33',
-    9586: 'freight_deck_SFW',
-    9587: 'freight_box_SFW01',
-    9588: 'freightbox_inSFw',
-    9589: 'frght_BOXES08',
-    9590: 'freight_interiorsfw',
-    9591: 'road_SFW13',
-    9592: 'sfw_boxwest12',
-    9593: 'hosbibal_sfw',
-    9594: 'fescape_sfw03',
-    9595: 'tempbuild_sfw22',
-    9596: 'land_04_sfw',
-    9597: 'sandbch_sfw01',
-    9598: 'sfw_boxwest02',
-    9599: 'vicbig_sfw1',
-    9600: 'road_SFW14',
-    9601: 'road_SFW15',
-    9602: 'road_SFW16',
-    9603: 'road_16_sfw',
-    9604: 'frght_BOXES19',
-    9605: 'land_01_sfw',
-    9606: 'land_34_sfw',
-    9607: 'land_22_sfw',
-    9608: 'ggate_park_sfw',
-    9609: 'land_37_sfw',
-    9610: 'land_42_sfw',
-    9611: 'land_43_sfw',
-    9612: 'ferrybit1_sfw',
-    9613: 'ferrybit3_sfw',
-    9614: 'donuts2_sfw',
-    9615: 'donuts_sfw',
-    9616: 'land_20_sfw',
-    9617: 'boigagr_sfw',
-    9618: 'scaff1_SFw',
-    9623: 'toll_SFW',
-    9624: 'spraysfw',
-    9625: 'spdr_sfw',
-    9652: 'road_SFW17',
-    9653: 'road_SFW18',
-    9680: 'tramstat_SFW',
-    9682: 'carspaces1_sfw',
-    9683: 'ggbrig_07_sfw',
-    9685: 'ggbrig_02_sfw',
-    9689: 'ggbrig_05_sfw',
-    9690: 'ggbrig_06_sfw',
-    9693: 'ggbrig_03_sfw',
-    9694: 'ggbrig_01_sfw',
-    9696: 'ggbrig_04_sfw',
-    9697: 'carspaces3_sfw',
-    9698: 'BRIDGE_argh',
-    9699: 'road_SFW19',
-    9700: 'road_SFW20',
-    9701: 'road_SFW21',
-    9702: 'road_SFW22',
-    9703: 'road_SFW23',
-    9704: 'road_SFW24',
-    9705: 'tunnel_sfw',
-    9706: 'road_SFW25',
-    9707: 'road_SFW26',
-    9708: 'road_SFW27',
-    9709: 'road_SFW01',
-    9710: 'road_SFW29',
-    9711: 'road_SFW30',
-    9712: 'road_SFW31',
-    9713: 'road_SFW32',
-    9714: 'road_SFW33',
-    9715: 'road_SFW34',
-    9716: 'road_sfw55',
-    9717: 'road_SFW35',
-    9718: 'road_SFW36',
-    9719: 'road_SFW37',
-    9720: 'road_SFW38',
-    9721: 'road_SFW39',
-    9722: 'road_SFW40',
-    9723: 'road_SFW41',
-    9724: 'road_SFW42',
-    9725: 'road_SFW43',
-    9726: 'road_SFW44',
-    9727: 'road_SFW45',
-    9728: 'road_SFW46',
-    9729: 'road_SFW47',
-    9730: 'road_SFW48',
-    9731: 'road_SFW49',
-    9732: 'road_SFW50',
-    9733: 'road_SFW51',
-    9734: 'road_SFW52',
-    9735: 'road_SFW53',
-    9736: 'road_SFW54',
-    9737: 'blokmod3_sfw69',
-    9738: 'blokmod2_sfw69',
-    9739: 'newvic1_sfw69b',
-    9740: 'newvic1_sfw69',
-    9741: 'blokmod1_sfwc',
-    9742: 'blokmod1_sfwb',
-    9743: 'rock_coastSFW2',
-    9744: 'rock_coastSFW1',
-    9745: 'rock_coastSFW3',
-    9746: 'rock_coastSFW4',
-    9747: 'road_SFW90',
-    9748: 'sfw_boxwest03',
-    9749: 'sfw_boxwest01',
-    9750: 'sfw_boxwest05',
-    9751: 'sfw_boxwest06',
-    9752: 'sfw_boxwest08',
-    9753: 'sfw_boxwest09',
-    9754: 'sfw_boxwest11',
-    9761: 'freight_alfa_SFW',
-    9762: 'sfw_boxwest07',
-    9763: 'blokcut_sfw01',
-    9764: 'blokcut_sfw02',
-    9765: 'blokcut_sfw03',
-    9766: 'scaff3_SFw',
-    9767: 'scaff2_SFw',
-    9812: 'veg_ivy_balcny_kb08',
-    9814: 'firscape_sfw01',
-    9815: 'firscape_sfw02',
-    9816: 'firscape_sfw03',
-    9817: 'scaff1b_SFw',
-    9818: 'shpbridge_sfw01',
-    9819: 'shpbridge_sfw02',
-    9820: 'shpbridge_sfw04',
-    9821: 'shpbridge_sfw03',
-    9822: 'shpbridge_sfw08',
-    9823: 'sav1sfw',
-    9824: 'diner_SFw',
-    9825: 'carspaces3_sfw02',
-    9827: 'road_SFW28',
-    9829: 'bumblister_SFW',
-    9830: 'ggcarpark_sfw',
-    9831: 'sfw_waterfall',
-    9832: 'parkbridge_sfw',
-    9833: 'fountain_SFW',
-    9834: 'hosbibal3_sfw',
-    9835: 'hosbibal4_sfw',
-    9836: 'hosbibal2_sfw',
-    9837: 'gg_split2_SFW',
-    9838: 'gg_split1_SFW',
-    9858: 'ferrybit69_sfw',
-    9859: 'chinawning69b',
-    9860: 'chinawning69',
-    9863: 'land_21_sfw',
-    9864: 'land_18_sfw',
-    9889: 'park3a_sfw',
-    9891: 'park2a_sfw',
-    9893: 'gardsfw02',
-    9894: 'blokmod2_sfw',
-    9895: 'bigboxtmp19',
-    9896: 'hosbi2al_sfw',
-    9897: 'hosbibal3b_sfw',
-    9900: 'landshit_09_sfe',
-    9901: 'ferybuild_1',
-    9902: 'ferryland3',
-    9903: 'pier69_models07',
-    9904: 'pier69_models04',
-    9905: 'pier69_models06',
-    9906: 'tempsf_2_sfe',
-    9907: 'monolith_sfe',
-    9908: 'anotherbuild091',
-    9909: 'vicstuff_sfe33',
-    9910: 'fishwarf01',
-    9911: 'fishwarf06',
-    9912: 'fishwarf03',
-    9913: 'fishwarf04',
-    9914: 'fishwarf05',
-    9915: 'sfe_park',
-    9916: 'jumpbuild_sfe',
-    9917: 'yet_another_sfe',
-    9918: 'posh2_sfe',
-    9919: 'grnwhite_sfe',
-    9920: 'vicstuff_sfe6000',
-    9921: 'ferryshops1',
-    9922: 'ferryshops2',
-    9923: 'ferryshops3',
-    9924: 'ferryshops4',
-    9925: 'ferryshops5',
-    9926: 'ferryshops07',
-    9927: 'sfe_redwht2',
-    9928: 'ferryshops08',
-    9929: 'boring_sfe',
-    9930: 'nicepark_sfe',
-    9931: 'church_sfe',
-    9946: 'pyrground_sfe',
-    9947: 'lbd_house1_sfe',
-    9948: 'lbd_house2_sfe',
-    9949: 'pier1_sfe',
-    9950: 'pier2_sfe',
-    9951: 'pier3_sfe',
-    9952: 'vicstuff_sfe6006',
-    9953: 'ottos_AUTOS_sfe',
-    9954: 'pier69_sfe3',
-    9955: 'pier69_sfe1',
-    9956: 'pier69_sfe2',
-    9957: 'multustor2_sfe',
-    9958: 'submarr_sfe',
-    10008: 'fer_cars2_sfe',
-    10009: 'fer_cars3_sfe',
-    10010: 'ugcarpark_SFe',
-    10011: 'carspaces_sfe14',
-    10012: 'cables4',
-    10013: 'vicstuff_sfe17',
-    10014: 'vicstu69_sfe',
-    10015: 'vicstu69b_sfe',
-    10016: 'vicnew_sfe04',
-    10017: 'bigvic_a1',
-    10018: 'tunnel_sfe',
-    10019: 'vicstuff_sfe45',
-    10020: 'vicstuff_sfe22',
-    10021: 'vicstuff_sfe06',
-    10022: 'vicstuff_sfe04',
-    10023: 'sfe_archybald1',
-    10024: 'archbuild_wins',
-    10025: 'chinatown_sfe2',
-    10026: 'fire_esc_SFE06',
-    10027: 'bigwhiete_SFE',
-    10028: 'copshop_sfe',
-    10029: 'copbits_sfe',
-    10030: 'chinatown_sfe9',
-    10031: 'landshit_24_sfe',
-    10032: 'carspaces_sfe',
-    10033: 'fire_esc_SFE02',
-    10034: 'landshit_18_sfe',
-    10035: 'chinatown_sfe20',
-    10036: 'chin_sfe1121',
-    10037: 'chbackbit8_sfe',
-    10038: 'chinatown_sfe8',
-    10039: 'chinatown_sfe1',
-    10040: 'cables3',
-    10041: 'BIGCENTRAL_SFE',
-    10042: 'fescape2_sfe',
-    10043: 'vicstuff_sfe6004',
-    10044: 'sfe_swank1',
-    10045: 'pinkbuild4_sfe',
-    10046: 'pinkbuild_sfe',
-    10047: 'monlith_ground',
-    10048: 'vicstuff_sfe66',
-    10049: 'Posh_thingsfe',
-    10050: 'vicstuff_sfe50',
-    10051: 'carimp_SFE',
-    10052: 'lowmall',
-    10053: 'fishwarf20_sfe',
-    10054: 'fishwarf24_sfe',
-    10055: 'fishwarf21_sfe',
-    10056: 'tempsf_4_sfe',
-    10060: 'aprtmnts01_sfe',
-    10061: 'aprtmntrailgs01_SFe',
-    10062: 'aprtmntrailgs03_SFe',
-    10063: 'aprtmnts02_sfe',
-    10064: 'aprtmntrailgs02_SFe',
-    10065: 'road24_sfe',
-    10066: 'road02_sfe',
-    10067: 'road05_sfe',
-    10068: 'road_07_sfe',
-    10069: 'road06_sfe',
-    10070: 'road08_sfe',
-    10071: 'road09_sfe',
-    10072: 'road10_sfe',
-    10073: 'road11_sfe',
-    10074: 'road12_sfe',
-    10075: 'road_16_sfe01',
-    10076: 'road13_sfe',
-    10077: 'road14_sfe',
-    10078: 'road15_sfe',
-    10079: 'pyr_top_SFe',
-    10080: 'fishwarf10_sfe',
-    10083: 'backalleys1_sfe',
-    10084: 'fishwarf13_sfe',
-    10086: 'aprtmnts03_sfe',
-    10087: 'landsl01_sfe',
-    10101: 'vicstuff_sfe67',
-    10110: 'road16_sfe',
-    10111: 'road17_sfe',
-    10112: 'road18_sfe',
-    10113: 'road19_sfe',
-    10114: 'road20_sfe',
-    10115: 'road21_sfe',
-    10116: 'road22_sfe',
-    10117: 'road23_sfe',
-    10118: 'road01_sfe',
-    10119: 'road25_sfe',
-    10120: 'road26_sfe',
-    10121: 'road27_sfe',
-    10122: 'road28_sfe',
-    10123: 'road29_sfe',
-    10124: 'road30_sfe',
-    10125: 'road32_sfe',
-    10126: 'road33_sfe',
-    10127: 'road34_sfe',
-    10128: 'road35_sfe',
-    10129: 'road36_sfe',
-    10130: 'road37_sfe',
-    10131: 'road38_sfe',
-    10132: 'road39_sfe',
-    10133: 'road40_sfe',
-    10134: 'road41_sfe',
-    10135: 'road43_sfe',
-    10136: 'road44_sfe',
-    10137: 'road45_sfe',
-    10138: 'road46_sfe',
-    10139: 'road47_sfe',
-    10140: 'freig2_intSFE',
-    10142: 'dwntwnsl01_sfe1',
-    10143: 'tempsf_1_sfe',
-    10145: 'genome_SFE',
-    10148: 'bombshop',
-    10149: 'bombdoor02',
-    10150: 'fdorsfe',
-    10151: 'bigvicgrnd_sfe',
-    10152: 'victimber1_sfe',
-    10153: 'victimber2_sfe',
-    10154: 'pier69gdr',
-    10165: 'pointybot_Sfe',
-    10166: 'p69_rocks',
-    10173: 'fire_esc_SFE03',
-    10174: 'fire_esc_SFE04',
-    10175: 'fire_esc_SFE05',
-    10176: 'fire_esc_SFE01',
-    10177: 'fire_esc_SFE07',
-    10178: 'fire_esc_SFE08',
-    10179: 'fire_esc_SFE09',
-    10180: 'fire_esc_SFE10',
-    10181: 'fire_esc_SFE11',
-    10182: 'michdr',
-    10183: 'ferspaces',
-    10184: 'sfcopdr',
-    10185: 'lombardsteps',
-    10186: 'lombard3_sfe',
-    10187: 'vicnew_sfe01',
-    10188: 'vicnew_sfe02',
-    10189: 'vicnew_sfe03',
-    10193: 'hotelbits_Sfe07',
-    10194: 'hotelbits_Sfe03',
-    10195: 'hotelbits_Sfe02',
-    10196: 'hotelbits_Sfe01',
-    10197: 'hotelbits_Sfe04',
-    10226: 'shipbits2_sfe',
-    10227: 'shipbits1_sfe',
-    10228: 'freight_litesSFE',
-    10229: 'freighter2b_SFE',
-    10230: 'freighter_sfe',
-    10231: 'freightboxes',
-    10233: 'carspaces_sfe15',
-    10234: 'fescape2b_sfe',
-    10235: 'pointybotb_Sfe',
-    10236: 'hotelbits_Sfe06',
-    10242: 'hotelbits_Sfe05',
-    10244: 'vicjump_sfe',
-    10245: 'ottos_ramp',
-    10246: 'sav1sfe',
-    10247: 'road37b_sfe',
-    10248: 'copcrates_sfe',
-    10249: 'ottos_bits',
-    10250: 'masts1_sfe',
-    10252: 'china_town_gateb',
-    10255: 'chinawning07',
-    10260: 'pointybot22_Sfe',
-    10261: 'chinawning01',
-    10262: 'chinawning02',
-    10263: 'chinawning03',
-    10264: 'chinawning04',
-    10265: 'chinawning05',
-    10266: 'chinawning06',
-    10267: 'cables16',
-    10270: 'bigwhiete2_SFE',
-    10271: 'sfe_redwht2b',
-    10273: 'churchgr_sfe',
-    10274: 'churchgr2_sfe',
-    10275: 'road07_sfe',
-    10276: 'road42_sfe',
-    10278: 'vicstu69c_sfe',
-    10280: 'lowbox_sfe',
-    10281: 'michsign_sfe',
-    10282: 'mich_int_sfe',
-    10287: 'tempsf_4_sfe3',
-    10288: 'tempsf_4_sfe2',
-    10289: 'tempsf_3_sfe',
-    10290: 'garse_85_SFE',
-    10294: 'road03_sfe',
-    10295: 'road04_sfe',
-    10296: 'road31_sfe',
-    10300: 'ferryland_sfe111',
-    10301: 'ferry_ncoast1_sfe',
-    10305: 'ferryland_sfe112',
-    10306: 'vicstuff_sfe38',
-    10308: 'yet_another_sfe2',
-    10309: 'pier69_models05',
-    10350: 'OC_FLATS_GND01_SFS',
-    10351: 'groundbit_10_SFS',
-    10352: 'groundbit_11_SFS',
-    10353: 'groundbit_12_SFS',
-    10354: 'groundbit_13_SFS',
-    10355: 'groundbit_48_SFS',
-    10356: 'hashbury_01_SFS',
-    10357: 'transmitter_sfs',
-    10358: 'OC_FLATS_GND02_SFS',
-    10359: 'sfshill02',
-    10360: 'sfshill03',
-    10361: 'sfshill04',
-    10362: 'sfshill05',
-    10363: 'sfshill06',
-    10364: 'sfshill07',
-    10365: 'roadbit21_SFS',
-    10366: 'golftunnel1_SFS',
-    10367: 'roadbit38_SFS',
-    10368: 'cathedral_SFS',
-    10369: 'smallshop_10_SFS08',
-    10370: 'alley1_SFS',
-    10371: 'alley1_SFS01',
-    10372: 'alley2_SFS01',
-    10373: 'alley2_SFS02',
-    10374: 'alley2_SFS04',
-    10375: 'subshop_SFS',
-    10376: 'subshop2_SFS',
-    10377: 'cityhall_SFS',
-    10378: 'ctiyhallsquare_SFS',
-    10379: 'cityhall2_SFS',
-    10380: 'cityhall2_SFS01',
-    10381: 'artgallery_SFS',
-    10382: 'alleyfuckingway_SFS',
-    10383: 'subshops3_SFS',
-    10384: 'cityhallsq_SFS',
-    10385: 'bbgroundbit_SFS',
-    10386: 'sfshill09',
-    10387: 'cuntwland22_SFS',
-    10388: 'tempobj_SFS02',
-    10389: 'mission_07_SFS',
-    10390: 'mission_12_SFS',
-    10391: 'mission_14_SFS',
-    10392: 'smallshop_10_SFS07',
-    10393: 'scum_SFS01',
-    10394: 'plot1_SFS',
-    10395: 'mission_13_SFS',
-    10396: 'hc_tenfence_SFS',
-    10397: 'hc_stadlight1_SFS',
-    10398: 'healthclub_SFS',
-    10399: 'healthcl69_SFS',
-    10400: 'hc_grounds02_SFS',
-    10401: 'hc_shed02_SFS',
-    10402: 'hc_secfence_SFS',
-    10403: 'hc_track02_SFS',
-    10404: 'hc_laybyland_SFS',
-    10405: 'hc_golfcrse02_SFS',
-    10406: 'hc_grounds04_SFS',
-    10407: 'hc_golfcrse03_SFS',
-    10408: 'hc_golfcrse05_SFS',
-    10409: 'hc_golfcrse09_SFS',
-    10410: 'hc_golfcrse10_SFS',
-    10411: 'shiteybit_SFS',
-    10412: 'poshotel1_SFS',
-    10413: 'groundbit_09_SFS',
-    10414: 'OC_FLATS_GND03_SFS',
-    10415: 'OC_FLATS_GND17_SFS',
-    10416: 'OC_FLATS_GND16_SFS',
-    10417: 'OC_FLATS_GND06_SFS',
-    10418: 'sfshill13',
-    10419: 'OC_FLATS_GND07_SFS',
-    10420: 'OC_FLATS_GND08_SFS',
-    10421: 'OC_FLATS_GND09_SFS',
-    10422: 'OC_FLATS_GND19_SFS',
-    10423: 'mission_15_SFS',
-    10424: 'ROADSsfs01',
-    10425: 'temphotel1_sfs',
-    10426: 'backroad_SFS',
-    10427: 'haight_52_SFS',
-    10428: 'hashblock1_02_SFS',
-    10429: 'hashblock1_10_SFS',
-    10430: 'hashblock1_08_SFS',
-    10431: 'hashbury_03_SFS',
-    10432: 'haight_17_SFS',
-    10433: 'hashbury_04_SFS',
-    10434: 'hashbury_05_SFS',
-    10435: 'shoppie6_SFS04',
-    10436: 'hashblock1_09_SFS',
-    10437: 'hashfence_09_SFS',
-    10438: 'hashbury_07_SFS',
-    10439: 'hashbury_08_SFS',
-    10440: 'ROADSsfs09',
-    10441: 'hashbury_10_SFS',
-    10442: 'graveyardwall_SFS',
-    10443: 'graveyard_SFS',
-    10444: 'poolwater_SFS',
-    10445: 'hotelback2',
-    10446: 'hotelback1',
-    10447: 'hashupass_SFS',
-    10448: 'lastbit_08_SFS',
-    10449: 'ROADSsfs17',
-    10450: 'ROADSsfs16',
-    10451: 'sfshill12',
-    10452: 'ROADSsfs39',
-    10453: 'sfshill14',
-    10454: 'sfshill15',
-    10455: 'ROADSsfs19',
-    10456: 'ROADSsfs02',
-    10457: 'ROADSsfs03',
-    10458: 'ROADSsfs04',
-    10459: 'ROADSsfs05',
-    10460: 'ROADSsfs06',
-    10461: 'ROADSsfs07',
-    10462: 'ROADSsfs08',
-    10463: 'ROADSsfs23',
-    10464: 'ROADSsfs10',
-    10465: 'ROADSsfs11',
-    10466: 'ROADSsfs12',
-    10467: 'ROADSsfs13',
-    10468: 'ROADSsfs14',
-    10469: 'ROADSsfs15',
-    10470: 'ROADSsfs38',
-    10471: 'ROADSsfs27',
-    10472: 'ROADSsfs18',
-    10473: 'ROADSsfs28',
-    10474: 'ROADSsfs20',
-    10475: 'ROADSsfs21',
-    10476: 'ROADSsfs22',
-    10477: 'ROADSsfs30',
-    10478: 'ROADSsfs24',
-    10479: 'ROADSsfs25',
-    10480: 'ROADSsfs26',
-    10481: 'ROADSsfs33',
-    10482: 'ROADSsfs29',
-    10483: 'ROADSsfs36',
-    10484: 'ROADSsfs32',
-    10485: 'ROADSsfs35',
-    10486: 'ROADSsfs34',
-    10487: 'parktunnel_SFS',
-    10488: 'sfshill08',
-    10489: 'cuntwland18_SFS',
-    10490: 'sfshill01',
-    10491: 'sfshill11_SFS',
-    10492: 'sfshill10',
-    10493: 'SV_ground_04_SFS',
-    10558: 'tbnSFS',
-    10559: 'sfshill11beach',
-    10560: 'bbgroundbitb_SFS',
-    10561: 'bbgroundbitc_SFS',
-    10562: 'bbgroundbitd_SFS',
-    10563: 'OC_FLATS_GND18_SFS',
-    10564: 'OC_FLATS_GND11_SFS',
-    10565: 'OC_FLATS_GND12_SFS',
-    10566: 'OC_FLATS_GND13_SFS',
-    10567: 'OC_FLATS_GND14_SFS',
-    10568: 'OC_FLATS_GND15_SFS',
-    10569: 'OC_FLATS_GND10_SFS',
-    10570: 'OC_FLATS_GND05_SFS',
-    10571: 'OC_FLATS_GND04_SFS',
-    10572: 'golftunnel3_SFS',
-    10573: 'golftunnel2_SFS',
-    10574: 'golftunnel4_SFS',
-    10575: 'modshopdoor1_SFS',
-    10576: 'modshopint1_SFS',
-    10601: 'sfshill10b',
-    10606: 'cluckbell_SFS',
-    10608: 'lastbit_GND01_SFS',
-    10609: 'lastbit_GND02_SFS',
-    10610: 'fedmint_SFS',
-    10611: 'fedmintfence_SFS',
-    10612: 'fedmintland_SFS',
-    10613: 'lastbit_07_SFS',
-    10614: 'lastbit_06_SFS',
-    10615: 'lastbit_04_SFS',
-    10616: 'lastbit_03_SFS',
-    10617: 'lastbit_01_SFS',
-    10618: 'lastbit_02_SFS',
-    10619: 'officymirrord_SFS',
-    10621: 'pinkcarpark_SFS',
-    10622: 'pinkcarparkrd1_SFS',
-    10623: 'pinkcarparkrd2_SFS',
-    10624: 'lowqueens1_SFS',
-    10625: 'lowqueens2_SFS',
-    10626: 'queens_09_SFS',
-    10627: 'queens_02_SFS',
-    10628: 'queens_03_SFS',
-    10629: 'queens_04_SFS',
-    10630: 'queens_10_SFS',
-    10631: 'ammunation_SFS',
-    10632: 'ammuwindows_SFS',
-    10633: 'queens_01_SFS',
-    10634: 'queens_06_SFS',
-    10635: 'queens_07_SFS',
-    10636: 'queens_05_SFS',
-    10637: 'queens_08_SFS',
-    10638: 'cityhallsq2_SFS',
-    10639: 'lastbit_06b_SFS',
-    10649: 'lastbit_01b_SFS',
-    10651: 'pinkcarparkrd1b_SFS',
-    10671: 'savehousegdoor_SFS',
-    10672: 'fescape_sfs01',
-    10675: 'elecstionv_SFS',
-    10676: 'transmitbldg_SFS',
-    10682: 'shitfence1_SFS',
-    10683: 'shitfence2_SFS',
-    10694: 'sfshill11z_SFS',
-    10695: 'wires_02_SFS',
-    10696: 'wires_18_SFS',
-    10697: 'wires_03_SFS',
-    10698: 'wires_04_SFS',
-    10699: 'wires_05_SFS',
-    10700: 'wires_06_SFS',
-    10701: 'wires_07_SFS',
-    10702: 'wires_08_SFS',
-    10703: 'wires_09_SFS',
-    10704: 'wires_01_SFS',
-    10705: 'wires_11_SFS',
-    10706: 'wires_12_SFS',
-    10707: 'wires_13_SFS',
-    10708: 'wires_10_SFS',
-    10709: 'wires_14_SFS',
-    10710: 'wires_15_SFS',
-    10711: 'wires_16_SFS',
-    10712: 'wires_17_SFS',
-    10713: 'gayclub_SFS',
-    10716: 'cath_hedge_SFS',
-    10718: 'poshotel1b_SFS',
-    10722: 'shoppie6_SFS03',
-    10734: 'wires_07b_SFS',
-    10735: 'wires_07c_SFS',
-    10736: 'wires_07d_SFS',
-    10737: 'wires_04b_SFS',
-    10738: 'wires_04c_SFS',
-    10739: 'wires_04d_SFS',
-    10740: 'wires_03b_SFS',
-    10741: 'wires_15b_SFS',
-    10742: 'wires_01b_SFS',
-    10743: 'wires_01c_SFS',
-    10750: 'roadsSFSE01',
-    10751: 'roadsSFSE02',
-    10752: 'just_stuff07_sfse',
-    10753: 'roadsSFSE03',
-    10754: 'road_sfse12',
-    10755: 'Airport_02_SFSe',
-    10756: 'Airport_03_SFSe',
-    10757: 'Airport_04_SFSe',
-    10758: 'Airport_05_SFSe',
-    10759: 'roadsSFSE04',
-    10760: 'Airport_07_SFSe',
-    10761: 'Airport_08_SFSe',
-    10762: 'Airport_09_SFSe',
-    10763: 'controltower_SFSe',
-    10764: 'app_light_SFS05e',
-    10765: 'skidmarks_SFSe',
-    10766: 'Airport_10_SFSe',
-    10767: 'Airport_11_SFSe',
-    10768: 'airprtgnd_06_SFSe',
-    10769: 'Airport_14_SFSe',
-    10770: 'CARRIER_BRIDGE_SFSe',
-    10771: 'CARRIER_HULL_SFSe',
-    10772: 'CARRIER_LINES_SFSe',
-    10773: 'dk_cargoshp2_SFSe',
-    10774: 'dk_cargoshp1_SFS01e',
-    10775: 'bigfactory_SFSe',
-    10776: 'bigfactory2_SFSe',
-    10777: 'ddfreeway3_SFSe',
-    10778: 'aircarpark_01_SFSe',
-    10779: 'aircarpark_06_SFSe',
-    10780: 'aircarpark_07_SFSe',
-    10781: 'aircarpark_08_SFSe',
-    10782: 'aircarpark_02_SFSe',
-    10783: 'aircarpark_03_SFSe',
-    10784: 'aircarpark_04_SFSe',
-    10785: 'aircarpark_05_SFSe',
-    10786: 'aircarpark_09_SFSe',
-    10787: 'aircarpark_10_SFSe',
-    10788: 'aircarpark_11_SFSe',
-    10789: 'xenonroof_SFSe',
-    10790: 'roadsSFSE05',
-    10791: 'roadsSFSE06',
-    10792: 'underfreeway_SFSe',
-    10793: 'car_ship_03_SFSe',
-    10794: 'car_ship_04_SFSe',
-    10795: 'car_ship_05_SFSe',
-    10806: 'airfence_01_SFSe',
-    10807: 'airfence_04_SFSe',
-    10808: 'airfence_03_SFSe',
-    10809: 'airfence_02_SFSe',
-    10810: 'ap_smallradar1_SFSe',
-    10811: 'apfuel1_SFSe',
-    10814: 'apfuel2_SFSe',
-    10815: 'airprtgnd_02_SFSe',
-    10816: 'airprtgnd_01_SFSe',
-    10817: 'airprtgnd_03_SFSe',
-    10818: 'airprtgnd_04_SFSe',
-    10819: 'airprtgnd_05_SFSe',
-    10820: 'baybridge1_SFSe',
-    10821: 'baybridge2_SFSe',
-    10822: 'baybridge3_SFSe',
-    10823: 'baybridge4_SFSe',
-    10824: 'subpen_int_SFSe',
-    10825: 'subpen_crane_SFSe',
-    10826: 'subpen_ext_SFSe',
-    10827: 'subbunker_ext_SFSe',
-    10828: 'drydock1_SFSe',
-    10829: 'gatehouse1_SFSe',
-    10830: 'drydock2_SFSe',
-    10831: 'drydock3_SFSe',
-    10832: 'gatehouse2_SFSe',
-    10833: 'navybase_02_SFSe',
-    10834: 'navybase_03_SFSe',
-    10835: 'navyfence2_SFSe',
-    10836: 'apinnerfence3_SFSe',
-    10837: 'ap_bigsign_SFSe',
-    10838: 'airwelcomesign_SFSe',
-    10839: 'aircarpkbarier_SFSe',
-    10840: 'bigshed_SFSe',
-    10841: 'drydock1_SFSe01',
-    10842: 'Airport_14_SFSe01',
-    10843: 'bigshed_SFSe01',
-    10844: 'gen_whouse01_SFSe',
-    10845: 'gen_whouse02_SFSe',
-    10846: 'gen_whouse03_SFSe',
-    10847: 'gen_whouse03_SFSe01',
-    10848: 'roadsSFSE07',
-    10849: 'roadsSFSE08',
-    10850: 'landbit01_SFSe',
-    10851: 'sfseland02',
-    10852: 'roadsSFSE09',
-    10854: 'roadsSFSE10',
-    10855: 'roadsSFSE11',
-    10856: 'viet_03b_SFSe',
-    10857: 'roadsSFSE12',
-    10858: 'roadsSFSE13',
-    10859: 'roadsSFSE14',
-    10860: 'roadsSFSE15',
-    10861: 'bigjunction_05_SFSe',
-    10862: 'bigjunction_06_SFSe',
-    10863: 'bigjunction_07_SFSe',
-    10864: 'bigjunction_08_SFSe',
-    10865: 'bigjunct_09_SFSe',
-    10866: 'roadsSFSE16',
-    10867: 'roadsSFSE18',
-    10868: 'roadsSFSE19',
-    10869: 'roadsSFSE20',
-    10870: 'roadsSFSE21',
-    10871: 'blacksky_SFSe',
-    10872: 'wc_lift_SFSe',
-    10873: 'blackskyrail_SFSe',
-    10874: 'apinnerfence1_SFSe',
-    10875: 'apinnerfence2_SFSe',
-    10885: 'navyfence_SFSe',
-    10889: 'dockbarrier1_SFSe',
-    10890: 'dockbarrier2_SFSe',
-    10891: 'bakery_SFSe',
-    10903: 'sf_landbut02',
-    10904: 'sf_landbut01',
-    10905: 'sfseland01',
-    10917: 'landbit01b_SFSe',
-    10925: 'shoppie1_SFS',
-    10926: 'groundbit_70_SFS',
-    10927: 'trainstuff37_SFS22',
-    10928: 'roadsSFSE22',
-    10929: 'roadsSFSE23',
-    10930: 'roadsSFSE24',
-    10931: 'traintrax05_SFS',
-    10932: 'station03_SFS',
-    10933: 'traintrax01_SFS',
-    10934: 'traintrax03_SFS',
-    10935: 'traintrax04_SFS',
-    10936: 'landbit04_SFS',
-    10937: 'roadsSFSE25',
-    10938: 'Groundbit84_SFS',
-    10939: 'Silicon09B_SFS',
-    10940: 'roadsSFSE26',
-    10941: 'Silicon11_SFS',
-    10942: 'Silicon12_SFS',
-    10943: 'SV_ground_02_SFS',
-    10944: 'southtunnel_04_SFS',
-    10945: 'skyscrap_SFS',
-    10946: 'fuuuuuuuck_SFS',
-    10947: 'officy_SFS',
-    10948: 'skyscrapper_SFS',
-    10949: 'shoppie4_SFS',
-    10950: 'shoppie2_SFS',
-    10951: 'shoppie3_SFS',
-    10952: 'shoppie6_SFS',
-    10953: 'shoppie5_SFS',
-    10954: 'stadium_SFSe',
-    10955: 'stadiumroof_SFS',
-    10956: 'southtunnel_01_SFS',
-    10957: 'xsjmstran1',
-    10958: 'roadsSFSE27',
-    10959: 'cuntwland36_SFS',
-    10960: 'cuntwland37_SFS',
-    10961: 'cuntwland39_SFS',
-    10962: 'cuntwland26_SFS',
-    10965: 'depot_SFS',
-    10966: 'tankfact03_SFS',
-    10967: 'roadsSFSE28',
-    10968: 'roadsSFSE29',
-    10969: 'groundbit_06_SFS',
-    10970: 'roadsSFSE30',
-    10971: 'roadsSFSE31',
-    10972: 'landbit06_SFS',
-    10973: 'mall_03_SFS',
-    10974: 'mall_01_SFS',
-    10975: 'shoppie6_SFS01',
-    10977: 'smallshop_16_SFS',
-    10978: 'smallshop_17_SFS',
-    10979: 'haightshop_SFS',
-    10980: 'tempobj2_SFS02',
-    10981: 'scum_SFS',
-    10982: 'smallshop_10_SFS03',
-    10983: 'hub_SFS',
-    10984: 'rubbled01_SFS',
-    10985: 'rubbled02_SFS',
-    10986: 'rubbled03_SFS',
-    10987: 'coveredpath1_SFS',
-    10988: 'mission_01_SFS',
-    10989: 'mission_02_SFS',
-    10990: 'mission_04_SFS',
-    10991: 'mission_05_SFS',
-    10992: 'mission_03_SFS',
-    10993: 'mission_06_SFS',
-    10994: 'shoppie6_SFS02',
-    10995: 'mission_08_SFS',
-    10996: 'smallshop_10_SFS05',
-    10997: 'smallshop_10_SFS06',
-    10998: 'mission_11_SFS',
-    10999: 'haightshop_SFS02',
-    11000: 'smallshop_17_SFS01',
-    11001: 'mission_16_SFS',
-    11002: 'tempobj_SFS03',
-    11003: 'roadsSFSE32',
-    11004: 'mission_18_SFS',
-    11005: 'mission_17_SFS',
-    11006: 'mission_09_SFS',
-    11007: 'crack_wins_SFS',
-    11008: 'firehouse_SFS',
-    11009: 'dk_cargoshp70_SFS02',
-    11010: 'crackbuild_SFS',
-    11011: 'crackfactjump_SFS',
-    11012: 'crackfact_SFS',
-    11013: 'landbit05_SFS',
-    11014: 'drivingschlgrg_SFS',
-    11015: 'drivingschoolex_SFS',
-    11071: 'roadsSFSE33',
-    11072: 'roadsSFSE36',
-    11073: 'roadsSFSE37',
-    11074: 'roadsSFSE38',
-    11075: 'roadsSFSE39',
-    11076: 'roadsSFSE42',
-    11077: 'roadsSFSE43',
-    11078: 'roadsSFSE44',
-    11079: 'roadsSFSE45',
-    11080: 'roadsSFSE46',
-    11081: 'crackfacttanks_SFS',
-    11082: 'landbit05b_SFS',
-    11083: 'drivingschlgnd_SFS',
-    11084: 'roadsSFSE47',
-    11085: 'crack_int1',
-    11086: 'crack_int2',
-    11087: 'crackfactwalk',
-    11088: 'CF_ext_dem_SFS',
-    11089: 'crackfacttanks2_SFS',
-    11090: 'crackfactvats_SFS',
-    11091: 'crackfactfence_SFS',
-    11092: 'burgalrystore_SFS',
-    11093: 'gen_whouse02_SFS',
-    11094: 'roadsSFSE49',
-    11095: 'stadbridge_SFS',
-    11096: 'roadsSFSE50',
-    11097: 'vietland_SFS',
-    11098: 'roadsSFSE52',
-    11099: 'drivingschskid_SFS',
-    11100: 'roadsSFSE53',
-    11101: 'newtunnelrail_SFS',
-    11102: 'burgalrydoor_SFS',
-    11103: 'cfsmashwin1_SFS',
-    11104: 'newsfsroad',
-    11105: 'roadsSFSE54',
-    11106: 'landy',
-    11107: 'landy2',
-    11110: 'roadsSFSE55',
-    11111: 'roadsSFSE57',
-    11112: 'roadsSFSE58',
-    11113: 'roadsSFSE59',
-    11114: 'roadsSFSE60',
-    11115: 'roadsSFSE61',
-    11116: 'roadsSFSE62',
-    11117: 'roadsSFSE63',
-    11118: 'roadsSFSE64',
-    11119: 'roadsSFSE65',
-    11120: 'roadsSFSE66',
-    11121: 'roadsSFSE68',
-    11122: 'roadsSFSE69',
-    11123: 'roadsSFSE70',
-    11124: 'roadsSFSE71',
-    11125: 'roadsSFSE72',
-    11126: 'roadsSFSE73',
-    11127: 'roadsSFSE74',
-    11128: 'roadsSFSE75',
-    11129: 'roadsSFSE76',
-    11130: 'roadsSFSE77',
-    11131: 'roadsSFSE78',
-    11132: 'roadsSFSE79',
-    11133: 'roadsSFSE80',
-    11134: 'roadsSFSE81',
-    11135: 'roadsSFSE82',
-    11136: 'roadsSFSE83',
-    11137: 'roadsSFSE84',
-    11138: 'roadsSFSE51',
-    11139: 'firehouseland_SFS',
-    11145: 'CARRIER_LOWDECK_SFS',
-    11146: 'CARRIER_HANGAR_SFS',
-    11147: 'acpipes1_SFS',
-    11148: 'acpipes2_SFS',
-    11149: 'accorridors_SFS',
-    11150: 'ab_ACC_control',
-    11223: 'hubhole1_SFSe',
-    11224: 'hubhole2_SFSe',
-    11225: 'hubhole3_SFSe',
-    11226: 'hubhole4_SFSe',
-    11228: 'traintrax01b_SFS',
-    11229: 'traintrax01c_SFS',
-    11230: 'traintrax01d_SFS',
-    11231: 'traintrax03b_SFS',
-    11232: 'traintrax03c_SFS',
-    11233: 'crackfactwalkb',
-    11234: 'crackfactwalkc',
-    11235: 'crackfactwalkd',
-    11236: 'crackfactwalke',
-    11237: 'CARRIER_Bits_SFSe',
-    11238: 'dockbarrier2z_SFSe',
-    11239: 'dockbarrier2zb_SFSe',
-    11240: 'dockbarrier2zc_SFSe',
-    11241: 'dockbarrier2zd_SFSe',
-    11242: 'dockbarrier2ze_SFSe',
-    11243: 'wall_cm_firehse',
-    11244: 'gen_whouse02_SFS01',
-    11245: 'sfsefirehseflag',
-    11247: 'TREEBIT21',
-    11252: 'railbridge04_sfse',
-    11253: 'railbridge08_sfse',
-    11254: 'railbridge06_sfse',
-    11255: 'railbridge03_sfse',
-    11256: 'railbridge09_sfse',
-    11257: 'railbridge05_sfse',
-    11258: 'railbridge01_sfse',
-    11259: 'railbridge07_sfse',
-    11260: 'railbridge02_sfse',
-    11261: 'railbridge10_sfse',
-    11280: 'crackhseskid',
-    11283: 'Airport_14B_SFSe',
-    11285: 'Airport_14C_SFSe',
-    11287: 'bigjunct_10B_SFSe',
-    11288: 'bigjuncT_10_SFSe',
-    11289: 'posters',
-    11290: 'facttanks_SFSe04',
-    11292: 'gasstatiohut',
-    11293: 'facttanks_SFSe08',
-    11295: 'facttanks_SFSe09',
-    11297: 'Groundbit82_SFS',
-    11299: 'roadsSFSE40',
-    11301: 'carshow4_SFSe',
-    11302: 'roadsSFSE17',
-    11303: 'bigjunction_15_SFSe',
-    11305: 'station',
-    11306: 'station05_SFS',
-    11308: 'roadsSFSE41',
-    11312: 'modshop2_SFSe',
-    11313: 'modshopdoor_SFSe',
-    11314: 'modshopint2_SFSe',
-    11315: 'sprayshopint_SFSe',
-    11316: 'Carshow3_SFSe',
-    11317: 'carshow_SFSe',
-    11318: 'Carshow2_SFSe',
-    11319: 'sprayshpdr2_SFSe',
-    11324: 'station_lights',
-    11326: 'Sfse_hublockup',
-    11327: 'sfse_hub_grgdoor02',
-    11332: 'dkgrassbitsfse',
-    11334: 'recroomstuff',
-    11335: 'sfselandy2',
-    11337: 'Stunnel_1A_SFSe',
-    11340: 'hub02_SFSe',
-    11342: 'southtunnel_03_SFS',
-    11343: 'southtunnel_03A_SFS',
-    11345: 'roadsSFSE35',
-    11351: 'roadsSFSE48',
-    11352: 'StationStuff',
-    11353: 'station5new',
-    11359: 'oldgrgedoor3_sfse',
-    11360: 'oldgrgedoor4_sfse',
-    11362: 'Silicon11_land',
-    11363: 'Silicon11_land2',
-    11364: 'Silicon09A_SFS',
-    11365: 'roadsSFSE67',
-    11367: 'airprtgnd_ct_SFSe',
-    11374: 'accorail_SFS',
-    11379: 'baybALPHA_SFSe',
-    11380: 'baybALPH2_SFSe',
-    11381: 'baybALPH3_SFSe',
-    11382: 'baybALPH4_SFSe',
-    11383: 'jjct02',
-    11384: 'cutseen1_sfse',
-    11385: 'ctscene2_sfse',
-    11386: 'nuroad_sfse',
-    11387: 'oldgarage_SFS',
-    11388: 'hubintroof_SFSe',
-    11389: 'hubinterior_SFS',
-    11390: 'hubgirders_SFSE',
-    11391: 'hubprops6_SFSe',
-    11392: 'hubfloorstains_SFSe',
-    11393: 'hubprops1_SFS',
-    11395: 'corvinsign_SFSe',
-    11396: 'stadiumgates_SFSe',
-    11400: 'acwinch1b_SFS02',
-    11401: 'acwinch1b_SFS',
-    11406: 'acwinch1b_SFS01',
-    11408: 'viet_03_SFSe',
-    11409: 'roadsSFSE34',
-    11413: 'fosterflowers1',
-    11414: 'fosterflowers02',
-    11416: 'hbgdSFS',
-    11420: 'con_lighth',
-    11421: 'roadsupp1_01',
-    11422: 'con_br1',
-    11423: 'con_br2',
-    11424: 'con_tunll_sup03',
-    11425: 'des_adobehooses1',
-    11426: 'des_adobe03',
-    11427: 'des_adobech',
-    11428: 'des_indruin02',
-    11429: 'nw_bit_31',
-    11430: 'sw_bit_13',
-    11431: 'des_tepeoff01',
-    11432: 'des_tepesign01',
-    11433: 'adobe_hoose2',
-    11434: 'des_indianstore',
-    11435: 'des_indsign1',
-    11436: 'des_indshops1',
-    11437: 'des_indchfenc',
-    11438: 'des_indtpfenc',
-    11439: 'des_woodbr_',
-    11440: 'des_pueblo1',
-    11441: 'des_pueblo5',
-    11442: 'des_pueblo3',
-    11443: 'des_pueblo4',
-    11444: 'des_pueblo2',
-    11445: 'des_pueblo06',
-    11446: 'des_pueblo07',
-    11447: 'des_pueblo08',
-    11448: 'des_railbr_twr1',
-    11449: 'des_nwtshop2',
-    11450: 'des_nwtshop07',
-    11451: 'des_nwsherrif',
-    11452: 'des_nwshfenc',
-    11453: 'des_sherrifsgn1',
-    11454: 'des_nwmedcen',
-    11455: 'des_medcensgn01',
-    11456: 'des_nwtshop10',
-    11457: 'des_pueblo09',
-    11458: 'des_pueblo10',
-    11459: 'des_pueblo11',
-    11460: 'des_telewires03',
-    11461: 'des_nwwtower',
-    11462: 'des_railbridge1',
-    11463: 'des_railbr_twr05',
-    11464: 'des_trainline02',
-    11465: 'des_trainline03',
-    11466: 'des_trainline04',
-    11467: 'des_trainline05',
-    11468: 'des_railstruct1_',
-    11469: 'des_bullgrill_',
-    11470: 'des_bigbull',
-    11471: 'des_swtshop14',
-    11472: 'des_swtstairs1',
-    11473: 'des_swtfence1',
-    11474: 'des_swtfence2',
-    11475: 'des_swtshop02',
-    11476: 'swt_teline_02',
-    11477: 'swt_teline_03',
-    11478: 'swt_teline_01',
-    11479: 'des_nwtfescape',
-    11480: 'des_nwt_carport',
-    11481: 'des_railfenc1',
-    11482: 'des_railfenc2',
-    11483: 'des_railjump02',
-    11484: 'dam_turbine_4',
-    11485: 'dam_turbine_3',
-    11486: 'dam_turbine_2',
-    11487: 'dam_turbine_1',
-    11488: 'dam_statarea',
-    11489: 'dam_statues',
-    11490: 'des_ranch',
-    11491: 'des_ranchbits1',
-    11492: 'des_rshed1_',
-    11493: 'des_ranchbot',
-    11494: 'des_rnchbhous',
-    11495: 'des_ranchjetty',
-    11496: 'des_wjetty',
-    11497: 'des_baitshop',
-    11498: 'des_rockgp2_27',
-    11499: 'des_dinerfenc01',
-    11500: 'des_skelsignbush_',
-    11501: 'des_westrn9_03',
-    11502: 'des_weebarn1_',
-    11503: 'des_westrn11_05',
-    11504: 'des_garagew',
-    11505: 'des_garwcanopy',
-    11506: 'nw_bit_02',
-    11507: 'nw_bit_03',
-    11508: 'nw_bit_04',
-    11509: 'nw_bit_07',
-    11510: 'nw_bit_08',
-    11511: 'nw_bit_09',
-    11512: 'nw_bit_10',
-    11513: 'nw_bit_11',
-    11514: 'nw_bit_12',
-    11515: 'nw_bit_13',
-    11516: 'nw_bit_14',
-    11517: 'nw_bit_15',
-    11518: 'nw_bit_16',
-    11519: 'nw_bit_17',
-    11520: 'nw_bit_18',
-    11521: 'nw_bit_19',
-    11522: 'nw_bit_20',
-    11523: 'nw_bit_21',
-    11524: 'nw_bit_22',
-    11525: 'nw_bit_23',
-    11526: 'nw_bit_24',
-    11527: 'nw_bit_25',
-    11528: 'nw_bit_26',
-    11529: 'nw_bit_27',
-    11530: 'nw_bit_28',
-    11531: 'nw_bit_30',
-    11532: 'sw_bit_03',
-    11533: 'sw_bit_04',
-    11534: 'sw_bit_05',
-    11535: 'sw_bit_06',
-    11536: 'sw_bit_08',
-    11537: 'sw_bit_11',
-    11538: 'sw_bit_12',
-    11539: 'dambit1',
-    11540: 'dambit2',
-    11541: 'dambit3',
-    11542: 'sw_bit_14',
-    11543: 'des_warehs',
-    11544: 'des_ntfrescape2',
-    11545: 'desn_tsblock',
-    11546: 'desn_fuelpay',
-    11547: 'desn_tscanopy',
-    11548: 'cnts_lines',
-    11549: 'des_decocafe',
-    11550: 'cn_nbridegrails',
-    11551: 'cn_tunlbarrier',
-    11552: 'nw_bit_29',
-    11553: 'sw_bit_01',
-    11554: 'sw_bit_02',
-    11555: 'sw_bit_15',
-    11556: 'des_adrocks',
-    11557: 'sw_bit_09',
-    11558: 'cn_sta_grid_03',
-    11559: 'sw_bit_07',
-    11560: 'sw_bit_10',
-    11561: 'cn_teline_01',
-    11562: 'cn_teline_02',
-    11563: 'cn_teline_03',
-    11564: 'swt_teline_04',
-    11565: 'swt_teline_05',
-    11566: 'des_tepeoff02',
-    11567: 'des_rvstuff',
-    11568: 'des_clifftwal',
-    11571: 'sw_teline_05',
-    11572: 'con_br06',
-    11607: 'sw_teline_06',
-    11608: 'pylo',
-    11609: 'pylo',
-    11610: 'Pylonwires_new',
-    11611: 'des_sherrifsgn02',
-    11623: 'n_dambarriers',
-    11625: 'cn_wires',
-    11626: 'cn_wires1',
-    11627: 'cn_wires2',
-    11628: 'nw_bit_06',
-    11629: 'nw_bit_01',
-    11631: 'ranch_desk',
-    11647: 'nw_bit_05',
-    11663: 'toreno_shadow',
-    11664: 'kb_couch02ext',
-    11665: 'kb_chair03ext',
-    11666: 'Frame_WOOD_1ext',
-    11674: 'des_cluckin',
-    11678: 'desn_detail01',
-    11679: 'desn_detail02',
-    11680: 'desn_detail03',
-    11681: 'desn_detail04',
-    12800: 'cunte_roads01',
-    12801: 'cunte_roads03',
-    12802: 'cunte_roads04',
-    12803: 'cunte_roads06',
-    12804: 'cuntEground01',
-    12805: 'CE_bigshed1',
-    12806: 'cunte_roads08',
-    12807: 'sw_logs4',
-    12808: 'sw_logs3',
-    12809: 'cunte_roads11',
-    12810: 'cunte_roads12',
-    12811: 'cunte_roads13',
-    12812: 'cunte_roads14',
-    12813: 'cunte_roads15',
-    12814: 'cuntyeland04',
-    12815: 'cunte_roads16',
-    12816: 'cunte_roads17',
-    12817: 'cunte_roads19',
-    12818: 'cunte_roads20',
-    12819: 'cunte_roads21',
-    12820: 'cunte_roads22',
-    12821: 'cratesinalley',
-    12822: 'smalltwnbld05',
-    12823: 'cuntEground02',
-    12824: 'CEgroundTP104',
-    12825: 'cuntEground08',
-    12826: 'cunte_roads23',
-    12827: 'cunte_roads24',
-    12828: 'cunte_roads25',
-    12829: 'cunte_roads26',
-    12830: 'cunte_roads27',
-    12831: 'coe_traintrax_10',
-    12832: 'coe_traintrax_03',
-    12833: 'coe_traintrax_04',
-    12835: 'coe_traintrax_06',
-    12836: 'coe_traintrax_07',
-    12837: 'coe_traintrax_08',
-    12838: 'coe_traintrax_09',
-    12839: 'cos_sbanksteps02',
-    12840: 'cos_pizskyglas01',
-    12841: 'cos_pizinterior',
-    12842: 'cos_pizseats',
-    12843: 'cos_liquorshop',
-    12844: 'cos_liqinside',
-    12845: 'cos_liqinsidebits',
-    12846: 'otb_sign',
-    12847: 'sprunk_fact',
-    12848: 'coe_sprunlkfenc',
-    12849: 'CornerStore_01',
-    12850: 'sw_block01',
-    12851: 'cunte_roads29',
-    12852: 'cunte_roads30',
-    12853: 'sw_gas01',
-    12854: 'sw_gas01int',
-    12855: 'sw_copshop',
-    12856: 'sw_bridge',
-    12857: 'CE_bridge02',
-    12858: 'sw_gate1',
-    12859: 'sw_cont03',
-    12860: 'sw_cont04',
-    12861: 'sw_cont05',
-    12862: 'sw_block03',
-    12863: 'sw_genstore02',
-    12864: 'cuntEground11',
-    12865: 'cuntEground13',
-    12866: 'CEgroundT202',
-    12867: 'cunte_roads32',
-    12868: 'cuntEground26',
-    12869: 'cyecuntEground28',
-    12870: 'CE_grndPALCST06',
-    12871: 'cuntEground34',
-    12872: 'cuntEground43',
-    12873: 'cunte_roads33',
-    12874: 'cunte_roads34',
-    12875: 'cunte_roads35',
-    12876: 'cunte_roads39',
-    12877: 'cunte_roads40',
-    12878: 'cunte_roads41',
-    12879: 'cunte_roads42',
-    12880: 'cunte_roads43',
-    12881: 'cunte_roads44',
-    12882: 'cunte_roads45',
-    12883: 'cunte_roads46',
-    12884: 'cunte_roads47',
-    12885: 'cunte_roads48',
-    12886: 'cunte_roads49',
-    12887: 'cunte_roads50',
-    12888: 'cunte_roads51',
-    12889: 'cunte_roads52',
-    12890: 'cunte_roads54',
-    12891: 'cunte_roads56',
-    12892: 'cunteroads_58',
-    12893: 'cunte_roads59',
-    12894: 'cunte_roads60',
-    12895: 'cunte_roads61',
-    12896: 'cunte_roads62',
-    12897: 'cunte_roads63',
-    12898: 'cunte_roads69',
-    12899: 'cunte_roads71',
-    12900: 'cunte_roads72',
-    12901: 'cunte_roads73',
-    12902: 'cunte_roads74',
-    12903: 'cunte_roads75',
-    12904: 'cuntetownrd1',
-    12905: 'cuntetownrd2',
-    12906: 'cuntetownrd3',
-    12907: 'cuntetownrd4',
-    12908: 'cuntEground09b',
-    12909: 'sw_bridge03',
-    12910: 'sw_trainbridge1',
-    12911: 'sw_Silo02',
-    12912: 'sw_Silo04',
-    12913: 'sw_fueldrum03',
-    12914: 'sw_corrug01',
-    12915: 'CE_bigbarn07',
-    12916: 'CE_farmland04',
-    12917: 'sw_haypile03',
-    12918: 'sw_haypile05',
-    12919: 'sw_tempbarn06',
-    12920: 'sw_tempbarn02',
-    12921: 'sw_farment01',
-    12922: 'sw_farment02',
-    12923: 'sw_blockbit05',
-    12924: 'sw_block06',
-    12925: 'sw_SHED01',
-    12926: 'sw_sheds_base',
-    12927: 'sw_pipepile01',
-    12928: 'sw_shedInterior04',
-    12929: 'sw_SHED06',
-    12930: 'sw_pipepile02',
-    12931: 'CE_brewery',
-    12932: 'sw_trailer02',
-    12933: 'sw_breweryFence01',
-    12934: 'sw_trailer03',
-    12935: 'sw_securitycab03',
-    12936: 'sw_beersign02',
-    12937: 'CE_CATshack',
-    12938: 'sw_apartments02',
-    12939: 'sw_apartmentsBase',
-    12940: 'sw_apartments07',
-    12941: 'sw_LastDrop',
-    12942: 'sw_shedInterior01',
-    12943: 'sw_SHED07',
-    12944: 'sw_lasershop',
-    12945: 'sw_dryclean01',
-    12946: 'sw_furnistore01',
-    12947: 'sw_musicstore01',
-    12948: 'sw_block01a',
-    12949: 'sw_jazzmags',
-    12950: 'cos_sbanksteps03',
-    12951: 'sw_shopflat01',
-    12952: 'sw_bankalley',
-    12953: 'sw_blockbit01',
-    12954: 'sw_furnipile01',
-    12955: 'dock_props01',
-    12956: 'sw_trailerjump',
-    12957: 'sw_pickupwreck01',
-    12958: 'cos_sbanksteps01',
-    12959: 'sw_library',
-    12960: 'sw_church01',
-    12961: 'sw_hedstones',
-    12962: 'sw_shopflat04',
-    12963: 'sw_shopflat02',
-    12964: 'sw_block07',
-    12965: 'cunte_roads10',
-    12966: 'cunte_roads66',
-    12967: 'cunte_roads67',
-    12968: 'cunte_roads68',
-    12969: 'CE_ground08',
-    12970: 'cunte_roads76',
-    12971: 'cunte_roads78',
-    12972: 'sw_bridge01',
-    12973: 'roadfromLAN2',
-    12974: 'cunte_roads40a',
-    12975: 'cunteroads43ramp01',
-    12976: 'sw_diner1',
-    12977: 'cratesinalley01',
-    12978: 'sw_SHED02',
-    12979: 'sw_block09',
-    12980: 'sw_block10',
-    12981: 'sw_fact01',
-    12982: 'sw_shopflat06',
-    12983: 'sw_med1',
-    12984: 'sw_block11',
-    12985: 'cos_sbanksteps05',
-    12986: 'sw_well1',
-    12987: 'cos_sbanksteps06',
-    12988: 'sw_fact02',
-    12989: 'cuntEground06',
-    12990: 'sw_jetty',
-    12991: 'sw_shack02',
-    12992: 'CE_archbridge',
-    12993: 'cunte_roads09',
-    12994: 'cunte_roads57',
-    12995: 'cunte_roads64',
-    12996: 'cunte_roads65',
-    12997: 'cunte_roads77',
-    12998: 'cunte_roads80',
-    12999: 'cunte_roads82',
-    13000: 'cunte_roads83',
-    13001: 'cunte_roads84',
-    13002: 'cuntebigbarn',
-    13003: 'cunte_racestart',
-    13004: 'sw_logs01',
-    13005: 'sw_logs6',
-    13006: 'sw_office1',
-    13007: 'sw_bankbits',
-    13008: 'sw_block02',
-    13009: 'sw_block02alpha',
-    13010: 'sw_Block01alpha',
-    13011: 'cos_sbanksteps04',
-    13012: 'sw_shopflat05',
-    13013: 'sw_block12',
-    13014: 'sw_block04',
-    13015: 'sw_genstore01',
-    13016: 'sw_block04COL27',
-    13017: 'CEhollyhil16',
-    13018: 'CEmulwire03',
-    13019: 'CEhollyhil17',
-    13020: 'CEroadTEMP2',
-    13021: 'CEhllyhil01a',
-    13022: 'sw_block11a',
-    13023: 'sw_rocks1',
-    13024: 'sw_breweryFence02',
-    13025: 'sw_fueldrum01',
-    13027: 'ce_spray',
-    13028: 'CE_spraydoor1',
-    13030: 'cuntEground34a',
-    13033: 'cunte_roads30bar',
-    13034: 'cunte_roads30bar01',
-    13035: 'cuntEground12a',
-    13036: 'cuntEgund11a',
-    13038: 'cunte_roads35a',
-    13039: 'CE_ground02',
-    13040: 'CE_ground03',
-    13041: 'CE_ground04',
-    13042: 'CE_ground05',
-    13043: 'CE_ground06',
-    13044: 'CE_ground07',
-    13045: 'cunte_roads30bar02',
-    13049: 'CE_farmland01',
-    13050: 'CE_farmland02',
-    13051: 'CE_farmland03',
-    13058: 'cunte_roads11a',
-    13059: 'CEfact03',
-    13060: 'CE_factcomp1',
-    13061: 'CE_factcomp2',
-    13065: 'sw_fact03',
-    13066: 'sw_fact04',
-    13070: 'CEgroundTP101',
-    13071: 'CEgroundTP102',
-    13072: 'CEgroundTP103',
-    13077: 'CE_townware',
-    13078: 'CEwrehse07',
-    13081: 'CEgroundT206',
-    13082: 'CEgroundT203',
-    13083: 'CEgroundT204',
-    13084: 'CEgroundT205',
-    13088: 'cuntetownrd4a',
-    13092: 'cuntetownrd05',
-    13095: 'cunte_roads02',
-    13096: 'cunte_roadsbar01',
-    13097: 'cunte_roads30bar06',
-    13098: 'cunte_roadsbar05',
-    13099: 'CE_groundPALO06',
-    13100: 'CE_groundPALO02',
-    13101: 'CE_groundPALO03',
-    13102: 'CE_groundPALO04',
-    13103: 'CE_groundPALO05',
-    13104: 'CE_groundPALO01',
-    13105: 'CE_groundPALO07',
-    13106: 'CE_groundPALO08',
-    13107: 'CE_groundPALO10',
-    13109: 'sw_watertower04',
-    13118: 'cunte_roadsbar02',
-    13119: 'cunte_roads37',
-    13120: 'CE_grndPALCST03',
-    13121: 'CE_grndPALCST04',
-    13122: 'CE_grndPALCST01',
-    13123: 'CE_grndPALCST07',
-    13124: 'CE_grndPALCST08',
-    13125: 'CE_grndPALCST09',
-    13126: 'CE_grndPALCST10',
-    13127: 'cunte_roads81',
-    13128: 'cunte_roads79',
-    13129: 'cunte_roads85',
-    13131: 'sw_block05',
-    13132: 'CE_bar01',
-    13134: 'cuntEground03',
-    13135: 'cyecuntEground01',
-    13136: 'cyecuntEground02',
-    13137: 'CEwirestown',
-    13138: 'CE_archbridge2',
-    13139: 'cuntetunnel1',
-    13140: 'cuntetunnel1A',
-    13141: 'cunte_roads58B',
-    13142: 'CE_Bbridge',
-    13143: 'CEmulwire02',
-    13144: 'cuntEground04',
-    13145: 'cuntEground05',
-    13146: 'cuntEground07',
-    13147: 'cuntEground09',
-    13148: 'cuntEground10',
-    13149: 'cuntEground17',
-    13150: 'cuntEground19',
-    13153: 'cunte_roads30bar03',
-    13156: 'cuntEground21',
-    13157: 'cuntEground22',
-    13158: 'cuntEground27',
-    13163: 'CE_groundPALO11',
-    13165: 'CE_groundPALO12',
-    13167: 'cyecuntEground03',
-    13168: 'cunte_roads58',
-    13169: 'cunte_roads86',
-    13170: 'cunte_roads87',
-    13171: 'cuntEgd12a01',
-    13172: 'cuntEgd12a02',
-    13173: 'cunte_roads88',
-    13174: 'cunte_roots01',
-    13175: 'cuntEground18',
-    13176: 'cuntEground29',
-    13177: 'cuntEground30',
-    13178: 'cuntEground31',
-    13179: 'cuntEground32',
-    13180: 'cuntEground33',
-    13181: 'cuntEground35',
-    13187: 'burbdoor',
-    13188: 'burbdoor2',
-    13190: 'CE_busdepot',
-    13198: 'CE_waretank',
-    13205: 'CE_wires',
-    13206: 'CEtruth_barn02',
-    13207: 'cuntEground12',
-    13208: 'cuntEground15',
-    13209: 'cuntEground36',
-    13210: 'cuntEground37',
-    13211: 'cuntEground38',
-    13212: 'cuntEground39',
-    13213: 'cuntEground40',
-    13214: 'cuntEground41',
-    13235: 'cuntehil01',
-    13236: 'cuntehil02',
-    13237: 'cuntehil03',
-    13295: 'CE_terminal1',
-    13296: 'CE_roadsidegas',
-    13297: 'CEgroundT201',
-    13312: 'coe_traintrax_05',
-    13321: 'cunte_roads07',
-    13323: 'cunte_roads18',
-    13324: 'cunte_roads38',
-    13325: 'cunte_roads89',
-    13332: 'CE_multibridge1',
-    13336: 'cunte_roads46walls',
-    13342: 'cunte_roads31',
-    13345: 'cunte_roads36',
-    13347: 'cunte_roads26W',
-    13348: 'cunte_roads23W',
-    13349: 'cunte_roads27W',
-    13360: 'CE_CATshackdoor',
-    13361: 'CE_pizza1',
-    13363: 'CE_photoblock',
-    13364: 'CE_wtownblok1',
-    13367: 'sw_watertower01',
-    13368: 'CE_bridgebase1',
-    13369: 'sw_logs07',
-    13370: 'CEhllyhil03a',
-    13371: 'CEhllyhil02a',
-    13374: 'CEwirestown01',
-    13375: 'CEwirestown02',
-    13422: 'cunte_roads05a',
-    13435: 'sw_logs08',
-    13436: 'CE_wires01',
-    13437: 'CE_wires02',
-    13438: 'sw_church01fnce',
-    13439: 'CE_wires03',
-    13440: 'CEwirestown04',
-    13441: 'CEwirestown05',
-    13442: 'CEwirestown06',
-    13443: 'CEwirestown03',
-    13444: 'CEwirestown07',
-    13445: 'cunteroads05aFNCE',
-    13447: 'CE_wires04',
-    13448: 'CE_wires05',
-    13449: 'CE_wires06',
-    13450: 'CE_apartStairs',
-    13451: 'CEwirestown08',
-    13452: 'CEwirestown09',
-    13470: 'cunte_roads303',
-    13486: 'CE_ground09',
-    13489: 'sw_fueldrum04',
-    13490: 'CE_ground01',
-    13491: 'coe_traintrax02',
-    13494: 'CE_groundPALO12A',
-    13495: 'CE_ground03A',
-    13496: 'CE_groundPALO07A',
-    13497: 'CE_grndPALCST04A',
-    13498: 'CE_grndPALCST01A',
-    13499: 'CE_grndPALCST03A',
-    13500: 'cuntEground21A',
-    13501: 'cuntEground22A',
-    13502: 'cuntEground07A',
-    13503: 'cuntEground02A',
-    13504: 'CE_grndPALCST07A',
-    13505: 'cuntEground03A',
-    13506: 'cuntEground05A',
-    13507: 'cuntEground04A',
-    13508: 'cyecuntEground02A',
-    13509: 'cyecuntEground28A',
-    13510: 'CE_grndPALCST08A',
-    13511: 'CE_grndPALCST09A',
-    13512: 'CE_groundPALO03A',
-    13513: 'CE_groundPALO04A',
-    13514: 'cuntEground10A',
-    13515: 'cuntEground09A',
-    13516: 'cuntEground19A',
-    13517: 'cuntEground26A',
-    13518: 'CE_groundPALO06A',
-    13519: 'CEgroundT205A',
-    13520: 'CEgroundT201A',
-    13521: 'CEgroundT206A',
-    13522: 'CEgroundTP104A',
-    13523: 'CEgroundTP103A',
-    13524: 'cuntEground43A',
-    13525: 'cuntEground17A',
-    13526: 'cuntEground18A',
-    13527: 'cuntEground29A',
-    13528: 'cuntEground39A',
-    13529: 'cuntehil03A',
-    13530: 'cuntehil02A',
-    13531: 'cuntehil01A',
-    13532: 'CEhllyhil03aA',
-    13533: 'CEhllyhil02aA',
-    13534: 'CEhllyhil01aA',
-    13535: 'cuntEground38A',
-    13536: 'cuntEground40A',
-    13537: 'cuntEground32A',
-    13538: 'cuntEground01A',
-    13539: 'CE_farmland04A',
-    13540: 'CE_farmland03A',
-    13541: 'cuntEground34A01',
-    13542: 'cuntEground34aA',
-    13543: 'cuntEground09bA',
-    13544: 'cuntEground15A',
-    13545: 'cuntEground37A',
-    13546: 'cuntEground36A',
-    13547: 'cuntEgund11aA',
-    13548: 'cuntEground11A',
-    13549: 'CEhollyhil17A',
-    13550: 'CEhollyhil16A',
-    13551: 'cuntEground08A',
-    13552: 'CE_ground01A',
-    13553: 'CE_ground09A',
-    13554: 'CE_ground02A',
-    13555: 'CE_ground05A',
-    13556: 'CE_ground06A',
-    13557: 'CE_ground08A',
-    13558: 'CE_ground04A',
-    13559: 'CE_ground07A',
-    13560: 'cuntEground33A',
-    13561: 'cuntEground31A',
-    13563: 'cuntEground30A',
-    13590: 'kickbus04',
-    13591: 'kickcar28',
-    13592: 'loopbig',
-    13593: 'kickramp03',
-    13594: 'fireyfire',
-    13595: 'stand02',
-    13596: 'destruct04',
-    13597: 'destruct05',
-    13598: 'stand03',
-    13599: 'standblack04',
-    13600: 'destruct06',
-    13601: 'destruct07',
-    13602: 'thebolla06',
-    13603: 'stad_tag',
-    13604: 'kickramp05',
-    13605: 'destruct1',
-    13606: 'standblack02',
-    13607: 'ringwalls',
-    13608: 'sumoring',
-    13609: 'supports',
-    13610: 'stand04',
-    13611: 'thebowl13',
-    13612: 'stuntman03',
-    13613: 'thebowl11',
-    13614: 'thebowl12',
-    13615: 'thebowl10',
-    13616: 'thebolla04',
-    13617: 'thebowl14',
-    13618: 'thebowl16',
-    13619: 'thebowl17',
-    13620: 'thebowl15',
-    13621: 'thebolla03',
-    13622: 'sumofence',
-    13623: 'midringfence',
-    13624: 'inner',
-    13625: 'stands',
-    13626: '8road2',
-    13627: 'stadoval',
-    13628: '8stad',
-    13629: '8screen01',
-    13630: '8screen',
-    13631: 'dirtstad',
-    13632: 'dirtcrowds',
-    13633: 'dirtouter01',
-    13634: 'dirtstad02',
-    13635: 'therocks10',
-    13636: 'logramps',
-    13637: 'tuberamp',
-    13638: 'stunt1',
-    13639: 'ramparse',
-    13640: 'arse',
-    13641: 'kickramp04',
-    13642: 'rings',
-    13643: 'logramps02',
-    13644: 'steps',
-    13645: 'kickramp06',
-    13646: 'ramplandpad',
-    13647: 'wall1',
-    13648: 'wall2',
-    13649: 'ramplandpad01',
-    13650: 'kickcrowd01',
-    13651: 'otunnel',
-    13652: 'oroadbit',
-    13653: 'innerfence',
-    13654: 'darkpoly',
-    13655: 'bridge',
-    13656: 'fuckknows',
-    13657: 'bit',
-    13658: 'bit01',
-    13659: '8bar5',
-    13660: '8track1',
-    13661: 'cockbars',
-    13662: 'dirtcock',
-    13663: 'dirtfences',
-    13664: 'dirtroad',
-    13665: 'dirtfences2',
-    13666: 'loopwee',
-    13667: 'monkeyman',
-    13672: 'cunte_roads05',
-    13673: 'CEhollyhil03',
-    13674: 'CEmullholdr05',
-    13675: 'cuntelungrdj',
-    13676: 'TCElawcuntun1a_law2',
-    13677: 'TCElawcuntuna_law2',
-    13678: 'CEnwhiltest',
-    13679: 'TCElandbivF4v_03',
-    13680: 'TCElawcuntunb',
-    13681: 'TCEhilhouse03',
-    13682: 'TCEcuntun',
-    13683: 'CEnwhiltest2',
-    13684: 'CEnwhiltest93',
-    13685: 'TCEnwhiltest92',
-    13686: 'TCEhomulhil10',
-    13687: 'TCEhillhse02',
-    13688: 'CEnwhiltest91',
-    13689: 'CEnwhiltest6',
-    13690: 'CE_Roads38a',
-    13691: 'TCELAlandbiv_03',
-    13692: 'cunte_landF4_03',
-    13693: 'TCEnwhiltest94',
-    13694: 'CEhillhse13',
-    13695: 'CEhillhse05',
-    13696: 'CEnewhillhus',
-    13697: 'TCElhouse06',
-    13698: 'CEhollyhil10',
-    13699: 'TCEmulhilhed1_law2',
-    13700: 'CEhollyhil1',
-    13701: 'TCEhilouse02',
-    13702: 'CEhollyhil09X',
-    13703: 'CEnwhiltest3',
-    13704: 'CEnwhiltest5',
-    13705: 'CEhillbar2b',
-    13706: 'CE_roads87',
-    13707: 'CEla_roads62',
-    13708: 'CE_roadscoast08',
-    13709: 'lae2_ground01',
-    13710: 'HillsEast05_LAe',
-    13711: 'CEhollyhil06',
-    13712: 'CEhollyhil8a',
-    13713: 'road_hil03',
-    13714: 'radarmast1_LAwN',
-    13715: 'cunte_hollyhil9',
-    13716: 'CE_hollyhil8a',
-    13717: 'road_hillLAwn15',
-    13718: 'CEroad_hill20',
-    13719: 'hollyhil10',
-    13720: 'road_hill04b',
-    13721: 'mulhouse03_cunte',
-    13722: 'VineSign1_cunte',
-    13723: 'cunte_hollyhil01',
-    13724: 'drg_nu_ext',
-    13725: 'opmans01_cunte',
-    13726: 'road_hill08',
-    13727: 'CEnorthbrij01',
-    13728: 'CEgraveBuil03_LAwN',
-    13729: 'CEgraveBuil01',
-    13730: 'CEroad_6',
-    13731: 'TCEmulwire01',
-    13732: 'CE_Roads37',
-    13733: 'CE_Roads42',
-    13734: 'HillClif06',
-    13735: 'CE_Roads41',
-    13736: 'CE_Roads40',
-    13737: 'cunteHill03',
-    13738: 'Roads39_CE',
-    13739: 'Roads38CE',
-    13740: 'cnteHillClif01',
-    13741: 'HillClif02',
-    13742: 'HillClif05',
-    13743: 'CEmulwire01',
-    13744: 'drg_nu_ext05',
-    13746: 'TCEhillhouse07',
-    13747: 'CEhillhse06',
-    13748: 'TCEmulhilhed1_law01',
-    13749: 'cunte_curvesteps1',
-    13751: 'cunte_Flyover2',
-    13752: 'cuntebridge01',
-    13753: 'CEhillhouse04',
-    13754: 'CEmulhouse04',
-    13755: 'CEhillhouse01',
-    13756: 'hollyhil04a',
-    13757: 'hollyhil05',
-    13758: 'radarmast1_LAwN01',
-    13761: 'cunte_Whisky',
-    13784: 'road_hill01',
-    13789: 'Roads40_CE',
-    13795: 'CE_HillsEast06',
-    13801: 'cunte_skatetrak',
-    13802: 'skateivy',
-    13804: 'cuntelandF4',
-    13805: 'CELAlandbiv',
-    13806: 'CEhollyhil8a01',
-    13809: 'CE_grndPALCST02',
-    13810: 'CE_grndPALCST05',
-    13813: 'CEGraveBlok03e',
-    13814: 'CEroadn',
-    13816: 'CE_safeground',
-    13817: 'CE_safedoor01',
-    13818: 'CEhollyhil01',
-    13820: 'cuntEground16',
-    13821: 'cuntEground20',
-    13823: 'cuntEground23',
-    13824: 'cuntEground24',
-    13825: 'cuntEground25',
-    13826: 'cuntEground28',
-    13831: 'VineSign1_cunte01',
-    13845: 'CEnwhiltest5base',
-    13861: 'CE_telewires01',
-    13862: 'CE_telewires02',
-    13863: 'CE_telewires03',
-    13864: 'CE_telewires04',
-    13865: 'CEnwhiltestBrd',
-    13871: 'LAhills_border1',
-    13872: 'LAhills_border2',
-    13882: 'road_hill13',
-    13887: 'CEroad_hill01',
-    13890: 'LAhBoards_LAh1',
-    14383: 'burg_kit1',
-    14384: 'kitchen_bits',
-    14385: 'kb_tr_main',
-    14386: 'kb_tr_bits',
-    14387: 'Dr_GsNEW02',
-    14388: 'MaddDoggs02',
-    14389: 'MaddDoggs03',
-    14390: 'MaddDoggs04',
-    14391: 'Dr_GsNEW07',
-    14392: 'Dr_GsNEW08',
-    14393: 'Dr_GsNEW09',
-    14394: 'Dr_GsNEW10',
-    14395: 'Dr_GsNEW11',
-    14396: 'girders01',
-    14397: 'girders07',
-    14398: 'girders11',
-    14399: 'bar2',
-    14400: 'flowe',
-    14401: 'bench1',
-    14402: 'flowe',
-    14403: 'cds',
-    14404: 'jet_interior',
-    14405: 'chairs',
-    14406: 'mansio',
-    14407: 'carte',
-    14408: 'Carte',
-    14409: 'carte',
-    14410: 'carte',
-    14411: 'carte',
-    14412: 'Carter_drugfloor',
-    14413: 'carte',
-    14414: 'carte',
-    14415: 'Carte',
-    14416: 'carte',
-    14417: 'MaddDoggs05',
-    14418: 'MaddDoggs07',
-    14419: 'MaddDoggs08',
-    14420: 'MaddDoggs09',
-    14421: 'MaddDoggs10',
-    14422: 'MaddDoggs01',
-    14423: 'MaddDoggs12',
-    14424: 'MaddDoggs13',
-    14425: 'MaddDoggs14',
-    14426: 'MaddDoggs15',
-    14427: 'MaddDoggs16',
-    14428: 'MaddDoggs17',
-    14429: 'MaddDoggs18',
-    14430: 'MaddDoggs19',
-    14431: 'MaddDoggs20',
-    14432: 'carter_light01',
-    14433: 'carter_gubbins',
-    14434: 'carte',
-    14435: 'carter_girders',
-    14436: 'carter_girders1',
-    14437: 'carte',
-    14438: 'Carte',
-    14439: 'Carte',
-    14440: 'Carter_grill',
-    14441: 'Carte',
-    14442: 'SHADO',
-    14443: 'burning_blinds08',
-    14444: 'Carte',
-    14445: 'carte',
-    14446: 'Smokes_bed',
-    14447: 'carte',
-    14448: 'carter_girders02',
-    14449: 'Carter_trampoline',
-    14450: 'carter_girders03',
-    14451: 'carter_girders04',
-    14452: 'carter_girders05',
-    14453: 'GANG_EXIT',
-    14454: 'carte',
-    14455: 'Gs_BOOKCASE',
-    14456: 'ceilin',
-    14457: 'gs_gol',
-    14458: 'gs_chairs',
-    14459: 'carte',
-    14460: 'mansio',
-    14461: 'Gs_Piccies',
-    14462: 'Gs_piccies1',
-    14463: 'gs_barstuff',
-    14464: 'gs_cages',
-    14465: 'carte',
-    14466: 'carte',
-    14467: 'carter_statue',
-    14468: 'flowe',
-    14469: 'flowe',
-    14470: 'mansio',
-    14471: 'carls_moms_kit2',
-    14472: 'carls_moms_kit1',
-    14473: 'mansionlights2',
-    14474: 'ganghse_int1',
-    14475: 'ganghse_int2',
-    14476: 'carlscrap',
-    14477: 'carlsbits',
-    14478: 'carlsshadfloor',
-    14479: 'motel_skuzmain1',
-    14480: 'motel_toilet',
-    14481: 'motel_bath1',
-    14482: 'motel_skuz_win',
-    14483: 'maddogsfakedoors',
-    14484: 'MaddDoggs06',
-    14485: 'MaddDoggs11',
-    14486: 'madgym1',
-    14487: 'madlites',
-    14488: 'madgymroofs',
-    14489: 'carlspics',
-    14490: 'cuntchair',
-    14491: 'iwanfucker',
-    14492: 'sweets_room',
-    14493: 'arsehole',
-    14494: 'sweets_bath',
-    14495: 'sweetshall',
-    14497: 'im_couchs',
-    14498: 'imys_bigvent',
-    14499: 'imy_motel_wins',
-    14500: 'immy_rooms',
-    14501: 'motel_grill',
-    14502: 'imy_roomfurn',
-    14503: 'imy_roomfurn01',
-    14504: 'imy_roomfurn03',
-    14505: 'imy_roomfurn06',
-    14506: 'imy_motel_int',
-    14507: 'imy_roomfurn07',
-    14508: 'imy_roomfurn10',
-    14509: 'imy_roomfurn11',
-    14510: 'imy_roomfurn12',
-    14511: 'im_cover_tbl',
-    14512: 'immy_rooms2',
-    14513: 'im_mtl_rail',
-    14514: 'hexi_lite',
-    14515: 'im_mtel_sckts',
-    14516: 'im_xtra3',
-    14517: 'im_xtra1',
-    14518: 'im_xtra2',
-    14519: 'im_xtra4',
-    14520: 'immy_clothes',
-    14521: 'immy_shoes',
-    14522: 'immy_curtains02',
-    14523: 'immy_curtains05',
-    14524: 'im_couchsa',
-    14525: 'imy_otherbit',
-    14526: 'sweetsmain',
-    14527: 'fannyfan',
-    14528: 'sweetshadows',
-    14530: 'driveschl_main',
-    14531: 'int_zerosrc01',
-    14532: 'tv_stand_driv',
-    14533: 'pleasur',
-    14534: 'ab_woozies01',
-    14535: 'ab_woozies03',
-    14536: 'pleasur',
-    14537: 'pdomesBar',
-    14538: 'Pdomes_Xitbox',
-    14539: 'pdomes_logo',
-    14540: 'pdomes_extras',
-    14542: 'woozies_Xitbox',
-    14543: 'ab_woozies04',
-    14544: 'ab_woozies02',
-    14545: 'ab_wooziesGlass',
-    14546: 'pleasur',
-    14547: 'pleasur',
-    14548: 'cargo_test',
-    14549: 'carge_barrels',
-    14550: 'cargo_netting',
-    14551: 'cargo_store',
-    14552: 'cargo_stuff',
-    14553: 'androm_des_obj',
-    14554: 'ab_wooziesSHAD',
-    14556: 'ZEROWARDROBE',
-    14558: 'MODEL_BOX15',
-    14559: 'PDomeCones',
-    14560: 'triad_bar',
-    14561: 'triad_neon',
-    14562: 'triad_lion',
-    14563: 'triad_main',
-    14564: 'triad_lights',
-    14565: 'triad_bar_stuff',
-    14566: 'budha_whel1b',
-    14567: 'budha_whel02b',
-    14568: 'budha_whel03b',
-    14569: 'tr_man_pillar',
-    14570: 'tr_man_glass',
-    14571: 'chinafurn1',
-    14572: 'maintenance16',
-    14573: 'maintenance03',
-    14574: 'maintenance20',
-    14575: 'maintenance31',
-    14576: 'vault_door',
-    14577: 'mafCasLoadbay01',
-    14578: 'mafCasPipes01',
-    14579: 'MafCasLites01',
-    14580: 'mafCasGoldBits01',
-    14581: 'ab_mafiaSuite01zzz',
-    14582: 'mafiaCasinoBar1',
-    14583: 'ab_mafCasLaund',
-    14584: 'ab_abbatoir05',
-    14585: 'ab_abbatoir04',
-    14586: 'ab_abbatoir03',
-    14587: 'ab_abbatoir02',
-    14588: 'ab_abbatoir01',
-    14589: 'ab_abbatoir06',
-    14590: 'mafCasTopfoor',
-    14591: 'mafcasWallLite',
-    14592: 'mafCasLoadbay02',
-    14593: 'paperchase04',
-    14594: 'paperchase03',
-    14595: 'paperchase02',
-    14596: 'paperchase_stairs',
-    14597: 'paperchase07',
-    14598: 'paperchase_glass',
-    14599: 'paperchase08',
-    14600: 'paperchase_bits2',
-    14601: 'MafCasLites02',
-    14602: 'paperchase01',
-    14603: 'bikeschl_main',
-    14604: 'tv_stand_bike',
-    14605: 'triad_lights2',
-    14606: 'MafCasMain4',
-    14607: 'triad_main2',
-    14608: 'triad_buddha01',
-    14609: 'MafCasLites04',
-    14610: 'MafCasLites05',
-    14611: 'mafiaCasinoBarLite',
-    14612: 'ab_abattoir_box2',
-    14613: 'ab_abattoir_box1',
-    14614: 'triad_main3',
-    14616: 'ab_pillarTemp3',
-    14617: 'ab_pillarTemp2',
-    14618: 'ab_pillarTemp1',
-    14619: 'tricas_slotTable2',
-    14620: 'tricas_slotTable1',
-    14621: 'mafiaCasinoGlass',
-    14622: 'ab_pillarTemp4',
-    14623: 'MafCasMain1',
-    14624: 'MafCasMain2',
-    14625: 'MafCasMain3',
-    14626: 'mafcasSigns1',
-    14627: 'mafcas_optilite1',
-    14628: 'ab_caligulasfront',
-    14629: 'mafcas_chande',
-    14630: 'mafcas_Xitbox',
-    14632: 'paperchase_bits2b',
-    14633: 'paperchase_bits2c',
-    14635: 'mafcasGenStuff',
-    14636: 'mafcas_signs',
-    14637: 'triad_dragon',
-    14638: 'ab_mafsuiteDoor',
-    14639: 'tr_man_main',
-    14640: 'chinafurn2',
-    14641: 'tri_main_holes',
-    14643: 'tr_man_main_tr',
-    14650: 'trukstp04',
-    14651: 'trukstp05',
-    14652: 'trukstp02',
-    14653: 'trukstp03',
-    14654: 'trukstp06',
-    14655: 'trukstp01',
-    14656: 'tsdinerXitbox',
-    14657: 'cuntchairs',
-    14660: 'int_tatooA05',
-    14661: 'int_tatooA01',
-    14662: 'int_tatooA02',
-    14663: 'int_tatooA03',
-    14664: 'int_tatooA04',
-    14665: 'int_7_11A40',
-    14666: 'CJ_SEX_COUNTER03',
-    14667: 'int_7_11A41',
-    14668: '711_c',
-    14669: '711_d',
-    14670: 'int_7_11A42',
-    14671: 'int_7_11A5',
-    14672: 'int_sex01',
-    14673: 'chnsaw1',
-    14674: 'hotelferns1_LAn',
-    14675: 'Hotelatrium_LAn',
-    14676: 'int_tatooA06',
-    14677: 'int_tatooA07',
-    14678: 'int_tatooA08',
-    14679: 'Int_tat_tools01',
-    14680: 'Int_tat_lights01',
-    14681: 'int_tatooA09',
-    14682: 'int_tatooA10',
-    14683: 'int_tatooA11',
-    14684: 'int_tatooA12',
-    14685: 'int_tatooA13',
-    14686: 'Int_tat_tools02',
-    14687: 'Int_tat_lights02',
-    14688: 'int_tatooA14',
-    14689: 'int_tatooA15',
-    14690: 'int_7_11A40_bits',
-    14691: 'int_7_11A41_bits',
-    14692: 'int_7_11A41_bits01',
-    14693: 'Int_tat_tools',
-    14694: 'SEX_SHOP_DET',
-    14695: 'int_7_11A41_bits02',
-    14699: 'Int_tat_lights',
-    14700: 'int2smSf01_int01',
-    14701: 'int2Hoose2',
-    14702: 'int2lamid01',
-    14703: 'int2Hoose09',
-    14704: 'int2Hoose2_bits',
-    14705: 'int2Vase',
-    14706: 'int2labigtwo01',
-    14707: 'int2labig301',
-    14708: 'int2labigone01',
-    14709: 'int2lamidtwo01',
-    14710: 'int2vgshM3',
-    14711: 'int2vgshM2',
-    14712: 'int2Hoose11',
-    14713: 'int2Hoose16',
-    14714: 'int2Hoose08',
-    14715: 'int2Hoose09_Bits',
-    14716: 'int2lamid01_rail',
-    14717: 'int2lasmtwo02',
-    14718: 'int2lasmone04',
-    14719: 'int2lasmone01',
-    14720: 'int2lasmone02',
-    14721: '2labigone_bits',
-    14722: 'int2Hoose09_Bits2',
-    14723: 'int2Hoose09_Bits3',
-    14724: 'int2Hoose09_Bits4',
-    14725: 'int2lamid01_rail2',
-    14726: 'int2lamid01_rail3',
-    14727: 'int2lamid01_rail4',
-    14728: 'int2labig302',
-    14735: 'crackhoose',
-    14736: 'AH_chiller2',
-    14737: 'whorepix',
-    14738: 'brothelbar',
-    14739: 'whorefurn',
-    14740: 'ryblinds',
-    14741: 'rykitunit',
-    14742: 'ryders_wall_stuf',
-    14743: 'rydhall',
-    14744: 'rybathroom',
-    14745: 'rybatharse01',
-    14746: 'rylounge',
-    14747: 'curses04',
-    14748: 'sfhsm1',
-    14749: 'sfhsm1lights',
-    14750: 'sfhsm2',
-    14751: 'sfhsm2bits',
-    14752: 'curses02',
-    14753: 'sfhsb2curts',
-    14754: 'bigsanfranhoose',
-    14755: 'shite',
-    14756: 'shitlobby',
-    14757: 'sfmansionbits',
-    14758: 'sfmansion1',
-    14759: 'sfhsm03',
-    14760: 'Object03',
-    14761: 'ryshadroom',
-    14762: 'arsewinows',
-    14764: 'ballustrades',
-    14765: 'lacrakbulb',
-    14770: 'int_brothelseats',
-    14771: 'int3int_brothel',
-    14772: 'int3int_LOW_TV',
-    14773: 'int3int_brothel03',
-    14774: 'int_5kb_flykiller',
-    14775: 'int3int_brothel04',
-    14776: 'int3int_carupg_int',
-    14777: 'int_5weecasino',
-    14778: 'int_boxing02',
-    14779: 'int_boxing03',
-    14780: 'in_bxing04',
-    14781: 'in_bxing05',
-    14782: 'int3int_boxing30',
-    14783: 'int3int_kbsgarage',
-    14784: 'genint_warehs',
-    14785: 'gen_otb',
-    14786: 'ab_sfGymBeams1',
-    14787: 'ab_sfGymBits02a',
-    14788: 'ab_sfGymBits01a',
-    14789: 'ab_sfGymMain1',
-    14790: 'ab_sfGymBits03a',
-    14791: 'a_vgsGymBoxa',
-    14792: 'ab_vgsGymBits01a',
-    14793: 'ab_vegasGymLitesa',
-    14794: 'ab_vegasGymMain2',
-    14795: 'genint3_smashtv',
-    14796: 'int_kbsgarage05b',
-    14797: 'int_kbsgarage3b',
-    14798: 'int_kbsgarage3',
-    14799: 'otb_glass',
-    14800: 'gen_otb_bits',
-    14801: 'Bdups_main',
-    14802: 'BDups_interior',
-    14803: 'BDupsNEW',
-    14804: 'BDups_plant',
-    14805: 'BDupsNew_int',
-    14806: 'BDupshifi',
-    14807: 'BDupslight01',
-    14808: 'Strip2_Building',
-    14809: 'Strip2_Platforms',
-    14810: 'Strip2_Tables',
-    14811: 'Strip2_neon',
-    14812: 'StudioHall_frames',
-    14813: 'StudioHall_Furn',
-    14814: 'StudioHallBuild',
-    14815: 'Whhouse_main',
-    14816: 'Whhouse_furn',
-    14817: 'Whhouse_Rms',
-    14818: 'mc_straps',
-    14819: 'OG_Door',
-    14820: 'dj_stuff',
-    14821: 'mc_straps_int',
-    14822: 'Gym2_doorway',
-    14823: 'Gym3_doorway',
-    14824: 'Gym1_doorway',
-    14825: 'int_boxing07',
-    14826: 'int_kbsgarage2',
-    14827: 'ab_sfGymBits01a2',
-    14828: 'LM_strip2Priv',
-    14829: 'strip_signs',
-    14830: 'strip_lights',
-    14831: 'LM_stripbar',
-    14832: 'LM_stripCorner',
-    14833: 'LM_stripchairs1',
-    14834: 'LM_stripplant',
-    14835: 'LM_stripColumns',
-    14836: 'LM_strippoles',
-    14837: 'LM_stripchairs',
-    14838: 'int_strip_club',
-    14839: 'LM_stripPriv',
-    14840: 'Bdups_graf',
-    14841: 'Lee_gymers',
-    14842: 'int_policeA07',
-    14843: 'int_policeA01',
-    14844: 'int_policeA02',
-    14845: 'int_policeA03',
-    14846: 'int_ppol',
-    14847: 'mp_sfpd_big',
-    14848: 'mp_sfpd_stairs1',
-    14849: 'mp_sfpd_lights1',
-    14850: 'mp_sfpd_obj1',
-    14851: 'mp_sfpd_signa',
-    14852: 'mp_sfpd_win1',
-    14853: 'veg_pol_main2',
-    14854: 'countera',
-    14855: 'counterb',
-    14856: 'cellsa',
-    14858: 'veg_pol_main1',
-    14859: 'coochi',
-    14860: 'coochi',
-    14861: 'choochi',
-    14862: 'headboard',
-    14863: 'clothes',
-    14864: 'shoes',
-    14865: 'bobb',
-    14866: 'bobbi',
-    14867: 'bobbi',
-    14868: 'pennants01',
-    14869: 'bobbi',
-    14870: 'pompom01',
-    14871: 'Kylie_barn',
-    14872: 'Kylie_logs',
-    14873: 'Kylie_hay',
-    14874: 'Kylie_stairs',
-    14875: 'Kylie_hay1',
-    14876: 'michell',
-    14877: 'michell',
-    14878: 'michell',
-    14879: 'michell',
-    14880: 'michell',
-    14881: 'barbar',
-    14882: 'bar',
-    14883: 'priso',
-    14885: 'Vega',
-    14886: 'polvegsigns1',
-    14887: 'polvegsigns3',
-    14888: 'Milli',
-    14889: 'Milli',
-    14890: 'milli',
-    14891: 'milli',
-    14892: 'mp_sfpd_win2',
-    14893: 'police',
-    14894: 'police',
-    14895: 'mp_sfpd_obj2',
-    14896: 'mp_sfpd_lights2a',
-    14897: 'mp_sfpd_lights1a',
-    14898: 'int_policeA03a',
-    14900: 'police',
-    14901: 'police',
-    14902: 'veg_pol_window',
-    14903: 'mp_sfpd_lights2',
-    15025: 'genmotelfurn_sv',
-    15026: 'imy_roomfurn12_sv',
-    15027: 'immy_clothes_sv',
-    15028: 'genmotel2sh_sv',
-    15029: 'genmotel2_sv',
-    15030: 'genmotel_sv',
-    15031: 'lasmall1_sv',
-    15032: 'lasmallfurn_sv',
-    15033: 'vegashotel_sv',
-    15034: 'hotelgen_sv',
-    15035: 'kb_bed_test2_sv',
-    15036: 'kit_cab_washin_sv',
-    15037: 'MED_DINNING_2_sv',
-    15038: 'Plant_Pot_3_sv',
-    15039: 'mrk_bed02_sv',
-    15040: 'cuntbits',
-    15041: 'cunthouse',
-    15042: 'newhouse1',
-    15043: 'svcuntflorday',
-    15046: 'countrysavehouse',
-    15047: 'svvgmdshadfloor',
-    15048: 'LABIGSAVEHOUse',
-    15049: 'svlabigkitchshad',
-    15050: 'svlabigbits',
-    15051: 'svlasmshad',
-    15052: 'svsfsmshad',
-    15053: 'bigniceveghotel',
-    15054: 'svvgmedhoose',
-    15055: 'savelamid',
-    15056: 'svsfsmshadfloor2',
-    15057: 'bihotelshad',
-    15058: 'midvegsavehouse',
-    15059: 'labihalfhouse',
-    15060: 'svsfmdshadflr1',
-    15061: 'svlamidshad',
-    15062: 'lamidshadflr',
-    15063: 'svmidsavebits',
-    15064: 'svrails',
-    16000: 'drvin_screen',
-    16001: 'drvin_projhut',
-    16002: 'drvin_sign',
-    16003: 'drvin_ticket',
-    16004: 'des_tepeoff',
-    16005: 'desn2_stwnblok2',
-    16006: 'ros_townhall',
-    16007: 'desn2_cn2blok1',
-    16008: 'des_nbrstruct',
-    16009: 'des_nbrstruct2',
-    16010: 'des_reslab_',
-    16011: 'des_westrn2_',
-    16012: 'des_ntcafe',
-    16013: 'des_ntwn_lines1_',
-    16014: 'des_ntwn_lines2_',
-    16015: 'des_ntwn_lines6_',
-    16016: 'des_roadbar01',
-    16017: 'des_roadbar02',
-    16018: 'des_roadbar03',
-    16019: 'des_roadbar04',
-    16020: 'des_roadbar05',
-    16021: 'des_geyhotbase_',
-    16022: 'des_geywall1',
-    16023: 'des_trXingsign02',
-    16024: 'des_ltraintunnel2',
-    16025: 'des_trainline06',
-    16026: 'des_trainline07',
-    16027: 'des_trainline08',
-    16028: 'des_trainline09',
-    16029: 'des_trainline11',
-    16030: 'des_trainline12',
-    16031: 'des_trainline13',
-    16032: 'des_trainline14',
-    16033: 'des_trainline15',
-    16034: 'des_trainline16',
-    16035: 'des_trainline10',
-    16036: 'des_trainline17',
-    16037: 'des_railbr_twr10',
-    16038: 'des_powercable_01',
-    16039: 'des_powercable_03',
-    16040: 'des_powercable_04',
-    16041: 'des_powercable_07',
-    16042: 'des_powercable_08',
-    16043: 'des_powercable_09',
-    16044: 'des_powercable_10',
-    16045: 'des_powercable_11',
-    16046: 'des_powercable_12',
-    16047: 'des_powercable_19',
-    16048: 'des_powercable_20',
-    16049: 'des_powercable_21',
-    16050: 'des_powercable_22',
-    16051: 'des_westsaloon_01',
-    16052: 'des_ghotfence',
-    16053: 'des_westrn7_01',
-    16054: 'des_westrn9_01',
-    16055: 'quarry_bit04',
-    16056: 'quarry_bit02',
-    16057: 'quarry_bit01',
-    16058: 'quarry_bit05',
-    16059: 'quarry_bit03',
-    16060: 'des_treeline1',
-    16061: 'des_treeline2',
-    16062: 'des_nt_buntpoles',
-    16063: 'des_cockbunting',
-    16064: 'des_cn2blok4',
-    16065: 'des_stwnshop01',
-    16066: 'des_bluecafe01',
-    16067: 'des_stwnmotel02',
-    16068: 'des_stripblock1',
-    16069: 'des_stwnyelmot1_',
-    16070: 'des_stwnhotel1',
-    16071: 'des_quarrybelt02',
-    16072: 'des_quarrybelt01',
-    16073: 'des_quarrybelt03',
-    16074: 'des_quarrybelt04',
-    16075: 'des_quarrybelt07',
-    16076: 'des_sorter01',
-    16077: 'des_gravelpile01',
-    16078: 'des_quarrybelt08',
-    16079: 'des_quarrybelt09',
-    16080: 'des_bigquaryconv01',
-    16081: 'des_bigquaryconv02',
-    16082: 'des_quarryplatform',
-    16083: 'des_quarry_hopper01',
-    16084: 'des_quarryramp',
-    16085: 'des_quarstmound_02',
-    16086: 'des_bigoilpipe01',
-    16087: 'des_oilfieldpipe01',
-    16088: 'des_pipestrut01',
-    16089: 'des_pipestrut02',
-    16090: 'des_pipestrut03',
-    16091: 'des_pipestrut04',
-    16092: 'des_pipestrut05',
-    16093: 'a51_gatecontrol',
-    16094: 'des_a51infenc',
-    16095: 'des_a51guardbox02',
-    16096: 'des_a51guardbox04',
-    16097: 'n_bit_16',
-    16098: 'des_by_hangar_',
-    16099: 'des_powercable_end',
-    16100: 'des_substa_bldgs',
-    16101: 'des_windsockpole',
-    16102: 'cen_bit_18',
-    16103: 'ne_bit_22',
-    16104: 'des_boulders_',
-    16105: 'des_westrn11_04',
-    16106: 'des_nmot_',
-    16107: 'des_ngassta',
-    16108: 'des_snakefarm_',
-    16109: 'radar_bit_03',
-    16110: 'des_rockgp1_01',
-    16111: 'des_rockgp1_02',
-    16112: 'des_rockfl1_',
-    16113: 'des_rockgp2_03',
-    16114: 'des_rockgp2_',
-    16115: 'des_rockgp1_03',
-    16116: 'des_rockgp2_04',
-    16117: 'des_rockgp1_04',
-    16118: 'des_rockgp2_05',
-    16119: 'des_rockgp2_06',
-    16120: 'des_rockgp2_07',
-    16121: 'des_rockgp2_09',
-    16122: 'des_rockgp2_11',
-    16123: 'des_rockgp2_13',
-    16124: 'des_rockgp1_06',
-    16125: 'des_rockgp1_07',
-    16126: 'des_rockgp2_15',
-    16127: 'des_rockgp1_08',
-    16128: 'des_rockgp1_09',
-    16129: 'des_rockgp1_12',
-    16130: 'des_rockgp2_16',
-    16131: 'des_rockgp2_17',
-    16132: 'dam_trellis01',
-    16133: 'des_rockgp2_18',
-    16134: 'des_rockfl1_01',
-    16135: 'des_geysrwalk2',
-    16136: 'des_telefenc',
-    16137: 'des_teleshed2_',
-    16138: 'des_teleshed2_01',
-    16139: 'des_rockgp2_19',
-    16140: 'des_rockgp2_20',
-    16141: 'des_rockgp2_21',
-    16142: 'des_rockgp2_22',
-    16143: 'des_telecafe',
-    16144: 'des_telecafenc',
-    16145: 'des_rockgp2_23',
-    16146: 'des_ufoinn',
-    16147: 'radar_bit_02',
-    16148: 'radar_bit_01',
-    16149: 'radar_bit_04',
-    16150: 'ufo_barinterior',
-    16151: 'ufo_bar',
-    16152: 'ufo_booths',
-    16153: 'ufo_photos',
-    16154: 'ufo_backroom',
-    16155: 'ufo_backrmstuff',
-    16156: 'Vdes_trainline18',
-    16157: 'n_bit_01',
-    16158: 'n_bit_02',
-    16159: 'n_bit_03',
-    16160: 'n_bit_04',
-    16161: 'n_bit_05',
-    16162: 'n_bit_06',
-    16163: 'n_bit_07',
-    16164: 'n_bit_08',
-    16165: 'n_bit_10',
-    16166: 'n_bit_11',
-    16167: 'n_bit_12',
-    16168: 'n_bit_13',
-    16169: 'n_bit_14',
-    16170: 'n_bit_15',
-    16171: 'ne_bit_23',
-    16172: 'ne_bit_01',
-    16173: 'ne_bit_02',
-    16174: 'ne_bit_03',
-    16175: 'ne_bit_04',
-    16176: 'ne_bit_06',
-    16177: 'ne_bit_07',
-    16178: 'ne_bit_08',
-    16179: 'ne_bit_09',
-    16180: 'ne_bit_10',
-    16181: 'ne_bit_11',
-    16182: 'ne_bit_12',
-    16183: 'ne_bit_13',
-    16184: 'ne_bit_14',
-    16185: 'ne_bit_15',
-    16186: 'ne_bit_16',
-    16187: 'ne_bit_17',
-    16188: 'ne_bit_18',
-    16189: 'ne_bit_19',
-    16190: 'ne_bit_20',
-    16191: 'ne_bit_21',
-    16192: 'cen_bit_01',
-    16193: 'cen_bit_02',
-    16194: 'cen_bit_03',
-    16195: 'cen_bit_04',
-    16196: 'cen_bit_20',
-    16197: 'cen_bit_05',
-    16198: 'cen_bit_06',
-    16199: 'cen_bit_07',
-    16200: 'cen_bit_08',
-    16201: 'cen_bit_09',
-    16202: 'cen_bit_10',
-    16203: 'cen_bit_11',
-    16204: 'cen_bit_12',
-    16205: 'cen_bit_13',
-    16206: 'cen_bit_14',
-    16207: 'cen_bit_15',
-    16208: 'cen_bit_16',
-    16209: 'cen_bit_19',
-    16210: 'cen_bit_17',
-    16211: 's_bit_01',
-    16212: 's_bit_02',
-    16213: 's_bit_03',
-    16214: 's_bit_04',
-    16215: 's_bit_05',
-    16216: 's_bit_06',
-    16217: 's_bit_07',
-    16218: 's_bit_08',
-    16219: 's_bit_09',
-    16220: 's_bit_10',
-    16221: 's_bit_11',
-    16222: 's_bit_12',
-    16223: 's_bit_13',
-    16224: 's_bit_14',
-    16225: 's_bit_15',
-    16226: 's_bit_16',
-    16227: 's_bit_17',
-    16228: 's_bit_18',
-    16229: 's_bit_19',
-    16230: 'se_bit_01',
-    16231: 'se_bit_02',
-    16232: 'se_bit_03',
-    16233: 'se_bit_04',
-    16234: 'se_bit_05',
-    16235: 'se_bit_06',
-    16236: 'se_bit_07',
-    16237: 'se_bit_08',
-    16238: 'se_bit_09',
-    16239: 'se_bit_10',
-    16240: 'se_bit_11',
-    16241: 'se_bit_12',
-    16242: 'se_bit_13',
-    16243: 'se_bit_14',
-    16244: 'se_bit_15',
-    16245: 'se_bit_16',
-    16246: 'se_bit_17',
-    16247: 'se_bit_18',
-    16248: 'se_bit_20',
-    16249: 'se_bit_21',
-    16250: 'se_bit_23',
-    16251: 'n_bit_17',
-    16252: 'n_bit_18',
-    16253: 'n_bit_19',
-    16254: 'n_bit_20',
-    16255: 'ne_bit_24',
-    16256: 'ne_bit_25',
-    16257: 'ne_bit_26',
-    16258: 'cen_bit_21',
-    16259: 'cen_bit_22',
-    16260: 'cen_bit_23',
-    16261: 'cen_bit_24',
-    16262: 's_bit_21',
-    16263: 'se_bit_24',
-    16264: 'radar_bit_05',
-    16266: 'des_railbridgeoil',
-    16267: 'des_oilpipe_04',
-    16268: 'des_oillines01',
-    16269: 'des_oillines02',
-    16270: 'des_oillines03',
-    16271: 'des_railfac02',
-    16272: 'des_railfac01',
-    16280: 'des_farmhouse1_',
-    16281: 'des_fgateway01',
-    16282: 'cn2_slines02',
-    16283: 'cn2_slines01',
-    16284: 'cn2_slines04',
-    16285: 'des_westrn7_03',
-    16286: 'cn2_slines06',
-    16287: 'des_fshed1_',
-    16288: 'cn2_slines03',
-    16289: 'cn2_slines05',
-    16290: 'cn2_slines07',
-    16291: 'cn2_slines08',
-    16292: 'cn2_slines09',
-    16293: 'a51_extfence03',
-    16294: 'a51_extfence06',
-    16295: 'quarry_fenc01',
-    16296: 'quarry_fenc04',
-    16297: 'quarry_fenc06',
-    16298: 'quarry_fenc05',
-    16299: 'quarry_fenc02',
-    16300: 'quarry_fenc03',
-    16301: 'des_quarrybelt13',
-    16302: 'des_gravelpile04',
-    16303: 'des_quarryramp01',
-    16304: 'des_gravelpile05',
-    16305: 'des_gravelpile06',
-    16306: 'cn2_ywire',
-    16307: 'des_tellines01',
-    16308: 'des_sbridsupps',
-    16309: 'des_quarrybelt11',
-    16310: 'des_quarryhut1',
-    16311: 'des_quarrybelt15',
-    16312: 'quarry_walllthing',
-    16313: 'quarry_fencins',
-    16314: 'quarry_chutelift',
-    16315: 'quarry_fencins2',
-    16316: 'des_quarrybelt17',
-    16317: 'des_quarstmound_03',
-    16318: 'des_quarrybelt18',
-    16319: 'quarrystuff4',
-    16320: 'quarry_fenc07',
-    16321: 'quarry_fenc08',
-    16322: 'a51_plat',
-    16323: 'a51_outbldgs',
-    16324: 'des_quaoldfenc',
-    16325: 'des_quarryhut02',
-    16326: 'des_byoffice',
-    16327: 'des_bycontowr',
-    16328: 'quarry_crane',
-    16332: 'quarry_cranhook',
-    16333: 'quarry_crhookcble',
-    16334: 'des_cranelines01',
-    16335: 'des_transtower',
-    16337: 'des_cranecontrol',
-    16338: 'dam_genbay01',
-    16339: 'dam_genend01',
-    16340: 'dam_genturbine05',
-    16341: 'dam_genalpha01',
-    16342: 'dam_genturbine04',
-    16343: 'dam_genalpha02',
-    16344: 'dam_genbay02',
-    16345: 'dam_genturbine03',
-    16346: 'dam_genturbine02',
-    16347: 'dam_genalpha04',
-    16348: 'dam_genbay04',
-    16349: 'dam_genturbine01',
-    16350: 'dam_genend02',
-    16351: 'dam_genalpha06',
-    16352: 'dam_genbay06',
-    16353: 'dam_genalpha07',
-    16354: 'dam_genbay07',
-    16355: 'dam_gencrane01',
-    16356: 'dam_gencrane02',
-    16357: 'des_ebrigroad01',
-    16358: 'des_ebrigroad07',
-    16359: 'des_shed3_01',
-    16360: 'desn2_tsfuelpay',
-    16361: 'desn2_tsblock',
-    16362: 'desn2_tscanopy',
-    16363: 'des_trstplines',
-    16364: 'des_quaybase',
-    16365: 'des_substat_17',
-    16366: 'des_substat_37',
-    16367: 'des_quayramp',
-    16368: 'bonyrd_windsock',
-    16369: 'des_quaoldfenc01',
-    16370: 'by_fuelfence',
-    16371: 'desn2_alphabit01',
-    16372: 'desn2_alphabit02',
-    16373: 'desn2_alphabit04',
-    16374: 'desn2_alphabit05',
-    16375: 'by_helimarkings',
-    16376: 'desn2dambit01',
-    16377: 'tv_stand_by',
-    16378: 'des_byofficeint',
-    16384: 'des_ebrigroad10',
-    16385: 'desh2_weefact2_',
-    16386: 'desn2_shed3_',
-    16387: 'desn2_ammun',
-    16388: 'des_studbldg',
-    16389: 'des_studgrnd',
-    16390: 'desn2_studbush',
-    16391: 'des_reffenc04',
-    16392: 'des_reffenc01',
-    16393: 'des_reffenc02',
-    16394: 'des_reffenc03',
-    16395: 'desn2_minerun',
-    16396: 'des_ntshop5_',
-    16397: 'n_bit_09',
-    16398: 'desn2_peckfac1',
-    16399: 'desn2_peckfac2',
-    16400: 'desn2_peckfac3',
-    16401: 'desn2_peckjump',
-    16402: 'desn2_peckalpha',
-    16403: 'des2_bushybits',
-    16404: 'desn2_hutskel2',
-    16405: 'desn2_hutskel03',
-    16406: 'desn2_weemineb',
-    16407: 'airfieldhus1',
-    16408: 'airfieldhus2',
-    16409: 'by_weehangr',
-    16410: 'desn2_graves',
-    16411: 'desn2_platroks',
-    16420: 'des_sbridsupps04',
-    16421: 's_bit_06_2',
-    16422: 's_bit_06_3',
-    16423: 's_bit_06_4',
-    16424: 's_bit_06_5',
-    16430: 'des_ebrigroad02',
-    16434: 'desn2_stwnalph1',
-    16436: 'cn2_roadblock01',
-    16437: 'cn2_roadblock02',
-    16438: 'cn2_roadblock03',
-    16439: 'cn2_roadblock04',
-    16442: 'desn2_stripsigs1',
-    16444: 'des_blackbags',
-    16445: 'des_quarrycut',
-    16446: 'quarry_weecrushr',
-    16448: 'des_nt_buntpoles01',
-    16475: 'des_stwnbowl',
-    16477: 'des_stwngas1',
-    16479: 'des_stgas1sig',
-    16480: 'ftcarson_sign',
-    16481: 'des_quarrybelt19',
-    16498: 'des_rdalpha01',
-    16500: 'cn2_savgardr1_',
-    16501: 'cn2_savgardr2_',
-    16502: 'cn2_jetty1',
-    16503: 'cn2_rockgpst',
-    16530: 'des_oilfieldpipe02',
-    16531: 'des_oilpipe_03',
-    16532: 'des_oilpipe_05',
-    16533: 'des_oilpipe_06',
-    16534: 'des_oilpipe_01',
-    16535: 'des_oilpipe_07',
-    16562: 'cn2_rosmot1',
-    16563: 'cn2_polis',
-    16564: 'des_stmedicentre_',
-    16568: 'cn2_rosmot02',
-    16571: 'des_railbridgest01',
-    16593: 'se_bit_19',
-    16599: 'by_fuel06',
-    16601: 'by_fuel07',
-    16605: 'des_stwnmotel03',
-    16610: 'des_nbridgebit_02',
-    16613: 'des_bigtelescope',
-    16622: 'des_ntwn_lines3_',
-    16623: 'des_rdalpha02',
-    16627: 'des_ghotfenc01',
-    16628: 'des_ghotfenc02',
-    16629: 'des_ghotfenc03',
-    16630: 'des_ghotfenc04',
-    16631: 'des_ghotfenc05',
-    16632: 'des_ghotfenc06',
-    16633: 'des_ghotfenc07',
-    16634: 'des_ghotfenc08',
-    16635: 'des_ghotfenc09',
-    16636: 'des_ghotfenc10',
-    16637: 'ghostgardoor',
-    16638: 'a51_gatecon_a',
-    16639: 'des_a51_labs',
-    16640: 'des_a51_inner3',
-    16641: 'des_a51warheads',
-    16642: 'a51_genroom',
-    16643: 'a51_stormech',
-    16644: 'a51_ventsouth',
-    16645: 'a51_ventsouth01',
-    16646: 'a51_ugstore1a',
-    16647: 'a51_storeroom',
-    16648: 'a51_fakeroom2',
-    16649: 'a51_entstair',
-    16650: 'a51_genroomalpha',
-    16651: 'a51_genwalkway',
-    16652: 'a51_fakealpha1',
-    16653: 'a51_fakealpha2',
-    16654: 'a51_fakeroom1',
-    16655: 'a51_labglass',
-    16656: 'a51_rocketlab',
-    16657: 'des_a51_labs2',
-    16658: 'des_a51_labent',
-    16659: 'des_a51_entalpha',
-    16660: 'a51_entstuff',
-    16661: 'a51_sci_stair',
-    16662: 'a51_radar_stuff',
-    16663: 'a51_jetpstuff',
-    16664: 'a51_jetpalpha',
-    16665: 'a51_radarroom',
-    16666: 'a51_machines',
-    16667: 'des_rockgp2_14',
-    16668: 'a51_extfence04',
-    16669: 'a51_extfence05',
-    16670: 'a51_extfence02',
-    16671: 'a51_extfence01',
-    16673: 'des_nmot_02',
-    16675: 'des_rockgp1_13',
-    16676: 'des_quarrycut3',
-    16677: 'des_quarrycut2',
-    16678: 'desn2_alphabit07',
-    16681: 'a51_launchbottom',
-    16682: 'a51_jetroom',
-    16683: 'cn2_alphabit01',
-    16684: 'cn2_rnway_bit',
-    16685: 'cn2_rnway_bit2',
-    16689: 'des_westrn7_02',
-    16690: 'des_westsaloon_02',
-    16692: 'des_rockgp1_05',
-    16693: 'n_bit_11b',
-    16694: 'n_bit_11c',
-    16700: 'androm_des_obj',
-    16701: 'china_town_gateb',
-    16702: 'cargo_stuff',
-    16705: 'cargo_test',
-    16706: 'carge_barrels',
-    16707: 'cargo_netting',
-    16708: 'cargo_store',
-    16731: 'cxrf_a51_stairs08',
-    16732: 'a51_ventcover',
-    16733: 'cn2_DETAIL01',
-    16734: 'cn2_DETAIL02',
-    16735: 'des_alphabit08',
-    16736: 'des_alphabit05',
-    16737: 'des_alphabit01',
-    16738: 'des_alphabit02',
-    16739: 'des_alphabit03',
-    16740: 'des_alphabit04',
-    16741: 'des_alphabit',
-    16742: 'des_alphabit06',
-    16743: 'des_alphabit07',
-    16744: 'des_alphabit09',
-    16745: 'des_alphabit10',
-    16746: 'des_alphabit11',
-    16747: 'des_alphabit12',
-    16753: 'des_cn2_detailbit',
-    16754: 'des_cn2_detail2',
-    16756: 'des_cn2_detail3',
-    16757: 'des_cn2_detail4',
-    16758: 'des_cn2_detailbit2',
-    16759: 'desn2_alphabit06',
-    16760: 'cn2_ftcar_sig1',
-    16766: 'des_oilpipe_02',
-    16767: 'cluckinbell1_cn2',
-    16769: 'desn2_ammun04',
-    16770: 'des_gunbldg01',
-    16771: 'des_savhangr',
-    16773: 'door_savhangr1',
-    16774: 'des_gunbldg',
-    16775: 'door_savhangr2',
-    16783: 'des_detailbit06',
-    16784: 'des_alphabit13',
-    16785: 'des_aroadbit02',
-    16786: 'des_aroadbit03',
-    16787: 'des_aroadbit04',
-    16788: 'des_aroadbit08',
-    16789: 'des_aroadbit12',
-    16790: 'desn2_aroadbit05',
-    17000: 'wt6suppsxc',
-    17001: 'cuntgrsilos',
-    17002: 'lawestbridge_law',
-    17003: 'cuntwcridge',
-    17004: 'cos_pch_brig_1',
-    17005: 'farmhouse',
-    17006: 'D5002whi',
-    17007: 'wt6supps01',
-    17008: 'farmhouse01',
-    17009: 'truth_barn02',
-    17010: 'truth_barn03',
-    17011: 'truth_barn04',
-    17012: 'cwsthseing26',
-    17013: 'cuntplant05',
-    17014: 'cuntwplant01',
-    17015: 'cuntwplant07',
-    17016: 'cutnwplant09',
-    17017: 'cuntwplant10',
-    17018: 'cuntsplantfnce03',
-    17019: 'cuntfrates1',
-    17020: 'cuntfrates02',
-    17021: 'cuntplant06',
-    17022: 'cuntwplant11',
-    17023: 'cutnwplant10',
-    17024: 'cuntwplant12',
-    17025: 'cunt_rockgp1_',
-    17026: 'cunt_rockgp2_',
-    17027: 'cunt_rockgp1_03',
-    17028: 'cunt_rockgp2_04',
-    17029: 'cunt_rockgp2_09',
-    17030: 'cunt_rockgp2_11',
-    17031: 'cunt_rockgp2_13',
-    17032: 'cunt_rockgp2_14',
-    17033: 'cunt_rockgp2_15',
-    17034: 'cunt_rockgp2_16',
-    17035: 'cunt_rockgp2_17',
-    17036: 'cuntw_carport1_',
-    17037: 'cuntw_carport2_',
-    17038: 'cuntw_weefactory1_',
-    17039: 'cuntw_weebarn1_',
-    17040: 'cuntw_weefact1_',
-    17041: 'cuntw_stwn',
-    17042: 'cuntw_stwnmotsign2',
-    17043: 'concretearch1',
-    17044: 'cuntw_stwnyels',
-    17045: 'cuntw_stwnyel',
-    17046: 'telewirescuntw',
-    17047: 'cuntwwires',
-    17048: 'cuntwwires2',
-    17049: 'cw_Silo01',
-    17050: 'cw_Silo02',
-    17051: 'cw_Silo03',
-    17052: 'cw_bigbarn02',
-    17053: 'cw_bigbarn03',
-    17054: 'cw_bigbarn04',
-    17055: 'cw_fueldrum03',
-    17056: 'cw_corrug01',
-    17057: 'cw_haypile03',
-    17058: 'cw_tempbarn01',
-    17059: 'cw_haypile05',
-    17060: 'cw_haypile06',
-    17061: 'cw_barnie',
-    17062: 'cuntytunnel',
-    17063: 'cw2_weebarn1_01',
-    17064: 'cw2_garage',
-    17065: 'cw2_garagecanopy',
-    17066: 'cw2_genstore',
-    17067: 'cw2_logcabins',
-    17068: 'xjetty01',
-    17069: 'cunt_rockgp2_24',
-    17070: 'carspaces03',
-    17071: 'cunt_rockgp2_25',
-    17072: 'smltrukext',
-    17073: 'smlltrukint',
-    17074: 'truth_barn05',
-    17075: 'cuntwland01b',
-    17076: 'cunt_rockgp2_26',
-    17077: 'cuntwland02b',
-    17078: 'cuntwland03b',
-    17079: 'cuntwland04b',
-    17080: 'cuntwland05b',
-    17081: 'cuntwland06b',
-    17082: 'cuntwland07b',
-    17083: 'cuntwland08b',
-    17084: 'cuntwland09b',
-    17085: 'cuntwland10bb',
-    17086: 'cuntwland11b',
-    17087: 'cuntwland12b',
-    17088: 'cuntwland13b',
-    17089: 'cuntwland15b',
-    17090: 'cuntwland16b',
-    17091: 'cuntwland17_de',
-    17092: 'cuntwland_de',
-    17093: 'cuntwland19b',
-    17094: 'cuntwland20b',
-    17095: 'cuntwland21b',
-    17096: 'cuntwland22b',
-    17097: 'cuntwland23b',
-    17098: 'cuntwland24b',
-    17099: 'cuntwland25b',
-    17100: 'cuntwland26b',
-    17101: 'cuntwland29b',
-    17102: 'cuntwland31b',
-    17103: 'cuntwland32b',
-    17104: 'cuntwland33b',
-    17105: 'cuntwland34b',
-    17106: 'cuntwland35b',
-    17107: 'cuntwland36b',
-    17108: 'cuntwland37b',
-    17109: 'cuntwland38b',
-    17110: 'cuntwland39b',
-    17111: 'cuntwland40b',
-    17112: 'cuntwland41b',
-    17113: 'cuntwland42b',
-    17114: 'cuntwland45b',
-    17115: 'cuntwland46b',
-    17116: 'cuntwland47b',
-    17117: 'cuntwland48b',
-    17118: 'cuntwland50b',
-    17119: 'cuntwland52b',
-    17120: 'cuntwland53b',
-    17121: 'cuntwland54b',
-    17122: 'cuntwland55b',
-    17123: 'cuntwland56bx',
-    17124: 'cuntwland58b',
-    17125: 'cuntwland59b',
-    17126: 'cuntwland60b',
-    17127: 'cuntwland62b',
-    17128: 'cuntwland63b',
-    17129: 'cuntwland64b',
-    17130: 'cuntwland65b',
-    17131: 'cuntwland66b',
-    17132: 'cuntwland67b',
-    17133: 'cuntwland68b',
-    17134: 'cuntwland69b',
-    17135: 'cuntwland70b',
-    17136: 'cuntwland71b',
-    17137: 'cuntwland72b',
-    17138: 'cuntwland73b',
-    17139: 'cuntwland74b',
-    17140: 'cuntwland75b',
-    17141: 'cuntwland76b',
-    17142: 'cuntwland77b',
-    17143: 'cuntwland78b',
-    17144: 'cuntwland79b',
-    17145: 'cuntwland80b',
-    17146: 'cuntwroad37',
-    17148: 'cuntwroad02',
-    17150: 'cuntwroad03',
-    17152: 'cuntwroad04',
-    17154: 'cuntwroad72',
-    17156: 'cuntwroad06',
-    17158: 'cuntwroad07',
-    17160: 'cuntwroad08',
-    17162: 'cuntwroad09',
-    17164: 'cuntwroad10',
-    17166: 'cuntwroad11',
-    17168: 'cuntwroad12',
-    17170: 'cuntwroad13',
-    17172: 'cuntwroad14',
-    17174: 'cuntwroad15',
-    17176: 'cuntwroad16',
-    17178: 'cuntwroad17',
-    17180: 'cuntwroad18',
-    17182: 'cuntwroad19',
-    17184: 'cuntwroad20',
-    17186: 'cuntwroad21',
-    17188: 'cuntwroad24',
-    17190: 'cuntwroad25',
-    17192: 'cuntwroad26',
-    17194: 'cuntwroad27',
-    17196: 'cuntwroad28',
-    17198: 'cuntwroad29',
-    17200: 'cuntwroad30',
-    17202: 'cuntwroad31',
-    17204: 'cuntwroad32',
-    17208: 'cuntwroad74',
-    17210: 'cuntwroad73',
-    17212: 'cuntwroad34',
-    17214: 'cuntwroad35',
-    17216: 'cuntwroad36',
-    17218: 'cuntwroad01',
-    17220: 'cuntwroad38',
-    17222: 'cuntwroad05',
-    17224: 'cuntwroad40',
-    17226: 'cuntwroad41',
-    17228: 'cuntwroad42',
-    17230: 'cuntwroad43',
-    17232: 'cuntwroad44',
-    17234: 'cuntwroad45',
-    17236: 'cuntwroad46',
-    17238: 'cuntwroad47',
-    17240: 'cuntwroad48',
-    17242: 'cuntwroad49',
-    17244: 'cuntwroad50',
-    17246: 'cuntwroad51',
-    17248: 'cuntwroad52',
-    17250: 'cuntwroad33',
-    17252: 'cuntwroad54',
-    17254: 'cuntwroad55',
-    17256: 'cuntwroad39',
-    17258: 'cuntwroad57',
-    17260: 'cuntwroad58',
-    17262: 'cuntwroad59',
-    17267: 'cuntwroad66',
-    17269: 'cuntwroad67',
-    17271: 'cuntwroad63',
-    17273: 'cuntwroad65',
-    17275: 'cuntwroad69',
-    17277: 'cuntwroad70',
-    17279: 'cuntwroad68',
-    17281: 'cuntwroad71',
-    17283: 'cuntwrail12',
-    17284: 'cuntwrail11',
-    17285: 'cuntwrail10',
-    17286: 'cuntwrail09',
-    17287: 'cuntwrail08',
-    17288: 'cuntwrail07',
-    17289: 'cuntwrail01',
-    17290: 'cuntwrail02',
-    17291: 'cuntwrail03',
-    17292: 'cuntwrail04',
-    17293: 'bwidgecuntw',
-    17294: 'cuntwland53bd',
-    17295: 'cuntwland53bc',
-    17296: 'cuntwrail04v',
-    17297: 'cuntwrail04c',
-    17298: 'sjmoldbarn03',
-    17299: 'cunt_rockgp2_27',
-    17300: 'cuntytunnel2',
-    17301: 'cuntwland49b',
-    17302: 'cuntwland51b',
-    17303: 'cuntwroad22',
-    17305: 'cuntwroad23',
-    17307: 'cuntwland40c',
-    17308: 'cuntwland02c',
-    17309: 'concretearch02',
-    17310: 'concretearch03',
-    17323: 'cuntwmotsignCJ',
-    17324: 'cw_combbarn',
-    17326: 'cuntwroad60',
-    17327: 'cuntwroad61',
-    17329: 'cuntwroad62',
-    17331: 'cuntwroad53',
-    17333: 'cuntwroad64',
-    17334: 'cuntwroad56',
-    17335: 'farmhouse02',
-    17426: 'cuntwwiresx',
-    17427: 'cuntwwiresxx',
-    17428: 'cuntwwiresxxx',
-    17429: 'telewirescuntw01',
-    17430: 'telewirescuntw02',
-    17431: 'telewirescuntw03',
-    17432: 'telewirescuntw04',
-    17433: 'cuntwwiresxx01',
-    17434: 'cuntwwiresxz',
-    17436: 'xoverlaymap01',
-    17437: 'xoverlaymap02',
-    17438: 'xoverlaymap03',
-    17439: 'xoverlaymap04',
-    17440: 'xoverlaymap05',
-    17441: 'xoverlaymap06',
-    17442: 'xoverlaymap13',
-    17443: 'xoverlaymap08',
-    17444: 'xoverlay_rock',
-    17448: 'xoverlaymap09',
-    17450: 'xoverlaymap10',
-    17451: 'xoverlaymap07',
-    17452: 'xoverlaymap07b',
-    17454: 'cuntgrsilosrail',
-    17455: 'dirtover',
-    17456: 'rockovergay',
-    17457: 'sjmoldbarn04',
-    17458: 'xxxxxxtra',
-    17459: 'xxxtra2',
-    17460: 'xxxover',
-    17461: 'xxxe',
-    17462: 'xxxxxxxxa',
-    17463: 'xxxc01',
-    17464: 'xxxd',
-    17465: 'xxxzc',
-    17466: 'xxxza',
-    17467: 'xxovr2',
-    17468: 'xxcliffx',
-    17469: 'xoverelaya',
-    17470: 'xoverlaydrt',
-    17471: 'cuntybitx',
-    17472: 'cunt_rocgxp2_04',
-    17474: 'cuntwland17_de_a',
-    17500: 'stormdrainLAE2_05',
-    17501: 'RiverBridge1_LAe',
-    17502: 'RiverBridge2_LAe',
-    17503: 'Furniture_LAe',
-    17504: 'furnittrans1_LAe',
-    17505: 'lae2_ground02',
-    17506: 'stormdrainLAE2_06',
-    17507: 'stormdrainLAE2_03',
-    17508: 'BlockK_LAe2',
-    17509: 'lae2_ground03',
-    17510: 'barrioTrans01_LAe',
-    17511: 'gwforum1_LAe',
-    17513: 'lae2_ground04',
-    17514: 'starthootra1_LAe',
-    17515: 'scumgym1_LAe',
-    17516: 'BlockItrans_LAe',
-    17517: 'BarberBlock1_LAe',
-    17518: 'telwire_01_LAe2',
-    17519: 'market2_lae',
-    17520: 'market1_lae',
-    17521: 'Pawnshp_lae2',
-    17522: 'gangshop7_lae2',
-    17523: 'Stripbar_lae',
-    17524: 'LongBeBlok1_LAe',
-    17525: 'RiverBridge3_LAe2',
-    17526: 'gangshops1_LAe',
-    17527: 'gangblock1Tr_LAe',
-    17528: 'barrioTrans01_LAe01',
-    17529: 'gangshops2_LAe2',
-    17530: 'pigpenblok1Tr_LAe',
-    17531: 'barrio03A_LAe',
-    17532: 'barrio06Trans_LAe',
-    17533: 'tempLB1_LAe2',
-    17534: 'cluckinbell1_LAe',
-    17535: 'furnsign1_LAe2',
-    17536: 'dambuild1_LAe2',
-    17537: 'cineblock1_LAe2',
-    17538: 'powerstat1_LAe2',
-    17539: 'rdsigns4_LAe03',
-    17540: 'rdsigns4_LAe05',
-    17541: 'LBeachBlok1z_LAe2',
-    17542: 'gangshops6_LAe2',
-    17543: 'gangshops5_LAe2',
-    17544: 'gangshops4_LAe2',
-    17545: 'barrio02_LAe',
-    17546: 'hydro3_LAe',
-    17547: 'EBeachAp1_LAe2',
-    17548: 'lae2_ground05',
-    17549: 'BeachBlok01_LAe2',
-    17550: 'EasBeBrij1_LAe2',
-    17551: 'BeachBlok02_LAe2',
-    17552: 'burnHous1_LAe2',
-    17553: 'BeachBlok3_LAe2',
-    17554: 'BeachBlok5_LAe2',
-    17555: 'BeachBlok7_LAe2',
-    17556: 'MStorCP1_LAe2',
-    17557: 'MStorCP2_LAe2',
-    17558: 'MStorCP4_LAe2',
-    17559: 'MStorCP6_LAe2',
-    17560: 'EBeachAp3_LAe2',
-    17561: 'MsCpTunn2_LAe2',
-    17562: 'LongBeBlokx_LAe',
-    17563: 'wattspark1_LAe2',
-    17564: 'Tempdoor_LAe2',
-    17565: 'rustybrij01_LAe2',
-    17566: 'sweetsdoor_LAe2',
-    17567: 'stormdrainLAE2_07',
-    17568: 'stormdrainLAE2_04',
-    17573: 'rydhou01_LAe2',
-    17574: 'rydbkyar1_LAe2',
-    17575: 'burgho01_LAe2',
-    17576: 'hubbridge1_LAe2',
-    17577: 'Liquorstore01_LAe2',
-    17578: 'Liquorstore02_LAe2',
-    17582: 'stadtplaza_lae2',
-    17583: 'stadt_fence',
-    17585: 'lae2transbit',
-    17586: 'ebeach_alphabits',
-    17588: 'ebeach_alpahbits2',
-    17589: 'ebeachpark',
-    17591: 'ebeachalpha5',
-    17592: 'ebeach_veg',
-    17594: 'lae2_ground06',
-    17595: 'Lae2_roads01',
-    17596: 'Lae2_roads02',
-    17597: 'Lae2_roads03',
-    17598: 'Lae2_roads04',
-    17599: 'Lae2_roads85',
-    17600: 'Lae2_roads05',
-    17601: 'lae2_ground07',
-    17602: 'Lae2_roads07',
-    17603: 'Lae2_roads08',
-    17604: 'Lae2_roads09',
-    17605: 'Lae2_roads10',
-    17606: 'lae2_roadscoast04',
-    17607: 'Lae2_roads12',
-    17608: 'Lae2_roads13',
-    17609: 'Lae2_roads14',
-    17610: 'Lae2_roads15',
-    17611: 'Lae2_roads16',
-    17612: 'Lae2_roads88',
-    17613: 'Lae2_roads89',
-    17614: 'Lae2_landHUB02',
-    17615: 'Lae2_landHUB03',
-    17616: 'Lae2_landHUB04',
-    17617: 'Lae2_landHUB05',
-    17618: 'Lae2_landHUB06',
-    17619: 'Lae2_landHUB07',
-    17620: 'Lae2_landHUB01',
-    17621: 'Lae2_roads17',
-    17622: 'Lae2_roads18',
-    17623: 'Lae2_roads19',
-    17624: 'Lae2_roads20',
-    17625: 'Lae2_roads21',
-    17626: 'Lae2_roads22',
-    17627: 'Lae2_roads23',
-    17628: 'Lae2_roads24',
-    17629: 'Lae2_roads25',
-    17630: 'Lae2_roads26',
-    17631: 'Lae2_roads27',
-    17632: 'Lae2_roads28',
-    17633: 'lae2_ground08',
-    17634: 'lae2_ground09',
-    17635: 'lae2_ground10',
-    17636: 'lae2_ground11',
-    17637: 'Lae2_roads29',
-    17638: 'Lae2_roads30',
-    17639: 'Lae2_roads31',
-    17640: 'Lae2_roads32',
-    17641: 'Lae2_roads33',
-    17642: 'Lae2_roads90',
-    17643: 'Lae2_roads34',
-    17644: 'Lae2_roads35',
-    17645: 'lae2_ground12',
-    17646: 'Lae2_roads36',
-    17647: 'Lae2_roads37',
-    17648: 'Lae2_roads38',
-    17649: 'Lae2_roads39',
-    17650: 'Lae2_roads40',
-    17651: 'Lae2_roads41',
-    17652: 'Lae2_roads42',
-    17653: 'Lae2_roads43',
-    17654: 'Lae2_roads44',
-    17655: 'Lae2_roads46',
-    17656: 'Lae2_roads50',
-    17657: 'Lae2_roads52',
-    17658: 'Lae2_roads53',
-    17659: 'Lae2_roads54',
-    17660: 'Lae2_roads55',
-    17661: 'Lae2_roads56',
-    17662: 'Lae2_roads57',
-    17663: 'Lae2_roads58',
-    17664: 'lae2_ground13',
-    17665: 'lae2_ground14',
-    17666: 'Lae2_roads86',
-    17667: 'Lae2_roads59',
-    17668: 'Lae2_roads64',
-    17669: 'Lae2_roads65',
-    17670: 'Lae2_roads66',
-    17671: 'Lae2_roads67',
-    17672: 'Lae2_roads68',
-    17673: 'lae2_roadscoast06',
-    17674: 'lae2_roadscoast05',
-    17675: 'lae2_roadscoast03',
-    17676: 'lae2_roadscoast01',
-    17677: 'lae2_ground15',
-    17678: 'grnd05_lae2',
-    17679: 'lae2_bigblock',
-    17680: 'Lae2_roads76',
-    17681: 'Lae2_roads77',
-    17682: 'Lae2_roads78',
-    17683: 'Lae2_roads79',
-    17684: 'Lae2_roads80',
-    17685: 'lae2_ground16',
-    17686: 'stormdrainLAE2_01',
-    17687: 'Lae2_roads81',
-    17688: 'stormdrainLAE2_02',
-    17689: 'brglae2',
-    17690: 'lae2_blockN',
-    17691: 'lae2_ground17',
-    17692: 'Lae2_roads83',
-    17693: 'Lae2_roads84',
-    17694: 'lae2_ground17b',
-    17695: 'brg_lae2',
-    17696: 'lae2_ground18',
-    17697: 'carlshou1_LAe2',
-    17698: 'sweetshou1_LAe2',
-    17699: 'mcstraps_LAe2',
-    17700: 'pigpenblok1_LAe2',
-    17804: 'LBeachApts1_LAe2',
-    17805: 'BeachApartAT_LAe2',
-    17807: 'BeachApartA4_LAe2',
-    17809: 'BeachApartA5_LAe2',
-    17829: 'Lae2_roads48',
-    17841: 'gymblok2_lae2',
-    17848: 'pigpen_props',
-    17849: 'Lae2_roads60',
-    17851: 'cineblok_alpha',
-    17852: 'autoshpblok_lae2',
-    17853: 'cine_mark_lae2',
-    17854: 'cinmamkr_alpha',
-    17859: 'cinemark2_lae2',
-    17860: 'autoshp_alpha',
-    17862: 'compomark_lae2',
-    17863: 'compmart_alpha',
-    17864: 'comp_puchase',
-    17865: 'comp_ground',
-    17866: 'grass_bank',
-    17867: 'Lae2_roads46b',
-    17872: 'grbank_alpha',
-    17874: 'hubst_alpha',
-    17875: 'hubst2_alpha',
-    17876: 'hubst3_alpha',
-    17877: 'lae2_hubgrass',
-    17878: 'lae2_hubgrass2',
-    17879: 'hubst4alpha',
-    17880: 'hub_grass3',
-    17881: 'hub5_grass',
-    17886: 'stdrain_alpha',
-    17887: 'stdrain_alpha2',
-    17888: 'EBeachAp2_LAe2',
-    17891: 'ground2_alpha',
-    17892: 'grnd02_lae2',
-    17893: 'splitapts01',
-    17894: 'splitapts02',
-    17897: 'cparkshit_alpha',
-    17898: 'hubbrdge_alphab',
-    17899: 'blockN_alpha',
-    17901: 'coast_apts',
-    17902: 'coastapt_alpha',
-    17904: 'blokz_fireescape',
-    17905: 'bighillalpha',
-    17906: 'lae2_ground15b',
-    17907: 'bighillalpha2',
-    17911: 'stdrainalpha3',
-    17912: 'stdrainalpha3b',
-    17913: 'hubbrdge_alpha',
-    17915: 'lae2billbrds2',
-    17916: 'lae2billbrds3',
-    17917: 'lae2billbrds4',
-    17918: 'lae2billbrds5',
-    17919: 'lae2billbrds6',
-    17920: 'Lae2_roads49',
-    17921: 'Lae2_roads82',
-    17922: 'coast_apts2',
-    17925: 'carls_faux',
-    17926: 'sweet_faux_ent',
-    17927: 'Lae2_roads06',
-    17928: 'burnsfakeint',
-    17933: 'Carte',
-    17934: 'coochieghous',
-    17936: 'rbridge3_girders',
-    17937: 'stormd_fill',
-    17938: 'stormd_fillc',
-    17939: 'stormd_fillb',
-    17940: 'rbridg23_girders',
-    17941: 'stormd_filld',
-    17942: 'stormd_fille',
-    17943: 'ebeachalpha5b',
-    17944: 'LngBeBlok2_LAe',
-    17946: 'Carter_GROUND',
-    17947: 'burg_alpha',
-    17950: 'cjsaveg',
-    17951: 'cjgaragedoor',
-    17953: 'conc_bblok',
-    17958: 'buringd_alpha',
-    17968: 'hubridge_smash',
-    17969: 'hub_graffitti',
-    17971: 'hub_grnd_alpha',
-    17972: 'grnd_alpha2',
-    17973: 'grnd_alpha3',
-    17974: 'grnd_alpha4',
-    17976: 'grnd_alpha5',
-    17978: 'grnd_alpha6',
-    18000: 'ammunationwwws01',
-    18001: 'int_barberA07',
-    18002: 'int_barberA02',
-    18003: 'int_barberA03',
-    18004: 'int_barberA05',
-    18005: 'int_barberA01',
-    18006: 'int_barberA08',
-    18007: 'int_barberA12',
-    18008: 'int_clothingA01',
-    18009: 'int_rest_main',
-    18010: 'int_3rest_lights',
-    18011: 'int_rest_veg02',
-    18012: 'int_rest_veg01',
-    18013: 'int_rest_veg3',
-    18014: 'int_rest_veg03',
-    18015: 'int_rest_veg04',
-    18016: 'int_rest_canopy',
-    18017: 'int_rest_counchs',
-    18018: 'int_bars',
-    18019: 'int_burger_furn',
-    18020: 'int_6burger_main',
-    18021: 'int_din_donut_main',
-    18022: 'int_chick_main',
-    18023: 'int_pizzaplace',
-    18024: 'int_clothe_ship',
-    18025: 'clothes_sports',
-    18026: 'clothes_shit',
-    18027: 'CJ_BARB_2',
-    18028: 'smllbarinterior',
-    18029: 'smllrestaurant',
-    18030: 'GAP',
-    18031: 'clothesexl',
-    18032: 'range_xtras2',
-    18033: 'munation_main',
-    18034: 'CJ_AMMUN1_EXTRA',
-    18035: 'munation_xtras2',
-    18036: 'range_main',
-    18038: 'Gu',
-    18039: 'vg_mun_opac2',
-    18040: 'vg_mun_xtras4',
-    18041: 'vg_mun_xtras3',
-    18042: 'gun_counter09',
-    18043: 'CJ_AMMUN_BITS',
-    18044: 'CJ_AMMUN3_EXTRA',
-    18045: 'mp_ammu01',
-    18046: 'mp_ammu03',
-    18047: 'mpgun_counter06',
-    18048: 'mp_ammu02',
-    18049: 'ammu_twofloor',
-    18050: 'range_opac01',
-    18051: 'range_xtras03',
-    18052: 'munation_xtras03',
-    18053: 'munation_xtras04',
-    18054: 'munation_xtras05',
-    18055: 'smllrestseats',
-    18056: 'mp_dinerbig',
-    18057: 'tabl',
-    18058: 'mp_dinersmall',
-    18059: 'tables',
-    18060: 'big_seats',
-    18061: 'condiments07',
-    18062: 'ab_sfAmmuItems01',
-    18063: 'ab_sfAmmuItems02',
-    18064: 'ab_sfAmmuUnits',
-    18065: 'ab_sfAmmuMain',
-    18066: 'posterv',
-    18067: 'bloo',
-    18068: 'clothe',
-    18069: 'clothes_sports2',
-    18070: 'GAP_COUNTER',
-    18071: 'Gap_Shadow',
-    18072: 'GAP_WINDOW',
-    18073: 'Sub_shadow',
-    18074: 'Donut_rail',
-    18075: 'lightD',
-    18077: 'din_donut_furn',
-    18078: 'CJ_BARB_2_acc',
-    18079: 'BARB_CURTAIN',
-    18080: 'DONUT_BLINDS',
-    18081: 'CJ_AB_Barber2_2',
-    18082: 'CJ_Barber2',
-    18083: 'CJ_Barber2_1',
-    18084: 'BARBER_BLINDS',
-    18085: 'Object01hjk',
-    18086: 'B_Lights',
-    18088: 'cj_changing_room',
-    18089: 'DISCO_FENCE',
-    18090: 'Bar_BAR1',
-    18091: 'CJ_BAR_2_DETAILS',
-    18092: 'ammun3_counter',
-    18094: 'CJ_SWEATER_F_71',
-    18095: 'BARBER_BLINDS02',
-    18098: 'BARBER_BLINDS03',
-    18099: 'cj_RUBBISH',
-    18100: 'cj_RUBBISH01',
-    18101: 'cj_RUBBISH02',
-    18104: 'CJ_AMMUN_BITS1',
-    18105: 'CJ_AMMUN5_EXTRA',
-    18109: 'CJ_AMMUN4_EXTRA',
-    18112: 'sub_signs',
-    18200: 'w_town_11',
-    18201: 'wtown_bits2_02',
-    18202: 'wtown_trailwal',
-    18203: 'wtown_bits2_05',
-    18204: 'w_townwires_01',
-    18205: 'w_townwires_02',
-    18206: 'w_townwires_03',
-    18207: 'w_townwires_04',
-    18208: 'w_townwires_05',
-    18209: 'w_townwires_06',
-    18210: 'w_townwires_07',
-    18211: 'w_townwires_08',
-    18212: 'w_townwires_09',
-    18213: 'w_townwires_10',
-    18214: 'w_townwires_11',
-    18215: 'w_townwires_12',
-    18216: 'mtbfence1',
-    18217: 'mtbfence06',
-    18218: 'mtbfence08',
-    18219: 'mtbfence09',
-    18220: 'mtbfence10',
-    18221: 'mtbfence11',
-    18222: 'mtbfence12',
-    18223: 'mtbfence14',
-    18224: 'mtbfence15',
-    18225: 'cunt_rockgp2_18',
-    18226: 'cunt_rockgp2_19',
-    18227: 'cunt_rockgp2_20',
-    18228: 'cunt_rockgp2_21',
-    18229: 'w7bark',
-    18230: 'logcabinnlogs',
-    18231: 'cs_landbit_81',
-    18232: 'cuntw_ngassta',
-    18233: 'cuntw_town07',
-    18234: 'cuntw_shed2_',
-    18235: 'cuntw_weechurch_',
-    18236: 'cuntw_shed3_',
-    18237: 'cuntw_dinerwst',
-    18238: 'cuntw_stwnfurn_',
-    18239: 'cuntw_restrnt1',
-    18240: 'cuntw_liquor01',
-    18241: 'cuntw_weebuild',
-    18242: 'cuntw_stwnmotel01',
-    18243: 'cuntw_stmotsigbas1',
-    18244: 'cuntw_stwnmotsign1',
-    18245: 'cuntwjunk02',
-    18246: 'cuntwjunk04',
-    18247: 'cuntwjunk03',
-    18248: 'cuntwjunk01',
-    18249: 'cuntwjunk05',
-    18250: 'cuntwjunk06',
-    18251: 'cuntwjunk07',
-    18252: 'cuntwjunk08',
-    18253: 'cuntwjunk09',
-    18254: 'cuntwjunk10',
-    18255: 'cuntwjunk11',
-    18256: 'w7bark01',
-    18257: 'crates',
-    18258: 'logcabinnlogs01',
-    18259: 'logcabinn01',
-    18260: 'crates01',
-    18261: 'cw2_photoblock',
-    18262: 'cw2_phroofstuf',
-    18263: 'wtown_bits2_06',
-    18264: 'cw2_cinemablock',
-    18265: 'cw2_wtownblok1',
-    18266: 'wtown_shops',
-    18267: 'logcabinn',
-    18268: 'cw2_mntfir05',
-    18269: 'cw2_mntfir11',
-    18270: 'cw2_mntfir13',
-    18271: 'cw2_mntfir16',
-    18272: 'cw2_mntfir27',
-    18273: 'cw2_weefirz08',
-    18274: 'cuntw_shed3_01',
-    18275: 'cw2_mtbfinish',
-    18276: 'mtb2_barrier1',
-    18277: 'mtb2_barrier2',
-    18278: 'mtb2_barrier3',
-    18279: 'mtb2_barrier6',
-    18280: 'mtb2_barrier4',
-    18281: 'mtb2_barrier5',
-    18282: 'cw_tsblock',
-    18283: 'cw_fuelpay',
-    18284: 'cw_tscanopy',
-    18285: 'cw_trucklines',
-    18286: 'cw_mountbarr06',
-    18287: 'cw_mountbarr01',
-    18288: 'cw_mountbarr02',
-    18289: 'cw_mountbarr03',
-    18290: 'cw_mountbarr04',
-    18291: 'cw_mountbarr07',
-    18292: 'cw_mountbarr05',
-    18293: 'cs_landbit_03',
-    18294: 'cs_landbit_04',
-    18295: 'cs_landbit_05',
-    18296: 'cs_landbit_06',
-    18297: 'cs_landbit_07',
-    18298: 'cs_landbit_08',
-    18299: 'cs_landbit_09',
-    18300: 'cs_landbit_10',
-    18301: 'cs_landbit_11',
-    18302: 'cs_landbit_13',
-    18303: 'cs_landbit_14',
-    18304: 'cs_landbit_15',
-    18305: 'cs_landbit_16',
-    18306: 'cs_landbit_17',
-    18307: 'cs_landbit_18',
-    18308: 'cs_landbit_19',
-    18309: 'cs_landbit_20',
-    18310: 'cs_landbit_21',
-    18311: 'cs_landbit_22',
-    18312: 'cs_landbit_23',
-    18313: 'cs_landbit_24',
-    18314: 'cs_landbit_25',
-    18315: 'cs_landbit_26',
-    18316: 'cs_landbit_27',
-    18317: 'cs_landbit_28',
-    18318: 'cs_landbit_29',
-    18319: 'cs_landbit_30',
-    18320: 'cs_landbit_31',
-    18321: 'cs_landbit_32',
-    18322: 'cs_landbit_33',
-    18323: 'cs_landbit_34',
-    18324: 'cs_landbit_35',
-    18325: 'cs_landbit_36',
-    18326: 'cs_landbit_37',
-    18327: 'cs_landbit_38',
-    18328: 'cs_landbit_39',
-    18329: 'cs_landbit_40',
-    18330: 'cs_landbit_41',
-    18331: 'cs_landbit_42',
-    18332: 'cs_landbit_43',
-    18333: 'cs_landbit_44',
-    18334: 'cs_landbit_45',
-    18335: 'cs_landbit_47',
-    18336: 'cs_landbit_48',
-    18337: 'cs_landbit_49',
-    18338: 'cs_landbit_50',
-    18339: 'cs_landbit_51',
-    18340: 'cs_landbit_52',
-    18341: 'cs_landbit_53',
-    18342: 'cs_landbit_55',
-    18343: 'cs_landbit_56',
-    18344: 'cs_landbit_57',
-    18345: 'cs_landbit_58',
-    18346: 'cs_landbit_59',
-    18347: 'cs_landbit_60',
-    18348: 'cs_landbit_61',
-    18349: 'cs_landbit_62',
-    18350: 'cs_landbit_64',
-    18351: 'cs_landbit_65',
-    18352: 'cs_landbit_66',
-    18353: 'cs_landbit_67',
-    18354: 'cs_landbit_68',
-    18355: 'cs_landbit_69',
-    18356: 'cs_landbit_70',
-    18357: 'cs_landbit_71',
-    18358: 'cs_landbit_73',
-    18359: 'cs_landbit_74',
-    18360: 'cs_landbit_75',
-    18361: 'cs_landbit_76',
-    18362: 'cs_landbit_79',
-    18363: 'cs_landbit_80',
-    18364: 'cs_landbit_01',
-    18365: 'sawmill',
-    18366: 'cw2_mountwalk1',
-    18367: 'cw2_bikelog',
-    18368: 'cs_mountplat',
-    18369: 'cs_roads01',
-    18370: 'cs_roads02',
-    18371: 'cs_roads03',
-    18372: 'cs_roads04',
-    18373: 'cs_roads05',
-    18374: 'cs_roads06',
-    18375: 'cs_roads07',
-    18376: 'cs_roads08',
-    18377: 'cs_roads09',
-    18378: 'cs_roads10',
-    18379: 'cs_roads11',
-    18380: 'cs_roads12',
-    18381: 'cs_roads13',
-    18382: 'cs_roads16',
-    18383: 'cs_roads17',
-    18384: 'cs_roads20',
-    18385: 'cuntsrod03',
-    18386: 'cuntsrod02',
-    18387: 'cuntsrod14',
-    18388: 'cuntsrod01',
-    18389: 'cs_roads26',
-    18390: 'cs_roads27',
-    18391: 'cs_roads28',
-    18392: 'cs_roads29',
-    18393: 'cuntsrod04',
-    18394: 'cs_roads35',
-    18432: 'mtbfence17',
-    18433: 'mtbfence21',
-    18434: 'mtbfence24',
-    18435: 'mtb_poles01',
-    18436: 'mtb_poles02',
-    18437: 'mtb_poles03',
-    18438: 'mtb_poles04',
-    18439: 'mtb_poles05',
-    18440: 'mtbfence26',
-    18441: 'mtbfence29',
-    18442: 'mtbfence31',
-    18443: 'mtbfence32',
-    18444: 'mtbfence39',
-    18445: 'mtbfence40',
-    18446: 'mtbfence43',
-    18447: 'cs_mntdetail01',
-    18448: 'w_townwires_13',
-    18449: 'cs_roadbridge01',
-    18450: 'cs_roadbridge04',
-    18451: 'cs_oldcarjmp',
-    18452: 'cw_tscanopy01',
-    18453: 'cs_detrok01',
-    18454: 'cs_detrok02',
-    18455: 'cs_detrok04',
-    18456: 'cs_detrok03',
-    18457: 'cs_detrok05',
-    18458: 'cs_detrok06',
-    18459: 'cs_detrok07',
-    18460: 'cs_detrok08',
-    18461: 'cs_detrok09',
-    18462: 'cs_detrok10',
-    18463: 'cs_detrok11',
-    18464: 'cs_detrok12',
-    18465: 'cs_detrok13',
-    18466: 'cs_detrok14',
-    18467: 'cs_detrok15',
-    18468: 'cs_detrok16',
-    18469: 'cs_landbit_12',
-    18470: 'telewires2cs',
-    18471: 'telewires1cs',
-    18472: 'telewires3cs',
-    18473: 'cs_landbit_50b',
-    18474: 'cstwnland03',
-    18475: 'cs_landbit_50c',
-    18476: 'cuntsrod12',
-    18477: 'cuntsrod11',
-    18478: 'cuntsrod09',
-    18479: 'cuntsrod10',
-    18480: 'cuntsrod06',
-    18481: 'cuntsrod08',
-    18482: 'cuntsrod05',
-    18483: 'cuntsrod07',
-    18484: 'cuntsrod13',
-    18485: 'cs_landbit_50d',
-    18496: 'w_town11b',
-    18518: 'cuntsrod02NEW',
-    18551: 'countS_barriers',
-    18552: 'cunts_ammun',
-    18553: 'count_ammundoor',
-    18561: 'cS_newbridge',
-    18563: 'cS_bsupport',
-    18565: 'Cs_Logs03',
-    18566: 'Cs_Logs02',
-    18567: 'Cs_Logs04',
-    18568: 'Cs_Logs05',
-    18569: 'Cs_Logs01',
-    18608: 'countS_lights01',
-    18609: 'Cs_Logs06',
-    18610: 'cs_landbit_70_A',
-    18611: 'cs_landbit_71_A',
-    18612: 'cs_landbit_53_A',
-    18613: 'cs_landbit_61_A',
-    18614: 'cs_landbit_44_A',
-    18615: 'cs_landbit_33_A',
-    18616: 'cs_landbit_25_A',
-    18617: 'cs_landbit_A',
-    18618: 'cs_landbit_41_A',
-    18619: 'cs_landbit_50_A',
-    18620: 'w_town_11_A',
-    18621: 'cs_landbit_58_A',
-    18622: 'cs_landbit_50b_A',
-    18623: 'cs_landbit_68_A',
-    18624: 'cs_landbit_65_A',
-    18625: 'cs_landbit_48_A',
-    18626: 'cs_landbit_36_A',
-    18627: 'cs_landbit_27_A',
-    18628: 'cs_landbit_10_A',
-    18629: 'cs_landbit_06_A',
-    18630: 'cs_landbit_20_A'
-}
\ No newline at end of file
+import numpy as np
+
+# Object ids free for new models and the names SA gives them, sorted by id
+AVAILABLE_IDS_PATH = pathlib.Path(__file__).with_name("available_ids.bin")
+AVAILABLE_IDS_MAGIC = b"AVID"
+# Magic and rows count, then int32 ids, uint32 end offsets of the names
+# and the ASCII names one after another
+AVAILABLE_IDS_HEADER = struct.Struct("<4sI")
+
+class AvailableIds(abc.Mapping):
+    def __init__(self, ids: np.ndarray, name_ends: np.ndarray, names: bytes):
+        self.ids = ids
+        self.name_ends = name_ends
+        self.names = names
+        self._names_order: Union[np.ndarray, None] = None
+        self._sorted_names: Union[np.ndarray, None] = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids.tolist())
+
+    def __getitem__(self, object_id: int):
+        index = self.get_index(object_id)
+        if index is None:
+            raise KeyError(object_id)
+        return self.get_name_at(index)
+
+    def get_index(self, object_id: int) -> Union[int, None]:
+        index = int(np.searchsorted(self.ids, object_id))
+        if index == len(self.ids) or self.ids[index] != object_id:
+            return None
+        return index
+
+    def get_name_at(self, index: int):
+        start = int(self.name_ends[index - 1]) if index != 0 else 0
+        return self.names[start:int(self.name_ends[index])].decode()
+
+    def get_id(self, name: str) -> Union[int, None]:
+        # Names are compared case-folded, a name shared by several ids gives the lowest one
+        if self._sorted_names is None:
+            folded = np.array([self.get_name_at(x).lower().encode() for x in range(len(self))])
+            self._names_order = np.argsort(folded, kind="stable")
+            self._sorted_names = folded[self._names_order]
+
+        key = name.lower().encode()
+        index = int(np.searchsorted(self._sorted_names, key))
+        if index == len(self._sorted_names) or self._sorted_names[index] != key:
+            return None
+        return int(self.ids[self._names_order[index]])
+
+def load_available_ids(path: Union[str, pathlib.Path] = AVAILABLE_IDS_PATH):
+    data = pathlib.Path(path).read_bytes()
+    magic, count = AVAILABLE_IDS_HEADER.unpack_from(data)
+    if magic != AVAILABLE_IDS_MAGIC:
+        raise Exception(f"File {path} is not an available ids table")
+
+    start = AVAILABLE_IDS_HEADER.size
+    ids = np.frombuffer(data, dtype="<i4", count=count, offset=start)
+    name_ends = np.frombuffer(data, dtype="<u4", count=count, offset=start + 4 * count)
+    return AvailableIds(ids, name_ends, data[start + 8 * count:])
+
+def write_available_ids(path: Union[str, pathlib.Path], available_ids: Mapping[int, str]):
+    ids = sorted(available_ids)
+    names = [available_ids[x].encode("ascii") for x in ids]
+    with open(path, "wb") as file:
+        file.write(AVAILABLE_IDS_HEADER.pack(AVAILABLE_IDS_MAGIC, len(ids)))
+        file.write(np.array(ids, dtype="<i4").tobytes())
+        file.write(np.cumsum([len(x) for x in names], dtype=np.int64).astype("<u4").tobytes())
+        file.write(b"".join(names))
+
+_available_ids: Union[AvailableIds, None] = None
+
+def get_available_ids():
+    global _available_ids
+    if _available_ids is None:
+        _available_ids = load_available_ids()
+    return _available_ids
+
+def __getattr__(name: str):
+    # The table is read on first use of available_ids, not on import
+    if name == "available_ids":
+        return get_available_ids()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
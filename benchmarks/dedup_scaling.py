@@ -0,0 +1,82 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from parsing.intention.instance_table import InstanceTable, DEDUP_POLICIES, SPATIAL_DEDUP_EPSILON
+
+DEFAULT_SCALES = (10000, 100000, 1000000)
+
+# Time per instance may grow by this factor from the smallest to the largest
+# scale, a quadratic dedup grows by the ratio of the scales instead
+MAX_GROWTH = 3.0
+
+def get_synthetic_table(instances_count: int, seed: int = 0):
+    random = np.random.default_rng(seed)
+    models_count = min(20000, max(100, instances_count // 50))
+    model_indices = random.integers(0, models_count, instances_count, dtype=np.int32)
+    positions = random.uniform(-3000, 3000, (instances_count, 3))
+    rotations = random.choice([0.0, 90.0, 180.0], (instances_count, 3))
+
+    # A tenth repeats another placement closer than epsilon, a tenth of one
+    # model shares an x coordinate and a hundredth is stacked on one point
+    copies = random.choice(instances_count, instances_count // 10, replace=False)
+    sources = random.integers(0, instances_count, len(copies))
+    model_indices[copies] = model_indices[sources]
+    rotations[copies] = rotations[sources]
+    positions[copies] = positions[sources] + random.uniform(
+        -SPATIAL_DEDUP_EPSILON / 2, SPATIAL_DEDUP_EPSILON / 2, (len(copies), 3)
+    )
+    column = random.choice(instances_count, instances_count // 10, replace=False)
+    model_indices[column] = 0
+    positions[column, 0] = 0.0
+    stack = random.choice(instances_count, instances_count // 100, replace=False)
+    model_indices[stack] = 1
+    positions[stack] = 0.0
+    rotations[stack] = 0.0
+
+    return InstanceTable(
+        20000 + model_indices,
+        [f"synth_obj{index:06d}" for index in range(models_count)],
+        model_indices,
+        np.zeros(instances_count, dtype=np.int32),
+        positions,
+        rotations,
+        np.full(instances_count, -1, dtype=np.int32)
+    )
+
+def time_dedup(instances_count: int, policy: str, repeats: int):
+    table = get_synthetic_table(instances_count)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        deduplicated = table.deduplicate(policy)
+        times.append(time.perf_counter() - start)
+
+    # The stacked placements are one placement under every policy but none
+    if policy != "none" and len(deduplicated) > instances_count - instances_count // 100 + 1:
+        raise Exception("Dedup kept stacked duplicates")
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that instance dedup scales linearly")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--policy", choices=DEDUP_POLICIES, default="spatial")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-growth", type=float, default=MAX_GROWTH)
+    args = parser.parse_args()
+
+    per_instance = []
+    for instances_count in sorted(args.scales):
+        seconds = time_dedup(instances_count, args.policy, args.repeats)
+        per_instance.append(seconds / instances_count)
+        print(f"{instances_count:>9}: {seconds:8.3f} s, {seconds / instances_count * 1e9:8.1f} ns/instance")
+
+    growth = per_instance[-1] / per_instance[0]
+    print(f"growth of time per instance: {growth:.2f}x (limit {args.max_growth:.2f}x)")
+    if growth > args.max_growth:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
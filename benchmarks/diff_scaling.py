@@ -0,0 +1,82 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from differences.differences import get_intentions_diffs
+from parsing.intention.create_object_type import CreateObjectType
+from parsing.intention.instance_table import InstanceTable, NO_LOD
+
+DEFAULT_SCALES = (10000, 100000, 1000000)
+
+# Time per instance may grow by this factor from the smallest to the largest
+# scale, a quadratic engine grows by the ratio of the scales instead
+MAX_GROWTH = 3.0
+
+def get_synthetic_intentions(instances_count: int, seed: int = 0):
+    random = np.random.default_rng(seed)
+    objects_count = min(20000, max(100, instances_count // 50))
+    object_ids = np.arange(20000, 20000 + objects_count, dtype=np.int32)
+    models = [f"synth_obj{index:06d}" for index in range(objects_count)]
+
+    model_indices = random.integers(0, objects_count, instances_count, dtype=np.int32)
+    LOD_ids = np.where(
+        random.random(instances_count) < 0.1,
+        random.integers(0, instances_count, instances_count),
+        NO_LOD
+    )
+    table = InstanceTable(
+        object_ids[model_indices],
+        models,
+        model_indices,
+        np.zeros(instances_count, dtype=np.int32),
+        random.uniform(-3000, 3000, (instances_count, 3)),
+        random.uniform(-180, 180, (instances_count, 3)),
+        LOD_ids
+    )
+
+    # A tenth of the IDE is never placed and some placed models have no IDE row
+    ide_intentions = {
+        CreateObjectType(object_id, model, None, "synth_txd", 300.0, 0, None, None)
+        for object_id, model in zip(object_ids.tolist(), models)
+        if object_id % 10 != 3
+    }
+    ide_intentions.update(
+        CreateObjectType(object_id, f"synth_unplaced{object_id}", None, "synth_txd", 300.0, 0, None, None)
+        for object_id in range(objects_count // 10)
+    )
+    return table, ide_intentions
+
+def time_diffs(instances_count: int, repeats: int):
+    table, ide_intentions = get_synthetic_intentions(instances_count)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        diffs = get_intentions_diffs(table, ide_intentions)
+        times.append(time.perf_counter() - start)
+
+    if len(diffs.ipl_in_both) + len(diffs.only_in_ipl) < instances_count:
+        raise Exception("Diff engine lost instances")
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the intention diff engine scales linearly")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-growth", type=float, default=MAX_GROWTH)
+    args = parser.parse_args()
+
+    per_instance = []
+    for instances_count in sorted(args.scales):
+        seconds = time_diffs(instances_count, args.repeats)
+        per_instance.append(seconds / instances_count)
+        print(f"{instances_count:>9}: {seconds:8.3f} s, {seconds / instances_count * 1e9:8.1f} ns/instance")
+
+    growth = per_instance[-1] / per_instance[0]
+    print(f"growth of time per instance: {growth:.2f}x (limit {args.max_growth:.2f}x)")
+    if growth > args.max_growth:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+from typing import Iterable
+import argparse
+import json
+import os
+import pathlib
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPOSITORY_PATH = pathlib.Path(__file__).resolve().parent.parent
+
+DEFAULT_SCALES = (10000, 100000, 1000000)
+
+# cold: empty output, cache and manifest; noop: the same tree right after a cold run
+RUNS = ("cold", "noop")
+
+def get_peak_rss():
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "main": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+        "workers": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit
+    }
+
+def get_stage_times(messages: list[tuple[float, str]], end: float):
+    # Every stage of main.main starts with a send_message, so a stage lasts
+    # until the next message
+    stages: dict[str, float] = dict()
+    for (start, text), (next_start, _) in zip(messages, [*messages[1:], (end, "")]):
+        if text.startswith("diffs:"):
+            continue
+        stages[text] = stages.get(text, 0.0) + next_start - start
+    return stages
+
+def run_single(root: pathlib.Path, instances_count: int, run: str):
+    sys.path.insert(0, str(REPOSITORY_PATH))
+    os.chdir(root)
+    import main
+
+    messages: list[tuple[float, str]] = []
+    send_message = main.send_message
+
+    def record_message(text: str, to_print = True, to_log = True):
+        # Log-only messages are reports, not stage boundaries
+        if to_print:
+            messages.append((time.perf_counter(), text))
+        send_message(text, to_print = False, to_log = to_log)
+
+    main.send_message = record_message
+
+    start = time.perf_counter()
+    main.main()
+    end = time.perf_counter()
+
+    wall_time = end - start
+    return {
+        "instances": instances_count,
+        "run": run,
+        "wall_time": wall_time,
+        "instances_per_second": instances_count / wall_time if wall_time > 0 else None,
+        "stages": get_stage_times(messages, end),
+        "profile": main.get_profile().get_report(),
+        "peak_rss": get_peak_rss()
+    }
+
+def clean_outputs(root: pathlib.Path):
+    for path in ("cache", "log.txt", "output/build_manifest.json"):
+        path = root.joinpath(path)
+        if path.is_dir():
+            shutil.rmtree(path)
+        elif path.exists():
+            path.unlink()
+    for path in root.joinpath("output/Content").rglob("*"):
+        if path.is_file():
+            path.unlink()
+
+def run_scale(root: pathlib.Path, instances_count: int, runs: Iterable[str]):
+    from .synthetic_map import SyntheticMapScale, write_synthetic_map
+
+    write_synthetic_map(root, SyntheticMapScale(instances_count))
+
+    results = []
+    for run in runs:
+        if run == "cold":
+            clean_outputs(root)
+
+        # Every run is a fresh process, so peak RSS belongs to that run only
+        process = subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.run",
+                "--single", str(root),
+                "--scales", str(instances_count),
+                "--runs", run
+            ],
+            cwd = REPOSITORY_PATH,
+            capture_output = True,
+            text = True
+        )
+        if process.returncode != 0:
+            raise Exception(f"Benchmark run failed:\n{process.stderr}")
+        results.append(json.loads(process.stdout.splitlines()[-1]))
+    return results
+
+def print_results(results: list[dict]):
+    for result in results:
+        peak_rss = result["peak_rss"]
+        peak = "?" if peak_rss is None else f"{max(peak_rss.values()) / (1 << 20):.0f} MB"
+        print(
+            f"{result['instances']:>9} {result['run']:>5}: "
+            f"{result['wall_time']:8.2f} s, {result['instances_per_second'] or 0:12.0f} inst/s, "
+            f"peak {peak}"
+        )
+        for stage, seconds in result["stages"].items():
+            print(f"{'':>17}{seconds:8.2f} s  {stage}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every stage of main.main on synthetic maps")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--runs", nargs="+", choices=RUNS, default=RUNS)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--work-dir", default=None)
+    parser.add_argument("--single", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single is not None:
+        print(json.dumps(run_single(pathlib.Path(args.single), args.scales[0], args.runs[0])))
+        return
+
+    work_dir = tempfile.mkdtemp(prefix="mta-stream-bench-", dir=args.work_dir)
+    try:
+        results = []
+        for instances_count in args.scales:
+            root = pathlib.Path(work_dir).joinpath(f"scale_{instances_count}")
+            results.extend(run_scale(root, instances_count, args.runs))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print_results(results)
+    with open(args.output, "w") as file:
+        json.dump({
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "results": results
+        }, file, indent=4)
+
+if __name__ == '__main__':
+    main()
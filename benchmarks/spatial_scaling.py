@@ -0,0 +1,64 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from parsing.intention.spatial_grid import SpatialGrid, DEFAULT_CELL_SIZE
+
+DEFAULT_SCALES = (10000, 100000, 1000000)
+
+# Build time per instance may grow by this factor from the smallest to the
+# largest scale, an n log n build stays well below it
+MAX_GROWTH = 3.0
+
+def time_grid(instances_count: int, cell_size: float, repeats: int):
+    random = np.random.default_rng(0)
+    positions = random.uniform((-3000, -3000, 0), (3000, 3000, 300), (instances_count, 3))
+
+    build_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        grid = SpatialGrid(positions, cell_size)
+        build_times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    inside = grid.query_bbox(-500, -500, 500, 500)
+    near = grid.query_radius(1000, 1000, 300)
+    nearest = grid.query_nearest(2000, -2000, 16)
+    query_time = time.perf_counter() - start
+
+    points = positions[:, :2]
+    expected = np.flatnonzero((np.abs(points) <= 500).all(axis=1))
+    if not np.array_equal(inside, expected):
+        raise Exception("Bounding box query lost instances")
+    if not np.array_equal(near, np.flatnonzero(np.hypot(*(points - (1000, 1000)).T) <= 300)):
+        raise Exception("Radius query lost instances")
+    if not np.array_equal(nearest, np.argsort(np.hypot(*(points - (2000, -2000)).T), kind="stable")[:16]):
+        raise Exception("Nearest query returned wrong instances")
+    return min(build_times), query_time
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the spatial grid builds in n log n")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--cell-size", type=float, default=DEFAULT_CELL_SIZE)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-growth", type=float, default=MAX_GROWTH)
+    args = parser.parse_args()
+
+    per_instance = []
+    for instances_count in sorted(args.scales):
+        build_time, query_time = time_grid(instances_count, args.cell_size, args.repeats)
+        per_instance.append(build_time / instances_count)
+        print(
+            f"{instances_count:>9}: build {build_time:8.3f} s, {build_time / instances_count * 1e9:8.1f} ns/instance, "
+            f"queries {query_time * 1e3:8.2f} ms"
+        )
+
+    growth = per_instance[-1] / per_instance[0]
+    print(f"growth of build time per instance: {growth:.2f}x (limit {args.max_growth:.2f}x)")
+    if growth > args.max_growth:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+from typing import Union
+import argparse
+import pathlib
+
+import numpy as np
+
+OUTPUT_DIRS = (
+    "output/Settings",
+    "output/Content/models",
+    "output/Content/textures",
+    "output/Content/coll"
+)
+
+class SyntheticMapScale:
+    def __init__(
+        self,
+        instances_count: int,
+        ipls_count: Union[int, None] = None,
+        objects_count: Union[int, None] = None,
+        ides_count: Union[int, None] = None,
+        water_rows_count: int = 400,
+        asset_size: int = 256,
+        lod_share: float = 0.1,
+        seed: int = 0
+    ):
+        self.instances_count = instances_count
+        self.objects_count = objects_count if objects_count is not None else (
+            min(20000, max(100, instances_count // 50))
+        )
+        self.ipls_count = ipls_count if ipls_count is not None else max(1, instances_count // 20000)
+        self.ides_count = ides_count if ides_count is not None else max(1, self.objects_count // 5000)
+        self.water_rows_count = water_rows_count
+        self.asset_size = asset_size
+        self.lod_share = lod_share
+        self.seed = seed
+
+def get_model_name(index: int):
+    return f"synth_obj{index:06d}"
+
+def get_texture_name(index: int):
+    return f"synth_txd{index // 4:06d}"
+
+def get_ide_text(object_ids: list[int], object_indices: np.ndarray, random: np.random.Generator):
+    draw_distances = random.integers(50, 300, len(object_indices)).tolist()
+    flags = random.choice((0, 0, 0, 4, 8, 2097152), len(object_indices)).tolist()
+    rows = (
+        f"{object_ids[index]}, {get_model_name(index)}, {get_texture_name(index)}, {draw_distance}, {flag}"
+        for index, draw_distance, flag in zip(object_indices.tolist(), draw_distances, flags)
+    )
+    return "objs\n" + "\n".join(rows) + "\nend\n"
+
+def get_ipl_text(object_ids: list[int], count: int, lod_share: float, random: np.random.Generator):
+    object_indices = random.integers(0, len(object_ids), count)
+    positions = random.uniform((-3000, -3000, 0), (3000, 3000, 300), (count, 3))
+    quaternions = random.normal(size=(count, 4))
+    quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+    LOD_ids = np.where(
+        random.random(count) < lod_share,
+        random.integers(0, count, count),
+        -1
+    )
+
+    rows = (
+        f"{object_ids[index]}, {get_model_name(index)}, 0, "
+        f"{x:.4f}, {y:.4f}, {z:.4f}, {qx:.6f}, {qy:.6f}, {qz:.6f}, {qw:.6f}, {LOD_id}"
+        for index, (x, y, z), (qx, qy, qz, qw), LOD_id in zip(
+            object_indices.tolist(),
+            positions.tolist(),
+            quaternions.tolist(),
+            LOD_ids.tolist()
+        )
+    )
+    return "# synthetic\ninst\n" + "\n".join(rows) + "\nend\ncull\nend\n"
+
+def get_water_text(count: int):
+    # A grid of adjacent 20x20 quads at the same height, like the SA sea
+    rows = []
+    for index in range(count):
+        x = -2000 + (index % 100) * 20
+        y = -2000 + (index // 100) * 20
+        rows.append(" ".join(map(str, (
+            x, y, 0, 0, 0, 0, 0,
+            x + 20, y, 0, 0, 0, 0, 0,
+            x, y + 20, 0, 0, 0, 0, 0,
+            x + 20, y + 20, 0, 0, 0, 0, 0,
+            1
+        ))))
+    return "processed\n" + "\n".join(rows) + "\n"
+
+def write_synthetic_map(root: Union[str, pathlib.Path], scale: SyntheticMapScale):
+    root = pathlib.Path(root)
+    random = np.random.default_rng(scale.seed)
+
+    maps_path = root.joinpath("input/data/maps/synthetic")
+    models_path = root.joinpath("input/models")
+    maps_path.mkdir(parents=True, exist_ok=True)
+    models_path.mkdir(parents=True, exist_ok=True)
+    for output_dir in OUTPUT_DIRS:
+        root.joinpath(output_dir).mkdir(parents=True, exist_ok=True)
+
+    object_ids = list(range(20000, 20000 + scale.objects_count))
+    gta_rows = ["# synthetic map"]
+
+    for index, object_indices in enumerate(np.array_split(np.arange(scale.objects_count), scale.ides_count)):
+        name = f"synth{index:03d}.ide"
+        maps_path.joinpath(name).write_text(get_ide_text(object_ids, object_indices, random))
+        gta_rows.append(f"IDE data\\maps\\synthetic\\{name}")
+
+    for index, rows in enumerate(np.array_split(np.arange(scale.instances_count), scale.ipls_count)):
+        name = f"synth{index:03d}.ipl"
+        maps_path.joinpath(name).write_text(get_ipl_text(object_ids, len(rows), scale.lod_share, random))
+        gta_rows.append(f"IPL data\\maps\\synthetic\\{name}")
+
+    root.joinpath("input/data/gta.dat").write_text("\n".join(gta_rows) + "\n")
+    root.joinpath("input/data/water.dat").write_text(get_water_text(scale.water_rows_count))
+
+    asset = bytes(random.integers(0, 256, scale.asset_size, dtype=np.uint8))
+    for index in range(scale.objects_count):
+        models_path.joinpath(f"{get_model_name(index)}.dff").write_bytes(asset)
+        models_path.joinpath(f"{get_model_name(index)}.col").write_bytes(asset)
+        if index % 4 == 0:
+            models_path.joinpath(f"{get_texture_name(index)}.txd").write_bytes(asset)
+
+    # Loose files that no IDE asks for, they end up in the diff report
+    for index in range(max(1, scale.objects_count // 100)):
+        models_path.joinpath(f"synth_unused{index:04d}.dff").write_bytes(asset)
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic input/ tree for benchmarks")
+    parser.add_argument("root")
+    parser.add_argument("--instances", type=int, default=100000)
+    parser.add_argument("--ipls", type=int, default=None)
+    parser.add_argument("--objects", type=int, default=None)
+    parser.add_argument("--ides", type=int, default=None)
+    parser.add_argument("--water-rows", type=int, default=400)
+    parser.add_argument("--asset-size", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    write_synthetic_map(args.root, SyntheticMapScale(
+        args.instances,
+        args.ipls,
+        args.objects,
+        args.ides,
+        args.water_rows,
+        args.asset_size,
+        seed=args.seed
+    ))
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,12 @@
-from typing import Iterable
+from typing import Iterable, Union
 import pathlib
-from itertools import chain
+
+import numpy as np
 
 from parsing.intention.create_object import CreateObject
 from parsing.intention.create_object_type import CreateObjectType
+from parsing.intention.instance_table import InstanceTable, get_instance_table
+from parsing.intention.name_table import NameTable
 
 from .dto import DataImportDifferences, Differences, IntentionsDifferences, ModelsImportDifferences, RequiredIntentionsAndFiles
 
@@ -22,90 +25,95 @@ def get_data_import_diffs(
     return diffs
 
 def get_intentions_diffs(
-    ipl_intentions: Iterable[CreateObject],
+    ipl_intentions: Union[InstanceTable, Iterable[CreateObject]],
     ide_intentions: Iterable[CreateObjectType],
+    names: Union[NameTable, None] = None
 ):
-    ipl_intentions = set(ipl_intentions)
+    ipl_table = get_instance_table(ipl_intentions)
     ide_intentions = set(ide_intentions)
-
-    lods = {x.LOD_id: x for x in ipl_intentions}
-
-    only_in_ipl: dict[str, set[CreateObject]] = dict()
-    for x in ipl_intentions:
-        model = x.object_model
-        if model not in only_in_ipl:
-            only_in_ipl[model] = set()
-        only_in_ipl[model].add(x)
-        
-    only_in_ide = {x.object_model: x for x in ide_intentions}
-    ipl_in_both = set()
+    if names is None:
+        names = NameTable()
+
+    # Models are joined on the ids of their case-folded names. name id ->
+    # instances is a mask over the table, so every IDE row costs O(1) and the
+    # table is walked a constant number of times. LOD ids index inst rows and
+    # not IDE objects, a LOD instance is matched by its own model
+    has_model = ipl_table.model_indices >= 0
+    instance_name_ids = ipl_table.get_model_name_ids(names)[has_model]
+    ide_name_ids = names.intern_all(x.object_model for x in ide_intentions)
+
+    placed_names = np.zeros(len(names), dtype=bool)
+    placed_names[instance_name_ids] = True
+    matched_names = np.zeros(len(names), dtype=bool)
+    only_in_ide = dict()
     ide_in_both = set()
 
-    for intention in (x for x in ide_intentions):
-        model = intention.object_model
-        object_id = intention.object_id
-        if model in only_in_ipl:
-            ipl_in_both = ipl_in_both | only_in_ipl[model]
-            ide_in_both.add(intention)
-            del only_in_ipl[model]
-        elif object_id in lods:
-            ipl_in_both.add(lods[object_id])
+    for intention, name_id in zip(ide_intentions, ide_name_ids):
+        if placed_names[name_id] and not matched_names[name_id]:
+            matched_names[name_id] = True
             ide_in_both.add(intention)
         else:
-            only_in_ide[model] = intention
+            only_in_ide[name_id] = intention
+
+    in_matched_model = np.zeros(len(ipl_table), dtype=bool)
+    in_matched_model[has_model] = matched_names[instance_name_ids]
 
     diffs = IntentionsDifferences(
-        set(chain(*only_in_ipl.values())),
+        ipl_table.take(np.flatnonzero(~in_matched_model)),
         set(only_in_ide.values()),
-        ipl_in_both,
+        ipl_table.take(np.flatnonzero(in_matched_model)),
         ide_in_both
     )
     return diffs
 
 def get_models_import_diffs(
     required_ide_intentions: Iterable[CreateObjectType],
-    import_paths: Iterable[pathlib.Path]
+    import_paths: Iterable[pathlib.Path],
+    names: Union[NameTable, None] = None
 ):
     required_ide_intentions = set(required_ide_intentions)
     import_paths = set(import_paths)
+    if names is None:
+        names = NameTable()
 
     # Object requires txd, dff and col files
 
-    only_in_dffs = {x.object_model.lower() for x in required_ide_intentions}
-    only_in_txds = {x.texture.lower() for x in required_ide_intentions}
-    only_in_cols = {x.object_model.lower() for x in required_ide_intentions}
+    only_in_dffs = set(names.intern_all(x.object_model for x in required_ide_intentions))
+    only_in_txds = set(names.intern_all(x.texture for x in required_ide_intentions))
+    only_in_cols = set(only_in_dffs)
     only_in_files = set()
     in_all: set[tuple[str, pathlib.Path]] = set()
 
     for file in import_paths:
-        name = file.stem.lower()
+        name_id = names.intern(file.stem)
         suffix = file.suffix[1:].lower()
 
-        if suffix == "dff" and name in only_in_dffs:
-            in_all.add((name, file))
-            only_in_dffs.remove(name)
-        elif suffix == "col" and name in only_in_cols:
-            in_all.add((name, file))
-            only_in_cols.remove(name)
-        elif suffix == "txd" and name in only_in_txds:
-            in_all.add((name, file))
-            only_in_txds.remove(name)
+        if suffix == "dff" and name_id in only_in_dffs:
+            in_all.add((names[name_id], file))
+            only_in_dffs.remove(name_id)
+        elif suffix == "col" and name_id in only_in_cols:
+            in_all.add((names[name_id], file))
+            only_in_cols.remove(name_id)
+        elif suffix == "txd" and name_id in only_in_txds:
+            in_all.add((names[name_id], file))
+            only_in_txds.remove(name_id)
         else:
             only_in_files.add(file)
 
     diffs = ModelsImportDifferences(
-        only_in_dffs,
-        only_in_txds,
-        only_in_cols,
+        {names[x] for x in only_in_dffs},
+        {names[x] for x in only_in_txds},
+        {names[x] for x in only_in_cols},
         only_in_files,
-        in_all
+        in_all,
+        names
     )
     return diffs
 
 def get_diffs(
     dat_paths: Iterable[pathlib.Path],
     gta_paths: Iterable[pathlib.Path],
-    ipl_intentions: Iterable[CreateObject],
+    ipl_intentions: Union[InstanceTable, Iterable[CreateObject]],
     ide_intentions: Iterable[CreateObjectType],
     import_paths: Iterable[pathlib.Path]
 ):
@@ -114,14 +122,17 @@ def get_diffs(
         gta_paths
     )
 
+    names = NameTable()
     intentions_diffs = get_intentions_diffs(
         ipl_intentions,
-        ide_intentions
+        ide_intentions,
+        names
     )
 
     models_import_diffs = get_models_import_diffs(
         intentions_diffs.ide_in_both,
-        import_paths
+        import_paths,
+        names
     )
 
     diffs = Differences(
@@ -134,37 +145,40 @@ def get_diffs(
 def get_required_by_diffs(
     diffs: Differences
 ):
-    required_ipls = set(diffs.intentions_diffs.ipl_in_both)
+    required_ipls = diffs.intentions_diffs.ipl_in_both
     required_ides = set()
+    names = diffs.models_import_diffs.names
+    if names is None:
+        names = NameTable()
 
-    files_by_suffix: dict[str, dict[str, pathlib.Path]] = dict()
+    files_by_suffix: dict[str, dict[int, pathlib.Path]] = dict()
     transform_files: set[tuple[pathlib.Path, str]] = set()
 
     for name, file in diffs.models_import_diffs.in_all:
         suffix = file.suffix[1:].lower()
         if suffix not in files_by_suffix:
             files_by_suffix[suffix] = dict()
-        files_by_suffix[suffix][name] = file
+        files_by_suffix[suffix][names.intern(name)] = file
 
     for intention in diffs.intentions_diffs.ide_in_both:
-        line_dff = intention.object_model
-        line_txd = intention.texture
-        line_col = intention.object_col
+        dff_id = names.intern(intention.object_model)
+        txd_id = names.intern(intention.texture)
+        col_id = names.intern(intention.object_col)
 
-        uni_dff = line_dff.lower()
-        uni_txd = line_txd.lower()
-        uni_col = line_col.lower()
+        uni_dff = names[dff_id]
+        uni_txd = names[txd_id]
+        uni_col = names[col_id]
 
-        if uni_dff in files_by_suffix["dff"]:
-            file_dff = files_by_suffix["dff"][uni_dff]
+        if dff_id in files_by_suffix["dff"]:
+            file_dff = files_by_suffix["dff"][dff_id]
             transform_files.add((file_dff, uni_dff))
 
-        if uni_txd in files_by_suffix["txd"]:
-            file_txd = files_by_suffix["txd"][uni_txd]
+        if txd_id in files_by_suffix["txd"]:
+            file_txd = files_by_suffix["txd"][txd_id]
             transform_files.add((file_txd, uni_txd))
 
-        if uni_col in files_by_suffix["col"]:
-            file_col = files_by_suffix["col"][uni_col]
+        if col_id in files_by_suffix["col"]:
+            file_col = files_by_suffix["col"][col_id]
             transform_files.add((file_col, uni_col))
         else:
             uni_col = None
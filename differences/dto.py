@@ -1,6 +1,8 @@
-from parsing.intention.create_object import CreateObject
 from parsing.intention.create_object_type import CreateObjectType
+from parsing.intention.instance_table import InstanceTable
+from parsing.intention.name_table import NameTable
 
+from typing import Union
 import pathlib
 
 class DataImportDifferences:
@@ -17,9 +19,9 @@ class DataImportDifferences:
 class IntentionsDifferences:
     def __init__(
         self,
-        only_in_ipl: set[CreateObjectType],
-        only_in_ide: set[CreateObject],
-        ipl_in_both: set[CreateObject],
+        only_in_ipl: InstanceTable,
+        only_in_ide: set[CreateObjectType],
+        ipl_in_both: InstanceTable,
         ide_in_both: set[CreateObjectType]
     ):
         self.only_in_ipl = only_in_ipl
@@ -34,18 +36,20 @@ class ModelsImportDifferences:
         only_in_txds: set[str],
         only_id_cols: set[str],
         only_in_files: set[pathlib.Path],
-        in_all: set[tuple[str, pathlib.Path]]
+        in_all: set[tuple[str, pathlib.Path]],
+        names: Union[NameTable, None] = None
     ):
         self.only_in_dffs = only_in_dffs
         self.only_in_txds = only_in_txds
         self.only_in_cols = only_id_cols
         self.only_in_files = only_in_files
         self.in_all = in_all
+        self.names = names
 
 class RequiredIntentionsAndFiles:
     def __init__(
         self,
-        required_ipl_intentions: set[CreateObject],
+        required_ipl_intentions: InstanceTable,
         required_ide_intentions: set[CreateObjectType],
         required_files: set[pathlib.Path]
     ):
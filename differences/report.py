@@ -0,0 +1,51 @@
+from .dto import Differences
+
+DIFFERENCE_MESSAGES = {
+    "missing_path": "Path {path} does not exist",
+    "unnecessary_path": "Path {path} is not necessary",
+    "missing_ide_model": "Model {model} does not exist in IDEs",
+    "unused_ide_model": "Model {model} is not necessary in IDEs",
+    "missing_dff": "DFF {model} does not exist in files",
+    "missing_txd": "TXD {texture} does not exist in files",
+    "unused_file": "File {path} is not necessary",
+    "orphan_stream_ipl": "Stream IPL {path} has no parent IPL in gta.dat, its LODs are not resolved",
+    "unmoved_object_id": "Model {model} keeps object id {object_id}, no free object ids are left"
+}
+
+def get_difference_records(diffs: Differences):
+    for path in diffs.data_import_diffs.only_in_dat:
+        yield {"kind": "missing_path", "path": str(path)}
+
+    for path in diffs.data_import_diffs.only_in_gta:
+        yield {"kind": "unnecessary_path", "path": str(path)}
+
+    only_in_ipl = diffs.intentions_diffs.only_in_ipl
+    models = only_in_ipl.models
+    for object_id, model_index, interior, position in zip(
+        only_in_ipl.object_ids.tolist(),
+        only_in_ipl.model_indices.tolist(),
+        only_in_ipl.interiors.tolist(),
+        only_in_ipl.positions.tolist()
+    ):
+        yield {
+            "kind": "missing_ide_model",
+            "model": models[model_index],
+            "object_id": object_id,
+            "interior": interior,
+            "position": position
+        }
+
+    for intention in diffs.intentions_diffs.only_in_ide:
+        yield {"kind": "unused_ide_model", "model": intention.object_model, "object_id": intention.object_id}
+
+    for model in diffs.models_import_diffs.only_in_dffs:
+        yield {"kind": "missing_dff", "model": model}
+
+    for texture in diffs.models_import_diffs.only_in_txds:
+        yield {"kind": "missing_txd", "texture": texture}
+
+    for file in diffs.models_import_diffs.only_in_files:
+        yield {"kind": "unused_file", "path": str(file)}
+
+def get_difference_message(record: dict):
+    return "diffs: " + DIFFERENCE_MESSAGES[record["kind"]].format(**record)
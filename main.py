@@ -1,25 +1,49 @@
 from typing import Iterable, Union
 from itertools import chain, groupby
 import pathlib
-import shutil
-import multiprocessing
+import mmap
+from functools import partial
 
 from parsing.ide import CreateObjectType
-from parsing.ipl import CreateObject
+from parsing.ipl import CreateObject, InstanceTable
 
 from parsing.gta import get_gta_cleaned_rows
 from parsing.gta import get_gta_intentions
-from parsing.water_dat import get_water_intentions, get_water_cleaned_rows
+from parsing.water_dat import get_water_table, get_water_cleaned_rows
 from parsing.water_lua import get_water_lua
-from parsing.ipl import get_ipl_intentions
-from parsing.ide import get_ide_intentions
-
-from parsing.jsd import get_jsd
-from parsing.jsp import get_jsp
+from parsing.ipl import scan_ipl, get_scanned_ipl_table, get_ipl_inst_section_table
+from parsing.ipl import PARALLEL_PARSE_MIN_SIZE, get_ipl_chunk_size, get_ipl_inst_chunks
+from parsing.ipl_binary import BINARY_IPL_MAGIC, get_binary_ipl_table
+from parsing.ipl_binary import get_stream_ipl_paths_by_parent, join_stream_ipl_tables
+from parsing.intention.instance_table import DEDUP_POLICIES, SPATIAL_DEDUP_EPSILON, concat_instance_tables, get_instance_table
+from parsing.intention.lod_graph import get_lod_object_ids
+from parsing.intention.name_table import NameTable
+from parsing.intention.id_allocator import IdAllocator, get_id_mapping, get_id_mapping_rows
+from parsing.intention.id_allocator import get_remapped_object_types, get_remapped_instance_table
+from parsing.rows_writer import write_rows
+from parsing.img import ImgEntry, get_img_archive, get_img_entry_data
+from parsing.ide import scan_ide, get_scanned_ide_intentions
+
+from parsing.jsd import write_jsd
+from parsing.jsp import write_jsp, write_jsp_shards, JSP_SHARDS_DIR, DEFAULT_SHARD_CELL_SIZE
 
 from parsing.meta import get_meta
 
-from differences.differences import get_diffs, get_required_by_diffs, Differences
+from differences.differences import get_required_by_diffs, Differences
+from differences.differences import get_data_import_diffs, get_intentions_diffs, get_models_import_diffs
+from differences.report import get_difference_records, get_difference_message
+
+from pipeline.manifest import BuildManifest, load_build_manifest, encode_source, decode_source, get_source_stat
+from pipeline.cache import ParseCache
+from pipeline.columns import encode_intentions, decode_instance_table, decode_object_types
+from pipeline.columns import concat_columns, pack_columns, unpack_columns
+from pipeline.columns import encode_intentions_diffs, decode_intentions_diffs
+from pipeline.executor import PipelineExecutor
+from pipeline.materialize import MATERIALIZE_MODES, materialize_file
+from pipeline.diagnostics import DiagnosticsSink
+from pipeline.profile import get_profile, stage, count, worker_profile, merge_worker_report
+
+from available_ids import get_available_ids
 
 def get_paths_from_gta_dat(input):
     for row in get_gta_cleaned_rows(input):
@@ -29,37 +53,129 @@ def get_paths_from_gta_dat(input):
             raise Exception("Unknown format of file")
         yield pathlib.Path("input/" + row[1].replace("\\", "/"))
 
+def get_img_paths_from_gta_dat(input):
+    for row in get_gta_cleaned_rows(input):
+        if row[0] == "IMG":
+            yield pathlib.Path("input/" + row[1].replace("\\", "/"))
+
+def get_img_entries(paths: Iterable[pathlib.Path]):
+    for path in paths:
+        yield from get_img_archive(path).get_entries()
+
 def get_all_files(base_path):
     for path in pathlib.Path(base_path).rglob("*"):
         if not path.is_file():
             continue
         yield path
 
-def get_intentions_from_file(path: pathlib.Path):
+def get_intentions_from_file(
+    path: Union[pathlib.Path, ImgEntry],
+    cache: Union[ParseCache, None] = None
+):
+    if cache is not None:
+        return cache.get_intentions(path, parse_intentions_from_file)
+    return parse_intentions_from_file(path)
+
+def get_columns_from_file(
+    path: Union[pathlib.Path, ImgEntry],
+    cache: Union[ParseCache, None] = None
+):
+    if cache is not None:
+        return cache.get_columns(path, parse_intentions_from_file)
+    return encode_intentions(parse_intentions_from_file(path))
+
+def parse_intentions_from_file(path: Union[pathlib.Path, ImgEntry]):
     suffix = path.suffix[1:].lower()
     if suffix != "ide" and suffix != "ipl":
         raise Exception(f"Unknown format '{suffix}' of file '{path}'")
-    
-    with open(path, 'r') as file:
-        text = file.read()
+
+    # One buffer per file, the parsers work on bytes and decode only names
+    if isinstance(path, ImgEntry):
+        data = get_img_entry_data(path)
+    else:
+        with open(path, 'rb') as file:
+            data = file.read()
+
+    count("files read")
+    count("bytes read", len(data))
+
+    if suffix == "ipl" and data[:len(BINARY_IPL_MAGIC)] == BINARY_IPL_MAGIC:
+        with stage("parse binary IPL"):
+            intentions = get_binary_ipl_table(data)
+        count("rows parsed: bnry inst", len(intentions))
+        return intentions
 
     if suffix == "ide":
-        intentions = get_ide_intentions(text)
+        with stage("parse IDE"):
+            scan = scan_ide(data)
+            intentions = set(get_scanned_ide_intentions(scan))
     elif suffix == "ipl":
-        intentions = get_ipl_intentions(text)
-    intentions = set(intentions)
-    return intentions
+        with stage("parse IPL"):
+            scan = scan_ipl(data)
+            intentions = get_scanned_ipl_table(scan)
 
-def copy_file(data: tuple[str, str]):
-    shutil.copyfile(data[0], data[1])
+    for section, rows_count in scan.counts.items():
+        count(f"rows parsed: {section}", rows_count)
+    return intentions
 
-def copy_files_to_output(
-    transform_files: Iterable[tuple[pathlib.Path, str]]
+def parse_ipl_chunk(chunk: tuple[Union[pathlib.Path, ImgEntry], int, int]):
+    path, start, end = chunk
+    if isinstance(path, ImgEntry):
+        data = get_img_entry_data(path)[start:end]
+    else:
+        with open(path, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start)
+
+    count("bytes read", len(data))
+    with stage("parse IPL"):
+        table = get_ipl_inst_section_table(data)
+    count("rows parsed: inst", len(table))
+    return table
+
+def get_ipl_chunks(
+    path: Union[pathlib.Path, ImgEntry],
+    cache: Union[ParseCache, None],
+    workers_count: int
 ):
-    def get_pairs(file_transformation: tuple[pathlib.Path, str]):
+    # Only a large text IPL that is not cached yet is worth splitting
+    if workers_count < 2:
+        return None
+    size, _ = get_source_stat(path)
+    if size < PARALLEL_PARSE_MIN_SIZE:
+        return None
+    if cache is not None and cache.has(path):
+        return None
+
+    chunk_size = get_ipl_chunk_size(size, workers_count)
+    if isinstance(path, ImgEntry):
+        data = bytes(get_img_entry_data(path))
+        chunks = list(get_ipl_inst_chunks(data, chunk_size))
+    else:
+        with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(BINARY_IPL_MAGIC)] == BINARY_IPL_MAGIC:
+                return None
+            chunks = list(get_ipl_inst_chunks(data, chunk_size))
+
+    if len(chunks) < 2:
+        return None
+    count("files read")
+    count("IPL files split", 1)
+    count("IPL chunks", len(chunks))
+    return [(path, start, end) for start, end in chunks]
+
+def copy_file(data: tuple[Union[pathlib.Path, ImgEntry], str]):
+    materialize_file((data[0], data[1], None), "copy")
+
+def start_copy_files_to_output(
+    transform_files: Iterable[tuple[Union[pathlib.Path, ImgEntry], str]],
+    executor: PipelineExecutor,
+    manifest: Union[BuildManifest, None] = None
+):
+    def get_pairs(file_transformation: tuple[Union[pathlib.Path, ImgEntry], str]):
         return (file_transformation[0], get_output_path(file_transformation))
 
-    def get_output_path(file_transformation: tuple[pathlib.Path, str]):
+    def get_output_path(file_transformation: tuple[Union[pathlib.Path, ImgEntry], str]):
         main_dir_by_suffix = {
             "dff": "models",
             "txd": "textures",
@@ -69,12 +185,49 @@ def copy_files_to_output(
         main_dir = pathlib.Path("output/Content").joinpath(pathlib.Path(main_dir_by_suffix[suffix]))
         relative_path = main_dir.joinpath(pathlib.Path(f"{file_transformation[1]}.{suffix}")).as_posix()
 
-        return f"{str(relative_path).replace("\\", "/")}"
+        return relative_path
+
+    copy_iter = list(map(get_pairs, transform_files))
 
-    copy_iter = map(get_pairs, transform_files)
-    
-    with multiprocessing.Pool() as p:
-        p.map(copy_file, copy_iter)
+    global materialize_mode
+
+    if manifest is not None:
+        # A copy is byte-exact, so the output digest is the source digest
+        digests = {source: manifest.get_record(source).digest for source, _ in copy_iter}
+        copy_iter = [
+            x for x in copy_iter
+            if not manifest.is_output_intact(pathlib.Path(x[1]), digests[x[0]])
+        ]
+    else:
+        digests = dict()
+
+    count("files to copy", len(copy_iter))
+    copying = executor.map_async(
+        partial(materialize_file, mode = materialize_mode),
+        [(source, destination, digests.get(source)) for source, destination in copy_iter]
+    )
+
+    def wait():
+        for method, size in copying.get():
+            count(f"files copied: {method}")
+            count("bytes copied", size)
+        if manifest is not None:
+            for source, destination in copy_iter:
+                manifest.add_output(pathlib.Path(destination), digests[source], digests[source])
+
+    return wait
+
+def copy_files_to_output(
+    transform_files: Iterable[tuple[Union[pathlib.Path, ImgEntry], str]],
+    manifest: Union[BuildManifest, None] = None,
+    executor: Union[PipelineExecutor, None] = None
+):
+    if executor is not None:
+        start_copy_files_to_output(transform_files, executor, manifest)()
+        return
+
+    with PipelineExecutor() as executor:
+        start_copy_files_to_output(transform_files, executor, manifest)()
 
 def get_intensions_dict(gta_rows: Iterable[tuple[str]]):
     intentions_dict = {a: tuple(b) for a, b in groupby(
@@ -83,67 +236,354 @@ def get_intensions_dict(gta_rows: Iterable[tuple[str]]):
     )}
     return intentions_dict
 
-def get_lods(create_object_intentions: Iterable[CreateObject]):
-    lods = {
-        x[0]: x[1] for x in filter(
-            lambda x: x[1] is not None,
-            map(
-                lambda x: (x.object_id, x.LOD_id),
-                create_object_intentions
-            )
-        )
-    }
-    return lods
-
-def load_IPLs(paths: Iterable[pathlib.Path]):
-    with multiprocessing.Pool() as p:
-        ipl_intentions = set(chain(*p.map(
-            get_intentions_from_file,
-            paths
-        )))
-    return ipl_intentions
-
-def load_IDEs(paths: Iterable[pathlib.Path]):
-    with multiprocessing.Pool() as p:
-        ide_intentions = set(chain(*p.map(
-            get_intentions_from_file,
-            paths
-        )))
-    return ide_intentions
+def get_lods(create_object_intentions: Union[InstanceTable, Iterable[CreateObject]]):
+    return get_lod_object_ids(get_instance_table(create_object_intentions))
+
+def get_ipl_with_streams(
+    paths: tuple[pathlib.Path, tuple[pathlib.Path]],
+    cache: Union[ParseCache, None] = None
+):
+    return join_stream_ipl_tables(
+        get_intentions_from_file(paths[0], cache),
+        map(partial(get_intentions_from_file, cache=cache), paths[1])
+    )
+
+def get_ipl_jobs(
+    paths: Iterable[pathlib.Path],
+    stream_paths_by_parent: Union[dict[str, list[pathlib.Path]], None] = None
+):
+    if stream_paths_by_parent is None:
+        stream_paths_by_parent = dict()
+
+    return [
+        (path, tuple(stream_paths_by_parent.get(path.stem.lower(), ())))
+        for path in paths
+    ]
+
+def get_orphan_stream_ipl_paths(
+    paths: Iterable[pathlib.Path],
+    stream_paths_by_parent: Union[dict[str, list[pathlib.Path]], None] = None
+):
+    if stream_paths_by_parent is None:
+        return []
+
+    parent_names = {x.stem.lower() for x in paths}
+    return [
+        tuple(stream_paths)
+        for parent_name, stream_paths in sorted(stream_paths_by_parent.items())
+        if parent_name not in parent_names
+    ]
+
+def load_intentions_job(
+    job: tuple[int, str, Union[pathlib.Path, tuple[pathlib.Path, tuple[pathlib.Path]]]],
+    cache: Union[ParseCache, None] = None
+):
+    index, suffix, paths = job
+    with worker_profile() as profile:
+        if suffix == "ipl" and len(paths[1]) != 0:
+            columns = encode_intentions(get_ipl_with_streams(paths, cache))
+        elif suffix == "ipl":
+            columns = get_columns_from_file(paths[0], cache)
+        elif suffix == "ipl_chunk":
+            columns = encode_intentions(parse_ipl_chunk(paths))
+        else:
+            columns = get_columns_from_file(paths, cache)
+    # Results travel as packed column buffers, the parent builds objects once
+    return index, pack_columns(columns), profile.get_report()
+
+def load_IPLs_and_IDEs(
+    ipl_paths: Iterable[pathlib.Path],
+    ide_paths: Iterable[pathlib.Path],
+    stream_paths_by_parent: Union[dict[str, list[pathlib.Path]], None] = None,
+    cache: Union[ParseCache, None] = None,
+    executor: Union[PipelineExecutor, None] = None
+):
+    if executor is None:
+        with PipelineExecutor() as executor:
+            return load_IPLs_and_IDEs(ipl_paths, ide_paths, stream_paths_by_parent, cache, executor)
+
+    # A huge IPL is parsed by several workers, its chunks and then its streams
+    # follow each other in the job list, so they merge back in file order
+    jobs = []
+    chunked_jobs: list[tuple[pathlib.Path, range]] = []
+    # Jobs of every IPL with its streams, LOD ids are resolved inside them
+    ipl_files: list[range] = []
+    ipl_paths = tuple(ipl_paths)
+    for path, stream_paths in get_ipl_jobs(ipl_paths, stream_paths_by_parent):
+        chunks = get_ipl_chunks(path, cache, executor.get_workers_count())
+        if chunks is None:
+            ipl_files.append(range(len(jobs), len(jobs) + 1))
+            jobs.append(("ipl", (path, stream_paths)))
+            continue
+        ipl_files.append(range(len(jobs), len(jobs) + len(chunks) + len(stream_paths)))
+        chunked_jobs.append((path, range(len(jobs), len(jobs) + len(chunks))))
+        jobs.extend(("ipl_chunk", x) for x in chunks)
+        jobs.extend(("ipl", (x, ())) for x in stream_paths)
+
+    # Streams without a parent IPL in gta.dat are still placed, but their LOD
+    # ids index the rows of the missing parent and stay unresolved
+    orphan_files: list[range] = []
+    for stream_paths in get_orphan_stream_ipl_paths(ipl_paths, stream_paths_by_parent):
+        orphan_files.append(range(len(jobs), len(jobs) + len(stream_paths)))
+        jobs.extend(("ipl", (x, ())) for x in stream_paths)
+    jobs.extend(("ide", x) for x in ide_paths)
+
+    # Results arrive in completion order, but are merged in submission order
+    # so the output does not depend on worker timing
+    results = [None] * len(jobs)
+    for index, packed, report in executor.imap_unordered(
+        partial(load_intentions_job, cache=cache),
+        ((index, *job) for index, job in enumerate(jobs))
+    ):
+        results[index] = unpack_columns(packed)
+        merge_worker_report(report)
+
+    for index, (suffix, _) in enumerate(jobs):
+        if suffix != "ide":
+            results[index] = decode_instance_table(results[index])
+
+    if cache is not None:
+        for path, indices in chunked_jobs:
+            cache.put(path, concat_instance_tables(results[x] for x in indices))
+
+    with stage("resolve LODs"):
+        ipl_intentions = concat_instance_tables(chain(
+            (concat_instance_tables(results[x] for x in indices).resolve_lods() for indices in ipl_files),
+            (concat_instance_tables(results[x] for x in indices).without_lod_parents() for indices in orphan_files)
+        ))
+    ipl_instances_count = len(ipl_intentions)
+    with stage(f"deduplicate IPL instances ({dedup_policy})"):
+        ipl_intentions = ipl_intentions.deduplicate(dedup_policy, dedup_epsilon)
+    count(f"IPL instances deduplicated ({dedup_policy})", ipl_instances_count - len(ipl_intentions))
+
+    ide_columns = [x for (suffix, _), x in zip(jobs, results) if suffix == "ide"]
+    if len(ide_columns) != 0:
+        ide_columns = concat_columns(ide_columns)
+        ide_objects_count = len(ide_columns["object_ids"])
+        ide_intentions = decode_object_types(ide_columns)
+    else:
+        ide_objects_count = 0
+        ide_intentions = set()
+    count("IDE objects deduplicated", ide_objects_count - len(ide_intentions))
+    return ipl_intentions, ide_intentions
+
+def load_IPLs(
+    paths: Iterable[pathlib.Path],
+    stream_paths_by_parent: Union[dict[str, list[pathlib.Path]], None] = None,
+    cache: Union[ParseCache, None] = None,
+    executor: Union[PipelineExecutor, None] = None
+):
+    return load_IPLs_and_IDEs(paths, (), stream_paths_by_parent, cache, executor)[0]
+
+def load_IDEs(
+    paths: Iterable[pathlib.Path],
+    cache: Union[ParseCache, None] = None,
+    executor: Union[PipelineExecutor, None] = None
+):
+    return load_IPLs_and_IDEs((), paths, None, cache, executor)[1]
 
 use_log = True
 log_path = "log.txt"
+manifest_path = "output/build_manifest.json"
+use_cache = True
+cache_path = "cache"
+cache_max_size = 1 << 30
+workers_count = None
+materialize_mode = "auto"
+# none keeps every placement, exact drops identical rows, spatial drops
+# placements of the same model closer than dedup_epsilon
+dedup_policy = "exact"
+dedup_epsilon = SPATIAL_DEDUP_EPSILON
+# single writes gta3.JSP, sharded writes one JSP per world cell of
+# jsp_cell_size and an index of the cells
+jsp_output_mode = "single"
+jsp_cell_size = DEFAULT_SHARD_CELL_SIZE
+# Object ids are moved onto the free ids of available_ids, the mapping is
+# written to id_map_path as model,old id,new id rows
+remap_object_ids = True
+id_map_path = "output/id_map.txt"
+# Adjacent water quads of one type and height become one createWater call
+merge_water_quads = True
+profile_path = "profile.json"
+diff_report_path = "diffs.jsonl"
+diagnostics_background = False
+
+diagnostics: Union[DiagnosticsSink, None] = None
 
 def send_message(text: str, to_print = True, to_log = True):
-    global use_log, log_path
+    global use_log, log_path, diagnostics
 
     if use_log and to_log:
-        with open(log_path, "a") as file:
-            file.write(text+"\n")
+        if diagnostics is not None:
+            diagnostics.log(text)
+        else:
+            with open(log_path, "a") as file:
+                file.write(text+"\n")
     if to_print:
         print(text)
 
+def send_record(record: dict):
+    # Goes to the log and, while the map is built, to the JSONL report
+    global diagnostics
+
+    send_message(get_difference_message(record), to_print = False)
+    if diagnostics is not None:
+        diagnostics.record(record)
+
+def send_difference_records(diffs: Differences):
+    for record in get_difference_records(diffs):
+        send_record(record)
+
 def get_info_about_differences(diffs: Differences):
-    for path in diffs.data_import_diffs.only_in_dat:
-        yield f"diffs: Path {path} does not exist"
+    return map(get_difference_message, get_difference_records(diffs))
+
+def count_differences(diffs: Differences):
+    count("diffs: only in dat", len(diffs.data_import_diffs.only_in_dat))
+    count("diffs: only in gta", len(diffs.data_import_diffs.only_in_gta))
+    count("diffs: only in IPL", len(diffs.intentions_diffs.only_in_ipl))
+    count("diffs: only in IDE", len(diffs.intentions_diffs.only_in_ide))
+    count("diffs: IPL in both", len(diffs.intentions_diffs.ipl_in_both))
+    count("diffs: IDE in both", len(diffs.intentions_diffs.ide_in_both))
+    count("diffs: missing DFFs", len(diffs.models_import_diffs.only_in_dffs))
+    count("diffs: missing TXDs", len(diffs.models_import_diffs.only_in_txds))
+    count("diffs: missing COLs", len(diffs.models_import_diffs.only_in_cols))
+    count("diffs: unused files", len(diffs.models_import_diffs.only_in_files))
+    count("diffs: found files", len(diffs.models_import_diffs.in_all))
+
+def get_map_requirements(
+    grouped_gta_paths: dict[str, set[pathlib.Path]],
+    stream_paths_by_parent: dict[str, list[Union[pathlib.Path, ImgEntry]]],
+    gta_paths: set[pathlib.Path],
+    dat_paths: set[pathlib.Path],
+    import_paths: set[Union[pathlib.Path, ImgEntry]],
+    executor: PipelineExecutor,
+    intentions_key: Union[str, None] = None
+):
+    global use_cache, cache_path, cache_max_size
+
+    parse_cache = ParseCache(cache_path, cache_max_size) if use_cache else None
+    # One table of case-folded model, texture and file names for every join
+    names = NameTable()
+
+    ipl_paths = tuple(grouped_gta_paths.get("ipl", ()))
+    orphan_paths = get_orphan_stream_ipl_paths(ipl_paths, stream_paths_by_parent)
+    for path in chain.from_iterable(orphan_paths):
+        send_record({"kind": "orphan_stream_ipl", "path": str(path)})
+    count("orphan stream IPLs", sum(len(x) for x in orphan_paths))
+
+    # The intentions diffs are kept while no IPL or IDE changed, then only
+    # the diffs against data and model files are computed again
+    intentions_diffs = None
+    if parse_cache is not None and intentions_key is not None:
+        columns = parse_cache.load_columns(parse_cache.get_keyed_path(intentions_key))
+        if columns is not None and str(columns["kind"]) == "intentions_diffs":
+            send_message("IPLs and IDEs are unchanged")
+            intentions_diffs = decode_intentions_diffs(columns)
+            count("intentions diffs reused")
+
+    if intentions_diffs is None:
+        # ------ DFFs, TXDs, COLs
+        send_message("Loading IPLs and IDEs")
+        with stage("load IPLs and IDEs"):
+            ipl_intentions, ide_intentions = load_IPLs_and_IDEs(
+                ipl_paths,
+                grouped_gta_paths.get("ide", ()),
+                stream_paths_by_parent,
+                parse_cache,
+                executor
+            )
+            ipl_intentions = ipl_intentions.with_models(
+                {x.object_id: x.object_model for x in ide_intentions}
+            )
 
-    for path in diffs.data_import_diffs.only_in_gta:
-        yield f"diffs: Path {path} is not necessary"
+        with stage("intentions diffs"):
+            intentions_diffs = get_intentions_diffs(ipl_intentions, ide_intentions, names)
+        if parse_cache is not None and intentions_key is not None:
+            parse_cache.store_columns(
+                parse_cache.get_keyed_path(intentions_key),
+                encode_intentions_diffs(intentions_diffs)
+            )
 
-    for intention in diffs.intentions_diffs.only_in_ipl:
-        yield f"diffs: Model {intention.object_model} does not exist in IDEs"
+    if parse_cache is not None:
+        parse_cache.evict()
 
-    for intention in diffs.intentions_diffs.only_in_ide:
-        yield f"diffs: Model {intention.object_model} is not necessary in IDEs"
+    with stage("diffs"):
+        diffs = Differences(
+            get_data_import_diffs(dat_paths, gta_paths),
+            intentions_diffs,
+            get_models_import_diffs(intentions_diffs.ide_in_both, import_paths, names)
+        )
+    count_differences(diffs)
 
-    for model in diffs.models_import_diffs.only_in_dffs:
-        yield f"diffs: DFF {model} does not exist in files"
+    send_difference_records(diffs)
 
-    for texture in diffs.models_import_diffs.only_in_txds:
-        yield f"diffs: TXD {texture} does not exist in files"
+    return get_required_by_diffs(diffs)
 
-    for file in diffs.models_import_diffs.only_in_files:
-        yield f"diffs: File {file} is not necessary"
+def write_map_files(
+    required_ipl_intentions: InstanceTable,
+    required_ide_intentions: set[CreateObjectType],
+    transform_files: set[tuple[Union[pathlib.Path, ImgEntry], str]]
+):
+    outputs = []
+
+    # ------ object ids
+    global remap_object_ids, id_map_path
+    if remap_object_ids:
+        send_message("Remapping object ids")
+        with stage("remap object ids"):
+            mapping, unmoved = get_id_mapping(required_ide_intentions, IdAllocator(get_available_ids()))
+            with open(id_map_path, "wb") as file:
+                write_rows(file, get_id_mapping_rows(required_ide_intentions, mapping))
+            count("object ids remapped", sum(
+                mapping[x.object_model.lower()] != x.object_id for x in required_ide_intentions
+            ))
+            # Not enough free ids, these objects stay on their own id
+            for intention in unmoved:
+                send_record({"kind": "unmoved_object_id", "model": intention.object_model, "object_id": intention.object_id})
+            count("object ids not remapped", len(unmoved))
+            required_ide_intentions = get_remapped_object_types(required_ide_intentions, mapping)
+            required_ipl_intentions = get_remapped_instance_table(required_ipl_intentions, mapping)
+        outputs.append(pathlib.Path(id_map_path))
+
+    # ------ JSD
+    send_message("Creating gta3.JSD")
+    with stage("write gta3.JSD"):
+        lods = get_lods(required_ipl_intentions)
+        with open("output/gta3.JSD", "wb") as file:
+            write_jsd(file, required_ide_intentions, lods)
+
+    # ------ JSP
+    global jsp_output_mode, jsp_cell_size
+    jsp_index = None
+    jsp_shards = []
+    if jsp_output_mode == "single":
+        send_message("Creating gta3.JSP")
+        with stage("write gta3.JSP"):
+            with open("output/gta3.JSP", "wb") as file:
+                write_jsp(file, required_ipl_intentions)
+        jsp_paths = [pathlib.Path("output/gta3.JSP")]
+    elif jsp_output_mode == "sharded":
+        send_message("Creating JSP shards")
+        with stage("write JSP shards"):
+            jsp_paths = write_jsp_shards(
+                pathlib.Path("output").joinpath(JSP_SHARDS_DIR),
+                required_ipl_intentions,
+                jsp_cell_size
+            )
+        count("JSP shards", len(jsp_paths) - 1)
+        jsp_index, *jsp_shards = (x.relative_to("output").as_posix() for x in jsp_paths)
+    else:
+        raise Exception(f"Unknown JSP output mode '{jsp_output_mode}'")
+
+    # ------ meta.xml
+    send_message("Creating meta.xml")
+    with stage("write meta.xml"):
+        with open("output/meta.xml", "w") as file:
+            text = get_meta(transform_files, jsp_shards, jsp_index)
+            file.write(text)
+
+    outputs.extend(jsp_paths)
+    return outputs
 
 def main():
     import os
@@ -154,22 +594,58 @@ def main():
     if os.path.exists(log_path):
         os.remove(log_path)
 
+    global diagnostics
+    diagnostics = DiagnosticsSink(log_path if use_log else None, background = diagnostics_background)
+    try:
+        run_pipeline()
+    finally:
+        diagnostics.close()
+        diagnostics = None
+
+def check_settings():
+    # A mistyped setting fails here, before any stage runs
+    if dedup_policy not in DEDUP_POLICIES:
+        raise Exception(f"Unknown dedup policy '{dedup_policy}', expected one of {', '.join(DEDUP_POLICIES)}")
+    if materialize_mode not in MATERIALIZE_MODES:
+        raise Exception(f"Unknown materialize mode '{materialize_mode}', expected one of {', '.join(MATERIALIZE_MODES)}")
+
+def run_pipeline():
+    check_settings()
+
     gta_path = "input/data/gta.dat"
     water_path = "input/data/water.dat"
 
+    manifest = load_build_manifest(manifest_path)
+    executor = PipelineExecutor(workers_count)
+
     try:
         # ------ water.dat
-        send_message("Reading water.dat")
-        with open(water_path, "r") as file:
-            input = file.read()
-        
-        water_intentions = get_water_intentions(get_water_cleaned_rows(input))
-
-        # ------ water.lua
-        send_message("Creating water.lua")
-        with open("output/Settings/CWaterData.lua", "w") as file:
-            text = get_water_lua(water_intentions)
-            file.write(text)
+        water_output_path = "output/Settings/CWaterData.lua"
+        water_key = manifest.get_stage_key((pathlib.Path(water_path),), f"merge {merge_water_quads}", name = "water")
+        if manifest.is_stage_fresh("water", water_key):
+            send_message("water.lua is up to date")
+        else:
+            send_message("Reading water.dat")
+            with stage("read water.dat"):
+                with open(water_path, "r") as file:
+                    input = file.read()
+
+                water_intentions = get_water_table(get_water_cleaned_rows(input))
+
+            if merge_water_quads:
+                with stage("merge water quads"):
+                    water_count = len(water_intentions)
+                    water_intentions = water_intentions.merge_quads()
+                count("water quads eliminated", water_count - len(water_intentions))
+                send_message(f"Water quads merged: {water_count} -> {len(water_intentions)}", to_print = False)
+
+            # ------ water.lua
+            send_message("Creating water.lua")
+            with stage("write water.lua"):
+                with open(water_output_path, "w") as file:
+                    text = get_water_lua(water_intentions)
+                    file.write(text)
+            manifest.set_stage("water", water_key, (water_output_path,))
 
         # ------ gta.dat
         send_message("Reading gta.dat")
@@ -191,57 +667,97 @@ def main():
                 grouped_gta_paths[suffix] = set()
             grouped_gta_paths[suffix].add(path)
 
-        # ------ DFFs, TXDs, COLs        
-        send_message("Loading IPLs")
-        ipl_intentions = load_IPLs(grouped_gta_paths["ipl"])
-
-        send_message("Loading IDEs")
-        ide_intentions = load_IDEs(grouped_gta_paths["ide"])
-
-        import_paths = set(get_all_files("input/models"))
-        dat_paths = get_all_files("input/data")
-
-        diffs = get_diffs(
-            dat_paths,
-            gta_paths,
-            ipl_intentions,
-            ide_intentions,
-            import_paths
+        img_paths = set(get_img_paths_from_gta_dat(input))
+        for path in img_paths:
+            if not path.is_file():
+                send_message(f"IMG archive {path} does not exist", to_print = False)
+        img_paths = set(filter(pathlib.Path.is_file, img_paths))
+        import_paths = set(get_all_files("input/models")) - img_paths
+        import_paths.update(get_img_entries(img_paths))
+        stream_paths_by_parent = get_stream_ipl_paths_by_parent(import_paths)
+        for stream_paths in stream_paths_by_parent.values():
+            import_paths.difference_update(stream_paths)
+
+        dat_paths = set(get_all_files("input/data"))
+        map_outputs = ("output/gta3.JSD", "output/meta.xml", diff_report_path)
+        map_key = manifest.get_stage_key(
+            chain(
+                (pathlib.Path(gta_path),),
+                filter(pathlib.Path.is_file, gta_paths),
+                img_paths,
+                (x for paths in stream_paths_by_parent.values() for x in paths if not isinstance(x, ImgEntry))
+            ),
+            *sorted(map(str, chain(import_paths, dat_paths))),
+            f"dedup {dedup_policy} {dedup_epsilon}",
+            f"jsp {jsp_output_mode} {jsp_cell_size}",
+            f"ids {remap_object_ids}",
+            name = "map"
         )
-
-        for message in get_info_about_differences(diffs):
-            send_message(message, to_print = False)
-
-        required_ipl_intentions, required_ide_intentions, transform_files = (
-            get_required_by_diffs(diffs)
+        # Only the IPLs, IDEs and their streams decide the intentions diffs,
+        # models and data files added or removed do not
+        intentions_key = manifest.get_stage_key(
+            chain(
+                (pathlib.Path(gta_path),),
+                (x for x in chain(grouped_gta_paths.get("ipl", ()), grouped_gta_paths.get("ide", ())) if x.is_file()),
+                img_paths,
+                (x for paths in stream_paths_by_parent.values() for x in paths if not isinstance(x, ImgEntry))
+            ),
+            *sorted(str(x) for paths in stream_paths_by_parent.values() for x in paths),
+            f"dedup {dedup_policy} {dedup_epsilon}",
+            name = "intentions"
         )
 
-        # ------ JSD
-        send_message("Creating gta3.JSD")
-        lods = get_lods(required_ipl_intentions)
-        with open("output/gta3.JSD", "w") as file:
-            text = get_jsd(required_ide_intentions, lods)
-            file.write(text)
-
-        # ------ JSP
-        send_message("Creating gta3.JSP")
-        with open("output/gta3.JSP", "w") as file:
-            text = get_jsp(required_ipl_intentions)
-            file.write(text)
+        if manifest.is_stage_fresh("map", map_key):
+            send_message("gta3.JSD, gta3.JSP and meta.xml are up to date")
+            transform_files = {
+                (decode_source(source), name)
+                for source, name in manifest.get_stage_data("map")
+            }
+
+            send_message("Copying models, textures, cols")
+            wait_for_copying = start_copy_files_to_output(transform_files, executor, manifest)
+        else:
+            # Records of the whole map stage go to one report
+            if diagnostics is not None:
+                diagnostics.open_report(diff_report_path)
+            required_ipl_intentions, required_ide_intentions, transform_files = (
+                get_map_requirements(
+                    grouped_gta_paths,
+                    stream_paths_by_parent,
+                    gta_paths,
+                    dat_paths,
+                    import_paths,
+                    executor,
+                    intentions_key
+                )
+            )
 
-        # ------ meta.xml
-        send_message("Creating meta.xml")
-        with open("output/meta.xml", "w") as file:
-            text = get_meta(transform_files)
-            file.write(text)
+            # Models are copied by the workers while the text files are written
+            send_message("Copying models, textures, cols")
+            wait_for_copying = start_copy_files_to_output(transform_files, executor, manifest)
+
+            outputs = write_map_files(required_ipl_intentions, required_ide_intentions, transform_files)
+            if diagnostics is not None:
+                diagnostics.close_report()
+            manifest.set_stage(
+                "map",
+                map_key,
+                chain(map_outputs, outputs),
+                [(encode_source(source), name) for source, name in transform_files]
+            )
 
-        send_message("Copying models, textures, cols")
-        copy_files_to_output(transform_files)
+        with stage("wait for copying"):
+            wait_for_copying()
+        manifest.save()
     except Exception as e:
+        executor.terminate()
         send_message("Something is wrong")
         send_message(str(e))
         raise e
     else:
+        executor.close()
+        get_profile().save(profile_path)
+        send_message(get_profile().get_table(), to_print = False)
         send_message("Successful end")
 
 if __name__ == '__main__':
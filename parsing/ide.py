@@ -1,23 +1,22 @@
-from .intention.create_object_type import CreateObjectType
-from .dat import remove_comment
+from typing import Union
+from itertools import chain
 
-def get_ide_intentions(text: str):
-    lines = filter(lambda x: len(x) != 0, map(lambda x: str.strip(remove_comment(x)), text.split("\n")))
+from .intention.create_object_type import CreateObjectType
+from .sections import SectionScan, SectionScanner, get_field_rows
 
-    state = 0
-    for line in lines:
-        if line == "end" and state == 1:
-            state = 0
-            break
+def get_ide_intentions(data: Union[bytes, memoryview, str]):
+    return get_scanned_ide_intentions(scan_ide(data))
 
-        if state == 1:
-            yield parse_ide_object(line)
+def get_scanned_ide_intentions(scan: SectionScan):
+    return chain(scan.get_rows("objs"), scan.get_rows("tobj"))
 
-        if line == "objs":
-            state = 1
+def scan_ide(data: Union[bytes, memoryview, str]):
+    return IDE_SCANNER.scan(data)
 
 def parse_ide_object(text: str):
-    strings = tuple(map(str.strip, text.split(",")))
+    return get_ide_object(tuple(map(str.strip, text.split(","))))
+
+def get_ide_object(strings: tuple[str]):
     return CreateObjectType(
         int(strings[0]),
         strings[1],
@@ -27,4 +26,14 @@ def parse_ide_object(text: str):
         int(strings[4]),
         strings[5] if len(strings) >= 6 else None,
         strings[6] if len(strings) >= 7 else None
-    )
\ No newline at end of file
+    )
+
+def get_ide_objects(body: bytes):
+    return [get_ide_object(x) for x in get_field_rows(body)]
+
+# Timed objects only add the hours they are visible to the objs row
+IDE_SCANNER = (
+    SectionScanner()
+    .register("objs", get_ide_objects)
+    .register("tobj", get_ide_objects)
+)
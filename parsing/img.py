@@ -0,0 +1,114 @@
+from typing import Union
+from dataclasses import dataclass
+import pathlib
+import mmap
+
+import numpy as np
+
+IMG_MAGIC = b"VER2"
+IMG_SECTOR_SIZE = 2048
+
+IMG_HEADER = np.dtype([
+    ("magic", "S4"),
+    ("entries_count", "<u4")
+])
+
+IMG_ENTRY = np.dtype([
+    ("offset", "<u4"),
+    ("streaming_size", "<u2"),
+    ("archive_size", "<u2"),
+    ("name", "V24")
+])
+
+@dataclass(frozen=True)
+class ImgEntry:
+    archive: pathlib.Path
+    name: str
+
+    @property
+    def stem(self):
+        return pathlib.PurePosixPath(self.name).stem
+
+    @property
+    def suffix(self):
+        return pathlib.PurePosixPath(self.name).suffix
+
+    def __str__(self):
+        return f"{self.archive.as_posix()}/{self.name}"
+
+class ImgArchive:
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self.path = pathlib.Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise Exception(f"IMG archive '{self.path}' is empty")
+        self._data = memoryview(self._mmap)
+        self.directory = get_img_directory(self._data)
+
+    def __contains__(self, name: str):
+        return name.lower() in self.directory
+
+    def __len__(self):
+        return len(self.directory)
+
+    def get_entries(self):
+        return (ImgEntry(self.path, name) for name, _, _ in self.directory.values())
+
+    def get_location(self, name: str):
+        _, offset, size = self.directory[name.lower()]
+        return offset, size
+
+    def get(self, name: str):
+        offset, size = self.get_location(name)
+        return self._data[offset:offset + size]
+
+    def close(self):
+        self._data.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def get_img_directory(data: memoryview):
+    if len(data) < IMG_HEADER.itemsize:
+        raise Exception("Unknown format of IMG archive")
+
+    header = np.frombuffer(data, IMG_HEADER, count=1)[0]
+    if header["magic"] != IMG_MAGIC:
+        raise Exception("Unknown format of IMG archive (only VER2 is supported)")
+
+    count = int(header["entries_count"])
+    if IMG_HEADER.itemsize + count * IMG_ENTRY.itemsize > len(data):
+        raise Exception("IMG archive directory is truncated")
+
+    entries = np.frombuffer(data, IMG_ENTRY, count=count, offset=IMG_HEADER.itemsize)
+    sizes = np.where(entries["streaming_size"] != 0, entries["streaming_size"], entries["archive_size"])
+    offsets = entries["offset"].astype(np.int64) * IMG_SECTOR_SIZE
+    sizes = sizes.astype(np.int64) * IMG_SECTOR_SIZE
+    if count != 0 and (offsets + sizes).max() > len(data):
+        raise Exception("IMG archive entry points outside of the archive")
+
+    directory: dict[str, tuple[str, int, int]] = dict()
+    for raw_name, offset, size in zip(entries["name"].tolist(), offsets.tolist(), sizes.tolist()):
+        name = raw_name.split(b"\0", 1)[0].decode("latin-1")
+        directory[name.lower()] = (name, offset, size)
+    return directory
+
+_opened_archives: dict[pathlib.Path, ImgArchive] = dict()
+
+def get_img_archive(path: pathlib.Path):
+    # Every process maps an archive once and keeps it for its whole life
+    path = pathlib.Path(path)
+    if path not in _opened_archives:
+        _opened_archives[path] = ImgArchive(path)
+    return _opened_archives[path]
+
+def get_img_entry_data(entry: ImgEntry):
+    return get_img_archive(entry.archive).get(entry.name)
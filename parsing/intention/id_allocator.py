@@ -0,0 +1,105 @@
+from typing import Iterable, Union
+from bisect import bisect_left
+from dataclasses import replace
+
+import numpy as np
+
+from .create_object_type import CreateObjectType
+from .instance_table import InstanceTable, NO_MODEL
+
+class IdAllocator:
+    # The sorted free ids never change, only a flag per id does. Claiming
+    # finds an id by binary search in O(log n). Ids are never given back, so
+    # allocating moves a cursor over the used ids and costs O(1) amortized
+    def __init__(self, free_ids: Iterable[int]):
+        self.ids: list[int] = np.unique(np.fromiter(free_ids, dtype=np.int64)).tolist()
+        self.free = bytearray(b"\x01") * len(self.ids)
+        # Ids before this one are used up
+        self.first = 0
+        self.free_count = len(self.ids)
+
+    def __len__(self):
+        return self.free_count
+
+    def get_index(self, object_id: int):
+        index = bisect_left(self.ids, object_id)
+        if index == len(self.ids) or self.ids[index] != object_id or not self.free[index]:
+            return None
+        return index
+
+    def __contains__(self, object_id: int):
+        return self.get_index(object_id) is not None
+
+    def claim(self, object_id: int):
+        index = self.get_index(object_id)
+        if index is None:
+            return False
+
+        self.free[index] = 0
+        self.free_count -= 1
+        return True
+
+    def allocate(self) -> Union[int, None]:
+        # None once every id is used, the caller decides what an object keeps
+        while self.first < len(self.ids) and not self.free[self.first]:
+            self.first += 1
+        if self.first == len(self.ids):
+            return None
+
+        self.free[self.first] = 0
+        self.free_count -= 1
+        return self.ids[self.first]
+
+def get_id_mapping(ide_intentions: Iterable[CreateObjectType], allocator: IdAllocator):
+    # Case-folded model -> new object id. An object keeps its id when the id is
+    # free and no other object uses it, the others get the lowest free ids in id order.
+    # Once the free ids run out the rest keep their own id and are returned
+    # as the unmoved objects
+    intentions = sorted(ide_intentions, key=lambda x: (x.object_id, x.object_model))
+    ids, counts = np.unique([x.object_id for x in intentions], return_counts=True)
+    shared_ids = set(ids[counts > 1].tolist())
+
+    mapping: dict[str, int] = dict()
+    moved = []
+    for intention in intentions:
+        model = intention.object_model.lower()
+        if model in mapping:
+            continue
+        if intention.object_id not in shared_ids and allocator.claim(intention.object_id):
+            mapping[model] = intention.object_id
+        else:
+            moved.append(intention)
+            mapping[model] = None
+
+    unmoved: list[CreateObjectType] = []
+    for intention in moved:
+        object_id = allocator.allocate()
+        if object_id is None:
+            unmoved.append(intention)
+            object_id = intention.object_id
+        mapping[intention.object_model.lower()] = object_id
+    return mapping, unmoved
+
+def get_remapped_object_types(ide_intentions: Iterable[CreateObjectType], mapping: dict[str, int]):
+    return {
+        replace(x, object_id=mapping.get(x.object_model.lower(), x.object_id))
+        for x in ide_intentions
+    }
+
+def get_remapped_instance_table(table: InstanceTable, mapping: dict[str, int]):
+    # Instances follow the new id of their model, unknown models keep their id
+    model_ids = np.array([mapping.get(x.lower(), -1) for x in table.models], dtype=np.int64)
+    has_model = table.model_indices != NO_MODEL
+    object_ids = table.object_ids.copy()
+    new_ids = model_ids[table.model_indices[has_model]]
+    object_ids[np.flatnonzero(has_model)[new_ids != -1]] = new_ids[new_ids != -1]
+    return table.with_object_ids(object_ids)
+
+def get_id_mapping_rows(ide_intentions: Iterable[CreateObjectType], mapping: dict[str, int]):
+    # model, old id, new id of every object, ordered by the new id
+    rows = sorted(
+        (mapping[x.object_model.lower()], x.object_model, x.object_id)
+        for x in ide_intentions
+        if x.object_model.lower() in mapping
+    )
+    return (f"{model},{old_id},{new_id}" for new_id, model, old_id in rows)
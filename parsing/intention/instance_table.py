@@ -0,0 +1,403 @@
+from typing import Iterable, Sequence, Union
+
+import numpy as np
+
+from .create_object import CreateObject
+from .name_table import NameTable
+from .spatial_grid import SpatialGrid, DEFAULT_CELL_SIZE
+
+NO_LOD = -1
+NO_MODEL = -1
+
+DEDUP_POLICIES = ("none", "exact", "spatial")
+# Spatial duplicates share a model and an interior and are not further apart
+# than these on any axis
+SPATIAL_DEDUP_EPSILON = 0.01
+SPATIAL_DEDUP_ROTATION_EPSILON = 0.1
+# Key row of a spatial cell, 8-byte aligned for the row hash
+SPATIAL_KEY_ROW = np.dtype([
+    ("model_index", np.int32),
+    ("object_id", np.int32),
+    ("interior", np.int32),
+    ("padding", np.int32),
+    ("cell", np.int64, 3),
+    ("rotation_cell", np.int64, 3)
+])
+# Key row of a cell of the grids that near rows are looked up in
+GRID_KEY_ROW = np.dtype([
+    ("group", np.uint64),
+    ("cell", np.int64, 3)
+])
+
+# Odd 64-bit constants of the row hash, one per 8-byte word of a key row
+ROW_HASH_MULTIPLIERS = np.array([
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5,
+    0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9
+], dtype=np.uint64)
+
+class InstanceTable:
+    def __init__(
+        self,
+        object_ids: np.ndarray,
+        models: Sequence[str],
+        model_indices: np.ndarray,
+        interiors: np.ndarray,
+        positions: np.ndarray,
+        rotations: np.ndarray,
+        LOD_ids: np.ndarray,
+        LOD_parents: Union[np.ndarray, None] = None
+    ):
+        self.object_ids = np.asarray(object_ids, dtype=np.int32)
+        self.models = tuple(models)
+        self.model_indices = np.asarray(model_indices, dtype=np.int32)
+        self.interiors = np.asarray(interiors, dtype=np.int32)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.rotations = np.asarray(rotations, dtype=np.float64).reshape(-1, 3)
+        self.LOD_ids = np.asarray(LOD_ids, dtype=np.int32)
+        # LOD ids index the inst rows of their own IPL, LOD parents are the
+        # rows of this table they resolve to, once the IPL of every row is known
+        self.LOD_parents = None if LOD_parents is None else np.asarray(LOD_parents, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.object_ids)
+
+    def __iter__(self):
+        models = self.models
+        for object_id, model_index, interior, position, rotation, LOD_id in zip(
+            self.object_ids.tolist(),
+            self.model_indices.tolist(),
+            self.interiors.tolist(),
+            self.positions.tolist(),
+            self.rotations.tolist(),
+            self.LOD_ids.tolist()
+        ):
+            yield CreateObject(
+                object_id,
+                models[model_index],
+                interior,
+                *position,
+                *rotation,
+                LOD_id if LOD_id != NO_LOD else None
+            )
+
+    def get_object(self, index: int):
+        LOD_id = int(self.LOD_ids[index])
+        return CreateObject(
+            int(self.object_ids[index]),
+            self.models[self.model_indices[index]],
+            int(self.interiors[index]),
+            *self.positions[index].tolist(),
+            *self.rotations[index].tolist(),
+            LOD_id if LOD_id != NO_LOD else None
+        )
+
+    def take(self, indices: np.ndarray, representatives: Union[np.ndarray, None] = None):
+        indices = np.asarray(indices, dtype=np.intp)
+        LOD_parents = None
+        if self.LOD_parents is not None:
+            # Parents are moved to their new rows, a parent that is not taken is
+            # lost unless its representative, a row that is taken, stands for it
+            new_rows = np.full(len(self), NO_LOD, dtype=np.int32)
+            new_rows[indices] = np.arange(len(indices), dtype=np.int32)
+            parents = self.LOD_parents[indices]
+            if representatives is not None:
+                parents = np.where(parents != NO_LOD, representatives[parents], NO_LOD)
+            LOD_parents = np.where(parents != NO_LOD, new_rows[parents], NO_LOD)
+
+        return InstanceTable(
+            self.object_ids[indices],
+            self.models,
+            self.model_indices[indices],
+            self.interiors[indices],
+            self.positions[indices],
+            self.rotations[indices],
+            self.LOD_ids[indices],
+            LOD_parents
+        )
+
+    def resolve_lods(self):
+        # All rows are taken as the inst rows of one IPL, its streams included
+        valid = (self.LOD_ids >= 0) & (self.LOD_ids < len(self))
+        return InstanceTable(
+            self.object_ids,
+            self.models,
+            self.model_indices,
+            self.interiors,
+            self.positions,
+            self.rotations,
+            self.LOD_ids,
+            np.where(valid, self.LOD_ids, NO_LOD)
+        )
+
+    def with_models(self, models_by_id: dict[int, str]):
+        # Binary IPLs only know object ids, names come from the IDEs
+        unresolved = self.model_indices == NO_MODEL
+        if not unresolved.any():
+            return self
+
+        models = {model: index for index, model in enumerate(self.models)}
+        object_ids, inverse = np.unique(self.object_ids[unresolved], return_inverse=True)
+        remap = np.array([
+            models.setdefault(models_by_id.get(object_id, str(object_id)), len(models))
+            for object_id in object_ids.tolist()
+        ], dtype=np.int32)
+
+        model_indices = self.model_indices.copy()
+        model_indices[unresolved] = remap[inverse]
+        return InstanceTable(
+            self.object_ids,
+            models,
+            model_indices,
+            self.interiors,
+            self.positions,
+            self.rotations,
+            self.LOD_ids,
+            self.LOD_parents
+        )
+
+    def without_lod_parents(self):
+        # The IPL the LOD ids point into is not loaded
+        return InstanceTable(
+            self.object_ids,
+            self.models,
+            self.model_indices,
+            self.interiors,
+            self.positions,
+            self.rotations,
+            self.LOD_ids,
+            np.full(len(self), NO_LOD, dtype=np.int32)
+        )
+
+    def get_model_name_ids(self, names: NameTable):
+        # Id of the interned model name of every row, NO_MODEL where there is none
+        model_name_ids = np.array(names.intern_all(self.models) + [NO_MODEL], dtype=np.int32)
+        return model_name_ids[self.model_indices]
+
+    def with_object_ids(self, object_ids: np.ndarray):
+        return InstanceTable(
+            object_ids,
+            self.models,
+            self.model_indices,
+            self.interiors,
+            self.positions,
+            self.rotations,
+            self.LOD_ids,
+            self.LOD_parents
+        )
+
+    def get_key_rows(self, positions: np.ndarray, rotations: np.ndarray):
+        rows = np.empty(len(self), dtype=[
+            ("object_id", np.int32),
+            ("model_index", np.int32),
+            ("interior", np.int32),
+            ("LOD_id", np.int32),
+            ("position", positions.dtype, 3),
+            ("rotation", rotations.dtype, 3)
+        ])
+        rows["object_id"] = self.object_ids
+        rows["model_index"] = self.model_indices
+        rows["interior"] = self.interiors
+        rows["LOD_id"] = self.LOD_ids
+        rows["position"] = positions
+        rows["rotation"] = rotations
+        return rows
+
+    def unique(self):
+        # -0.0 and 0.0 must collapse the same way they do in a set of CreateObjects
+        rows = self.get_key_rows(self.positions + 0.0, self.rotations + 0.0)
+        return self.take_representatives(get_row_representatives(rows))
+
+    def unique_spatial(
+        self,
+        epsilon: float = SPATIAL_DEDUP_EPSILON,
+        rotation_epsilon: float = SPATIAL_DEDUP_ROTATION_EPSILON
+    ):
+        return self.take_representatives(get_spatial_representatives(self, epsilon, rotation_epsilon))
+
+    def take_representatives(self, representatives: np.ndarray):
+        # Only the rows that represent themselves are kept, the LOD children of
+        # a dropped duplicate are moved to the row that was kept in its place
+        return self.take(np.flatnonzero(representatives == np.arange(len(self))), representatives)
+
+    def deduplicate(self, policy: str, epsilon: float = SPATIAL_DEDUP_EPSILON):
+        if policy == "none":
+            return self
+        if policy == "exact":
+            return self.unique()
+        if policy == "spatial":
+            return self.unique_spatial(epsilon)
+        raise Exception(f"Unknown dedup policy '{policy}'")
+
+    def get_spatial_grid(self, cell_size: float = DEFAULT_CELL_SIZE):
+        return SpatialGrid(self.positions, cell_size)
+
+def get_row_hashes(rows: np.ndarray):
+    # A 64-bit hash of the bytes of every key row
+    words = rows.view(np.uint64).reshape(len(rows), rows.dtype.itemsize // 8)
+    hashes = np.zeros(len(rows), dtype=np.uint64)
+    for index in range(words.shape[1]):
+        mixed = words[:, index] * ROW_HASH_MULTIPLIERS[index % len(ROW_HASH_MULTIPLIERS)]
+        hashes ^= mixed ^ (mixed >> np.uint64(31))
+        hashes *= ROW_HASH_MULTIPLIERS[0]
+    return hashes
+
+def get_row_representatives(rows: np.ndarray):
+    # For every row the index of the first row equal to it. Rows are grouped
+    # by a 64-bit hash of their bytes and a hash collision between different
+    # rows falls back to a full comparison
+    if len(rows) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    words = rows.view(np.uint64).reshape(len(rows), rows.dtype.itemsize // 8)
+    hashes = get_row_hashes(rows)
+    order = np.argsort(hashes, kind="stable")
+    sorted_hashes = hashes[order]
+    starts = np.empty(len(rows), dtype=bool)
+    starts[0] = True
+    np.not_equal(sorted_hashes[1:], sorted_hashes[:-1], out=starts[1:])
+
+    # The sort is stable, so the first row of a group has the lowest index
+    sorted_representatives = order[starts][np.cumsum(starts) - 1]
+    repeated = ~starts
+    if not (words[order[repeated]] == words[sorted_representatives[repeated]]).all():
+        _, first_indices, groups = np.unique(rows.view(np.void), return_index=True, return_inverse=True)
+        return first_indices[groups.reshape(-1)]
+    representatives = np.empty(len(rows), dtype=np.intp)
+    representatives[order] = sorted_representatives
+    return representatives
+
+def get_spatial_representatives(
+    table: InstanceTable,
+    epsilon: float,
+    rotation_epsilon: float
+):
+    # For every row the index of the row it is a duplicate of, itself if it is
+    # kept. Positions and rotations are floored into cells of epsilon, the rows
+    # of one cell are within epsilon of each other and go to its first row.
+    # A first row is then a duplicate of the first earlier kept row near it.
+    # Unresolved binary rows have no model yet and are told apart by object id
+    count = len(table)
+    object_ids = np.where(table.model_indices == NO_MODEL, table.object_ids, 0)
+    rows = np.zeros(count, dtype=SPATIAL_KEY_ROW)
+    rows["model_index"] = table.model_indices
+    rows["object_id"] = object_ids
+    rows["interior"] = table.interiors
+    rows["cell"] = np.floor(table.positions / epsilon)
+    rows["rotation_cell"] = np.floor(table.rotations / rotation_epsilon)
+    representatives = get_row_representatives(rows)
+    firsts = np.flatnonzero(representatives == np.arange(count))
+
+    # First rows are compared inside the cells of 2 epsilon of 8 grids, shifted
+    # by 0 or epsilon on every axis. Two rows within epsilon on an axis share a
+    # cell of one of the two shifts, so every near pair shares a cell of one
+    # grid, and a cell holds only the few first rows of its epsilon cells
+    rows = rows[firsts]
+    rows["cell"] = 0
+    rows["rotation_cell"] = 0
+    groups = np.zeros(len(firsts), dtype=GRID_KEY_ROW)
+    groups["group"] = get_row_hashes(rows)
+    positions = table.positions[firsts] / (2 * epsilon)
+    earlier, later = [], []
+    for shift in np.ndindex(2, 2, 2):
+        groups["cell"] = np.floor(positions + np.array(shift) * 0.5)
+        hashes = get_row_hashes(groups)
+        order = np.argsort(hashes)
+        sorted_hashes = hashes[order]
+        for offset in range(1, len(firsts)):
+            same = sorted_hashes[offset:] == sorted_hashes[:-offset]
+            if not same.any():
+                break
+
+            # A hash collision only adds a candidate, every pair is compared in full
+            first, second = firsts[order[:-offset][same]], firsts[order[offset:][same]]
+            close = (
+                (table.model_indices[first] == table.model_indices[second]) &
+                (object_ids[first] == object_ids[second]) &
+                (table.interiors[first] == table.interiors[second]) &
+                (np.abs(table.positions[first] - table.positions[second]) <= epsilon).all(axis=1) &
+                (np.abs(table.rotations[first] - table.rotations[second]) <= rotation_epsilon).all(axis=1)
+            )
+            earlier.append(np.minimum(first, second)[close])
+            later.append(np.maximum(first, second)[close])
+    if len(earlier) == 0:
+        return representatives
+
+    earlier, later = np.concatenate(earlier), np.concatenate(later)
+    pairs = np.lexsort((earlier, later))
+    # Pairs go by the later row, so every earlier row is settled before it is used
+    for first, second in zip(earlier[pairs].tolist(), later[pairs].tolist()):
+        if representatives[first] == first and representatives[second] == second:
+            representatives[second] = first
+    # The rows of a cell follow its first row to the row that is kept
+    return representatives[representatives]
+
+def get_empty_instance_table():
+    return InstanceTable(
+        np.empty(0, dtype=np.int32),
+        (),
+        np.empty(0, dtype=np.int32),
+        np.empty(0, dtype=np.int32),
+        np.empty((0, 3), dtype=np.float64),
+        np.empty((0, 3), dtype=np.float64),
+        np.empty(0, dtype=np.int32)
+    )
+
+def get_instance_table(intentions: Iterable[CreateObject]):
+    if isinstance(intentions, InstanceTable):
+        return intentions
+
+    intentions = tuple(intentions)
+    if len(intentions) == 0:
+        return get_empty_instance_table()
+
+    models: dict[str, int] = dict()
+    return InstanceTable(
+        [x.object_id for x in intentions],
+        models,
+        [models.setdefault(x.object_model, len(models)) for x in intentions],
+        [x.interior for x in intentions],
+        [(x.x, x.y, x.z) for x in intentions],
+        [(x.rx, x.ry, x.rz) for x in intentions],
+        [x.LOD_id if x.LOD_id is not None else NO_LOD for x in intentions]
+    )
+
+def concat_instance_tables(tables: Iterable[InstanceTable]):
+    tables = tuple(tables)
+    if len(tables) == 0:
+        return get_empty_instance_table()
+
+    models: dict[str, int] = dict()
+    model_indices = []
+    for table in tables:
+        remap = np.array(
+            [models.setdefault(model, len(models)) for model in table.models],
+            dtype=np.int32
+        )
+        if len(remap) != 0:
+            model_indices.append(np.where(
+                table.model_indices == NO_MODEL,
+                NO_MODEL,
+                remap[table.model_indices]
+            ))
+        else:
+            model_indices.append(table.model_indices)
+
+    # Parents are kept only when every table has them, moved by the rows before
+    LOD_parents = None
+    if all(x.LOD_parents is not None for x in tables):
+        offsets = np.cumsum([0] + [len(x) for x in tables[:-1]])
+        LOD_parents = np.concatenate([
+            np.where(x.LOD_parents != NO_LOD, x.LOD_parents + offset, NO_LOD)
+            for x, offset in zip(tables, offsets.tolist())
+        ])
+
+    return InstanceTable(
+        np.concatenate([x.object_ids for x in tables]),
+        models,
+        np.concatenate(model_indices),
+        np.concatenate([x.interiors for x in tables]),
+        np.concatenate([x.positions for x in tables]),
+        np.concatenate([x.rotations for x in tables]),
+        np.concatenate([x.LOD_ids for x in tables]),
+        LOD_parents
+    )
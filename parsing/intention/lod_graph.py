@@ -0,0 +1,46 @@
+from typing import Union
+
+import numpy as np
+
+from .instance_table import InstanceTable, NO_LOD
+
+class LodGraph:
+    # parents[row] is the row of the LOD instance of a row, the children of a
+    # row are children[child_starts[row]:child_starts[row + 1]]
+    def __init__(self, parents: np.ndarray):
+        self.parents = np.asarray(parents, dtype=np.int32)
+
+        child_rows = np.flatnonzero(self.parents != NO_LOD)
+        child_parents = self.parents[child_rows]
+        self.children = child_rows[np.argsort(child_parents, kind="stable")]
+        self.child_starts = np.zeros(len(self.parents) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(child_parents, minlength=len(self.parents)), out=self.child_starts[1:])
+
+    def __len__(self):
+        return len(self.parents)
+
+    def get_parent(self, row: int) -> Union[int, None]:
+        parent = int(self.parents[row])
+        return parent if parent != NO_LOD else None
+
+    def get_children(self, row: int):
+        return self.children[self.child_starts[row]:self.child_starts[row + 1]]
+
+    def get_children_counts(self):
+        return np.diff(self.child_starts)
+
+    def get_lod_rows(self):
+        return np.flatnonzero(self.get_children_counts() != 0)
+
+    def get_detail_rows(self):
+        return np.flatnonzero(self.parents != NO_LOD)
+
+def get_lod_graph(table: InstanceTable):
+    if table.LOD_parents is None:
+        table = table.resolve_lods()
+    return LodGraph(table.LOD_parents)
+
+def get_lod_object_ids(table: InstanceTable):
+    # Object ids placed as the LOD of at least one instance
+    rows = get_lod_graph(table).get_lod_rows()
+    return set(np.unique(table.object_ids[rows]).tolist())
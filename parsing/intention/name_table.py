@@ -0,0 +1,40 @@
+from typing import Iterable, Union
+
+class NameTable:
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: list[str] = []
+        self.ids: dict[str, int] = dict()
+        # Spellings seen so far, a known spelling is never case-folded again
+        self._ids_by_spelling: dict[str, int] = dict()
+        for name in names:
+            self.intern(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, name_id: int):
+        return self.names[name_id]
+
+    def __contains__(self, name: str):
+        return self.get_id(name) is not None
+
+    def intern(self, name: str):
+        name_id = self._ids_by_spelling.get(name)
+        if name_id is None:
+            folded = name.lower()
+            name_id = self.ids.get(folded)
+            if name_id is None:
+                name_id = len(self.names)
+                self.names.append(folded)
+                self.ids[folded] = name_id
+            self._ids_by_spelling[name] = name_id
+        return name_id
+
+    def intern_all(self, names: Iterable[str]):
+        return [self.intern(name) for name in names]
+
+    def get_id(self, name: str) -> Union[int, None]:
+        name_id = self._ids_by_spelling.get(name)
+        if name_id is None:
+            name_id = self.ids.get(name.lower())
+        return name_id
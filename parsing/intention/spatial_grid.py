@@ -0,0 +1,105 @@
+from typing import Union
+
+import numpy as np
+
+DEFAULT_CELL_SIZE = 250.0
+
+class SpatialGrid:
+    # A uniform grid over the x, y plane: instances are sorted by the key of
+    # their cell, every non-empty cell is a contiguous slice of that order.
+    # The origin defaults to the lowest corner and must not be above any position
+    def __init__(
+        self,
+        positions: np.ndarray,
+        cell_size: float = DEFAULT_CELL_SIZE,
+        origin: Union[np.ndarray, None] = None
+    ):
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.cell_size = float(cell_size)
+
+        points = self.positions[:, :2]
+        if len(points) != 0:
+            self.origin = points.min(axis=0) if origin is None else np.asarray(origin, dtype=np.float64)
+            cells = self.get_cells_of(points)
+            self.shape = cells.max(axis=0) + 1
+        else:
+            self.origin = np.zeros(2) if origin is None else np.asarray(origin, dtype=np.float64)
+            cells = np.empty((0, 2), dtype=np.int64)
+            self.shape = np.zeros(2, dtype=np.int64)
+
+        keys = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_keys, self.cell_starts = np.unique(keys[self.order], return_index=True)
+        self.cell_starts = np.append(self.cell_starts, len(keys))
+
+    def __len__(self):
+        return len(self.positions)
+
+    def get_cells_of(self, points: np.ndarray):
+        return np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+
+    def get_cells(self):
+        # (column, row) of every non-empty cell with the indices of its instances
+        for index, key in enumerate(self.cell_keys.tolist()):
+            cell = divmod(key, int(self.shape[1]))
+            yield cell, self.order[self.cell_starts[index]:self.cell_starts[index + 1]]
+
+    def get_cell_bounds(self, cell: tuple[int, int]):
+        min_x, min_y = self.origin + np.array(cell) * self.cell_size
+        return min_x, min_y, min_x + self.cell_size, min_y + self.cell_size
+
+    def get_candidates(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        if len(self.positions) == 0 or min_x > max_x or min_y > max_y:
+            return np.empty(0, dtype=np.intp)
+
+        low = np.maximum(self.get_cells_of(np.array([min_x, min_y])), 0)
+        high = np.minimum(self.get_cells_of(np.array([max_x, max_y])), self.shape - 1)
+        if (low > high).any():
+            return np.empty(0, dtype=np.intp)
+
+        # The cells of one column of the box have consecutive keys, so every
+        # column is a single slice of the sorted order
+        columns = np.arange(low[0], high[0] + 1) * self.shape[1]
+        first_cells = np.searchsorted(self.cell_keys, columns + low[1])
+        last_cells = np.searchsorted(self.cell_keys, columns + high[1], side="right")
+        slices = [
+            self.order[self.cell_starts[first]:self.cell_starts[last]]
+            for first, last in zip(first_cells.tolist(), last_cells.tolist())
+            if first != last
+        ]
+        if len(slices) == 0:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(slices)
+
+    def query_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        candidates = self.get_candidates(min_x, min_y, max_x, max_y)
+        points = self.positions[candidates, :2]
+        inside = (
+            (points[:, 0] >= min_x) & (points[:, 0] <= max_x) &
+            (points[:, 1] >= min_y) & (points[:, 1] <= max_y)
+        )
+        return np.sort(candidates[inside])
+
+    def query_radius(self, x: float, y: float, radius: float):
+        candidates = self.get_candidates(x - radius, y - radius, x + radius, y + radius)
+        distances = np.hypot(self.positions[candidates, 0] - x, self.positions[candidates, 1] - y)
+        return np.sort(candidates[distances <= radius])
+
+    def query_nearest(self, x: float, y: float, k: int):
+        # Indices of the k nearest instances, nearest first. The search radius
+        # doubles until it holds k instances, they are then the nearest ones
+        k = min(k, len(self.positions))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        extent = np.hypot(*(self.shape * self.cell_size)) + np.hypot(*(np.array([x, y]) - self.origin))
+        radius = self.cell_size
+        while True:
+            candidates = self.query_radius(x, y, radius)
+            if len(candidates) >= k or radius > extent:
+                break
+            radius *= 2
+
+        distances = np.hypot(self.positions[candidates, 0] - x, self.positions[candidates, 1] - y)
+        nearest = np.lexsort((candidates, distances))[:k]
+        return candidates[nearest]
@@ -0,0 +1,96 @@
+import numpy as np
+
+from .create_water import CreateWater, Point
+
+class WaterTable:
+    # Every row has 4 points, the fourth is NaN for triangles. A quad lists
+    # its corners as (x0, y0), (x1, y0), (x0, y1), (x1, y1)
+    def __init__(self, points: np.ndarray, points_counts: np.ndarray, types: np.ndarray):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 4, 3)
+        self.points_counts = np.asarray(points_counts, dtype=np.int32)
+        self.types = np.asarray(types, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        for points, points_count, type in zip(
+            self.points.tolist(),
+            self.points_counts.tolist(),
+            self.types.tolist()
+        ):
+            yield CreateWater(tuple(Point(*x) for x in points[:points_count]), type)
+
+    def take(self, indices: np.ndarray):
+        indices = np.asarray(indices, dtype=np.intp)
+        return WaterTable(self.points[indices], self.points_counts[indices], self.types[indices])
+
+    def get_flat_rectangles(self):
+        # Quads that are axis aligned rectangles with one height can be merged
+        x = self.points[:, :, 0]
+        y = self.points[:, :, 1]
+        z = self.points[:, :, 2]
+        return (
+            (self.points_counts == 4) &
+            (x[:, 0] == x[:, 2]) & (x[:, 1] == x[:, 3]) & (x[:, 0] < x[:, 1]) &
+            (y[:, 0] == y[:, 1]) & (y[:, 2] == y[:, 3]) & (y[:, 0] < y[:, 2]) &
+            (z == z[:, :1]).all(axis=1)
+        )
+
+    def merge_quads(self):
+        # Rectangles of one type and height that share a whole edge are merged,
+        # first into strips along x and then strips of one width along y.
+        # Merged quads take the place of their first row
+        flat = self.get_flat_rectangles()
+        rows = np.flatnonzero(flat)
+        corners = self.points[rows]
+        x0, x1 = corners[:, 0, 0], corners[:, 1, 0]
+        y0, y1 = corners[:, 0, 1], corners[:, 2, 1]
+        z = corners[:, 0, 2]
+        types = self.types[rows]
+
+        x0, x1, (y0, y1, z, types), rows = merge_touching(x0, x1, (y0, y1, z, types), rows)
+        y0, y1, (x0, x1, z, types), rows = merge_touching(y0, y1, (x0, x1, z, types), rows)
+
+        points = np.stack([
+            np.stack([x0, y0, z], axis=1),
+            np.stack([x1, y0, z], axis=1),
+            np.stack([x0, y1, z], axis=1),
+            np.stack([x1, y1, z], axis=1)
+        ], axis=1)
+        kept = np.flatnonzero(~flat)
+        order = np.argsort(np.concatenate((kept, rows)), kind="stable")
+        return WaterTable(
+            np.concatenate((self.points[kept], points))[order],
+            np.concatenate((self.points_counts[kept], np.full(len(rows), 4)))[order],
+            np.concatenate((self.types[kept], types))[order]
+        )
+
+def merge_touching(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    keys: tuple[np.ndarray, ...],
+    rows: np.ndarray
+):
+    # Intervals with equal keys are sorted by start, an interval that starts
+    # where the previous one ends joins its run
+    if len(starts) == 0:
+        return starts, ends, keys, rows
+
+    order = np.lexsort((starts, *keys[::-1]))
+    starts = starts[order]
+    ends = ends[order]
+    keys = tuple(x[order] for x in keys)
+    rows = rows[order]
+
+    joins = starts[1:] == ends[:-1]
+    for key in keys:
+        joins &= key[1:] == key[:-1]
+    first = np.flatnonzero(np.concatenate(([True], ~joins)))
+    last = np.append(first[1:], len(starts)) - 1
+    return (
+        starts[first],
+        ends[last],
+        tuple(x[first] for x in keys),
+        np.minimum.reduceat(rows, first)
+    )
@@ -1,8 +1,31 @@
+from typing import Union
+import warnings
+import io
+
 import numpy as np
 
 from .intention.create_object import CreateObject
+from .intention.instance_table import InstanceTable, get_empty_instance_table, concat_instance_tables
+
+from .sections import SectionScan, SectionScanner, get_field_rows, get_section_spans
+
+INST_NAME_SIZE = 64
 
-from .dat import remove_comment
+# Smaller text IPLs are parsed by one worker, larger ones are split into chunks
+# of whole inst rows, a few per worker so a slow chunk does not hold the others
+PARALLEL_PARSE_MIN_SIZE = 1 << 22
+PARALLEL_PARSE_MIN_CHUNK_SIZE = 1 << 20
+PARALLEL_PARSE_CHUNKS_PER_WORKER = 2
+
+# id, model, interior, x, y, z, qx, qy, qz, qw, LOD
+INST_ROW = np.dtype([
+    ("object_id", np.int32),
+    ("model", f"S{INST_NAME_SIZE}"),
+    ("interior", np.float64),
+    ("position", np.float64, 3),
+    ("quaternion", np.float64, 4),
+    ("LOD_id", np.int32)
+])
 
 def quaternion_to_euler(w, x, y, z):
     sinr_cosp = 2 * (w * x + y * z)
@@ -21,29 +44,138 @@ def quaternion_to_euler(w, x, y, z):
 
     return np.degrees(roll), np.degrees(pitch), np.degrees(yaw)
 
-def get_ipl_intentions(text: str):
-    lines = filter(lambda x: len(x) != 0, map(lambda x: str.strip(remove_comment(x)), text.split("\n")))
+def quaternions_to_eulers(
+    w: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray
+):
+    w, x, y, z = (np.asarray(v, dtype=np.float64) for v in (w, x, y, z))
+
+    sinr_cosp = 2 * (w * x + y * z)
+    cosr_cosp = 1 - 2 * (x * x + y * y)
+    roll = np.arctan2(sinr_cosp, cosr_cosp)
+
+    # Same gimbal lock handling as quaternion_to_euler, for the whole column
+    sinp = 2 * (w * y - z * x)
+    pitch = np.where(
+        np.abs(sinp) >= 1,
+        np.copysign(np.pi / 2, sinp),
+        np.arcsin(np.clip(sinp, -1, 1))
+    )
+
+    siny_cosp = 2 * (w * z + x * y)
+    cosy_cosp = 1 - 2 * (y * y + z * z)
+    yaw = np.arctan2(siny_cosp, cosy_cosp)
+
+    return np.degrees(roll), np.degrees(pitch), np.degrees(yaw)
+
+def get_ipl_inst_section_table(body: Union[bytes, memoryview]):
+    # numpy tokenizes and converts the section in C. It reads the bytes in
+    # blocks, so the section is never decoded to one str. latin-1 keeps the
+    # bytes of the names as they are and only the distinct names are decoded
+    try:
+        with warnings.catch_warnings():
+            # An empty section is a valid one, not a reason to warn
+            warnings.simplefilter("ignore", UserWarning)
+            rows = np.loadtxt(
+                io.BytesIO(body),
+                encoding="latin-1",
+                dtype=INST_ROW,
+                delimiter=",",
+                comments="#",
+                ndmin=1
+            )
+    except ValueError:
+        rows = None
+    if rows is None or (rows["model"].size != 0 and max(map(len, rows["model"].tolist())) >= INST_NAME_SIZE):
+        # A row of another shape or a long name, the slow path handles it the usual way
+        return get_ipl_inst_table(get_field_rows(body))
+    if len(rows) == 0:
+        return get_empty_instance_table()
+
+    models: dict[bytes, int] = dict()
+    model_indices = [models.setdefault(x.strip(), len(models)) for x in rows["model"].tolist()]
+    quaternions = rows["quaternion"]
+
+    return InstanceTable(
+        rows["object_id"],
+        [x.decode() for x in models],
+        model_indices,
+        rows["interior"],
+        rows["position"],
+        np.column_stack(quaternions_to_eulers(*quaternions.T)),
+        rows["LOD_id"]
+    )
+
+IPL_SCANNER = SectionScanner().register("inst", get_ipl_inst_section_table)
+
+def scan_ipl(data: Union[bytes, memoryview, str]):
+    return IPL_SCANNER.scan(data)
+
+def get_ipl_chunk_size(size: int, workers_count: int):
+    chunks_count = min(
+        workers_count * PARALLEL_PARSE_CHUNKS_PER_WORKER,
+        max(1, size // PARALLEL_PARSE_MIN_CHUNK_SIZE)
+    )
+    return -(-size // chunks_count)
 
-    state = 0
-    for line in lines:
-        if line == "end" and state == 1:
-            state = 0
-            break
+def get_ipl_inst_chunks(data: bytes, chunk_size: int):
+    # Byte ranges of whole inst rows in file order, parsed one by one and
+    # concatenated they give the same table as the whole file
+    for section, start, end in get_section_spans(data):
+        if section != "inst":
+            continue
+        while end - start > chunk_size:
+            split = data.find(b"\n", start + chunk_size, end)
+            if split == -1:
+                break
+            yield start, split + 1
+            start = split + 1
+        yield start, end
 
-        if state == 1:
-            yield parse_ipl_object(line)
+def get_scanned_ipl_table(scan: SectionScan):
+    tables = scan.get_parsed("inst")
+    if len(tables) == 1:
+        return tables[0]
+    return concat_instance_tables(tables)
 
-        if line == "inst":
-            state = 1
+def get_ipl_table(data: Union[bytes, memoryview, str]):
+    return get_scanned_ipl_table(scan_ipl(data))
+
+def get_ipl_inst_table(rows: list[tuple[str]]):
+    if len(rows) == 0:
+        return get_empty_instance_table()
+
+    models: dict[str, int] = dict()
+    numbers = np.array([row[2:10] for row in rows], dtype=np.float64)
+    quaternions = numbers[:, 4:8]
+
+    return InstanceTable(
+        np.array([row[0] for row in rows], dtype=np.int32),
+        models,
+        [models.setdefault(row[1], len(models)) for row in rows],
+        numbers[:, 0],
+        numbers[:, 1:4],
+        np.column_stack(quaternions_to_eulers(*quaternions.T)),
+        np.array([row[10] for row in rows], dtype=np.int32)
+    )
+
+def get_ipl_intentions(text: str):
+    return iter(get_ipl_table(text))
 
 def parse_ipl_object(text: str):
     strings = tuple(map(str.strip, text.split(",")))
-    rx, ry, rz = quaternion_to_euler(
+    rotation = quaternion_to_euler(
         float(strings[6]),
         float(strings[7]),
         float(strings[8]),
         float(strings[9]),
     )
+    return get_ipl_object(strings, rotation)
+
+def get_ipl_object(strings: tuple[str], rotation: tuple[float, float, float]):
+    rx, ry, rz = rotation
     LOD_id = int(strings[10])
     return CreateObject(
         int(strings[0]),
@@ -56,4 +188,4 @@ def parse_ipl_object(text: str):
         ry,
         rz,
         LOD_id if LOD_id != -1 else None
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,99 @@
+from typing import Iterable, Union
+import pathlib
+import re
+
+import numpy as np
+
+from .intention.instance_table import InstanceTable, NO_MODEL, concat_instance_tables
+from .ipl import quaternions_to_eulers
+
+BINARY_IPL_MAGIC = b"bnry"
+
+BINARY_IPL_HEADER = np.dtype([
+    ("magic", "S4"),
+    ("instances_count", "<i4"),
+    ("unknown1_count", "<i4"),
+    ("unknown2_count", "<i4"),
+    ("unknown3_count", "<i4"),
+    ("cars_count", "<i4"),
+    ("unknown4_count", "<i4"),
+    ("instances_offset", "<i4"),
+    ("instances_size", "<i4"),
+    ("unknown1_offset", "<i4"),
+    ("unknown1_size", "<i4"),
+    ("unknown2_offset", "<i4"),
+    ("unknown2_size", "<i4"),
+    ("unknown3_offset", "<i4"),
+    ("unknown3_size", "<i4"),
+    ("cars_offset", "<i4"),
+    ("cars_size", "<i4"),
+    ("unknown4_offset", "<i4"),
+    ("unknown4_size", "<i4")
+])
+
+# Quaternion is stored as x, y, z, w - the same column order as a text inst row
+BINARY_IPL_INSTANCE = np.dtype([
+    ("position", "<f4", 3),
+    ("quaternion", "<f4", 4),
+    ("object_id", "<i4"),
+    ("interior", "<i4"),
+    ("LOD_id", "<i4")
+])
+
+STREAM_IPL_NAME = re.compile(r"^(.+)_stream\d+$")
+
+def is_binary_ipl(data: Union[bytes, memoryview]):
+    return bytes(data[:len(BINARY_IPL_MAGIC)]) == BINARY_IPL_MAGIC
+
+def get_binary_ipl_table(data: Union[bytes, memoryview]):
+    data = memoryview(data)
+    if len(data) < BINARY_IPL_HEADER.itemsize or not is_binary_ipl(data):
+        raise Exception("Unknown format of binary IPL")
+
+    header = np.frombuffer(data, BINARY_IPL_HEADER, count=1)[0]
+    count = int(header["instances_count"])
+    offset = int(header["instances_offset"])
+    if offset + count * BINARY_IPL_INSTANCE.itemsize > len(data):
+        raise Exception("Binary IPL is truncated")
+
+    instances = np.frombuffer(data, BINARY_IPL_INSTANCE, count=count, offset=offset)
+
+    return InstanceTable(
+        instances["object_id"],
+        (),
+        np.full(count, NO_MODEL, dtype=np.int32),
+        instances["interior"],
+        instances["position"],
+        np.column_stack(quaternions_to_eulers(*instances["quaternion"].T)),
+        instances["LOD_id"]
+    )
+
+def get_binary_ipl_intentions(data: Union[bytes, memoryview], models_by_id: dict[int, str]):
+    return iter(get_binary_ipl_table(data).with_models(models_by_id))
+
+def get_stream_ipl_parent_name(path: pathlib.PurePath):
+    match = STREAM_IPL_NAME.match(path.stem.lower())
+    if match is None:
+        return None
+    return match.group(1)
+
+def get_stream_ipl_paths_by_parent(paths: Iterable[pathlib.PurePath]):
+    stream_paths: dict[str, list[pathlib.PurePath]] = dict()
+    for path in paths:
+        if path.suffix[1:].lower() != "ipl":
+            continue
+        parent_name = get_stream_ipl_parent_name(path)
+        if parent_name is None:
+            continue
+        if parent_name not in stream_paths:
+            stream_paths[parent_name] = list()
+        stream_paths[parent_name].append(path)
+
+    for paths in stream_paths.values():
+        paths.sort(key=lambda x: x.stem.lower())
+    return stream_paths
+
+def join_stream_ipl_tables(parent_table: InstanceTable, stream_tables: Iterable[InstanceTable]):
+    # LOD ids of stream instances index the inst rows of the parent text IPL,
+    # so the parent rows have to stay first in the joined table
+    return concat_instance_tables((parent_table, *stream_tables))
@@ -1,7 +1,8 @@
-from typing import Iterable
+from typing import BinaryIO, Collection, Iterable
 from functools import partial
 
 from .intention.create_object_type import CreateObjectType
+from .rows_writer import write_rows
 
 def get_flag(flag: int):
     return flag == 4 or flag == 8
@@ -9,13 +10,14 @@ def get_flag(flag: int):
 def is_culled(culled: int):
     return culled == 2097152
 
-def get_jsd_row(intention: CreateObjectType, lods: dict[int, int]):
+def get_jsd_row(intention: CreateObjectType, lods: Collection[int]):
     model = intention.object_model
     collision = "nil" if intention.object_col is None else intention.object_col
     texture = intention.texture
     draw_distance = intention.draw_distance
     flag = "true" if get_flag(intention.flag) else "nil"
     culled = "true" if is_culled(intention.flag) else "nil"
+    # lods holds the object ids placed as the LOD of some instance
     lod = "true" if intention.object_id in lods else "nil"
     time_on = intention.time_on
     time_off = intention.tine_off
@@ -26,12 +28,16 @@ def get_jsd_row(intention: CreateObjectType, lods: dict[int, int]):
         output = f"{model},{model},{texture},{collision},{draw_distance},{flag},{culled},{lod}"
     return output
 
-def get_jsd(intentions: Iterable[CreateObjectType], lods: dict[int, int]):
+def get_jsd_rows(intentions: Iterable[CreateObjectType], lods: Collection[int]):
     handler = partial(get_jsd_row, lods=lods)
-    rows = map(
+    return map(
         handler,
         intentions
     )
-    
-    output = '\n'.join(rows)
+
+def get_jsd(intentions: Iterable[CreateObjectType], lods: Collection[int]):
+    output = '\n'.join(get_jsd_rows(intentions, lods))
     return output
+
+def write_jsd(file: BinaryIO, intentions: Iterable[CreateObjectType], lods: Collection[int]):
+    write_rows(file, get_jsd_rows(intentions, lods))
@@ -1,7 +1,18 @@
-from typing import Iterable
+from typing import BinaryIO, Iterable, Union
 from itertools import chain
+import pathlib
+
+import numpy as np
 
 from .intention.create_object import CreateObject
+from .intention.instance_table import InstanceTable, NO_LOD
+from .intention.lod_graph import get_lod_graph
+from .intention.spatial_grid import SpatialGrid
+from .rows_writer import WRITE_CHUNK_ROWS, write_rows
+
+JSP_SHARDS_DIR = "JSP"
+JSP_INDEX_NAME = "index.txt"
+DEFAULT_SHARD_CELL_SIZE = 500.0
 
 def get_jsp_row(intention: CreateObject):
     model = intention.object_model
@@ -15,13 +26,83 @@ def get_jsp_row(intention: CreateObject):
     output = f"{model},{interior},-1,{x},{y},{z},{rx},{ry},{rz}"
     return output
 
-def get_jsp(intentions: Iterable[CreateObject]):
-    rows = chain(
+def get_jsp_table_rows(table: InstanceTable):
+    # Columns are converted to Python objects one block at a time. The third
+    # field is the placement row of the LOD instance, counted from 0 after the header
+    models = table.models
+    lods = get_lod_graph(table).parents
+    for start in range(0, len(table), WRITE_CHUNK_ROWS):
+        block = slice(start, start + WRITE_CHUNK_ROWS)
+        for model_index, interior, lod, (x, y, z), (rx, ry, rz) in zip(
+            table.model_indices[block].tolist(),
+            table.interiors[block].tolist(),
+            lods[block].tolist(),
+            table.positions[block].tolist(),
+            table.rotations[block].tolist()
+        ):
+            yield f"{models[model_index]},{interior},{lod},{x},{y},{z},{rx},{ry},{rz}"
+
+def get_jsp_rows(intentions: Union[InstanceTable, Iterable[CreateObject]]):
+    if isinstance(intentions, InstanceTable):
+        intentions_rows = get_jsp_table_rows(intentions)
+    else:
+        intentions_rows = map(get_jsp_row, intentions)
+
+    return chain(
         ("0,0,0",),
-        map(
-            get_jsp_row,
-            intentions
-        )
+        intentions_rows
     )
-    output = '\n'.join(rows)
-    return output
\ No newline at end of file
+
+def get_jsp(intentions: Union[InstanceTable, Iterable[CreateObject]]):
+    output = '\n'.join(get_jsp_rows(intentions))
+    return output
+
+def write_jsp(file: BinaryIO, intentions: Union[InstanceTable, Iterable[CreateObject]]):
+    write_rows(file, get_jsp_rows(intentions))
+
+def get_shard_grid(table: InstanceTable, cell_size: float):
+    # Cells are aligned to multiples of the cell size, so the client finds
+    # the cell of a position without looking at the index. An instance goes to
+    # the cell of its LOD instance, so the pair stays in one shard
+    parents = get_lod_graph(table).parents
+    positions = table.positions[np.where(parents != NO_LOD, parents, np.arange(len(table)))]
+    origin = None
+    if len(table) != 0:
+        origin = np.floor(positions[:, :2].min(axis=0) / cell_size) * cell_size
+    return SpatialGrid(positions, cell_size, origin)
+
+def get_jsp_shards(table: InstanceTable, cell_size: float = DEFAULT_SHARD_CELL_SIZE):
+    grid = get_shard_grid(table, cell_size)
+    first_cell = np.round(grid.origin / cell_size).astype(np.int64)
+    for cell, indices in grid.get_cells():
+        x, y = (first_cell + cell).tolist()
+        yield f"gta3_{x}_{y}.JSP", grid.get_cell_bounds(cell), table.take(indices)
+
+def get_jsp_index_rows(cell_size: float, shards: Iterable[tuple[str, tuple[float, float, float, float], int]]):
+    yield f"{cell_size}"
+    for name, (min_x, min_y, max_x, max_y), rows_count in shards:
+        yield f"{name},{min_x},{min_y},{max_x},{max_y},{rows_count}"
+
+def write_jsp_shards(
+    directory: pathlib.Path,
+    table: InstanceTable,
+    cell_size: float = DEFAULT_SHARD_CELL_SIZE
+):
+    # One JSP per non-empty cell and an index of the cells, shards of an
+    # earlier build are removed. Returns the paths of the index and the shards
+    directory.mkdir(parents=True, exist_ok=True)
+    for path in directory.glob("*.JSP"):
+        path.unlink()
+
+    paths = [directory.joinpath(JSP_INDEX_NAME)]
+    shards = []
+    for name, bounds, shard in get_jsp_shards(table, cell_size):
+        path = directory.joinpath(name)
+        with open(path, "wb") as file:
+            write_jsp(file, shard)
+        paths.append(path)
+        shards.append((name, bounds, len(shard)))
+
+    with open(paths[0], "wb") as file:
+        write_rows(file, get_jsp_index_rows(cell_size, shards))
+    return paths
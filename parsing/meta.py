@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Iterable, Union
 import pathlib
 
 def get_meta_client_file_row(file_transformation: tuple[pathlib.Path, str]):
@@ -14,13 +14,32 @@ def get_meta_client_file_row(file_transformation: tuple[pathlib.Path, str]):
     row = f'<file src = "{relative_path}" type="client" />'
     return row
 
-def get_meta(transform_files: Iterable[tuple[pathlib.Path, str]]):
+def get_meta_shard_row(path: str, download: bool):
+    # Shards are downloaded by the client on demand, only the index is fetched on start
+    if download:
+        return f'<file src = "{path}" type="client" />'
+    return f'<file src = "{path}" type="client" download="false" />'
+
+def get_meta(
+    transform_files: Iterable[tuple[pathlib.Path, str]],
+    jsp_shards: Iterable[str] = (),
+    jsp_index: Union[str, None] = None
+):
+    shard_rows = ()
+    if jsp_index is not None:
+        shard_rows = (
+            "\t" + get_meta_shard_row(jsp_index, True),
+            *map(lambda x: "\t" + get_meta_shard_row(x, False), jsp_shards),
+            ''
+        )
+
     rows = (
         '<meta>',
         '\t<info type="script" name="MTA-Stream-Map" author="Unknown" description="MTA-Stream-Map-Conversion" version="3" Streamer="1" />',
         '',
         '\t<script src="Settings/CWaterData.lua" type="client" />',
         '',
+        *shard_rows,
         *map(
             lambda x: "\t" + get_meta_client_file_row(x),
             transform_files
@@ -0,0 +1,12 @@
+from typing import BinaryIO, Iterable
+from itertools import islice
+
+WRITE_CHUNK_ROWS = 8192
+
+def write_rows(file: BinaryIO, rows: Iterable[str], chunk_rows: int = WRITE_CHUNK_ROWS):
+    # Same bytes as '\n'.join(rows), but only one chunk of rows is alive at a time
+    rows = iter(rows)
+    separator = b""
+    while chunk := tuple(islice(rows, chunk_rows)):
+        file.write(separator + '\n'.join(chunk).encode())
+        separator = b"\n"
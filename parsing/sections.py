@@ -0,0 +1,105 @@
+from typing import Any, Callable, Union
+from itertools import chain
+import mmap
+import re
+
+# A line with a single word opens a section (objs, inst, cull, ...) or closes it (end),
+# in any case like the section names
+SECTION_LINE = re.compile(rb"^[ \t]*([A-Za-z0-9]+)[ \t]*(?:#[^\n]*)?\r?$", re.MULTILINE)
+END_LINE = re.compile(rb"[ \t]*end[ \t]*(?:#[^\n]*)?\r?(?:\n|$)", re.IGNORECASE)
+# Any line that is not empty and not only a comment
+ROW_LINE = re.compile(rb"^[ \t]*[^\s#]", re.MULTILINE)
+# Patterns instead of bytes.find, so bytes, mmap and memoryview are searched alike
+END_WORD = re.compile(rb"end", re.IGNORECASE)
+NEW_LINE = re.compile(rb"\n")
+
+def get_rows_count(body: bytes):
+    return len(ROW_LINE.findall(body))
+
+def get_field_rows(body: bytes):
+    # Every row is decoded once and split into its fields afterwards
+    rows = []
+    for line in bytes(body).split(b"\n"):
+        mark = line.find(b"#")
+        if mark != -1:
+            line = line[:mark]
+        line = line.strip()
+        if len(line) != 0:
+            rows.append(tuple(x.strip() for x in line.decode().split(",")))
+    return rows
+
+class SectionScan:
+    def __init__(self):
+        self.parsed: dict[str, list[Any]] = dict()
+        self.counts: dict[str, int] = dict()
+
+    def get_parsed(self, section: str):
+        return self.parsed.get(section, [])
+
+    def get_rows(self, section: str):
+        return list(chain.from_iterable(self.get_parsed(section)))
+
+class SectionScanner:
+    def __init__(self):
+        self.handlers: dict[str, Callable[[bytes], Any]] = dict()
+
+    def register(self, section: str, handler: Union[Callable[[bytes], Any], None] = None):
+        # A handler gets the raw body of every occurrence of its section,
+        # without one the rows are kept as tuples of fields
+        self.handlers[section] = handler if handler is not None else get_field_rows
+        return self
+
+    def scan(self, data: Union[bytes, memoryview, mmap.mmap, str]):
+        # Bodies are views into the data, a handler copies only what it keeps
+        if isinstance(data, str):
+            data = data.encode()
+        view = memoryview(data)
+
+        scan = SectionScan()
+        for section, start, end in get_section_spans(view):
+            self.add_section(scan, section, view[start:end])
+        return scan
+
+    def add_section(self, scan: SectionScan, section: str, body: memoryview):
+        handler = self.handlers.get(section)
+        if handler is None:
+            rows_count = get_rows_count(body)
+        else:
+            parsed = handler(body)
+            scan.parsed.setdefault(section, []).append(parsed)
+            rows_count = len(parsed)
+        scan.counts[section] = scan.counts.get(section, 0) + rows_count
+
+def get_section_spans(data: Union[bytes, memoryview, mmap.mmap]):
+    # Name and byte range of the body of every section, in file order
+    position = 0
+    while True:
+        header = SECTION_LINE.search(data, position)
+        if header is None:
+            return
+        position = header.end()
+        word = header.group(1)
+        if word.lower() == b"end":
+            continue
+
+        end = find_end_line(data, position)
+        yield word.decode().lower(), position, end
+        if end == len(data):
+            return
+        line_end = NEW_LINE.search(data, end)
+        if line_end is None:
+            return
+        position = line_end.start()
+
+def find_end_line(data: Union[bytes, memoryview, mmap.mmap], position: int):
+    # Rows are skipped with a substring search, only "end" candidates are checked
+    while True:
+        word = END_WORD.search(data, position)
+        if word is None:
+            return len(data)
+        line_start = word.start()
+        while line_start > 0 and data[line_start - 1] in b" \t":
+            line_start -= 1
+        if (line_start == 0 or data[line_start - 1] == ord("\n")) and END_LINE.match(data, line_start):
+            return line_start
+        position = word.end()
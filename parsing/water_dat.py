@@ -1,7 +1,10 @@
 
 from typing import Iterable
 
+import numpy as np
+
 from .intention.create_water import CreateWater, Point
+from .intention.water_table import WaterTable
 from .dat import get_dat_cleaned_rows
 
 def get_water_intentions_from_row(row: str):
@@ -25,5 +28,25 @@ def get_water_intentions_from_row(row: str):
 def get_water_intentions(water_rows: Iterable[str]):
     return map(get_water_intentions_from_row, water_rows)
 
+def get_water_table(water_rows: Iterable[str]):
+    # Rows of 3 and 4 points are converted one group at a time, every point
+    # has 7 numbers of which x, y, z are kept, the last number is the type
+    rows = [x.split() for x in water_rows]
+    lengths = np.array([len(x) for x in rows], dtype=np.int32)
+    if not np.isin(lengths, (22, 29)).all():
+        raise Exception("Unknown format")
+
+    points = np.full((len(rows), 4, 3), np.nan)
+    types = np.zeros(len(rows), dtype=np.int32)
+    for length in (22, 29):
+        indices = np.flatnonzero(lengths == length)
+        if len(indices) == 0:
+            continue
+        values = np.array([rows[x] for x in indices.tolist()], dtype=np.float64)
+        points_count = (length - 1) // 7
+        points[indices, :points_count] = values[:, :-1].reshape(-1, points_count, 7)[:, :, :3]
+        types[indices] = values[:, -1]
+    return WaterTable(points, (lengths - 1) // 7, types)
+
 def get_water_cleaned_rows(text: str):
     return filter(lambda x: x != "processed", get_dat_cleaned_rows(text))
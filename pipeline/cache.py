@@ -0,0 +1,133 @@
+from typing import Callable, Union
+import pathlib
+import hashlib
+import os
+
+import numpy as np
+
+from parsing.img import ImgEntry
+from parsing.intention.create_object_type import CreateObjectType
+from parsing.intention.instance_table import InstanceTable
+
+from .columns import encode_intentions, decode_intentions, has_columns
+from .manifest import get_source_key, get_source_stat, get_source_digest
+from .profile import count
+
+CACHE_VERSION = 1
+
+# A change in any file of these patterns makes every cached entry stale. Every
+# parser module is taken, so a module a parser starts to import is never missed
+PARSER_SOURCES = (
+    "parsing/**/*.py",
+    "pipeline/columns.py"
+)
+
+def get_parser_version():
+    base_path = pathlib.Path(__file__).parent.parent
+    paths = sorted({x for pattern in PARSER_SOURCES for x in base_path.glob(pattern)})
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(str(CACHE_VERSION).encode())
+    for path in paths:
+        digest.update(f"{path.relative_to(base_path).as_posix()}\0".encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+class ParseCache:
+    def __init__(self, path: Union[str, pathlib.Path], max_size: int):
+        self.path = pathlib.Path(path)
+        self.max_size = max_size
+        self.version = get_parser_version()
+
+    def get_entry_path(self, source: Union[pathlib.Path, ImgEntry]):
+        size, mtime_ns = get_source_stat(source)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{self.version}\0{get_source_key(source)}\0{size}\0{mtime_ns}\0".encode()
+        )
+        digest.update(get_source_digest(source).encode())
+        return self.path.joinpath(f"{digest.hexdigest()}.npz")
+
+    def has(self, source: Union[pathlib.Path, ImgEntry]):
+        return self.get_entry_path(source).is_file()
+
+    def load_columns(self, entry_path: pathlib.Path):
+        try:
+            with np.load(entry_path, allow_pickle=False) as arrays:
+                columns = {name: arrays[name] for name in arrays.files}
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        if not has_columns(columns):
+            return None
+        # The mtime of an entry is its last use, eviction drops the oldest ones first
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return columns
+
+    def load(self, entry_path: pathlib.Path):
+        columns = self.load_columns(entry_path)
+        if columns is None:
+            return None
+        return decode_intentions(columns)
+
+    def store_columns(self, entry_path: pathlib.Path, columns: dict[str, np.ndarray]):
+        self.path.mkdir(parents=True, exist_ok=True)
+        temporary_path = entry_path.with_name(f"{entry_path.stem}.{os.getpid()}.tmp")
+        with open(temporary_path, "wb") as file:
+            np.savez(file, **columns)
+        os.replace(temporary_path, entry_path)
+
+    def store(self, entry_path: pathlib.Path, intentions: Union[InstanceTable, set[CreateObjectType]]):
+        self.store_columns(entry_path, encode_intentions(intentions))
+
+    def get_columns(
+        self,
+        source: Union[pathlib.Path, ImgEntry],
+        parse: Callable[[Union[pathlib.Path, ImgEntry]], Union[InstanceTable, set[CreateObjectType]]]
+    ):
+        entry_path = self.get_entry_path(source)
+        columns = self.load_columns(entry_path)
+        if columns is None:
+            count("parse cache misses")
+            columns = encode_intentions(parse(source))
+            self.store_columns(entry_path, columns)
+        else:
+            count("parse cache hits")
+        return columns
+
+    def get_intentions(
+        self,
+        source: Union[pathlib.Path, ImgEntry],
+        parse: Callable[[Union[pathlib.Path, ImgEntry]], Union[InstanceTable, set[CreateObjectType]]]
+    ):
+        return decode_intentions(self.get_columns(source, parse))
+
+    def get_keyed_path(self, key: str):
+        # Entries of results that depend on many files are named by a stage key
+        return self.path.joinpath(f"{key}.npz")
+
+    def put(self, source: Union[pathlib.Path, ImgEntry], intentions: Union[InstanceTable, set[CreateObjectType]]):
+        self.store(self.get_entry_path(source), intentions)
+
+    def evict(self):
+        if not self.path.is_dir():
+            return
+
+        entries = []
+        for entry_path in self.path.glob("*.npz"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total_size = sum(x[1] for x in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
@@ -0,0 +1,178 @@
+from typing import Union
+
+import numpy as np
+
+from parsing.intention.create_object_type import CreateObjectType
+from parsing.intention.instance_table import InstanceTable
+from differences.dto import IntentionsDifferences
+
+# Column buffers are aligned so every array can be a view into the buffer
+COLUMN_ALIGNMENT = 8
+
+COLUMN_NAMES = {
+    "ipl": ("object_ids", "models", "model_indices", "interiors", "positions", "rotations", "LOD_ids"),
+    "ide": (
+        "object_ids", "models", "cols", "has_cols", "textures", "draw_distances",
+        "flags", "times_on", "has_times_on", "times_off", "has_times_off"
+    )
+}
+
+# Every part of the intentions diffs is stored as the columns of its kind
+# with the name of the part as a prefix
+INTENTIONS_DIFFS_PARTS = (
+    ("only_in_ipl", "ipl"),
+    ("only_in_ide", "ide"),
+    ("ipl_in_both", "ipl"),
+    ("ide_in_both", "ide")
+)
+COLUMN_NAMES["intentions_diffs"] = tuple(
+    f"{part}.{name}"
+    for part, kind in INTENTIONS_DIFFS_PARTS
+    for name in COLUMN_NAMES[kind]
+)
+
+def encode_instance_table(table: InstanceTable):
+    columns = {
+        "kind": np.array("ipl"),
+        "object_ids": table.object_ids,
+        "models": np.array(table.models, dtype=str),
+        "model_indices": table.model_indices,
+        "interiors": table.interiors,
+        "positions": table.positions,
+        "rotations": table.rotations,
+        "LOD_ids": table.LOD_ids
+    }
+    if table.LOD_parents is not None:
+        columns["LOD_parents"] = table.LOD_parents
+    return columns
+
+def decode_instance_table(arrays):
+    return InstanceTable(
+        arrays["object_ids"],
+        arrays["models"].tolist(),
+        arrays["model_indices"],
+        arrays["interiors"],
+        arrays["positions"],
+        arrays["rotations"],
+        arrays["LOD_ids"],
+        arrays["LOD_parents"] if "LOD_parents" in arrays else None
+    )
+
+def encode_object_types(intentions: set[CreateObjectType]):
+    intentions = tuple(intentions)
+
+    def get_optional_column(values):
+        values = tuple(values)
+        return (
+            np.array(["" if x is None else x for x in values], dtype=str),
+            np.array([x is not None for x in values], dtype=bool)
+        )
+
+    cols, has_cols = get_optional_column(x.object_col for x in intentions)
+    times_on, has_times_on = get_optional_column(x.time_on for x in intentions)
+    times_off, has_times_off = get_optional_column(x.tine_off for x in intentions)
+    return {
+        "kind": np.array("ide"),
+        "object_ids": np.array([x.object_id for x in intentions], dtype=np.int64),
+        "models": np.array([x.object_model for x in intentions], dtype=str),
+        "cols": cols,
+        "has_cols": has_cols,
+        "textures": np.array([x.texture for x in intentions], dtype=str),
+        "draw_distances": np.array([x.draw_distance for x in intentions], dtype=np.float64),
+        "flags": np.array([x.flag for x in intentions], dtype=np.int64),
+        "times_on": times_on,
+        "has_times_on": has_times_on,
+        "times_off": times_off,
+        "has_times_off": has_times_off
+    }
+
+def decode_object_types(arrays):
+    def get_optional_column(name: str):
+        return (
+            x if has else None
+            for x, has in zip(arrays[name].tolist(), arrays["has_" + name].tolist())
+        )
+
+    return set(map(
+        lambda x: CreateObjectType(*x),
+        zip(
+            arrays["object_ids"].tolist(),
+            arrays["models"].tolist(),
+            get_optional_column("cols"),
+            arrays["textures"].tolist(),
+            arrays["draw_distances"].tolist(),
+            arrays["flags"].tolist(),
+            get_optional_column("times_on"),
+            get_optional_column("times_off")
+        )
+    ))
+
+def encode_intentions(intentions: Union[InstanceTable, set[CreateObjectType]]):
+    if isinstance(intentions, InstanceTable):
+        return encode_instance_table(intentions)
+    return encode_object_types(intentions)
+
+def decode_intentions(arrays):
+    if str(arrays["kind"]) == "ipl":
+        return decode_instance_table(arrays)
+    return decode_object_types(arrays)
+
+def encode_intentions_diffs(diffs: IntentionsDifferences):
+    columns = {"kind": np.array("intentions_diffs")}
+    for part, _ in INTENTIONS_DIFFS_PARTS:
+        for name, array in encode_intentions(getattr(diffs, part)).items():
+            if name != "kind":
+                columns[f"{part}.{name}"] = array
+    return columns
+
+def decode_intentions_diffs(arrays):
+    parts = []
+    for part, kind in INTENTIONS_DIFFS_PARTS:
+        prefix = part + "."
+        part_arrays = {"kind": np.array(kind)}
+        part_arrays.update(
+            (name[len(prefix):], array)
+            for name, array in arrays.items()
+            if name.startswith(prefix)
+        )
+        parts.append(decode_intentions(part_arrays))
+    return IntentionsDifferences(*parts)
+
+def has_columns(columns: dict[str, np.ndarray]):
+    if "kind" not in columns:
+        return False
+    names = COLUMN_NAMES.get(str(columns["kind"]))
+    return names is not None and all(x in columns for x in names)
+
+def concat_columns(columns_list: list[dict[str, np.ndarray]]):
+    # Only for IDE columns, the model indices of IPL columns are local to every part
+    return {
+        name: columns_list[0][name] if name == "kind" else np.concatenate([x[name] for x in columns_list])
+        for name in columns_list[0]
+    }
+
+def pack_columns(columns: dict[str, np.ndarray]):
+    # One bytes object instead of an object graph, so a worker result is
+    # pickled and unpickled as a single buffer copy
+    layout = []
+    parts = []
+    offset = 0
+    for name, array in columns.items():
+        array = np.ascontiguousarray(array)
+        padding = -offset % COLUMN_ALIGNMENT
+        if padding != 0:
+            parts.append(bytes(padding))
+            offset += padding
+        layout.append((name, array.dtype.str, array.shape, offset))
+        parts.append(array.tobytes())
+        offset += array.nbytes
+    return layout, b"".join(parts)
+
+def unpack_columns(packed: tuple[list[tuple[str, str, tuple[int, ...], int]], bytes]):
+    layout, buffer = packed
+    columns = dict()
+    for name, dtype, shape, offset in layout:
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape, dtype=np.int64))
+        columns[name] = np.frombuffer(buffer, dtype, count, offset).reshape(shape)
+    return columns
@@ -0,0 +1,99 @@
+from typing import TextIO, Union
+import threading
+import pathlib
+import queue
+import json
+
+FLUSH_LINES = 4096
+
+class DiagnosticsSink:
+    def __init__(
+        self,
+        log_path: Union[str, pathlib.Path, None],
+        flush_lines: int = FLUSH_LINES,
+        background: bool = False
+    ):
+        self.flush_lines = flush_lines
+        self._log_file = open(log_path, "a") if log_path is not None else None
+        self._report_file: Union[TextIO, None] = None
+        self._log_lines: list[str] = []
+        self._report_lines: list[str] = []
+
+        # Only one thread ever writes to the files, either the caller or the writer
+        self._queue: Union[queue.Queue, None] = None
+        self._thread: Union[threading.Thread, None] = None
+        if background:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._write_batches, daemon=True)
+            self._thread.start()
+
+    def log(self, text: str):
+        if self._log_file is None:
+            return
+        self._log_lines.append(text)
+        if len(self._log_lines) >= self.flush_lines:
+            self.flush()
+
+    def open_report(self, path: Union[str, pathlib.Path]):
+        self.close_report()
+        self._report_file = open(path, "w")
+
+    def record(self, record: dict):
+        if self._report_file is None:
+            return
+        self._report_lines.append(json.dumps(record))
+        if len(self._report_lines) >= self.flush_lines:
+            self.flush()
+
+    def close_report(self):
+        if self._report_file is None:
+            return
+        self.flush()
+        if self._queue is not None:
+            self._queue.join()
+        self._report_file.close()
+        self._report_file = None
+
+    def flush(self):
+        batch = (self._log_lines, self._report_file, self._report_lines)
+        self._log_lines = []
+        self._report_lines = []
+        if self._queue is not None:
+            self._queue.put(batch)
+        else:
+            self._write(batch)
+
+    def _write(self, batch: tuple[list[str], Union[TextIO, None], list[str]]):
+        log_lines, report_file, report_lines = batch
+        if log_lines:
+            self._log_file.write("\n".join(log_lines) + "\n")
+            self._log_file.flush()
+        if report_lines:
+            report_file.write("\n".join(report_lines) + "\n")
+
+    def _write_batches(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                self._write(batch)
+            finally:
+                self._queue.task_done()
+
+    def close(self):
+        self.close_report()
+        self.flush()
+        if self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
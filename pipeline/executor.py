@@ -0,0 +1,51 @@
+from typing import Callable, Iterable, Union
+import multiprocessing
+import os
+import multiprocessing.pool
+
+class PipelineExecutor:
+    def __init__(self, workers_count: Union[int, None] = None):
+        self.workers_count = workers_count
+        self._pool: Union[multiprocessing.pool.Pool, None] = None
+
+    def get_workers_count(self):
+        if self.workers_count is not None:
+            return self.workers_count
+        return os.cpu_count() or 1
+
+    @property
+    def pool(self):
+        # Workers are forked once, on first use, and serve every stage of the run
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers_count)
+        return self._pool
+
+    def map(self, function: Callable, iterable: Iterable, chunksize: Union[int, None] = None):
+        return self.pool.map(function, iterable, chunksize)
+
+    def map_async(self, function: Callable, iterable: Iterable, chunksize: Union[int, None] = None):
+        return self.pool.map_async(function, iterable, chunksize)
+
+    def imap_unordered(self, function: Callable, iterable: Iterable, chunksize: int = 1):
+        return self.pool.imap_unordered(function, iterable, chunksize)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, *args):
+        if exception_type is None:
+            self.close()
+        else:
+            self.terminate()
@@ -0,0 +1,219 @@
+from typing import Iterable, Union
+import pathlib
+import hashlib
+import json
+import os
+
+from parsing.img import ImgEntry, get_img_entry_data
+
+MANIFEST_VERSION = 1
+
+# The code a stage runs is part of its key, so outputs of an older
+# converter are rebuilt even when the inputs did not change
+STAGE_SOURCES = {
+    "water": (
+        "main.py", "parsing/dat.py", "parsing/water_dat.py", "parsing/water_lua.py",
+        "parsing/intention/create_water.py", "parsing/intention/water_table.py"
+    ),
+    "intentions": (
+        "main.py", "parsing/**/*.py", "differences/*.py", "pipeline/columns.py"
+    ),
+    "map": (
+        "main.py", "available_ids.py", "available_ids.bin", "parsing/**/*.py",
+        "differences/*.py", "pipeline/columns.py"
+    )
+}
+
+DIGEST_CHUNK_SIZE = 1 << 20
+
+class FileRecord:
+    def __init__(
+        self,
+        size: int,
+        mtime_ns: int,
+        digest: str,
+        source_digest: Union[str, None] = None
+    ):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.digest = digest
+        self.source_digest = source_digest
+
+    def has_same_stat(self, stat: tuple[int, int]):
+        return (self.size, self.mtime_ns) == stat
+
+_stage_versions: dict[str, str] = dict()
+
+def get_stage_version(name: str):
+    version = _stage_versions.get(name)
+    if version is None:
+        base_path = pathlib.Path(__file__).parent.parent
+        paths = sorted({x for pattern in STAGE_SOURCES[name] for x in base_path.glob(pattern)})
+        digest = hashlib.blake2b(digest_size=8)
+        for path in paths:
+            digest.update(f"{path.relative_to(base_path).as_posix()}\0".encode())
+            digest.update(path.read_bytes())
+        version = digest.hexdigest()
+        _stage_versions[name] = version
+    return version
+
+def get_data_digest(data: Union[bytes, memoryview]):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def get_file_digest(path: pathlib.Path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        while chunk := file.read(DIGEST_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_source_key(source: Union[pathlib.Path, ImgEntry]):
+    if isinstance(source, ImgEntry):
+        return str(source)
+    return pathlib.Path(source).as_posix()
+
+def get_source_stat(source: Union[pathlib.Path, ImgEntry]):
+    if isinstance(source, ImgEntry):
+        stat = os.stat(source.archive)
+        return len(get_img_entry_data(source)), stat.st_mtime_ns
+    stat = os.stat(source)
+    return stat.st_size, stat.st_mtime_ns
+
+def get_source_digest(source: Union[pathlib.Path, ImgEntry]):
+    if isinstance(source, ImgEntry):
+        return get_data_digest(get_img_entry_data(source))
+    return get_file_digest(source)
+
+def encode_source(source: Union[pathlib.Path, ImgEntry]):
+    if isinstance(source, ImgEntry):
+        return {"archive": source.archive.as_posix(), "name": source.name}
+    return {"path": pathlib.Path(source).as_posix()}
+
+def decode_source(data: dict[str, str]):
+    if "archive" in data:
+        return ImgEntry(pathlib.Path(data["archive"]), data["name"])
+    return pathlib.Path(data["path"])
+
+class BuildManifest:
+    def __init__(
+        self,
+        path: pathlib.Path,
+        records: Union[dict[str, FileRecord], None] = None,
+        stages: Union[dict[str, dict], None] = None
+    ):
+        self.path = pathlib.Path(path)
+        self.previous_records = records if records is not None else dict()
+        self.previous_stages = stages if stages is not None else dict()
+        self.records: dict[str, FileRecord] = dict()
+        self.stages: dict[str, dict] = dict()
+
+    def get_record(self, source: Union[pathlib.Path, ImgEntry]):
+        # Content is only rehashed when size or mtime moved since the last run
+        key = get_source_key(source)
+        if key in self.records:
+            return self.records[key]
+
+        stat = get_source_stat(source)
+        previous = self.previous_records.get(key)
+        if previous is not None and previous.has_same_stat(stat):
+            digest = previous.digest
+        else:
+            digest = get_source_digest(source)
+
+        record = FileRecord(*stat, digest)
+        self.records[key] = record
+        return record
+
+    def get_stage_key(
+        self,
+        sources: Iterable[Union[pathlib.Path, ImgEntry]],
+        *extra: str,
+        name: Union[str, None] = None
+    ):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(MANIFEST_VERSION).encode())
+        if name is not None:
+            digest.update(f"\0{get_stage_version(name)}".encode())
+        for key, record in sorted((get_source_key(x), self.get_record(x)) for x in sources):
+            digest.update(f"\0{key}\0{record.digest}".encode())
+        for item in extra:
+            digest.update(f"\0{item}".encode())
+        return digest.hexdigest()
+
+    def is_output_intact(self, path: pathlib.Path, source_digest: Union[str, None] = None):
+        key = get_source_key(path)
+        previous = self.previous_records.get(key)
+        if previous is None or previous.source_digest != source_digest:
+            return False
+        try:
+            stat = get_source_stat(path)
+        except FileNotFoundError:
+            return False
+        if not previous.has_same_stat(stat) and get_file_digest(path) != previous.digest:
+            return False
+
+        self.records[key] = FileRecord(*stat, previous.digest, source_digest)
+        return True
+
+    def add_output(
+        self,
+        path: pathlib.Path,
+        digest: Union[str, None] = None,
+        source_digest: Union[str, None] = None
+    ):
+        stat = get_source_stat(path)
+        if digest is None:
+            digest = get_file_digest(path)
+        self.records[get_source_key(path)] = FileRecord(*stat, digest, source_digest)
+
+    def is_stage_fresh(self, name: str, key: str):
+        previous = self.previous_stages.get(name)
+        if previous is None or previous["key"] != key:
+            return False
+        if not all(self.is_output_intact(pathlib.Path(x)) for x in previous["outputs"]):
+            return False
+
+        self.stages[name] = previous
+        return True
+
+    def get_stage_data(self, name: str):
+        return self.stages[name].get("data")
+
+    def set_stage(self, name: str, key: str, outputs: Iterable[pathlib.Path], data=None):
+        outputs = [pathlib.Path(x) for x in outputs]
+        for path in outputs:
+            self.add_output(path)
+        self.stages[name] = {
+            "key": key,
+            "outputs": [x.as_posix() for x in outputs],
+            "data": data
+        }
+
+    def save(self):
+        # Only files seen by this run are kept, so removed inputs do not pile up
+        data = {
+            "version": MANIFEST_VERSION,
+            "records": {
+                key: [x.size, x.mtime_ns, x.digest, x.source_digest]
+                for key, x in self.records.items()
+            },
+            "stages": self.stages
+        }
+        temporary_path = self.path.with_suffix(".tmp")
+        with open(temporary_path, "w") as file:
+            json.dump(data, file)
+        os.replace(temporary_path, self.path)
+
+def load_build_manifest(path: Union[str, pathlib.Path]):
+    path = pathlib.Path(path)
+    try:
+        with open(path, "r") as file:
+            data = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return BuildManifest(path)
+
+    if data.get("version") != MANIFEST_VERSION:
+        return BuildManifest(path)
+
+    records = {key: FileRecord(*value) for key, value in data["records"].items()}
+    return BuildManifest(path, records, data["stages"])
@@ -0,0 +1,141 @@
+from typing import Union
+import pathlib
+import shutil
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from parsing.img import ImgEntry, get_img_archive, get_img_entry_data
+
+from .manifest import get_file_digest
+
+# ioctl number of FICLONE from linux/fs.h
+FICLONE = 0x40049409
+
+COPY_CHUNK_SIZE = 1 << 24
+
+MATERIALIZE_MODES = ("auto", "hardlink", "reflink", "copy_file_range", "copy")
+
+def get_source_location(source: Union[pathlib.Path, ImgEntry]):
+    if isinstance(source, ImgEntry):
+        offset, size = get_img_archive(source.archive).get_location(source.name)
+        return source.archive, offset, size
+    return pathlib.Path(source), 0, os.path.getsize(source)
+
+def remove_destination(destination: str):
+    try:
+        os.remove(destination)
+    except FileNotFoundError:
+        pass
+
+def hardlink_file(source: Union[pathlib.Path, ImgEntry], destination: str):
+    if isinstance(source, ImgEntry):
+        raise OSError("An entry of an IMG archive can not be hardlinked")
+    remove_destination(destination)
+    os.link(source, destination)
+
+def reflink_file(source: Union[pathlib.Path, ImgEntry], destination: str):
+    if fcntl is None:
+        raise OSError("Reflinks are not supported on this platform")
+    if isinstance(source, ImgEntry):
+        raise OSError("An entry of an IMG archive can not be reflinked")
+    # A new inode, so a previous hardlink to the source is never written through
+    remove_destination(destination)
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+
+def copy_file_range_file(source: Union[pathlib.Path, ImgEntry], destination: str):
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None and not hasattr(os, "sendfile"):
+        raise OSError("copy_file_range and sendfile are not supported on this platform")
+
+    path, offset, size = get_source_location(source)
+    remove_destination(destination)
+    with open(path, "rb") as source_file, open(destination, "wb") as destination_file:
+        copied = 0
+        while copied < size:
+            count = min(size - copied, COPY_CHUNK_SIZE)
+            if copy_range is not None:
+                written = copy_range(
+                    source_file.fileno(),
+                    destination_file.fileno(),
+                    count,
+                    offset + copied
+                )
+            else:
+                written = os.sendfile(
+                    destination_file.fileno(),
+                    source_file.fileno(),
+                    offset + copied,
+                    count
+                )
+            if written == 0:
+                raise OSError(f"Source '{path}' ended before {size} bytes were copied")
+            copied += written
+
+def copy_plain_file(source: Union[pathlib.Path, ImgEntry], destination: str):
+    remove_destination(destination)
+    if isinstance(source, ImgEntry):
+        with open(destination, "wb") as file:
+            file.write(get_img_entry_data(source))
+    else:
+        shutil.copyfile(source, destination)
+
+MATERIALIZERS = {
+    "hardlink": hardlink_file,
+    "reflink": reflink_file,
+    "copy_file_range": copy_file_range_file,
+    "copy": copy_plain_file
+}
+
+def get_materialize_chain(mode: str):
+    # Every mode falls back to cheaper-to-support ones, a plain copy always works
+    if mode == "auto":
+        return ("reflink", "copy_file_range", "copy")
+    if mode == "hardlink":
+        return ("hardlink", "copy")
+    if mode == "reflink":
+        return ("reflink", "copy_file_range", "copy")
+    if mode == "copy_file_range":
+        return ("copy_file_range", "copy")
+    if mode == "copy":
+        return ("copy",)
+    raise Exception(f"Unknown materialize mode '{mode}'")
+
+def is_materialized(
+    source: Union[pathlib.Path, ImgEntry],
+    destination: str,
+    digest: Union[str, None]
+):
+    try:
+        destination_size = os.path.getsize(destination)
+    except FileNotFoundError:
+        return False
+
+    if not isinstance(source, ImgEntry) and os.path.samefile(source, destination):
+        return True
+    if digest is None or destination_size != get_source_location(source)[2]:
+        return False
+    return get_file_digest(destination) == digest
+
+def materialize_file(
+    job: tuple[Union[pathlib.Path, ImgEntry], str, Union[str, None]],
+    mode: str = "auto"
+):
+    source, destination, digest = job
+    if is_materialized(source, destination, digest):
+        return "skipped", 0
+
+    error = None
+    for method in get_materialize_chain(mode):
+        try:
+            MATERIALIZERS[method](source, destination)
+        except OSError as e:
+            error = e
+            remove_destination(destination)
+            continue
+        return method, os.path.getsize(destination)
+    raise error
@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+import time
+import json
+
+class Profile:
+    def __init__(self):
+        self.timers: dict[str, float] = dict()
+        self.counters: dict[str, int] = dict()
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float):
+        self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, report: dict[str, dict], timers_prefix: str = ""):
+        for name, seconds in report["timers"].items():
+            self.add_time(timers_prefix + name, seconds)
+        for name, value in report["counters"].items():
+            self.count(name, value)
+
+    def get_report(self):
+        return {
+            "timers": dict(self.timers),
+            "counters": dict(self.counters)
+        }
+
+    def get_table(self):
+        width = max(map(len, (*self.timers, *self.counters, "Counter")), default=0) + 2
+        rows = [f"{'Stage':<{width}}{'Seconds':>12}"]
+        rows.extend(f"{name:<{width}}{seconds:>12.3f}" for name, seconds in self.timers.items())
+        rows.append("")
+        rows.append(f"{'Counter':<{width}}{'Value':>12}")
+        rows.extend(f"{name:<{width}}{value:>12}" for name, value in self.counters.items())
+        return "\n".join(rows)
+
+    def save(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.get_report(), file, indent=4)
+
+_profile = Profile()
+
+def get_profile():
+    return _profile
+
+def reset_profile():
+    global _profile
+    _profile = Profile()
+    return _profile
+
+def stage(name: str):
+    return _profile.stage(name)
+
+def count(name: str, value: int = 1):
+    _profile.count(name, value)
+
+@contextmanager
+def worker_profile():
+    # A forked worker inherits the counters of its parent, so every job
+    # collects into a fresh profile that is sent back with the job result
+    global _profile
+    previous = _profile
+    _profile = Profile()
+    try:
+        yield _profile
+    finally:
+        _profile = previous
+
+def merge_worker_report(report: dict[str, dict]):
+    # Worker timers are summed over processes, so they are CPU time, not wall time
+    _profile.merge(report, "workers: ")